@@ -63,7 +63,7 @@ def create_parser():
         prog="makeprojects", description=(
             "Make project files. Copyright by Rebecca Ann Heineman. "
             "Creates files for XCode, Visual Studio, "
-            "CodeBlocks, Watcom, make, Codewarrior..."))
+            "CodeBlocks, Watcom, make, ninja, Codewarrior..."))
 
     parser.add_argument("--version", action="version",
                         version="%(prog)s " + __version__)
@@ -0,0 +1,430 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Delete the files created by builds without starting the build tools.
+
+The makefiles, Watcom makefiles and ninja files created by makeprojects write
+their output to known files in the ``temp`` and ``bin`` folders and the
+custom rule outputs, so ``cleanme`` deletes them directly instead of running
+the ``clean`` target. Folders are scanned and files deleted by a pool of
+threads.
+
+The variable ``CLEAN_PATTERNS`` in ``build_rules.py`` adds patterns of files
+to delete for any other project.
+
+See Also:
+    delete_artifacts, makeprojects.cleanme
+
+@package makeprojects.artifacts
+
+@var makeprojects.artifacts._GENERATED_MATCH
+Regex for the header of a file created by makeprojects
+"""
+
+# pylint: disable=consider-using-f-string
+# pylint: disable=useless-object-inheritance
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import stat
+import threading
+from glob import glob
+from re import compile as re_compile
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    from os import scandir
+except ImportError:
+    scandir = None
+
+from burger import convert_to_array
+from .build_objects import BuildObject, BuildError, get_job_limit, \
+    _OUTPUT_FOLDERS, _REFERENCE_SPLIT, _get_log_name
+
+# The header makefile, watcom and ninja write in their files
+_GENERATED_MATCH = re_compile(
+    "^# Generated with makeprojects\\.(makefile|watcom|ninja)$")
+
+########################################
+
+
+def get_generated_artifacts(file_name):
+    """
+    Return the files a generated build file created.
+
+    The ``temp`` and ``bin`` folders and files written by every configuration
+    and the outputs of the custom rules are found in the file, since they're
+    the files the ``clean`` target deletes. The logs ``buildme`` saved in
+    ``temp`` are added, so the ``temp`` folder can be removed.
+
+    Args:
+        file_name: Pathname of the makefile, Watcom makefile or ninja file.
+    Returns:
+        List of pathnames that exist, or None if the file wasn't created by
+        makeprojects.
+    """
+
+    try:
+        with open(file_name, "r") as fp:
+            lines = fp.read().splitlines()
+    except (IOError, OSError, UnicodeDecodeError):
+        return None
+
+    # Hand written files may clean anything
+    if not any(_GENERATED_MATCH.match(x) for x in lines[:4]):
+        return None
+
+    results = set()
+    extra_objs = False
+    for line in lines:
+        tokens = _REFERENCE_SPLIT.split(line)
+
+        # Custom outputs of makefile and watcom, with continued lines
+        if extra_objs or line.startswith("EXTRA_OBJS"):
+            extra_objs = line.endswith(("\\", "&"))
+            results.update(
+                x for x in tokens if x and x != "\\" and "$" not in x
+                and not x.startswith("EXTRA_OBJS"))
+
+        # Custom outputs of ninja
+        elif line.startswith("build ") and ": custom " in line:
+            results.update(
+                x for x in line[6:line.index(": custom ")].split()
+                if "$" not in x)
+
+        # Files and folders in temp and bin of each configuration
+        for token in tokens:
+            if "$" in token or "%" in token:
+                continue
+            parts = token.replace("\\", "/").split("/")
+            if len(parts) > 1 and parts[0] in _OUTPUT_FOLDERS and parts[1]:
+                results.add(parts[0] + "/" + parts[1])
+
+    # Logs of all the configurations, see BuildObject.get_log_file_name()
+    log_name = _get_log_name(os.path.basename(file_name))
+    results.add("temp/" + log_name)
+    results.add("temp/" + log_name[:-4] + "_*.log")
+
+    return find_artifacts(
+        os.path.dirname(os.path.abspath(file_name)), sorted(results))
+
+########################################
+
+
+def find_artifacts(working_directory, patterns):
+    """
+    Return the files and folders that match a list of patterns.
+
+    The patterns are relative to the working directory and can use the
+    wildcards of glob. Only files and folders inside of the working directory
+    are returned, so patterns like ``../*`` or absolute pathnames can't
+    delete anything else.
+
+    Args:
+        working_directory: Directory the patterns are relative to
+        patterns: Pattern or list of patterns, like ``temp`` or ``*.d``
+    Returns:
+        Sorted list of absolute pathnames.
+    """
+
+    working_directory = os.path.abspath(working_directory)
+    prefix = os.path.join(working_directory, "")
+    results = set()
+    for pattern in convert_to_array(patterns):
+        for item in glob(os.path.join(working_directory, pattern)):
+            item = os.path.abspath(item)
+
+            # Don't delete the folder being cleaned or anything outside of it
+            if item.startswith(prefix):
+                results.add(item)
+    return sorted(results)
+
+########################################
+
+
+def _list_folder(folder):
+    """
+    Return the contents of a folder.
+
+    Args:
+        folder: Pathname of the folder
+    Returns:
+        List of tuples of the pathname, True if a folder and the size.
+    """
+
+    results = []
+    if scandir is not None:
+        for entry in scandir(folder):
+            is_dir = entry.is_dir(follow_symlinks=False)
+            size = 0 if is_dir else entry.stat(follow_symlinks=False).st_size
+            results.append((entry.path, is_dir, size))
+        return results
+
+    # Python 2 doesn't have scandir
+    for item in os.listdir(folder):
+        item = os.path.join(folder, item)
+        info = os.lstat(item)
+        is_dir = stat.S_ISDIR(info.st_mode)
+        results.append((item, is_dir, 0 if is_dir else info.st_size))
+    return results
+
+########################################
+
+
+def _remove_file(file_name):
+    """
+    Delete a file, even if it's read only.
+
+    Args:
+        file_name: Pathname of the file
+    """
+
+    try:
+        os.remove(file_name)
+    except OSError:
+        # Windows won't delete read only files
+        os.chmod(file_name, stat.S_IWRITE)
+        os.remove(file_name)
+
+########################################
+
+
+def delete_artifacts(paths, dry_run=False, jobs=None):
+    """
+    Delete files and folders with a pool of threads.
+
+    Each folder is scanned by one of the threads, which deletes its files and
+    hands its subfolders to the others. The empty folders are removed when
+    the threads are done. Empty ``temp`` and ``bin`` folders left behind are
+    removed, like the generated ``clean`` targets do.
+
+    Args:
+        paths: Iterable of pathnames of files and folders to delete
+        dry_run: True to count the files without deleting them
+        jobs: Number of threads, None for get_job_limit()
+    Returns:
+        Tuple of the number of files, their size in bytes and a list of
+        tuples of the pathname and message of each error.
+    """
+
+    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-statements
+
+    # Drop anything that's inside of another folder being deleted
+    top_paths = []
+    for item in sorted(set(os.path.abspath(x) for x in paths), key=len):
+        if not any(item.startswith(os.path.join(x, "")) for x in top_paths):
+            top_paths.append(item)
+
+    totals = [0, 0]
+    errors = []
+    folders = []
+    lock = threading.Lock()
+    work = queue.Queue()
+
+    def delete_file(file_name, size):
+        try:
+            if not dry_run:
+                _remove_file(file_name)
+        except OSError as error:
+            with lock:
+                errors.append((file_name, str(error)))
+            return
+        with lock:
+            totals[0] += 1
+            totals[1] += size
+
+    def worker():
+        while True:
+            folder = work.get()
+            if folder is None:
+                work.task_done()
+                return
+            try:
+                for item, is_dir, size in _list_folder(folder):
+                    if is_dir:
+                        with lock:
+                            folders.append(item)
+                        work.put(item)
+                    else:
+                        delete_file(item, size)
+            except OSError as error:
+                with lock:
+                    errors.append((folder, str(error)))
+            work.task_done()
+
+    for item in top_paths:
+        if os.path.isdir(item) and not os.path.islink(item):
+            folders.append(item)
+            work.put(item)
+        elif os.path.lexists(item):
+            delete_file(item, os.lstat(item).st_size)
+
+    # Only start the threads if there are folders to scan
+    if folders:
+        if jobs is None:
+            jobs = get_job_limit()[0]
+        threads = [threading.Thread(target=worker)
+                   for _ in range(max(1, jobs))]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        work.join()
+        for _ in threads:
+            work.put(None)
+        for thread in threads:
+            thread.join()
+
+    if not dry_run:
+        # Remove the folders, the deepest first
+        for item in sorted(folders, key=len, reverse=True):
+            try:
+                os.rmdir(item)
+            except OSError as error:
+                errors.append((item, str(error)))
+
+        # Remove empty output folders
+        for item in sorted(set(os.path.dirname(x) for x in top_paths)):
+            if os.path.basename(item) in _OUTPUT_FOLDERS:
+                try:
+                    os.rmdir(item)
+                except OSError:
+                    pass
+
+    return totals[0], totals[1], errors
+
+########################################
+
+
+def clean_artifacts(working_directory, patterns, dry_run=False, jobs=None):
+    """
+    Delete the files and folders that match a list of patterns.
+
+    This can be called by ``clean()`` in ``build_rules.py`` instead of
+    deleting folders one at a time.
+
+    Args:
+        working_directory: Directory the patterns are relative to
+        patterns: Pattern or list of patterns, like ``temp`` or ``*.d``
+        dry_run: True to count the files without deleting them
+        jobs: Number of threads, None for get_job_limit()
+    Returns:
+        Tuple of the number of files, their size in bytes and a list of
+        tuples of the pathname and message of each error.
+    See Also:
+        find_artifacts, delete_artifacts
+    """
+
+    return delete_artifacts(
+        find_artifacts(working_directory, patterns), dry_run, jobs)
+
+########################################
+
+
+def delete_build_artifacts(build_object, paths=None):
+    """
+    Delete the files of a BuildObject without starting its build tools.
+
+    Args:
+        build_object: BuildObject with a get_artifacts() method
+        paths: List of pathnames, None to call get_artifacts()
+    Returns:
+        BuildError object
+    """
+
+    if paths is None:
+        paths = build_object.get_artifacts()
+    files, size, errors = delete_artifacts(paths)
+    if errors:
+        return BuildError(
+            1, errors[0][0], msg="{} errors, {}".format(
+                len(errors), errors[0][1]))
+    return BuildError(
+        0, build_object.file_name,
+        msg="Deleted {} files, {} bytes".format(files, size))
+
+########################################
+
+
+class BuildArtifacts(BuildObject):
+    """
+    Class to delete the files listed in ``CLEAN_PATTERNS``.
+
+    Attributes:
+        working_directory: Directory the patterns are relative to
+        patterns: List of patterns of files to delete
+    """
+
+    def __init__(self, file_name, working_directory, patterns,
+                 priority=None):
+        """
+        Class to delete files that match patterns.
+
+        Args:
+            file_name: Pathname to the build_rules.py with the patterns
+            working_directory: Directory the patterns are relative to
+            patterns: Pattern or list of patterns of files to delete
+            priority: Priority to clean this object
+        """
+
+        super(BuildArtifacts, self).__init__(file_name, priority)
+        self.working_directory = working_directory
+        self.patterns = convert_to_array(patterns)
+
+    ########################################
+
+    def clean(self):
+        """
+        Delete the files that match the patterns.
+
+        Returns:
+            BuildError object
+        """
+
+        return delete_build_artifacts(self)
+
+    ########################################
+
+    def get_artifacts(self):
+        """
+        Return the files and folders that match the patterns.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return find_artifacts(self.working_directory, self.patterns)
+
+    ########################################
+
+    def __repr__(self):
+        """
+        Convert the object into a string.
+
+        Returns:
+            A full string.
+        """
+
+        return (
+            "{} for file \"{}\" with priority {}, delete {} in \"{}\"").format(
+                type(self).__name__,
+                self.file_name,
+                self.priority,
+                ", ".join(self.patterns),
+                self.working_directory)
+
+    def __str__(self):
+        """
+        Convert the object into a string.
+
+        Returns:
+            A full string.
+        """
+
+        return self.__repr__()
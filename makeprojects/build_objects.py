@@ -5,6 +5,48 @@
 Module contains build objects for makeproject.
 
 @package makeprojects.build_objects
+
+@var makeprojects.build_objects._JOB_LIMIT
+Number of jobs build tools may run at once, None for the number of CPUs
+
+@var makeprojects.build_objects._LOAD_LIMIT
+Load average build tools don't start new jobs above, None for no limit
+
+@var makeprojects.build_objects._JOBSERVER
+JobServer shared by the build tools, None if not running
+
+@var makeprojects.build_objects._MEMORY_LIMIT
+Megabytes of memory parallel builds may use, None for physical memory
+
+@var makeprojects.build_objects.RESOURCE_CLASSES
+Megabytes of memory a build of each resource class is expected to use
+
+@var makeprojects.build_objects._HISTORY_FILE
+Default file name of the build time history
+
+@var makeprojects.build_objects._STAMPS_FILE
+Default file name of the build stamp database
+
+@var makeprojects.build_objects._OUTPUT_FOLDERS
+Folders the generated projects write their output to
+
+@var makeprojects.build_objects._REFERENCE_SPLIT
+Regex for splitting a project file into possible pathnames
+
+@var makeprojects.build_objects._OUTPUT_LOCK
+Lock so lines of output from several builds aren't mixed together
+
+@var makeprojects.build_objects._CANCELLED
+Event set when running commands are to be stopped
+
+@var makeprojects.build_objects._STOP_TIMEOUT
+Seconds to wait for a stopped command to exit before killing it
+
+@var makeprojects.build_objects._JOBSERVER_POLL
+Seconds between checks for cancellation while waiting for a token
+
+@var makeprojects.build_objects._BUFFER_SIZE
+Bytes of buffered output kept in memory before it's moved to a file
 """
 
 # pylint: disable=consider-using-f-string
@@ -14,7 +56,633 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import os
 import sys
-from burger import run_command
+import time
+import errno
+import select
+import json
+import hashlib
+import shutil
+import signal
+import tempfile
+import subprocess
+import threading
+import multiprocessing
+from itertools import groupby
+from operator import attrgetter
+from re import compile as re_compile
+from burger import create_folder_if_needed
+
+# Number of jobs build tools may run at once, None for the number of CPUs
+_JOB_LIMIT = None
+
+# Load average build tools don't start new jobs above, None for no limit
+_LOAD_LIMIT = None
+
+# JobServer shared by the build tools, None if not running
+_JOBSERVER = None
+
+# Megabytes of memory parallel builds may use, None for physical memory
+_MEMORY_LIMIT = None
+
+# Single threaded tools are light, tools that run their own jobs are heavy
+RESOURCE_CLASSES = {
+    "light": 256,
+    "heavy": 2048
+}
+
+# Default file name of the build time history
+_HISTORY_FILE = "~/.buildme_history.json"
+
+# Default file name of the build stamp database
+_STAMPS_FILE = "~/.buildme_stamps.json"
+
+# Folders the generated projects write their output to
+_OUTPUT_FOLDERS = ("bin", "temp")
+
+# Quotes, XML and the separators used by makefiles and solutions
+_REFERENCE_SPLIT = re_compile("[\\s\"'<>;=,|&]+")
+
+# Lock so lines of output from several builds aren't mixed together
+_OUTPUT_LOCK = threading.Lock()
+
+# Event set when running commands are to be stopped
+_CANCELLED = threading.Event()
+
+# Seconds to wait for a stopped command to exit before killing it
+_STOP_TIMEOUT = 5.0
+
+# Seconds between checks for cancellation while waiting for a token
+_JOBSERVER_POLL = 0.1
+
+# Bytes of buffered output kept in memory before it's moved to a file
+_BUFFER_SIZE = 1024 * 1024
+
+########################################
+
+
+def set_job_limit(jobs=None, load_average=None):
+    """
+    Set the job budget shared by the build tools.
+
+    ``make`` and ``ninja`` are invoked with these limits instead of running
+    an unlimited number of compilers.
+
+    Args:
+        jobs: Number of jobs to run at once, None for the number of CPUs.
+        load_average: Don't start new jobs above this load, None for no limit
+    Raises:
+        ValueError
+    See Also:
+        get_job_limit, get_job_arguments
+    """
+
+    # pylint: disable=global-statement
+    global _JOB_LIMIT, _LOAD_LIMIT
+
+    if jobs is not None:
+        jobs = int(jobs)
+        if jobs < 1:
+            raise ValueError("The number of jobs must be greater than zero")
+    if load_average is not None:
+        load_average = float(load_average)
+        if load_average <= 0:
+            raise ValueError("The load average must be greater than zero")
+
+    _JOB_LIMIT = jobs
+    _LOAD_LIMIT = load_average
+
+########################################
+
+
+def get_job_limit():
+    """
+    Return the job budget shared by the build tools.
+
+    Returns:
+        Tuple of the number of jobs and the load average limit or None.
+    See Also:
+        set_job_limit
+    """
+
+    jobs = _JOB_LIMIT
+    if jobs is None:
+        try:
+            jobs = multiprocessing.cpu_count()
+        except NotImplementedError:
+            jobs = 1
+    return jobs, _LOAD_LIMIT
+
+########################################
+
+
+def get_job_arguments(use_jobserver=True):
+    """
+    Return the job limit arguments for ``make`` and ``ninja``.
+
+    If the job server is running, the number of jobs is left out so the
+    tools use the job server instead.
+
+    Args:
+        use_jobserver: False if the tool can't use the job server
+    Returns:
+        List of arguments, such as ``["-j", "8", "-l", "6.0"]``.
+    See Also:
+        set_job_limit, start_jobserver
+    """
+
+    jobs, load_average = get_job_limit()
+    result = []
+    if _JOBSERVER is None or not use_jobserver:
+        result.extend(("-j", str(jobs)))
+    if load_average is not None:
+        result.extend(("-l", str(load_average)))
+    return result
+
+########################################
+
+
+def set_memory_limit(megabytes=None):
+    """
+    Set the memory budget for building projects in parallel.
+
+    Args:
+        megabytes: Megabytes of memory, None for the physical memory.
+    Raises:
+        ValueError
+    See Also:
+        get_memory_limit, BuildScheduler
+    """
+
+    # pylint: disable=global-statement
+    global _MEMORY_LIMIT
+
+    if megabytes is not None:
+        megabytes = int(megabytes)
+        if megabytes < 1:
+            raise ValueError("The memory limit must be greater than zero")
+    _MEMORY_LIMIT = megabytes
+
+########################################
+
+
+def get_memory_limit():
+    """
+    Return the memory budget for building projects in parallel.
+
+    If set_memory_limit() wasn't given a value, the amount of physical
+    memory is used. If it can't be determined, such as on Windows, there is
+    no limit.
+
+    Returns:
+        Megabytes of memory or None for no limit.
+    See Also:
+        set_memory_limit
+    """
+
+    if _MEMORY_LIMIT is not None:
+        return _MEMORY_LIMIT
+    try:
+        # Python 2 only accepts str for the names
+        return (os.sysconf(str("SC_PAGE_SIZE")) *
+                os.sysconf(str("SC_PHYS_PAGES"))) // (1024 * 1024)
+    except (AttributeError, TypeError, ValueError, OSError):
+        return None
+
+########################################
+
+
+def create_environment(overlay=None):
+    """
+    Create the environment for a child process.
+
+    The changes are applied to a copy of ``os.environ``, so builds running
+    at the same time don't see each other's changes.
+
+    Args:
+        overlay: Dictionary of variables to set, a value of None removes it.
+    Returns:
+        New dictionary, or None to use ``os.environ`` as is.
+    """
+
+    if not overlay:
+        return None
+
+    env = dict(os.environ)
+    for key, value in overlay.items():
+        if value is None:
+            env.pop(key, None)
+        else:
+            env[key] = value
+    return env
+
+########################################
+
+
+def get_referenced_files(file_name, base_dir=None, folders=False,
+                         follow=None):
+    """
+    Return the files a project or script file refers to.
+
+    The file is scanned for anything that could be a pathname, in quotes,
+    in XML or separated by spaces, ``;`` or ``=``. Names with macros, names
+    of files that don't exist and anything in the ``bin`` and ``temp``
+    output folders are ignored.
+
+    Args:
+        file_name: Pathname of the file to scan
+        base_dir: Directory the names are relative to, None for the file's
+        folders: True to add the files in referenced folders
+        follow: Iterable of file extensions to scan for references too
+    Returns:
+        Sorted list of pathnames, including file_name.
+    """
+
+    file_name = os.path.abspath(file_name)
+    if base_dir is None:
+        base_dir = os.path.dirname(file_name)
+
+    result = {file_name}
+    try:
+        with open(file_name, "rb") as fp:
+            text = fp.read().decode("utf-8", "replace")
+    except (IOError, OSError):
+        return sorted(result)
+
+    for token in set(_REFERENCE_SPLIT.split(text)):
+        # Skip macros like $(OutDir) and %(FileName)
+        if not token or "$" in token or "%" in token:
+            continue
+
+        name = os.path.normpath(
+            os.path.join(base_dir, token.replace("\\", "/")))
+        try:
+            parts = os.path.relpath(name, base_dir).split(os.sep)
+        except ValueError:
+            parts = [name]
+        if parts[0] in _OUTPUT_FOLDERS:
+            continue
+
+        if os.path.isfile(name):
+            result.add(name)
+            if follow and name.lower().endswith(tuple(follow)):
+                result.update(get_referenced_files(name, folders=folders))
+
+        # Add the contents of folders like SOURCE_DIRS, but only the ones
+        # in the project's tree
+        elif folders and parts[0] not in (os.curdir, os.pardir) and \
+                not os.path.isabs(token) and os.path.isdir(name):
+            for item in os.listdir(name):
+                item = os.path.join(name, item)
+                if os.path.isfile(item):
+                    result.add(item)
+    return sorted(result)
+
+########################################
+
+
+class JobServer(object):
+    """
+    GNU make job server shared by the build tools.
+
+    A named pipe is filled with one token for every job, except the one
+    each process is allowed to run without a token. ``make``, ``ninja`` and
+    buildme read a token before starting a job and write it back when the
+    job is done, so all of them together never run more jobs than there are
+    tokens.
+
+    ``make`` is given the file descriptors of the pipe, which every version
+    of GNU make since 3.78 understands. ``ninja`` 1.13 and later and
+    ``make`` 4.4 and later can open the pipe by name.
+
+    Attributes:
+        jobs: Total number of jobs
+        path: Pathname of the named pipe
+        read_fd: File descriptor to read tokens from
+        write_fd: File descriptor to return tokens to
+        _poll_fd: Non blocking file descriptor buildme reads tokens from
+        _folder: Temporary folder holding the named pipe
+    """
+
+    def __init__(self, jobs):
+        """
+        Create the named pipe and fill it with tokens.
+
+        Args:
+            jobs: Total number of jobs, including the implicit one.
+        Raises:
+            OSError
+        """
+
+        self.jobs = jobs
+        self._folder = tempfile.mkdtemp(prefix="buildme")
+        self.path = os.path.join(self._folder, "jobserver")
+        os.mkfifo(self.path, 0o600)
+
+        # Opening the read side first doesn't block if it's non blocking,
+        # after the write side is opened, reads are allowed to block. The
+        # child processes get the blocking descriptor, since old versions
+        # of make don't handle non blocking reads.
+        self._poll_fd = os.open(self.path, os.O_RDONLY | os.O_NONBLOCK)
+        self.write_fd = os.open(self.path, os.O_WRONLY)
+        self.read_fd = os.open(self.path, os.O_RDONLY)
+
+        # The implicit job doesn't need a token
+        if jobs > 1:
+            os.write(self.write_fd, b"+" * (jobs - 1))
+
+    ########################################
+
+    def get_makeflags(self, use_fifo=False):
+        """
+        Return the value of ``MAKEFLAGS`` for a child process.
+
+        Args:
+            use_fifo: True to pass the pipe by name instead of by descriptor
+        Returns:
+            String for the ``MAKEFLAGS`` environment variable.
+        """
+
+        if use_fifo:
+            auth = "fifo:" + self.path
+        else:
+            auth = "{},{}".format(self.read_fd, self.write_fd)
+        return "-j{} --jobserver-auth={}".format(self.jobs, auth)
+
+    ########################################
+
+    def get_environment(self, use_fifo=False, env=None):
+        """
+        Return the environment for a child process using the job server.
+
+        Args:
+            use_fifo: True to pass the pipe by name instead of by descriptor
+            env: Environment to update, None for a copy of os.environ
+        Returns:
+            Environment with ``MAKEFLAGS`` set.
+        """
+
+        if env is None:
+            env = dict(os.environ)
+        env["MAKEFLAGS"] = self.get_makeflags(use_fifo)
+
+        # Old versions of make only check MFLAGS
+        env.pop("MFLAGS", None)
+        return env
+
+    ########################################
+
+    def acquire(self, cancel=None):
+        """
+        Wait for a token to start a job.
+
+        Tokens held by a process that was killed are never returned, so the
+        wait stops if cancel() returns True.
+
+        Args:
+            cancel: Function returning True to stop waiting, None to stop
+                when cancel_commands() is called
+        Returns:
+            The token, it must be passed to release() when the job is done,
+            or None if the wait was cancelled.
+        """
+
+        if cancel is None:
+            cancel = _CANCELLED.is_set
+
+        while not cancel():
+            try:
+                if select.select(
+                        (self._poll_fd,), (), (), _JOBSERVER_POLL)[0]:
+                    token = os.read(self._poll_fd, 1)
+                    if token:
+                        return token
+            except (OSError, select.error) as error:
+                # Retry if interrupted by a signal, or if another process
+                # took the token first
+                if error.args[0] not in (errno.EINTR, errno.EAGAIN):
+                    raise
+        return None
+
+    ########################################
+
+    def release(self, token):
+        """
+        Return a token from acquire() to the job server.
+
+        Args:
+            token: Token returned by acquire().
+        """
+
+        os.write(self.write_fd, token)
+
+    ########################################
+
+    def reset(self):
+        """
+        Refill the pipe with all of the tokens.
+
+        Tokens held by processes that were killed or timed out are lost, so
+        the pipe is refilled when no jobs are running.
+        """
+
+        try:
+            while os.read(self._poll_fd, 256):
+                pass
+        except OSError as error:
+            if error.errno != errno.EAGAIN:
+                raise
+        if self.jobs > 1:
+            os.write(self.write_fd, b"+" * (self.jobs - 1))
+
+    ########################################
+
+    def close(self):
+        """
+        Close the pipe and delete it.
+        """
+
+        for item in (self.read_fd, self.write_fd, self._poll_fd):
+            try:
+                os.close(item)
+            except OSError:
+                pass
+        shutil.rmtree(self._folder, ignore_errors=True)
+
+########################################
+
+
+def start_jobserver():
+    """
+    Start the job server shared by the build tools.
+
+    The number of tokens is taken from get_job_limit(). Job servers need
+    named pipes, so on Windows nothing is started and the tools are given the
+    number of jobs on the command line instead.
+
+    Returns:
+        JobServer instance or None if not supported.
+    See Also:
+        stop_jobserver, get_jobserver
+    """
+
+    # pylint: disable=global-statement
+    global _JOBSERVER
+
+    if _JOBSERVER is None and hasattr(os, "mkfifo"):
+        try:
+            _JOBSERVER = JobServer(get_job_limit()[0])
+        except OSError:
+            _JOBSERVER = None
+    return _JOBSERVER
+
+########################################
+
+
+def stop_jobserver():
+    """
+    Stop the job server started with start_jobserver().
+
+    See Also:
+        start_jobserver
+    """
+
+    # pylint: disable=global-statement
+    global _JOBSERVER
+
+    if _JOBSERVER is not None:
+        _JOBSERVER.close()
+        _JOBSERVER = None
+
+########################################
+
+
+def get_jobserver():
+    """
+    Return the running job server.
+
+    Returns:
+        JobServer instance or None if not running.
+    See Also:
+        start_jobserver
+    """
+
+    return _JOBSERVER
+
+########################################
+
+
+def cancel_commands(cancel=True):
+    """
+    Stop all commands started by BuildObject.run_command().
+
+    Commands that are streaming their output are stopped, and commands
+    started afterwards fail immediately, until this is called with False.
+
+    Args:
+        cancel: True to cancel commands, False to allow them again
+    """
+
+    if cancel:
+        _CANCELLED.set()
+    else:
+        _CANCELLED.clear()
+
+########################################
+
+
+def _copy_output(pipe, output, prefix, log_fp, buffer_fp, lines):
+    """
+    Copy the output of a command line by line.
+
+    Args:
+        pipe: Pipe from the command
+        output: Stream to print to, with each line prefixed
+        prefix: String to insert in front of every line
+        log_fp: Log file to copy the output to as is, or None
+        buffer_fp: Binary file to write to instead of output, or None
+        lines: List to append each line to, or None
+    """
+
+    # pylint: disable=too-many-arguments
+
+    for line in iter(pipe.readline, b""):
+        text = line.decode("utf-8", "replace").rstrip("\r\n")
+        if lines is not None:
+            lines.append(text)
+        text = prefix + text + "\n"
+        with _OUTPUT_LOCK:
+            if log_fp is not None:
+                log_fp.write(line)
+            if buffer_fp is not None:
+                buffer_fp.write(text.encode("utf-8"))
+            else:
+                output.write(text)
+                output.flush()
+    pipe.close()
+
+########################################
+
+
+def _get_process_group_args():
+    """
+    Return the subprocess.Popen arguments to start a process group.
+
+    Streamed commands are started in their own process group, so
+    _stop_process() can stop every process the command started.
+
+    Returns:
+        Dictionary of arguments for subprocess.Popen
+    """
+
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    if sys.version_info[0] >= 3:
+        return {"start_new_session": True}
+    return {"preexec_fn": os.setsid}
+
+########################################
+
+
+def _stop_process(process):
+    """
+    Stop a command started with _get_process_group_args().
+
+    The process group is asked to exit, so ``make``, ``ninja``, ``msbuild``
+    and the others can stop their own jobs. Anything still running after
+    _STOP_TIMEOUT seconds is killed.
+
+    Args:
+        process: subprocess.Popen instance
+    """
+
+    try:
+        if os.name == "nt":
+            os.kill(process.pid, signal.CTRL_BREAK_EVENT)
+        else:
+            os.killpg(process.pid, signal.SIGTERM)
+    except (OSError, AttributeError, ValueError):
+        pass
+
+    deadline = time.time() + _STOP_TIMEOUT
+    while process.poll() is None and time.time() < deadline:
+        time.sleep(0.05)
+
+    # Kill what's left, including children that outlived the command
+    try:
+        if os.name == "nt":
+            if process.poll() is None:
+                with open(os.devnull, "w") as null:
+                    subprocess.call(
+                        ["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                        stdout=null, stderr=null)
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        pass
+    try:
+        process.kill()
+    except OSError:
+        pass
 
 ########################################
 
@@ -100,6 +768,22 @@ class BuildError(object):
 ########################################
 
 
+def _get_log_name(job_name):
+    """
+    Return the file name of the log of a build.
+
+    Args:
+        job_name: Name from BuildObject.get_job_name()
+    Returns:
+        The job name with unsafe characters replaced and ``.log`` appended.
+    """
+
+    return "".join(
+        x if x.isalnum() or x in "-_." else "_" for x in job_name) + ".log"
+
+########################################
+
+
 class BuildObject(object):
     """
     Object describing something to build.
@@ -111,8 +795,27 @@ class BuildObject(object):
         file_name: Name of file to build.
         priority: Numeric priorty in ascending order.
         configuration: Configuration if applicable
+        weight: Number of CPUs the build uses
+        resource_class: Key in RESOURCE_CLASSES for the memory it uses
+        estimate: Seconds the build takes if it's not in the history
+        stream_output: True to prefix the output and save it to a log file
+        buffer_output: True to hold the output until replay_output()
+        timeout: Seconds a command may run before it's stopped, or None
     """
 
+    # Most tools are single threaded and quick
+    weight = 1
+    resource_class = "light"
+    estimate = 5.0
+
+    # Output goes straight to the console with no time limit
+    stream_output = False
+    buffer_output = False
+    timeout = None
+
+    # Output held while buffer_output is True
+    _output_buffer = None
+
     def __init__(self, file_name, priority=None,
                  configuration=None):
         """
@@ -173,24 +876,150 @@ class BuildObject(object):
 
     ########################################
 
-    def run_command(self, cmd, verbose):
+    def get_input_files(self):
         """
-        Issue a command and return the generated BuildError
+        Return the files this build reads.
 
-        Args:
-            cmd: command line to execute
+        Used by BuildStamps to skip builds whose input files haven't
+        changed since the last successful build.
+
+        Returns:
+            List of pathnames, or None if the build must always run.
+        """
+
+        return None
+
+    ########################################
+
+    def get_artifacts(self):
+        """
+        Return the files ``cleanme`` deletes instead of calling clean().
+
+        Used by makeprojects.artifacts.delete_artifacts so projects that
+        know their output files are cleaned without starting their build
+        tools.
+
+        Returns:
+            List of pathnames, or None if clean() must be called.
+        """
+
+        return None
+
+    ########################################
+
+    def get_job_name(self):
+        """
+        Return the name of this build for output and log files.
+
+        Returns:
+            String in the form of ``name|configuration``.
+        """
+
+        name = os.path.basename(self.file_name)
+        if self.configuration:
+            name += "|" + self.configuration
+        return name
+
+    ########################################
+
+    def get_log_file_name(self):
+        """
+        Return the pathname of the log file used with stream_output.
+
+        Logs are saved in the ``temp`` folder next to the file being built.
+
+        Returns:
+            Pathname of the log file.
+        """
+
+        return os.path.join(
+            os.path.dirname(self.file_name), "temp",
+            _get_log_name(self.get_job_name()))
+
+    ########################################
+
+    def replay_output(self, show=True):
+        """
+        Print and release the output held by buffer_output.
+
+        Args:
+            show: False to throw the output away
+        """
+
+        buffer_fp = self._output_buffer
+        if buffer_fp is None:
+            return
+        self._output_buffer = None
+
+        if show:
+            buffer_fp.seek(0)
+            with _OUTPUT_LOCK:
+                for line in buffer_fp:
+                    sys.stdout.write(line.decode("utf-8", "replace"))
+                sys.stdout.flush()
+        buffer_fp.close()
+
+    ########################################
+
+    # pylint: disable=too-many-arguments
+    # pylint: disable=unused-argument
+    def run_command(self, cmd, verbose, jobserver=None, use_fifo=False,
+                    env=None, working_dir=None, stderr_lines=None):
+        """
+        Issue a command and return the generated BuildError
+
+        Neither the current directory nor ``os.environ`` are changed, the
+        working directory and environment changes are only given to the
+        command, so several builds can run at the same time.
+
+        If stream_output is True, every line of output is prefixed with
+        ``[name|configuration]`` and the output is also saved with
+        get_log_file_name(). If timeout is set, the command is stopped if it
+        runs longer. Streamed commands are also stopped by cancel_commands().
+
+        If buffer_output is True, the output isn't printed. It's kept in
+        memory, or a temporary file if it's large, until replay_output() is
+        called once the build is known to have failed or succeeded.
+
+        If a job server is passed, the command is given access to it with
+        ``MAKEFLAGS``.
+
+        Args:
+            cmd: command line to execute
             verbose: True if verbose output is required
+            jobserver: JobServer to share with the command, or None
+            use_fifo: True if the command opens the job server by name
+            env: Dictionary of environment variables to change, or None
+            working_dir: Directory to run in, None for the file's directory
+            stderr_lines: List to append the lines of stderr to, or None
         Returns:
             BuildError object with error condition, if any.
+        See Also:
+            create_environment
         """
 
+        if working_dir is None:
+            working_dir = os.path.dirname(self.file_name)
+        env = create_environment(env)
+
+        kwargs = {}
+        if jobserver is not None:
+            env = jobserver.get_environment(use_fifo, env)
+            if not use_fifo and sys.version_info[0] >= 3:
+                # Python 3 doesn't inherit file descriptors by default
+                kwargs["pass_fds"] = (jobserver.read_fd, jobserver.write_fd)
+
         # Perform the command
         try:
-            error_code = run_command(
-                cmd, working_dir=os.path.dirname(self.file_name),
-                quiet=not verbose)[0]
-            msg = None
-        except OSError as error:
+            if self.stream_output or self.buffer_output or \
+                    self.timeout is not None or stderr_lines is not None:
+                error_code, msg = self._run_streamed(
+                    cmd, working_dir, env, kwargs, stderr_lines)
+            else:
+                error_code = subprocess.Popen(
+                    cmd, cwd=working_dir, env=env, **kwargs).wait()
+                msg = None
+        except (IOError, OSError) as error:
             error_code = getattr(error, "winerror", error.errno)
             msg = str(error)
             print(msg, file=sys.stderr)
@@ -201,6 +1030,94 @@ class BuildObject(object):
 
     ########################################
 
+    # pylint: disable=too-many-locals
+    def _run_streamed(self, cmd, working_dir, env, kwargs, stderr_lines):
+        """
+        Run a command with prefixed output, a log file and a time limit.
+
+        Args:
+            cmd: command line to execute
+            working_dir: Directory to run in
+            env: Environment for the command, None for os.environ
+            kwargs: Other arguments for subprocess.Popen
+            stderr_lines: List to append the lines of stderr to, or None
+        Returns:
+            Error code and message, or None if there was no error.
+        Raises:
+            IOError, OSError
+        """
+
+        if _CANCELLED.is_set():
+            return 10, "Cancelled"
+
+        log_fp = None
+        prefix = ""
+        if self.stream_output:
+            prefix = "[{}] ".format(self.get_job_name())
+            log_file_name = self.get_log_file_name()
+            create_folder_if_needed(os.path.dirname(log_file_name))
+            log_fp = open(log_file_name, "wb")
+
+        # Hold the output until the build is done
+        buffer_fp = None
+        if self.buffer_output:
+            if self._output_buffer is None:
+                self._output_buffer = tempfile.SpooledTemporaryFile(
+                    _BUFFER_SIZE)
+            buffer_fp = self._output_buffer
+
+        kwargs.update(_get_process_group_args())
+        try:
+            process = subprocess.Popen(
+                cmd, cwd=working_dir, env=env, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE, **kwargs)
+
+            readers = []
+            for pipe, output, lines in (
+                    (process.stdout, sys.stdout, None),
+                    (process.stderr, sys.stderr, stderr_lines)):
+                reader = threading.Thread(
+                    target=_copy_output,
+                    args=(pipe, output, prefix, log_fp, buffer_fp, lines))
+                reader.daemon = True
+                reader.start()
+                readers.append(reader)
+
+            # Wait for the command to finish, or stop it
+            msg = None
+            deadline = None
+            if self.timeout is not None:
+                deadline = time.time() + self.timeout
+            try:
+                while process.poll() is None:
+                    if _CANCELLED.is_set():
+                        msg = "Cancelled"
+                    elif deadline is not None and time.time() > deadline:
+                        msg = "Timed out after {} seconds".format(
+                            self.timeout)
+                    else:
+                        time.sleep(0.05)
+                        continue
+                    _stop_process(process)
+                    break
+            except KeyboardInterrupt:
+                # The process group doesn't get the Ctrl-C, pass it on
+                _stop_process(process)
+                raise
+
+            for reader in readers:
+                reader.join()
+            error_code = process.wait()
+        finally:
+            if log_fp is not None:
+                log_fp.close()
+
+        if msg is not None and not error_code:
+            error_code = 10
+        return error_code, msg
+
+    ########################################
+
     def __repr__(self):
         """
         Convert the object into a string.
@@ -230,3 +1147,639 @@ class BuildObject(object):
         """
 
         return self.__repr__()
+
+########################################
+
+
+def _load_json(file_name):
+    """
+    Load a dictionary from a JSON file.
+
+    Args:
+        file_name: Pathname of the JSON file
+    Returns:
+        Dictionary, empty if the file is missing or damaged.
+    """
+
+    result = {}
+    try:
+        with open(file_name, "r") as fp:
+            result = json.load(fp)
+    except (IOError, OSError, ValueError):
+        pass
+    if not isinstance(result, dict):
+        result = {}
+    return result
+
+########################################
+
+
+def _save_json(file_name, data):
+    """
+    Save a dictionary to a JSON file.
+
+    A temporary file is renamed over the old one, so an interrupted save
+    doesn't damage it.
+
+    Args:
+        file_name: Pathname of the JSON file
+        data: Dictionary to save
+    Returns:
+        True if saved, False on error.
+    """
+
+    temp_name = file_name + ".tmp"
+    try:
+        with open(temp_name, "w") as fp:
+            json.dump(data, fp, indent=1, sort_keys=True)
+        if os.path.exists(file_name):
+            os.remove(file_name)
+        os.rename(temp_name, file_name)
+    except (IOError, OSError):
+        return False
+    return True
+
+########################################
+
+
+class BuildHistory(object):
+    """
+    Wall clock times of previous builds.
+
+    Times are keyed by the BuildObject class, file and configuration and
+    stored in a JSON file, by default ``~/.buildme_history.json``. The
+    environment variable ``BUILDME_HISTORY`` can select another file.
+
+    Attributes:
+        file_name: Pathname of the JSON file
+        times: Dictionary of keys and seconds
+        modified: True if times has changed since it was loaded
+    """
+
+    def __init__(self, file_name=None):
+        """
+        Load the history.
+
+        A missing or damaged file is treated as an empty history.
+
+        Args:
+            file_name: Pathname of the JSON file, None for the default
+        """
+
+        if file_name is None:
+            file_name = os.environ.get("BUILDME_HISTORY", _HISTORY_FILE)
+        self.file_name = os.path.expanduser(file_name)
+        self.modified = False
+        self.times = _load_json(self.file_name)
+
+    ########################################
+
+    @staticmethod
+    def get_key(build_object):
+        """
+        Return the history key of a BuildObject.
+
+        Args:
+            build_object: BuildObject to look up
+        Returns:
+            String with the class name, file name and configuration.
+        """
+
+        return "{}|{}|{}".format(
+            type(build_object).__name__, build_object.file_name,
+            build_object.configuration or "")
+
+    ########################################
+
+    def get_estimate(self, build_object):
+        """
+        Return the expected build time of a BuildObject.
+
+        Args:
+            build_object: BuildObject to look up
+        Returns:
+            Seconds from the history, or the class estimate if never built.
+        """
+
+        return self.times.get(
+            self.get_key(build_object), build_object.estimate)
+
+    ########################################
+
+    def record(self, build_object, seconds):
+        """
+        Add a build time to the history.
+
+        The time is averaged with the previous one to smooth out builds
+        that had little or nothing to do.
+
+        Args:
+            build_object: BuildObject that was built
+            seconds: Wall clock time of the build
+        """
+
+        key = self.get_key(build_object)
+        previous = self.times.get(key)
+        if previous is not None:
+            seconds = (previous + seconds) / 2.0
+        self.times[key] = round(seconds, 3)
+        self.modified = True
+
+    ########################################
+
+    def save(self):
+        """
+        Save the history if it was modified.
+
+        Errors are ignored, the history is only a scheduling hint.
+        """
+
+        if self.modified and _save_json(self.file_name, self.times):
+            self.modified = False
+
+########################################
+
+
+def get_stamps_file_name():
+    """
+    Return the pathname of the BuildStamps JSON file.
+
+    Returns:
+        Pathname from ``BUILDME_STAMPS``, or ``~/.buildme_stamps.json``.
+    See Also:
+        BuildStamps
+    """
+
+    return os.path.expanduser(
+        os.environ.get("BUILDME_STAMPS", _STAMPS_FILE))
+
+########################################
+
+
+class BuildStamps(object):
+    """
+    Input digests of successful builds.
+
+    The digest is made from the names, sizes and modification times of the
+    files returned by BuildObject.get_input_files(). It's taken before the
+    build starts and saved if the build succeeds, with the ``bin`` and
+    ``temp`` folders next to the project that exist after the build. If the
+    files haven't changed and the folders are still there by the next build,
+    the BuildObject is skipped.
+
+    Digests are keyed like BuildHistory and stored in a JSON file, by
+    default ``~/.buildme_stamps.json``. The environment variable
+    ``BUILDME_STAMPS`` can select another file.
+
+    Attributes:
+        file_name: Pathname of the JSON file
+        force: True to build everything and only record the digests
+        stamps: Dictionary of keys and digests
+        modified: True if stamps has changed since it was loaded
+        _pending: Dictionary of keys and digests of builds not finished
+    """
+
+    def __init__(self, file_name=None, force=False):
+        """
+        Load the stamps.
+
+        A missing or damaged file is treated as an empty database.
+
+        Args:
+            file_name: Pathname of the JSON file, None for the default
+            force: True to build everything and only record the digests
+        """
+
+        if file_name is None:
+            file_name = get_stamps_file_name()
+        self.file_name = os.path.expanduser(file_name)
+        self.force = force
+        self.modified = False
+        self.stamps = _load_json(self.file_name)
+        self._pending = {}
+
+    ########################################
+
+    @staticmethod
+    def get_digest(build_object):
+        """
+        Return the digest of the input files of a BuildObject.
+
+        Args:
+            build_object: BuildObject to test
+        Returns:
+            String with the SHA1 digest, or None if the build must run.
+        """
+
+        file_names = build_object.get_input_files()
+        if file_names is None:
+            return None
+
+        digest = hashlib.sha1()
+        for item in sorted(file_names):
+            try:
+                stat = os.stat(item)
+                entry = "{}|{}|{!r}\n".format(
+                    item, stat.st_size, stat.st_mtime)
+            except OSError:
+                entry = "{}|missing\n".format(item)
+            digest.update(entry.encode("utf-8"))
+        return digest.hexdigest()
+
+    ########################################
+
+    @staticmethod
+    def get_outputs(build_object):
+        """
+        Return the output folders of a BuildObject that exist.
+
+        Args:
+            build_object: BuildObject to test
+        Returns:
+            String with the names of the folders, separated by commas.
+        """
+
+        folder = os.path.dirname(os.path.abspath(build_object.file_name))
+        return ",".join(x for x in _OUTPUT_FOLDERS
+                        if os.path.isdir(os.path.join(folder, x)))
+
+    ########################################
+
+    def is_current(self, build_object):
+        """
+        Test if a BuildObject has to be built.
+
+        If the build has to run, its digest is held until record() is
+        called and the old digest is removed, so a failed build isn't
+        skipped next time.
+
+        Args:
+            build_object: BuildObject to test
+        Returns:
+            True if the input files are unchanged since the last build and
+            the output folders weren't deleted.
+        """
+
+        key = BuildHistory.get_key(build_object)
+        digest = self.get_digest(build_object)
+        if digest is None:
+            return False
+
+        # Deleted output folders have to be built again
+        if not self.force and self.stamps.get(key) == "{}|{}".format(
+                digest, self.get_outputs(build_object)):
+            return True
+
+        self._pending[key] = digest
+        if self.stamps.pop(key, None) is not None:
+            self.modified = True
+        return False
+
+    ########################################
+
+    def get_outdated(self, build_objects, verbose=False):
+        """
+        Remove the BuildObjects that don't need to be built.
+
+        Call this right before the builds start, since builds with a
+        lower priority may change the input files.
+
+        Args:
+            build_objects: Iterable of BuildObjects
+            verbose: True to list the BuildObjects that are skipped
+        Returns:
+            List of the BuildObjects to build.
+        """
+
+        result = []
+        for build_object in build_objects:
+            if self.is_current(build_object):
+                if verbose:
+                    print("{} is up to date".format(
+                        build_object.get_job_name()))
+            else:
+                result.append(build_object)
+        return result
+
+    ########################################
+
+    def record(self, build_object):
+        """
+        Save the digest of a successful build.
+
+        The output folders that exist now are saved with the digest.
+
+        Args:
+            build_object: BuildObject that was built
+        """
+
+        key = BuildHistory.get_key(build_object)
+        digest = self._pending.pop(key, None)
+        if digest is not None:
+            self.stamps[key] = "{}|{}".format(
+                digest, self.get_outputs(build_object))
+            self.modified = True
+
+    ########################################
+
+    def forget(self, folder):
+        """
+        Remove the digests of all files in a folder.
+
+        Called when the folder is cleaned, so the next build isn't skipped.
+
+        Args:
+            folder: Pathname of the folder, subfolders are included
+        """
+
+        folder = os.path.join(os.path.abspath(folder), "")
+        for key in list(self.stamps):
+            file_name = key.split("|", 1)[-1].rsplit("|", 1)[0]
+            if file_name.startswith(folder):
+                del self.stamps[key]
+                self.modified = True
+
+    ########################################
+
+    def save(self):
+        """
+        Save the stamps if they were modified.
+
+        Errors are ignored, the next build will run everything.
+        """
+
+        if self.modified and _save_json(self.file_name, self.stamps):
+            self.modified = False
+
+########################################
+
+
+class BuildScheduler(object):
+    """
+    Build BuildObjects in parallel within a CPU and memory budget.
+
+    BuildObjects with the same priority are built at the same time, as long
+    as the sum of their weights fits in the CPU budget and the memory of
+    their resource classes fits in the memory budget. A BuildObject that
+    is too large for the budget is built when nothing else is running.
+    Lighter BuildObjects fill in the gaps left by the heavy ones. A file is
+    never built twice at the same time, since the IDEs lock their project
+    files.
+
+    Within a priority, the BuildObjects expected to take the longest are
+    started first, so a long build doesn't start last. The times come from
+    the BuildHistory, which is updated as builds finish.
+
+    Each BuildObject has stream_output set, so the lines of output say which
+    build they came from and the full output is saved in a log file.
+
+    If ``fatal`` is set, the first failure stops the builds that are still
+    running with cancel_commands(), so the build ends within seconds
+    instead of when the slowest build is done.
+
+    If the job server is running, a token is taken for every BuildObject
+    after the first, so child ``make`` and ``ninja`` processes see them as
+    running jobs.
+
+    Attributes:
+        jobs: CPU budget
+        memory: Megabytes of memory budget, None for no limit
+        history: BuildHistory with the build times, None to not record
+        verbose: True to show buffered output of builds that succeeded
+        stamps: BuildStamps to skip and record builds, None to not use
+        _condition: Lock and signal for finished builds
+        _finished: List of BuildObject, result, error, seconds of builds
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, jobs=None, memory=None, history=None, verbose=False,
+                 stamps=None):
+        """
+        Set the budgets.
+
+        Args:
+            jobs: CPU budget, None for get_job_limit()
+            memory: Megabytes of memory budget, None for get_memory_limit()
+            history: BuildHistory to order and record builds
+            verbose: True to show buffered output of builds that succeeded
+            stamps: BuildStamps to skip builds that are up to date
+        """
+
+        if jobs is None:
+            jobs = get_job_limit()[0]
+        if memory is None:
+            memory = get_memory_limit()
+
+        self.jobs = jobs
+        self.memory = memory
+        self.history = history
+        self.verbose = verbose
+        self.stamps = stamps
+        self._condition = threading.Condition()
+        self._finished = []
+
+    ########################################
+
+    def get_cost(self, build_object):
+        """
+        Return the CPUs and memory a BuildObject uses.
+
+        Costs larger than the budget are reduced to the budget.
+
+        Args:
+            build_object: BuildObject to test
+        Returns:
+            Tuple of CPUs and megabytes of memory.
+        """
+
+        weight = min(max(int(build_object.weight), 1), self.jobs)
+        memory = RESOURCE_CLASSES.get(build_object.resource_class, 0)
+        if self.memory is not None:
+            memory = min(memory, self.memory)
+        return weight, memory
+
+    ########################################
+
+    def _build(self, build_object):
+        """
+        Build a BuildObject on a worker thread.
+
+        Args:
+            build_object: BuildObject to build
+        """
+
+        result = None
+        error = None
+        start = time.time()
+        try:
+            result = build_object.build()
+        except Exception as exception:   # pylint: disable=broad-except
+            error = exception
+        elapsed = time.time() - start
+
+        # Show the buffered output of failed builds
+        build_object.replay_output(
+            self.verbose or error is not None or
+            bool(result is not None and result.error))
+        with self._condition:
+            self._finished.append((build_object, result, error, elapsed))
+            self._condition.notify()
+
+    ########################################
+
+    def _stop_waiting(self):
+        """
+        Test if waiting for a job server token should stop.
+
+        Returns:
+            True if the build was cancelled or another build finished.
+        """
+
+        if _CANCELLED.is_set():
+            return True
+        with self._condition:
+            return bool(self._finished)
+
+    ########################################
+
+    def run(self, build_objects, results, fatal=False):
+        """
+        Build a list of BuildObjects in priority order.
+
+        Args:
+            build_objects: Iterable of BuildObjects to build
+            results: list object to append BuildError objects
+            fatal: True to stop after the first error
+        Returns:
+            True if processing should abort, False if not.
+        """
+
+        # Build each priority in turn
+        build_objects = sorted(build_objects, key=attrgetter("priority"))
+        for _, group in groupby(build_objects, attrgetter("priority")):
+            group = list(group)
+            if self.stamps is not None:
+                group = self.stamps.get_outdated(group, self.verbose)
+            if self._run_group(group, results, fatal):
+                return True
+        return False
+
+    ########################################
+
+    def _run_group(self, pending, results, fatal):
+        """
+        Build BuildObjects with the same priority.
+
+        Args:
+            pending: List of BuildObjects to build
+            results: list object to append BuildError objects
+            fatal: True to stop after the first error
+        Returns:
+            True if processing should abort, False if not.
+        """
+
+        # pylint: disable=too-many-branches
+        # pylint: disable=too-many-statements
+
+        # Longest processing time first
+        if self.history is not None:
+            pending.sort(key=self.history.get_estimate, reverse=True)
+        else:
+            pending.sort(key=attrgetter("estimate"), reverse=True)
+
+        jobserver = get_jobserver()
+        running = {}
+        busy_files = set()
+        tokens = []
+        used_jobs = 0
+        used_memory = 0
+        abort = False
+        exception = None
+
+        while running or (pending and not abort):
+
+            # Start everything that fits in the budget
+            index = 0
+            while not abort and index < len(pending):
+                build_object = pending[index]
+                weight, memory = self.get_cost(build_object)
+                if build_object.file_name in busy_files or running and (
+                        used_jobs + weight > self.jobs or
+                        (self.memory is not None and
+                         used_memory + memory > self.memory)):
+                    index += 1
+                    continue
+
+                # The first build uses the job server's implicit job
+                if running and jobserver is not None:
+                    token = jobserver.acquire(self._stop_waiting)
+
+                    # Handle the builds that finished first
+                    if token is None:
+                        break
+                    tokens.append(token)
+
+                # Output from builds running together is prefixed
+                build_object.stream_output = True
+
+                del pending[index]
+                used_jobs += weight
+                used_memory += memory
+                thread = threading.Thread(
+                    target=self._build, args=(build_object,))
+                running[id(build_object)] = (weight, memory, thread)
+                busy_files.add(build_object.file_name)
+                thread.daemon = True
+                thread.start()
+
+            # Wait for a build to finish
+            try:
+                with self._condition:
+                    while not self._finished:
+                        self._condition.wait()
+                    finished = self._finished
+                    self._finished = []
+            except KeyboardInterrupt:
+                # Stop the running builds before giving up
+                cancel_commands()
+                for item in running.values():
+                    item[2].join(_STOP_TIMEOUT * 2)
+                cancel_commands(False)
+                raise
+
+            for build_object, result, error, elapsed in finished:
+                weight, memory, _ = running.pop(id(build_object))
+                busy_files.discard(build_object.file_name)
+                used_jobs -= weight
+                used_memory -= memory
+                if tokens:
+                    jobserver.release(tokens.pop())
+
+                if error is not None:
+                    exception = error
+                    if not abort:
+                        abort = True
+                        cancel_commands()
+                    continue
+
+                # Failed builds don't take the usual time
+                if result is None or not result.error:
+                    if self.history is not None:
+                        self.history.record(build_object, elapsed)
+                    if self.stamps is not None:
+                        self.stamps.record(build_object)
+                if result is not None:
+                    results.append(result)
+                    if result.error and fatal and not abort:
+                        # Stop everything else that's running
+                        abort = True
+                        cancel_commands()
+
+        # Allow commands again
+        if abort:
+            cancel_commands(False)
+
+        # Pass exceptions on to the caller once the other builds are done
+        if exception is not None:
+            raise exception
+        return abort
@@ -68,6 +68,9 @@ CONTINUE = False
 # Can be overridden above
 DEPENDENCIES = None
 
+# ``cleanme`` will delete these files and folders without calling clean().
+# CLEAN_PATTERNS = ["temp", "bin", "*.d"]
+
 # If set to True, ``cleanme -r`` will not parse directories in this folder.
 # Overrides NO_RECURSE
 # CLEANME_NO_RECURSE = True
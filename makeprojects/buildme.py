@@ -28,8 +28,11 @@ from .config import BUILD_RULES_PY, _XCODEPROJECT_FILE, _XCODEPROJ_MATCH
 from .__init__ import __version__
 from .util import get_build_rules, was_processed, getattr_build_rules_list, \
     fixup_args, getattr_build_rules, do_generate_build_rules
-from .build_objects import BuildError
+from .build_objects import BuildError, set_job_limit, get_job_limit, \
+    start_jobserver, stop_jobserver, get_jobserver, BuildScheduler, \
+    BuildHistory, BuildStamps, RESOURCE_CLASSES, get_stamps_file_name
 from .modules import add_documentation_modules, MODULES
+from . import cleanme
 from .python import create_simple_script_object, create_build_rules_objects
 from .python import match as python_match
 
@@ -53,6 +56,11 @@ def create_parser():
     - files string array of project files to process
     - configurations string array of configurations to process
     - documentation boolean if Doxygen is be executed
+    - jobs integer number of jobs for make and ninja
+    - load_average float load average limit for make and ninja
+    - incremental boolean skip projects whose files haven't changed
+    - force boolean build everything and update the stamps
+    - clean boolean clean each directory before building it
     - args string array of unknown parameters
 
     Returns:
@@ -106,6 +114,43 @@ def create_parser():
     parser.add_argument("-docs", dest="documentation", action="store_true",
                         default=False, help="Compile Doxyfile files.")
 
+    parser.add_argument("-j", dest="jobs", type=int, metavar="<jobs>",
+                        help="Number of jobs make and ninja may run at once, "
+                        "the default is the number of CPUs.")
+
+    parser.add_argument("-l", dest="load_average", type=float,
+                        metavar="<load>",
+                        help="Don't start new jobs if the load average "
+                        "is above this value.")
+
+    parser.add_argument("--timeout", dest="timeout", type=float,
+                        metavar="<seconds>",
+                        help="Stop any build that runs longer than this.")
+
+    parser.add_argument("--errors-only", dest="errors_only",
+                        action="store_true", default=False,
+                        help="Only show the output of builds that failed.")
+
+    parser.add_argument("--incremental", dest="incremental",
+                        action="store_true", default=False,
+                        help="Skip projects whose files haven't changed "
+                        "since they were last built.")
+
+    parser.add_argument("--force", dest="force", action="store_true",
+                        default=False,
+                        help="Build everything, even with --incremental, "
+                        "and update the stamps.")
+
+    parser.add_argument("--clean", dest="clean", action="store_true",
+                        default=False,
+                        help="Clean each directory right before building "
+                        "it.")
+
+    parser.add_argument("-p", dest="parallel", action="store_true",
+                        default=False,
+                        help="Build projects with the same priority "
+                        "at the same time.")
+
     parser.add_argument("args", nargs=argparse.REMAINDER,
                         help="project filenames")
 
@@ -174,7 +219,7 @@ def add_build_rules(projects, file_name, args, build_rules=None):
 ########################################
 
 
-def add_project(projects, processed, file_name, args):
+def add_project(projects, processed, file_name, args, cleans=None):
     """
     Detect the project type and add it to the list.
 
@@ -183,6 +228,7 @@ def add_project(projects, processed, file_name, args):
         processed: List of directories already processed.
         file_name: Pathname to the build_rules.py file.
         args: Args for determining verbosity for output.
+        cleans: List of projects to clean, None to not clean.
     Returns:
         True if the file was buildable, False if not.
     """
@@ -221,6 +267,14 @@ def add_project(projects, processed, file_name, args):
                     file_name,
                     configurations=args.configurations,
                     verbose=args.verbose))
+
+            # Clean it first?
+            if cleans is not None:
+                cleans.extend(
+                    module.create_clean_object(
+                        file_name,
+                        configurations=args.configurations,
+                        verbose=args.verbose))
             return True
 
     return False
@@ -228,12 +282,25 @@ def add_project(projects, processed, file_name, args):
 ########################################
 
 
-def process_projects(results, projects, args):
+def process_projects(results, projects, args, cleans=None):
     """
     Process a list of projects
 
     Sort the projects by priority and build all of them.
+
+    Args:
+        results: list object to append BuildError objects
+        projects: List of projects to build.
+        args: parsed argument list
+        cleans: List of projects to clean before building, or None.
+    Returns:
+        True if processing should abort, False if not.
     """
+
+    # Clean the projects in this directory first
+    if cleans and cleanme.process_projects(results, cleans, args):
+        return True
+
     # Sort the list by priority (The third parameter is priority from 1-99)
     error = 0
     projects = sorted(projects, key=attrgetter("priority"))
@@ -245,13 +312,39 @@ def process_projects(results, projects, args):
             print(project)
         return False
 
+    # Apply the time limit and output mode
+    for project in projects:
+        if args.timeout is not None:
+            project.timeout = args.timeout
+        project.buffer_output = args.errors_only
+
+    # Stamps loaded only for cleaning aren't used by the build
+    stamps = args.stamps if args.incremental or args.force else None
+
+    # Let the scheduler build them in parallel
+    if args.parallel:
+        return BuildScheduler(
+            history=args.history, verbose=args.verbose,
+            stamps=stamps).run(projects, results, args.fatal)
+
     # Build all the projects
     for project in projects:
+
+        # Skip it if nothing changed since the last build
+        if stamps is not None and \
+                not stamps.get_outdated((project,), args.verbose):
+            continue
+
         berror = project.build()
         error = 0
         if berror is not None:
             results.append(berror)
             error = berror.error
+        if not error and stamps is not None:
+            stamps.record(project)
+
+        # Show the buffered output of failed builds
+        project.replay_output(args.verbose or bool(error))
 
         # Abort on error?
         if error and args.fatal:
@@ -261,23 +354,61 @@ def process_projects(results, projects, args):
 ########################################
 
 
+def set_build_weights(projects, build_rules_list):
+    """
+    Apply the weight overrides from ``build_rules.py``.
+
+    ``BUILDME_WEIGHTS`` and ``BUILDME_RESOURCE_CLASSES`` are dictionaries
+    keyed by the BuildObject class name, such as ``BuildMakeFile``.
+
+    Args:
+        projects: List of BuildObjects to update
+        build_rules_list: List of ``build_rules.py`` instances.
+    Raises:
+        ValueError
+    """
+
+    weights = getattr_build_rules_list(
+        build_rules_list, ("BUILDME_WEIGHTS", "WEIGHTS"), None)
+    resource_classes = getattr_build_rules_list(
+        build_rules_list, ("BUILDME_RESOURCE_CLASSES", "RESOURCE_CLASSES"),
+        None)
+
+    for project in projects:
+        name = type(project).__name__
+        if weights and name in weights:
+            project.weight = int(weights[name])
+        if resource_classes and name in resource_classes:
+            resource_class = resource_classes[name]
+            if resource_class not in RESOURCE_CLASSES:
+                raise ValueError(
+                    "Resource class \"{}\" is not one of {}".format(
+                        resource_class, sorted(RESOURCE_CLASSES)))
+            project.resource_class = resource_class
+
+########################################
+
+
 def process_files(results, processed, files, args):
     """
     Process a list of files.
     """
     projects = []
+    cleans = [] if args.clean else None
     for item in files:
         full_name = os.path.abspath(item)
         base_name = os.path.basename(full_name)
         if base_name == args.rules_file:
             if not was_processed(processed, full_name, args.verbose):
+                if cleans is not None:
+                    cleanme.add_clean_rules(cleans, None, full_name, args)
                 process_dependencies(
                     results, processed, add_build_rules(
                         projects, full_name, args), args)
-        elif not add_project(projects, processed, full_name, args):
+        elif not add_project(projects, processed, full_name, args, cleans):
             print("\"{}\" is not supported.".format(full_name))
             return True
-    return process_projects(results, projects, args)
+    return process_projects(results, projects, args, cleans)
 
 ########################################
 
@@ -327,6 +458,23 @@ def process_directories(results, processed, directories, args):
         # Pass one, create a list of all projects to build
         projects = []
 
+        # With --clean, the clean objects are found in the same pass
+        cleans = None
+        file_cleans = None
+        if args.clean:
+            cleans = []
+            clean_rules_list = get_build_rules(
+                working_directory, args.verbose, args.rules_file, "CLEANME")
+            for build_rules in clean_rules_list:
+                cleanme.add_clean_rules(
+                    cleans, working_directory, build_rules.__file__, args,
+                    build_rules)
+            if getattr_build_rules_list(
+                    clean_rules_list,
+                    ("CLEANME_PROCESS_PROJECT_FILES",
+                     "PROCESS_PROJECT_FILES"), True):
+                file_cleans = cleans
+
         # Process all of the dependencies first, then this folder
         for build_rules in build_rules_list:
             if not was_processed(processed, build_rules.__file__, args.verbose):
@@ -346,7 +494,8 @@ def process_directories(results, processed, directories, args):
 
                     # Check if it's an xcode project file, if so, add it
                     if not add_project(projects, processed, os.path.join(
-                            full_name, _XCODEPROJECT_FILE), args):
+                            full_name, _XCODEPROJECT_FILE), args,
+                            file_cleans):
                         print(
                             "\"{}\" is not supported on this platform.".format(
                                 full_name))
@@ -365,11 +514,44 @@ def process_directories(results, processed, directories, args):
             # It's a file, process it, if possible
             # Don't double process the rules file
             if args.rules_file != entry:
-                add_project(projects, processed, full_name, args)
+                add_project(projects, processed, full_name, args, file_cleans)
+
+        # Use the job count from build_rules.py unless -j was passed
+        if args.jobs is None:
+            jobs = None
+            rules_file = working_directory
+            for build_rules in build_rules_list:
+                jobs, hit = getattr_build_rules(
+                    build_rules, ("BUILDME_JOBS", "JOBS"))
+                if hit:
+                    rules_file = build_rules.__file__
+                    break
+
+            try:
+                set_job_limit(jobs, args.load_average)
+            except (TypeError, ValueError) as error:
+                msg = "BUILDME_JOBS = {!r} is not valid, {}".format(
+                    jobs, error)
+                results.append(BuildError(10, rules_file, msg=msg))
+                if args.fatal:
+                    return True
+
+        # Tokens held by builds that were killed are never returned, so refill
+        # the job server, it's only restarted if the number of jobs changed
+        jobserver = get_jobserver()
+        if jobserver is not None:
+            if jobserver.jobs != get_job_limit()[0]:
+                stop_jobserver()
+                start_jobserver()
+            else:
+                jobserver.reset()
+
+        # Use the weights from build_rules.py for the parallel builds
+        set_build_weights(projects, build_rules_list)
 
-        # The list is ready, process it in priority order
+        # The list is ready, clean it if needed, process it in priority order
         # and then loop to the next directory to process
-        temp = process_projects(results, projects, args)
+        temp = process_projects(results, projects, args, cleans)
         if temp:
             return temp
     return False
@@ -427,6 +609,14 @@ def main(working_directory=None, args=None):
     - ``-d``, List of directories to build.
     - ``-c``, List of configurations to build
     - ``-docs``, Compile Doxyfile files.
+    - ``-j``, Number of jobs make and ninja may run at once.
+    - ``-l``, Load average limit for make and ninja.
+    - ``-p``, Build projects with the same priority in parallel.
+    - ``--timeout``, Stop builds that take longer than this many seconds.
+    - ``--errors-only``, Only show the output of builds that failed.
+    - ``--incremental``, Skip projects whose files haven't changed.
+    - ``--force``, Build everything anyway, but update the stamps.
+    - ``--clean``, Clean each directory right before building it.
     - Additional terms are considered specific files or configurations to build.
 
     Args:
@@ -456,6 +646,31 @@ def main(working_directory=None, args=None):
     # Handle extra arguments
     fixup_args(parsed)
 
+    # Set the job budget for make and ninja
+    if parsed.jobs is not None and parsed.jobs < 1:
+        parser.error("-j must be greater than zero")
+    if parsed.load_average is not None and parsed.load_average <= 0:
+        parser.error("-l must be greater than zero")
+    if parsed.timeout is not None and parsed.timeout <= 0:
+        parser.error("--timeout must be greater than zero")
+    set_job_limit(parsed.jobs, parsed.load_average)
+
+    # Share the jobs between all the make and ninja processes
+    start_jobserver()
+
+    # Parallel builds start the slowest projects first
+    parsed.history = BuildHistory() if parsed.parallel else None
+
+    # Skip projects that were built and haven't changed, a rebuild
+    # builds everything and updates the stamps
+    parsed.stamps = None
+    if parsed.incremental or parsed.force:
+        parsed.stamps = BuildStamps(force=parsed.force or parsed.clean)
+
+    # Cleaning only removes the stamps of the cleaned folders
+    elif parsed.clean and os.path.isfile(get_stamps_file_name()):
+        parsed.stamps = BuildStamps()
+
     # Get lists of files/directories to build
     files = parsed.files
     directories = parsed.directories
@@ -472,11 +687,18 @@ def main(working_directory=None, args=None):
     if parsed.documentation:
         add_documentation_modules()
 
-    # Try building all individual files first
-    if not process_files(results, processed, files, parsed):
-
-        # If successful, process all directories
-        process_directories(results, processed, directories, parsed)
+    try:
+        # Try building all individual files first
+        if not process_files(results, processed, files, parsed):
+
+            # If successful, process all directories
+            process_directories(results, processed, directories, parsed)
+    finally:
+        stop_jobserver()
+        if parsed.history is not None:
+            parsed.history.save()
+        if parsed.stamps is not None:
+            parsed.stamps.save()
 
     # Was there a build error?
     error = 0
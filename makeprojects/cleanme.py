@@ -31,7 +31,9 @@ from .__init__ import __version__
 from .util import get_build_rules, getattr_build_rules_list, was_processed, \
     fixup_args, clear_build_rules_cache, getattr_build_rules, \
     do_generate_build_rules
-from .build_objects import BuildError
+from .build_objects import BuildError, BuildStamps, get_stamps_file_name
+from .artifacts import BuildArtifacts, delete_artifacts, \
+    delete_build_artifacts
 from .modules import MODULES
 from .python import create_clean_rules_objects, BuildPythonFile
 
@@ -48,6 +50,7 @@ def create_parser():
     - recursive boolean for directory recursion
     - verbose boolean for verbose output
     - preview boolean for previewing the clean process
+    - dry_run boolean for reporting the files that would be deleted
     - generate_build_rules boolean create build rules and exit
     - rules_file string override build_rules.py
     - fatal boolean abort if error occurs in processing
@@ -74,6 +77,11 @@ def create_parser():
     parser.add_argument("-n", "-preview", dest="preview", action="store_true",
                         default=False, help="Preview clean commands.")
 
+    parser.add_argument("--dry-run", dest="dry_run", action="store_true",
+                        default=False,
+                        help="Report the number of files and bytes that "
+                        "would be deleted.")
+
     parser.add_argument("-v", "-verbose", dest="verbose", action="store_true",
                         default=False, help="Verbose output.")
 
@@ -167,6 +175,13 @@ def add_clean_rules(projects, working_directory,
                 build_rules,
                 parms,
                 args.verbose))
+
+        # Files to delete without a clean() function
+        patterns = getattr_build_rules(
+            build_rules, "CLEAN_PATTERNS", None)[0]
+        if patterns:
+            projects.append(
+                BuildArtifacts(file_name, working_directory, patterns))
     return dependencies
 
 
@@ -216,8 +231,12 @@ def process_projects(results, projects, args):
     """
     Process a list of projects
 
-    Sort the projects by priority and build all of them.
+    Sort the projects by priority and clean all of them. The files of
+    projects that know them are deleted without starting their build tools.
     """
+
+    # pylint: disable=too-many-branches
+
     # Sort the list by priority (The third parameter is priority from 1-99)
     error = 0
     projects = sorted(projects, key=attrgetter("priority"))
@@ -229,20 +248,43 @@ def process_projects(results, projects, args):
             print(project)
         return False
 
+    # buildme --clean doesn't have a dry run
+    if getattr(args, "dry_run", False):
+        artifacts = [(x, x.get_artifacts()) for x in projects]
+        report_artifacts(
+            [x for x in artifacts if x[1] is not None],
+            [x[0] for x in artifacts if x[1] is None])
+        return False
+
     # Clean all the projects
     # Note, python objects are a special case, if any return a
-    # non "None" error code, don't call any others
+    # non "None" error code, don't call any others, and the
+    # CLEAN_PATTERNS of the other build_rules.py files aren't deleted
 
-    python_none = False
+    python_none = None
     for project in projects:
 
         # Skip all python clean objects if a numeric error code
         # was already obtained
-        if isinstance(project, BuildPythonFile) and python_none:
-            continue
-
-        berror = project.clean()
+        if python_none is not None:
+            if isinstance(project, BuildPythonFile):
+                continue
+            if isinstance(project, BuildArtifacts) and \
+                    project.file_name != python_none:
+                continue
+
+        # Projects that know their files don't need their build tools
+        paths = project.get_artifacts()
+        if paths is None:
+            berror = project.clean()
+        else:
+            berror = delete_build_artifacts(project, paths)
         error = 0
+
+        # The next incremental build has to rebuild the folder
+        if args.stamps is not None:
+            args.stamps.forget(os.path.dirname(project.file_name))
+
         if berror is not None:
             results.append(berror)
             error = berror.error
@@ -251,7 +293,7 @@ def process_projects(results, projects, args):
             if error is not None:
                 if isinstance(project, BuildPythonFile):
                     # Don't parse any more python "clean" scripts
-                    python_none = True
+                    python_none = project.file_name
 
         # Abort on error?
         if error and args.fatal:
@@ -261,6 +303,26 @@ def process_projects(results, projects, args):
 ########################################
 
 
+def report_artifacts(artifacts, projects):
+    """
+    Print what a clean would do without deleting anything.
+
+    Args:
+        artifacts: List of tuples of projects and the files they delete
+        projects: List of projects that run their build tools to clean
+    """
+
+    for project, paths in artifacts:
+        files, size, _ = delete_artifacts(paths, dry_run=True)
+        print("{} would delete {} files, {} bytes".format(
+            project.file_name, files, size))
+
+    for project in projects:
+        print("Would run {}".format(project))
+
+########################################
+
+
 def process_files(results, processed, files, args):
     """
     Process a list of files.
@@ -431,6 +493,7 @@ def main(working_directory=None, args=None):
     - ``-r``, Perform a recursive clean.
     - ``-v``, Verbose output.
     - ``-n``, Preview clean commands
+    - ``--dry-run``, Report the files that would be deleted
     - ``--generate-rules``, Create build_rules.py and exit.
     - ``--rules-file``, Override the configruration file.
     - ``-q``, Quit after the first error
@@ -476,11 +539,19 @@ def main(working_directory=None, args=None):
     results = []
     processed = set()
 
+    # Stamps of incremental builds of the cleaned folders are removed, if
+    # there are any
+    parsed.stamps = None
+    if os.path.isfile(get_stamps_file_name()):
+        parsed.stamps = BuildStamps()
+
     # Try building all individual files first
     if not process_files(results, processed, files, parsed):
 
         # If successful, process all directories
         process_directories(results, processed, directories, parsed)
+    if parsed.stamps is not None:
+        parsed.stamps.save()
 
     # Was there a build error?
     error = 0
@@ -34,10 +34,11 @@ import os
 import sys
 from re import compile as re_compile
 import xml.etree.ElementTree as ET
-from burger import save_text_file_if_newer, convert_to_linux_slashes, \
-    where_is_codeblocks, get_windows_host_type
+from burger import convert_to_linux_slashes, where_is_codeblocks, \
+    get_windows_host_type
 from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_referenced_files
+from .core import get_file_lists
 
 _CBPFILE_MATCH = re_compile('(?is).*\\.cbp\\Z')
 
@@ -107,6 +108,11 @@ class BuildCodeBlocksFile(BuildObject):
         verbose: The verbose flag
     """
 
+    # Code::Blocks runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     # pylint: disable=too-many-arguments
     def __init__(self, file_name, priority, configuration,
                  verbose=False):
@@ -192,6 +198,20 @@ class BuildCodeBlocksFile(BuildObject):
 
     ########################################
 
+    def get_input_files(self):
+        """
+        Return the files this build reads.
+
+        The project and the files it contains.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(self.file_name)
+
+    ########################################
+
     def clean(self):
         """
         Delete temporary files.
@@ -382,16 +402,16 @@ class Project(object):
         self.configuration_list = []
         self.configuration_names = []
 
+        # Process the filenames, the projects are scanned in parallel
+        get_file_lists(solution.project_list, [FileTypes.h,
+                                               FileTypes.cpp,
+                                               FileTypes.c,
+                                               FileTypes.x86,
+                                               ])
+
         # Process all the projects and configurations
         for project in solution.project_list:
 
-            # Process the filenames
-            project.get_file_list([FileTypes.h,
-                                   FileTypes.cpp,
-                                   FileTypes.c,
-                                   FileTypes.x86,
-                                   ])
-
             # Add to the master list
             self.configuration_list.extend(project.configuration_list)
 
@@ -618,10 +638,9 @@ def generate(solution):
         return error
 
     # Save the file if it changed
-    save_text_file_if_newer(
+    solution.file_batch.save_text_file_if_newer(
         os.path.join(solution.working_directory, solution.codeblocks_filename),
         codeblocks_lines,
         bom=False,
-        perforce=solution.perforce,
-        verbose=solution.verbose)
+        perforce=solution.perforce)
     return 0
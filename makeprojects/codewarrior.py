@@ -56,12 +56,13 @@ from struct import unpack as struct_unpack
 from re import compile as re_compile
 from burger import save_text_file_if_newer, perforce_edit, PY2, is_string, \
     convert_to_linux_slashes, convert_to_windows_slashes, truefalse, \
-    read_zero_terminated_string, get_windows_host_type, run_command, \
+    read_zero_terminated_string, get_windows_host_type, \
     create_folder_if_needed, get_mac_host_type, is_codewarrior_mac_allowed
 from burger.buildutils import _WINDOWS_ENV_PATHS
 from .enums import FileTypes, ProjectTypes, IDETypes, PlatformTypes, \
     source_file_filter
 from .build_objects import BuildObject, BuildError
+from .core import get_file_lists
 
 _MCPFILE_MATCH = re_compile("(?is).*\\.mcp\\Z")
 
@@ -205,6 +206,12 @@ class BuildCodeWarriorFile(BuildObject):
         linkers: The linker list
     """
 
+    # The IDE builds one project at a time, so nothing else can run with it
+    # and builds take a while
+    weight = 256
+    resource_class = "heavy"
+    estimate = 60.0
+
     # pylint: disable=too-many-arguments
     def __init__(self, file_name, priority, configuration,
                  verbose=False, linkers=None):
@@ -344,23 +351,12 @@ class BuildCodeWarriorFile(BuildObject):
         if self.verbose:
             print(' '.join(cmd))
 
-        try:
-            error_code = run_command(
-                cmd, working_dir=os.path.dirname(self.file_name),
-                quiet=not self.verbose)[0]
-            msg = None
-            if error_code and error_code < len(CODEWARRIOR_ERRORS):
-                msg = CODEWARRIOR_ERRORS[error_code]
-        except OSError as error:
-            error_code = getattr(error, "winerror", error.errno)
-            msg = str(error)
-            print(msg, file=sys.stderr)
-
-        return BuildError(
-            error_code,
-            self.file_name,
-            configuration=self.configuration,
-            msg=msg)
+        result = self.run_command(cmd, self.verbose)
+        error_code = result.error
+        if result.msg is None and error_code and \
+                error_code < len(CODEWARRIOR_ERRORS):
+            result.msg = CODEWARRIOR_ERRORS[error_code]
+        return result
 
     ########################################
 
@@ -1428,6 +1424,13 @@ class Project(object):
         # build all sub project
         rootproject = self.addtarget('Everything', 'None')
 
+        # Process the filenames, the projects are scanned in parallel
+        get_file_lists(solution.get_project_list(), [FileTypes.h,
+                                                     FileTypes.cpp,
+                                                     FileTypes.c,
+                                                     FileTypes.rc
+                                                     ])
+
         # Process all the projects and configurations
         for project in solution.get_project_list():
 
@@ -1435,13 +1438,6 @@ class Project(object):
             if project.platform is None:
                 project.platform = project.configuration_list[0].platform
 
-            # Process the filenames
-            project.get_file_list([FileTypes.h,
-                                   FileTypes.cpp,
-                                   FileTypes.c,
-                                   FileTypes.rc
-                                   ])
-
             # Add to the master list
             self.configuration_list.extend(project.configuration_list)
 
@@ -5,6 +5,21 @@
 Module contains the core classes for makeproject.
 
 @package makeprojects.core
+
+@var makeprojects.core._ATTRIBUTE_REVISION
+Counter incremented whenever an attribute of an Attributes object is set
+
+@var makeprojects.core._CACHE_ATTRIBUTES
+Names of the Attributes members used for the chained lookup cache
+
+@var makeprojects.core._FINGERPRINT_SKIP
+Names of the Attributes members that are not part of a fingerprint
+
+@var makeprojects.core._UNITY_FOLDER
+Folder relative to the project where unity build files are created
+
+@var makeprojects.core._UNITY_BATCH_SIZE
+Default number of source files in a unity build file
 """
 
 # pylint: disable=consider-using-f-string
@@ -15,18 +30,372 @@ Module contains the core classes for makeproject.
 from __future__ import absolute_import, print_function, unicode_literals
 
 import os
+import hashlib
+from enum import Enum
+from numbers import Integral
 from operator import attrgetter
 from copy import deepcopy
 from burger import get_windows_host_type, convert_to_windows_slashes, \
     convert_to_linux_slashes, is_string, translate_to_regex_match, \
-    StringListProperty, BooleanProperty, NoneProperty, StringProperty
+    StringListProperty, BooleanProperty, NoneProperty, StringProperty, \
+    create_folder_if_needed, delete_file
 
 from .enums import FileTypes, ProjectTypes, IDETypes, PlatformTypes, \
     platformtype_short_code
 from .defaults import settings_from_name, configuration_presets, \
     project_presets
 from .util import validate_enum_type, regex_dict, validate_boolean, \
-    validate_string
+    validate_string, parallel_map
+from .vcs import FileBatch
+
+# Counter incremented whenever an attribute of an Attributes object is set
+_ATTRIBUTE_REVISION = 0
+
+# Names of the Attributes members used for the chained lookup cache
+_CACHE_ATTRIBUTES = ("_chained_cache", "_frozen")
+
+# Names of the Attributes members that are not part of a fingerprint
+_FINGERPRINT_SKIP = _CACHE_ATTRIBUTES + (
+    "parent", "project", "solution", "configuration_list", "project_list",
+    "file_batch", "vs_fragment_cache")
+
+# Folder relative to the project where unity build files are created
+_UNITY_FOLDER = "unity"
+
+# Default number of source files in a unity build file
+_UNITY_BATCH_SIZE = 8
+
+########################################
+
+
+def _fingerprint_text(value):
+    """
+    Convert a value into text that's the same in every process.
+
+    repr() can't be used, since dict ordering, compiled regexes and objects
+    without a __repr__ (which print the address) vary from run to run.
+
+    Args:
+        value: Value to convert
+    Returns:
+        String describing the value.
+    Raises:
+        TypeError
+    """
+
+    # pylint: disable=too-many-return-statements
+
+    if value is None or isinstance(value, (bool, float)):
+        return repr(value)
+
+    if is_string(value):
+        return "\"{}\"".format(
+            value.replace("\\", "\\\\").replace("\"", "\\\""))
+
+    # Test before int, since the enums are IntEnum
+    if isinstance(value, Enum):
+        return "{}.{}".format(type(value).__name__, value.name)
+
+    # Also the long type of Python 2
+    if isinstance(value, Integral):
+        return str(value)
+
+    if isinstance(value, dict):
+        return "{" + ",".join(sorted(
+            _fingerprint_text(key) + ":" + _fingerprint_text(item)
+            for key, item in value.items())) + "}"
+
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_fingerprint_text(item) for item in value) + "]"
+
+    if isinstance(value, (set, frozenset)):
+        return "(" + ",".join(
+            sorted(_fingerprint_text(item) for item in value)) + ")"
+
+    # Compiled regexes, and the match methods created by regex_dict()
+    pattern = getattr(getattr(value, "__self__", value), "pattern", None)
+    if pattern is not None:
+        return "re(" + _fingerprint_text(pattern) + ")"
+
+    # Source files are identified by their name and type
+    if isinstance(value, SourceFile):
+        return "SourceFile(" + _fingerprint_text(
+            value.relative_pathname) + "," + _fingerprint_text(
+                value.type) + ")"
+
+    # Functions are identified by name
+    if callable(value):
+        return "{}.{}".format(
+            getattr(value, "__module__", None),
+            getattr(value, "__name__", type(value).__name__))
+
+    # Anything else would make different values hash the same
+    raise TypeError(
+        "Can't create a fingerprint of type {}".format(type(value).__name__))
+
+########################################
+
+
+def _unique_list(value_list):
+    """
+    Return a list with duplicates removed, in the original order.
+
+    dict.fromkeys() doesn't keep the order on Python 2.
+
+    Args:
+        value_list: Iterable of hashable values
+    Returns:
+        New list with the first copy of each value.
+    """
+
+    found = set()
+    result = []
+    for item in value_list:
+        if item not in found:
+            found.add(item)
+            result.append(item)
+    return result
+
+########################################
+
+
+def _scan_directory(state, directory, recurse):
+    """
+    Scan a directory for source files.
+
+    Given a base directory and a relative directory
+    scan for all the files that are to be included in the project
+
+    Args:
+        state: Tuple of the project directory, exclusion regexes,
+            acceptable FileTypes, SourceFile list and include folder set
+        directory: Directory to scan
+        recurse: Enable recursion
+    """
+
+    project_directory, exclude_list_regex, acceptable_list, \
+        file_list, include_list = state
+
+    # Absolute or relative?
+    if not os.path.isabs(directory):
+        directory = os.path.abspath(
+            os.path.join(project_directory, directory))
+
+    # Is this a valid directory?
+    if not os.path.isdir(directory):
+        return
+
+    # Scan the directory
+    for base_name in os.listdir(directory):
+
+        # Is this file in the exclusion list?
+        for item in exclude_list_regex:
+            if item(base_name):
+                break
+        else:
+
+            # Is it a file? (Skip links and folders)
+            file_name = os.path.join(directory, base_name)
+            if os.path.isfile(file_name):
+
+                # Check against the extension list (Skip if not
+                # supported)
+                file_type = FileTypes.lookup(base_name)
+                if file_type is None:
+                    continue
+
+                # Found a match, test if the type is in
+                # the acceptable list
+
+                if file_type in acceptable_list:
+                    # Create a new entry (Using windows style slashes
+                    # for consistency)
+                    file_list.append(SourceFile(
+                        os.path.relpath(
+                            file_name,
+                            project_directory),
+                        directory,
+                        file_type))
+
+                    # Add the directory the file was found for header search
+                    include_list.add(
+                        os.path.relpath(
+                            directory, project_directory))
+
+            # Process folders only if in recursion mode
+            elif recurse and os.path.isdir(file_name):
+                _scan_directory(state, file_name, recurse)
+
+########################################
+
+
+def scan_source_files(task):
+    """
+    Obtain the list of source files for a project.
+
+    The task only contains strings and enums so this can be called in a
+    worker process.
+
+    Args:
+        task: Tuple from Project.get_scan_task()
+    Returns:
+        Tuple of the sorted SourceFile list and sorted include folder list.
+    See Also:
+        Project.get_scan_task, get_file_lists
+    """
+
+    working_directory, exclude_list, source_files_list, \
+        source_folders_list, acceptable_list = task
+
+    file_list = []
+    include_list = set()
+
+    for item in source_files_list:
+        if not os.path.isabs(item):
+            abs_path = os.path.abspath(
+                os.path.join(working_directory, item))
+        else:
+            abs_path = item
+
+        # Check against the extension list (Skip if not
+        # supported)
+        file_type = FileTypes.lookup(os.path.basename(abs_path))
+        if file_type is None:
+            continue
+
+        # Found a match, test if the type is in
+        # the acceptable list
+
+        if file_type in acceptable_list:
+            # Create a new entry (Using windows style slashes
+            # for consistency)
+            file_list.append(SourceFile(
+                os.path.relpath(
+                    abs_path,
+                    working_directory),
+                os.path.dirname(abs_path),
+                file_type))
+
+            # Add the directory the file was found for header search
+            include_list.add(
+                os.path.relpath(
+                    os.path.dirname(abs_path), working_directory))
+
+    # Get the files to exclude in this
+    state = (working_directory, translate_to_regex_match(exclude_list),
+             acceptable_list, file_list, include_list)
+
+    # Pull in all the source folders and scan them
+    for item in source_folders_list:
+
+        # Is it a recursive test?
+        recurse = False
+        if item.endswith("/*.*"):
+            # Remove the trailing /*.*
+            item = item[:-4]
+            recurse = True
+
+        # Scan the folder for files
+        _scan_directory(state, item, recurse)
+
+    # Since the slashes are all windows (No matter what
+    # host this script is running on, the sort will yield consistent
+    # results so it doesn't matter what platform generated the
+    # file list, it's the same output.
+    return (sorted(file_list, key=attrgetter("relative_pathname")),
+            sorted(include_list))
+
+########################################
+
+
+def get_file_lists(project_list, acceptable_list, jobs=None):
+    """
+    Obtain the list of source files for several projects.
+
+    Each project's folders are scanned independently, so the scans are run
+    with parallel_map(). The result is the same as calling
+    Project.get_file_list() on every project.
+
+    Args:
+        project_list: Iterable of Project instances
+        acceptable_list: List of acceptable FileTypes
+        jobs: Number of processes to use, None for the number of CPUs.
+    See Also:
+        Project.get_file_list, scan_source_files
+    """
+
+    project_list = list(project_list)
+    results = parallel_map(
+        scan_source_files,
+        [project.get_scan_task(acceptable_list) for project in project_list],
+        jobs=jobs)
+    for project, result in zip(project_list, results):
+        project.set_scan_result(result)
+
+########################################
+
+
+def _find_unity_files(unity_directory, name):
+    """
+    Return the unity build files of a project that exist.
+
+    Args:
+        unity_directory: Folder with the unity build files
+        name: Name of the project
+    Returns:
+        Set of pathnames of the files created for the project.
+    """
+
+    results = set()
+    header = "// Unity build file for " + name
+    try:
+        file_names = os.listdir(unity_directory)
+    except OSError:
+        return results
+
+    for item in file_names:
+        if not item.startswith(name + "_"):
+            continue
+        file_name = os.path.join(unity_directory, item)
+        try:
+            with open(file_name, "r") as fp:
+                lines = fp.read(256).splitlines()
+        except (IOError, OSError, UnicodeDecodeError):
+            continue
+        if header in lines[:3]:
+            results.add(file_name)
+    return results
+
+########################################
+
+
+def save_unity_files(solution, unity_files):
+    """
+    Save the unity build files created by Project.add_unity_files().
+
+    The files are queued in the solution's file batch, so they are only
+    written if their membership changed. They're generated, so they're
+    never added to version control. Unity files of batches that no longer
+    exist are deleted.
+
+    Args:
+        solution: Solution being generated
+        unity_files: List of (file_name, text_lines), text_lines is None
+            for files to delete
+    See Also:
+        Project.add_unity_files
+    """
+
+    for file_name, lines in unity_files:
+        if lines is None:
+            delete_file(file_name)
+            continue
+        create_folder_if_needed(os.path.dirname(file_name))
+        solution.file_batch.save_text_file_if_newer(
+            file_name,
+            lines,
+            bom=False,
+            perforce=False)
 
 ########################################
 
@@ -63,6 +432,12 @@ class Attributes(object):
         working_directory: Base directory for relative paths
         deploy_folder: Directory to deploy binaries
         fastcall: Boolean, True if fastcall is requested
+        unity_build: Boolean, True to compile C/C++ files in unity files
+        unity_batch_size: Number of source files in each unity file
+        unity_exclude_list: List of files to compile outside of unity files
+        precompiled_header: Header file to precompile for makefiles
+        compiler_launcher: Command to prefix compiler invocations, like ccache
+        rule_cache: Boolean, True to run custom build rules with rulecache
         _source_include_list: Generated file folder list
         _platform: platform value
         _project_type: True @ref makeprojects.core.Attributes.project_type
@@ -80,6 +455,16 @@ class Attributes(object):
             @ref makeprojects.core.Attributes.working_directory
         _deploy_folder: True @ref makeprojects.core.Attributes.deploy_folder
         _fastcall: None @ref makeprojects.core.Attributes.fastcall
+        _unity_build: None @ref makeprojects.core.Attributes.unity_build
+        _unity_batch_size: None
+            @ref makeprojects.core.Attributes.unity_batch_size
+        _precompiled_header: None
+            @ref makeprojects.core.Attributes.precompiled_header
+        _compiler_launcher: None
+            @ref makeprojects.core.Attributes.compiler_launcher
+        _rule_cache: None @ref makeprojects.core.Attributes.rule_cache
+        _chained_cache: Cache of results from the chained lookups
+        _frozen: True if freeze() was called
     """
 
     # pylint: disable=too-many-instance-attributes
@@ -94,12 +479,15 @@ class Attributes(object):
     exclude_from_build_list = StringListProperty("_exclude_from_build_list")
     exclude_list = StringListProperty("_exclude_list")
     cw_environment_variables = StringListProperty("_cw_environment_variables")
+    unity_exclude_list = StringListProperty("_unity_exclude_list")
 
     def __init__(self):
         """
         Perform initialization off all attributes.
         """
 
+        self._chained_cache = {}
+        self._frozen = False
         self.parent = None
         self.define_list = []
         self.include_folders_list = []
@@ -111,6 +499,7 @@ class Attributes(object):
         self.exclude_from_build_list = []
         self.exclude_list = []
         self.cw_environment_variables = []
+        self.unity_exclude_list = []
         self.custom_rules = {}
 
         # These are internal values
@@ -129,6 +518,100 @@ class Attributes(object):
         self._working_directory = None
         self._deploy_folder = None
         self._fastcall = None
+        self._unity_build = None
+        self._unity_batch_size = None
+        self._precompiled_header = None
+        self._compiler_launcher = None
+        self._rule_cache = None
+
+    ########################################
+
+    def __setattr__(self, name, value):
+        """
+        Set an attribute and invalidate the chained lookup caches.
+
+        Every assignment increments a global revision counter, which makes
+        all the cached lookups stale. If this object is frozen, its cache and
+        the caches of the objects that chain to it are cleared instead.
+
+        Args:
+            name: Name of the attribute
+            value: Value to store
+        """
+
+        # pylint: disable=global-statement
+        global _ATTRIBUTE_REVISION
+
+        _ATTRIBUTE_REVISION += 1
+        super(Attributes, self).__setattr__(name, value)
+        if self.__dict__.get("_frozen"):
+            self.invalidate_chained_cache()
+
+    ########################################
+
+    def _chained_children(self):
+        """
+        Return the objects that use this object as their parent.
+
+        Returns:
+            Iterable of Attributes objects.
+        """
+
+        # pylint: disable=no-self-use
+        return ()
+
+    ########################################
+
+    def invalidate_chained_cache(self):
+        """
+        Discard the cached chained lookups.
+
+        The caches of the objects that use this object as their parent are
+        also discarded.
+
+        See Also:
+            freeze
+        """
+
+        self._chained_cache.clear()
+        for item in self._chained_children():
+            item.invalidate_chained_cache()
+
+    ########################################
+
+    def freeze(self):
+        """
+        Stop checking the chained lookup cache for stale entries.
+        @details
+        Before generating, the attributes are not expected to change, so the
+        cached lookups are returned without checking the revision counter and
+        the chained lists are cached as well. Assigning an attribute to a
+        frozen object still clears the caches that depend on it, but lists
+        modified in place are not detected.
+
+        See Also:
+            thaw, invalidate_chained_cache
+        """
+
+        self.invalidate_chained_cache()
+        self._frozen = True
+        for item in self._chained_children():
+            item.freeze()
+
+    ########################################
+
+    def thaw(self):
+        """
+        Undo freeze() and check the chained lookup cache for stale entries.
+
+        See Also:
+            freeze
+        """
+
+        self._frozen = False
+        for item in self._chained_children():
+            item.thaw()
+        self.invalidate_chained_cache()
 
     ########################################
 
@@ -136,6 +619,9 @@ class Attributes(object):
         """
         Follow the chain to find a value.
 
+        The result is cached until an attribute of any Attributes object is
+        assigned.
+
         Args:
             self: The "this" reference.
             name: Name of the attribute
@@ -143,12 +629,20 @@ class Attributes(object):
             None or the value.
         """
 
+        # Is it in the cache and still valid?
+        entry = self._chained_cache.get(name)
+        if entry is not None and (
+                self._frozen or entry[0] == _ATTRIBUTE_REVISION):
+            return entry[1]
+
         # Get the value
         value = getattr(self, name, None)
 
         # If not found, follow the chain, if any
         if value is None and self.parent is not None:
             value = self.parent.get_chained_value(name)
+
+        self._chained_cache[name] = (_ATTRIBUTE_REVISION, value)
         return value
 
     ########################################
@@ -167,6 +661,29 @@ class Attributes(object):
             A list of all items found. The list can be empty.
         """
 
+        # Lists can be modified in place, so they are only cached if frozen
+        if self._frozen:
+            key = ("list", name)
+            value_list = self._chained_cache.get(key)
+            if value_list is None:
+                value_list = self._chained_cache[key] = \
+                    self._build_chained_list(name)
+            return list(value_list)
+
+        return self._build_chained_list(name)
+
+    ########################################
+
+    def _build_chained_list(self, name):
+        """
+        Create the list for get_chained_list().
+
+        Args:
+            name: Name of the attribute key
+        Returns:
+            A list of all items found. The list can be empty.
+        """
+
         value_list = list(getattr(self, name, []))
 
         # Is there a reverse link?
@@ -182,7 +699,8 @@ class Attributes(object):
         @details
         Obtain the list from the named attribute and append it with the same
         attribute in parent and return the entire list. This function does not
-        modify the original lists. All duplicates are removed.
+        modify the original lists. All duplicates are removed, the first copy
+        of each item is kept.
 
         Args:
             name: Name of the attribute key
@@ -192,7 +710,50 @@ class Attributes(object):
             get_chained_list
         """
 
-        return list(dict.fromkeys(self.get_chained_list(name)))
+        if self._frozen:
+            key = ("unique", name)
+            value_list = self._chained_cache.get(key)
+            if value_list is None:
+                value_list = self._chained_cache[key] = \
+                    _unique_list(self._build_chained_list(name))
+            return list(value_list)
+
+        return _unique_list(self._build_chained_list(name))
+
+    ########################################
+
+    def _get_own_fingerprint(self, skip=()):
+        """
+        Return a hash of the attributes stored in this object only.
+        @details
+        The parent is not included, the public fingerprint() functions
+        combine the hashes of all the objects in the chain. The hash is
+        cached only while frozen, since lists modified in place can't be
+        detected.
+
+        Args:
+            skip: Tuple of attribute names to leave out of the hash
+        Returns:
+            Hex string of the SHA-1 hash.
+        See Also:
+            freeze
+        """
+
+        key = ("fingerprint", skip)
+        if self._frozen:
+            digest = self._chained_cache.get(key)
+            if digest is not None:
+                return digest
+
+        text = ";".join(sorted(
+            name + "=" + _fingerprint_text(value)
+            for name, value in vars(self).items()
+            if name not in _FINGERPRINT_SKIP and name not in skip))
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+        if self._frozen:
+            self._chained_cache[key] = digest
+        return digest
 
     ########################################
 
@@ -490,6 +1051,118 @@ class Attributes(object):
 
     fastcall = property(_getfastcall, _setfastcall)
 
+    ########################################
+
+    def _getunity_build(self):
+        """
+        Get unity build boolean
+        """
+
+        return self.get_chained_value("_unity_build")
+
+    def _setunity_build(self, value):
+        """
+        Set the boolean with validation
+        Args:
+            self: The "this" reference.
+            value: None, True or False
+        """
+
+        self._unity_build = validate_boolean(value)
+
+    unity_build = property(_getunity_build, _setunity_build)
+
+    ########################################
+
+    def _getunity_batch_size(self):
+        """
+        Get the number of files in each unity file
+        """
+
+        return self.get_chained_value("_unity_batch_size")
+
+    def _setunity_batch_size(self, value):
+        """
+        Set the integer with validation
+        Args:
+            self: The "this" reference.
+            value: None or a number greater than zero
+        """
+
+        if value is not None:
+            value = int(value)
+            if value < 1:
+                raise ValueError(
+                    "unity_batch_size must be greater than zero")
+        self._unity_batch_size = value
+
+    unity_batch_size = property(_getunity_batch_size, _setunity_batch_size)
+
+    ########################################
+
+    def _getprecompiled_header(self):
+        """
+        Get the header file to precompile
+        """
+
+        return self.get_chained_value("_precompiled_header")
+
+    def _setprecompiled_header(self, value):
+        """
+        Set the string with validation
+        Args:
+            self: The "this" reference.
+            value: None, string
+        """
+
+        self._precompiled_header = validate_string(value)
+
+    precompiled_header = property(
+        _getprecompiled_header, _setprecompiled_header)
+
+    ########################################
+
+    def _getcompiler_launcher(self):
+        """
+        Get the command to prefix compiler invocations
+        """
+
+        return self.get_chained_value("_compiler_launcher")
+
+    def _setcompiler_launcher(self, value):
+        """
+        Set the string with validation
+        Args:
+            self: The "this" reference.
+            value: None, string
+        """
+
+        self._compiler_launcher = validate_string(value)
+
+    compiler_launcher = property(
+        _getcompiler_launcher, _setcompiler_launcher)
+
+    ########################################
+
+    def _getrule_cache(self):
+        """
+        Get the rule cache boolean
+        """
+
+        return self.get_chained_value("_rule_cache")
+
+    def _setrule_cache(self, value):
+        """
+        Set the boolean with validation
+        Args:
+            self: The "this" reference.
+            value: None, True or False
+        """
+
+        self._rule_cache = validate_boolean(value)
+
+    rule_cache = property(_getrule_cache, _setrule_cache)
+
 ########################################
 
 
@@ -757,6 +1430,89 @@ class Configuration(Attributes):
 
     ########################################
 
+    def get_resolved_attributes(self):
+        """
+        Return all chained attributes flattened into a single dict.
+        @details
+        The instance attributes of the Solution, Project and this
+        Configuration are merged in that order, so a value set on a child
+        overrides the parent. Attributes set to None are skipped so they
+        don't hide the parent's value, which matches get_chained_value().
+
+        The dict is cached the same way as get_chained_value(), and is
+        recreated when an attribute is assigned.
+
+        @note Only attributes stored on the instances are present, values
+            computed by properties are not.
+
+        Returns:
+            dict of attribute names to values.
+        See Also:
+            get_chained_value
+        """
+
+        # The key can't collide with an attribute name
+        entry = self._chained_cache.get(None)
+        if entry is not None and (
+                self._frozen or entry[0] == _ATTRIBUTE_REVISION):
+            resolved = entry[1]
+        else:
+
+            # Collect the chain, starting with the configuration
+            chain = []
+            item = self
+            while item is not None:
+                chain.append(item)
+                item = item.parent
+
+            # Merge from the root down to the configuration
+            resolved = {}
+            for item in reversed(chain):
+                for key, value in vars(item).items():
+                    if value is not None:
+                        resolved[key] = value
+            for key in _CACHE_ATTRIBUTES:
+                resolved.pop(key, None)
+            self._chained_cache[None] = (_ATTRIBUTE_REVISION, resolved)
+        return resolved
+
+    ########################################
+
+    def fingerprint(self, skip=()):
+        """
+        Return a stable hash of the fully resolved configuration.
+        @details
+        The hash covers the attributes of this configuration, its project
+        and the solution, such as the platform, project_type, debug,
+        optimization, the lists of defines and include folders, and the
+        custom rules. It's the same in every process, so it can be used as a
+        key for caches saved to disk.
+
+        ``skip`` leaves attributes of the project and solution out of the
+        hash, so configurations of different projects can match if they only
+        differ by things like the project name.
+
+        Args:
+            skip: Tuple of attribute names of the parents to leave out
+        Returns:
+            Hex string of the SHA-1 hash.
+        See Also:
+            Project.fingerprint, freeze
+        """
+
+        # pylint: disable=protected-access
+
+        digests = [self._get_own_fingerprint()]
+        item = self.parent
+        while item is not None:
+            digests.append(item._get_own_fingerprint(skip))
+            item = item.parent
+
+        return hashlib.sha1(
+            ",".join(digests).encode("utf-8")).hexdigest()
+
+    ########################################
+
     def get_suffix(self, force_short=False):
         """
         Return the proposed suffix.
@@ -799,7 +1555,7 @@ class Configuration(Attributes):
 
         result_list = []
         for item in self.__dict__.items():
-            if item[0] == "parent":
+            if item[0] == "parent" or item[0] in _CACHE_ATTRIBUTES:
                 continue
             if item[0] == "project":
                 result_list.append(
@@ -851,10 +1607,10 @@ class Project(Attributes):
         configuration_list: Generate the default configurations
         project_list: Project records that need to be built first
         codefiles: Initial array of SourceFile in the solution
+        unity_members: Set of relative pathnames compiled by unity files
         file_list: Used by scan_directory
         include_list: Used by scan_directory
         platform_code: Platform code for generation
-        exclude_list_regex: Regex iterable of files to exclude
         _source_include_list: Generated file folder list
     """
 
@@ -902,6 +1658,7 @@ class Project(Attributes):
         self.configuration_list = []
         self.project_list = []
         self.codefiles = []
+        self.unity_members = set()
         self.file_list = None
         self.include_list = None
         self.platform_code = ""
@@ -990,6 +1747,49 @@ class Project(Attributes):
 
     ########################################
 
+    def fingerprint(self):
+        """
+        Return a stable hash of the project and all of its configurations.
+        @details
+        The hash covers the attributes of this project, the solution and
+        every configuration in the order they appear in configuration_list.
+        It's the same in every process, so it can be used as a key for
+        caches saved to disk.
+
+        Returns:
+            Hex string of the SHA-1 hash.
+        See Also:
+            Configuration.fingerprint, freeze
+        """
+
+        # pylint: disable=protected-access
+
+        digests = []
+        item = self
+        while item is not None:
+            digests.append(item._get_own_fingerprint())
+            item = item.parent
+
+        for configuration in self.configuration_list:
+            digests.append(configuration._get_own_fingerprint())
+
+        return hashlib.sha1(
+            ",".join(digests).encode("utf-8")).hexdigest()
+
+    ########################################
+
+    def _chained_children(self):
+        """
+        Return the configurations of this project.
+
+        Returns:
+            List of Configuration objects.
+        """
+
+        return self.configuration_list
+
+    ########################################
+
     def get_project_list(self):
         """
         Return the project list for all projects.
@@ -1068,68 +1868,45 @@ class Project(Attributes):
 
     ########################################
 
-    def _scan_directory(self, working_directory, recurse, acceptable_list):
+    def get_scan_task(self, acceptable_list):
         """
-        Given a base directory and a relative directory
-        scan for all the files that are to be included in the project
+        Return the arguments needed to scan for the source files.
+        @details
+        The data is only strings and enums, so it can be passed to another
+        process.
 
         Args:
-            working_directory: Directory to scan
-            recurse: Enable recursion
-            acceptable_list: list to store SourceFile records
+            acceptable_list: List of acceptable FileTypes
+        Returns:
+            Tuple for scan_source_files().
+        See Also:
+            get_file_list, scan_source_files
         """
 
-        # Absolute or relative?
-        if not os.path.isabs(working_directory):
-            working_directory = os.path.abspath(
-                os.path.join(self.working_directory,
-                             working_directory))
+        return (
+            self.working_directory,
+            self.get_unique_chained_list("exclude_list"),
+            self.get_unique_chained_list("source_files_list"),
+            self.get_unique_chained_list("source_folders_list"),
+            tuple(acceptable_list))
 
-        # Is this a valid directory?
-        if not os.path.isdir(working_directory):
-            return
+    ########################################
 
-        # Scan the directory
-        for base_name in os.listdir(working_directory):
+    def set_scan_result(self, result):
+        """
+        Set the source file lists from the output of scan_source_files().
 
-            # Is this file in the exclusion list?
-            for item in self.exclude_list_regex:
-                if item(base_name):
-                    break
-            else:
+        Args:
+            result: Tuple of codefiles and _source_include_list
+        See Also:
+            get_file_list, scan_source_files
+        """
 
-                # Is it a file? (Skip links and folders)
-                file_name = os.path.join(working_directory, base_name)
-                if os.path.isfile(file_name):
-
-                    # Check against the extension list (Skip if not
-                    # supported)
-                    file_type = FileTypes.lookup(base_name)
-                    if file_type is None:
-                        continue
-
-                    # Found a match, test if the type is in
-                    # the acceptable list
-
-                    if file_type in acceptable_list:
-                        # Create a new entry (Using windows style slashes
-                        # for consistency)
-                        self.file_list.append(SourceFile(
-                            os.path.relpath(
-                                file_name,
-                                self.working_directory),
-                            working_directory,
-                            file_type))
-
-                        # Add the directory the file was found for header search
-                        self.include_list.add(
-                            os.path.relpath(
-                                working_directory, self.working_directory))
-
-                # Process folders only if in recursion mode
-                elif recurse and os.path.isdir(file_name):
-                    self._scan_directory(
-                        file_name, recurse, acceptable_list)
+        # pylint: disable=attribute-defined-outside-init
+
+        self.codefiles, self._source_include_list = result
+        self.file_list = None
+        self.include_list = None
 
     ########################################
 
@@ -1146,75 +1923,151 @@ class Project(Attributes):
         - ``source_files_list`` list of files to add
         Args:
             acceptable_list: List of acceptable FileTypes
+        See Also:
+            get_file_lists
         """
 
-        # pylint: disable=attribute-defined-outside-init
+        self.set_scan_result(
+            scan_source_files(self.get_scan_task(acceptable_list)))
+
+    ########################################
 
-        # Get the files to exclude in this
-        self.exclude_list_regex = translate_to_regex_match(
-            self.get_unique_chained_list("exclude_list"))
+    def add_unity_files(self, keep_members=False):
+        """
+        Group the C and C++ files into unity build files.
+        @details
+        If ``unity_build`` is True in any configuration, the C and C++ files
+        in ``codefiles`` are grouped by directory into batches of
+        ``unity_batch_size`` files in name order, so the membership only
+        changes when files are added or removed. Each batch is compiled by
+        one file in the ``unity`` folder that includes all of its members.
+        Files matching ``unity_exclude_list`` and batches of a single file are
+        compiled normally.
+
+        The unity files are added to ``codefiles`` and the members are
+        recorded in ``unity_members``. The members are removed from
+        ``codefiles`` unless keep_members is True, which is used by IDEs that
+        show the files but exclude them from the build.
+
+        Unity files of this project that aren't created again, because
+        files were removed or unity builds were turned off, are returned
+        with None instead of lines so they're deleted.
 
-        self.file_list = []
-        self.include_list = set()
+        Args:
+            keep_members: True to keep the grouped files in codefiles
+        Returns:
+            List of (file_name, text_lines) for save_unity_files().
+        See Also:
+            save_unity_files
+        """
 
-        working_directory = self.working_directory
+        # pylint: disable=too-many-locals
 
-        for item in self.get_unique_chained_list("source_files_list"):
-            if not os.path.isabs(item):
-                abs_path = os.path.abspath(
-                    os.path.join(working_directory, item))
-            else:
-                abs_path = item
+        self.unity_members = set()
+        unity_directory = os.path.join(self.working_directory, _UNITY_FOLDER)
+        old_files = _find_unity_files(unity_directory, self.name)
+
+        # The source files are shared by all configurations, so a setting
+        # in any configuration applies to the project
+        chain_list = self.configuration_list or [self]
+        if not any(x.unity_build for x in chain_list):
+            return [(x, None) for x in sorted(old_files)]
+
+        batch_size = _UNITY_BATCH_SIZE
+        for item in chain_list:
+            if item.unity_batch_size:
+                batch_size = item.unity_batch_size
+                break
 
-            # Check against the extension list (Skip if not
-            # supported)
-            file_type = FileTypes.lookup(os.path.basename(abs_path))
-            if file_type is None:
+        exclude_list = []
+        for item in chain_list:
+            exclude_list.extend(item.get_unique_chained_list(
+                "unity_exclude_list"))
+        exclude_list_regex = translate_to_regex_match(
+            _unique_list(exclude_list))
+
+        # Group the files by directory and type, in codefiles order
+        key_list = []
+        groups = {}
+        for item in self.codefiles:
+            if item.type not in (FileTypes.c, FileTypes.cpp):
                 continue
+            file_name = convert_to_linux_slashes(item.relative_pathname)
+            base_name = os.path.basename(file_name)
+            for test in exclude_list_regex:
+                if test(base_name):
+                    break
+            else:
+                key = (os.path.dirname(file_name), item.type)
+                if key not in groups:
+                    key_list.append(key)
+                    groups[key] = []
+                groups[key].append(item)
+
+        unity_files = []
+        results = []
+        for key in key_list:
+            directory, file_type = key
+
+            # Name the files after the directory, so adding a directory
+            # doesn't rename the other unity files
+            prefix = [self.name]
+            if directory:
+                name = "".join(x if x.isalnum() else "_" for x in directory)
+
+                # Keep a/b and a_b apart
+                if name != directory:
+                    name += "_" + hashlib.sha1(
+                        directory.encode("utf-8")).hexdigest()[:8]
+                prefix.append(name)
+
+            file_list = groups[key]
+            for index in range(0, len(file_list), batch_size):
+                batch = file_list[index:index + batch_size]
+                if len(batch) < 2:
+                    continue
 
-            # Found a match, test if the type is in
-            # the acceptable list
-
-            if file_type in acceptable_list:
-                # Create a new entry (Using windows style slashes
-                # for consistency)
-                self.file_list.append(SourceFile(
-                    os.path.relpath(
-                        abs_path,
-                        working_directory),
-                    os.path.dirname(abs_path),
-                    file_type))
-
-                # Add the directory the file was found for header search
-                self.include_list.add(
-                    os.path.relpath(
-                        os.path.dirname(abs_path), working_directory))
-
-        # Pull in all the source folders and scan them
-        for item in self.get_unique_chained_list("source_folders_list"):
-
-            # Is it a recursive test?
-            recurse = False
-            if item.endswith("/*.*"):
-                # Remove the trailing /*.*
-                item = item[:-4]
-                recurse = True
-
-            # Scan the folder for files
-            self._scan_directory(item, recurse, acceptable_list)
-
-        # Since the slashes are all windows (No matter what
-        # host this script is running on, the sort will yield consistent
-        # results so it doesn't matter what platform generated the
-        # file list, it's the same output.
-        self.codefiles = sorted(
-            self.file_list, key=attrgetter("relative_pathname"))
-        self._source_include_list = sorted(self.include_list)
-
-        # Cleanup
-        self.file_list = None
-        self.include_list = None
-        del self.exclude_list_regex
+                base_name = "_".join(prefix + [str(index // batch_size)]) + \
+                    (".c" if file_type is FileTypes.c else ".cpp")
+
+                lines = [
+                    "//",
+                    "// Unity build file for " + self.name,
+                    "// Generated with makeprojects, do not edit",
+                    "//",
+                    ""]
+                for item in batch:
+                    lines.append("#include \"{}\"".format(
+                        convert_to_linux_slashes(os.path.relpath(
+                            os.path.join(
+                                self.working_directory,
+                                convert_to_linux_slashes(
+                                    item.relative_pathname)),
+                            unity_directory))))
+                    self.unity_members.add(item.relative_pathname)
+
+                unity_files.append(SourceFile(
+                    os.path.join(_UNITY_FOLDER, base_name),
+                    unity_directory, file_type))
+                results.append(
+                    (os.path.join(unity_directory, base_name), lines))
+
+        # Unity files are found in their folder by the build tools
+        if unity_files:
+            self._source_include_list = sorted(
+                set(self._source_include_list) | set((_UNITY_FOLDER,)))
+
+        # Compile the unity files instead of the members
+        if not keep_members:
+            self.codefiles = [x for x in self.codefiles
+                              if x.relative_pathname not in self.unity_members]
+        self.codefiles = sorted(self.codefiles + unity_files,
+                                key=attrgetter("relative_pathname"))
+
+        # Remove the files of batches that are gone
+        old_files.difference_update(x[0] for x in results)
+        results.extend((x, None) for x in sorted(old_files))
+        return results
 
     ########################################
 
@@ -1228,7 +2081,7 @@ class Project(Attributes):
 
         result_list = []
         for item in self.__dict__.items():
-            if item[0] == "parent":
+            if item[0] == "parent" or item[0] in _CACHE_ATTRIBUTES:
                 continue
             if item[0] == "solution":
                 if item[1] is None:
@@ -1428,6 +2281,18 @@ class Solution(Attributes):
 
     ########################################
 
+    def _chained_children(self):
+        """
+        Return every project in this solution.
+
+        Returns:
+            List of Project objects.
+        """
+
+        return self.get_project_list()
+
+    ########################################
+
     def get_project_list(self):
         """
         Return the project list for all sub projects.
@@ -1465,9 +2330,21 @@ class Solution(Attributes):
 
     ########################################
 
-    def generate(self, ide=None):
+    def generate(self, ide=None, file_batch=None):
         """
         Generate a project file and write it out to disk.
+
+        All generated files are queued in a vcs.FileBatch so the files that
+        changed are checked out from version control with a single command.
+        If ``file_batch`` is passed, the files are queued in it and the caller
+        is responsible for calling commit(), otherwise the files are written
+        before this function returns.
+
+        Args:
+            ide: IDETypes to generate for, None for the default.
+            file_batch: vcs.FileBatch to queue files in, or None.
+        Returns:
+            Zero if no error, non-zero on error
         """
 
         # pylint: disable=import-outside-toplevel
@@ -1494,6 +2371,7 @@ class Solution(Attributes):
 
         import makeprojects.watcom
         import makeprojects.makefile
+        import makeprojects.ninja
         import makeprojects.visual_studio
         import makeprojects.codewarrior
         import makeprojects.xcode
@@ -1503,6 +2381,7 @@ class Solution(Attributes):
             makeprojects.visual_studio,
             makeprojects.watcom,
             makeprojects.makefile,
+            makeprojects.ninja,
             makeprojects.codewarrior,
             makeprojects.xcode,
             makeprojects.codeblocks)
@@ -1567,8 +2446,27 @@ class Solution(Attributes):
         # Set the IDE code
         solution.ide_code = ide.get_short_code()
 
+        # Queue the generated files for a single version control checkout
+        if file_batch is None:
+            solution.file_batch = FileBatch(verbose=solution.verbose)
+        else:
+            solution.file_batch = file_batch
+
+        # The attributes are final, skip the stale checks on chained lookups
+        # while the copy is used by the generator
+        solution.freeze()
+
         # Create project files
-        return generator.generate(solution)
+        try:
+            error = generator.generate(solution)
+        finally:
+            solution.thaw()
+
+        # Write out the files if the caller isn't batching. Version control
+        # failures are not fatal, same as burger.save_text_file_if_newer()
+        if file_batch is None:
+            solution.file_batch.commit()
+        return error
 
     def __repr__(self):
         """
@@ -1579,7 +2477,7 @@ class Solution(Attributes):
         """
         result_list = []
         for item in self.__dict__.items():
-            if item[0] == "parent":
+            if item[0] == "parent" or item[0] in _CACHE_ATTRIBUTES:
                 continue
             item_name = item[0][1:] if item[0].startswith("_") else item[0]
             result_list.append(
@@ -20,7 +20,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import os
 
 from burger import load_text_file, delete_file, where_is_doxygen, \
-    save_text_file, create_folder_if_needed, get_windows_host_type, run_command
+    save_text_file, create_folder_if_needed, get_windows_host_type
 from .build_objects import BuildObject, BuildError
 
 ########################################
@@ -96,8 +96,9 @@ class BuildDoxygenFile(BuildObject):
             print(' '.join(cmd))
 
         # Capture the error output
-        stderr = run_command(cmd, working_dir=doxyfile_dir,
-                             quiet=not self.verbose, capture_stderr=True)[2]
+        stderr = []
+        self.run_command(
+            cmd, self.verbose, working_dir=doxyfile_dir, stderr_lines=stderr)
 
         # If there was a temp doxyfile, get rid of it.
         if temp_doxyfile != self.file_name:
@@ -108,7 +109,7 @@ class BuildDoxygenFile(BuildObject):
 
         # If the error log has something, save it.
         if stderr:
-            save_text_file(log_filename, stderr.splitlines())
+            save_text_file(log_filename, stderr)
             msg = 'Errors stored in {}'.format(log_filename)
             return BuildError(10, self.file_name, msg=msg)
 
@@ -27,6 +27,9 @@ Deploy a file without source control
 
 @var makeprojects.makefile._DEPLOY_PERFORCE
 Using perforce, deploy a file
+
+@var makeprojects.makefile._COMPILE_COMMANDS
+Name of the compilation database for clang tooling
 """
 
 # pylint: disable=consider-using-f-string
@@ -37,14 +40,19 @@ Using perforce, deploy a file
 from __future__ import absolute_import, print_function, unicode_literals
 
 import os
-from burger import save_text_file_if_newer, encapsulate_path_linux, \
-    convert_to_linux_slashes, host_machine
+import json
+from burger import encapsulate_path_linux, convert_to_linux_slashes, \
+    host_machine
 
 from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes, \
     get_output_template
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_job_arguments, \
+    get_jobserver
+from .core import save_unity_files
+from .artifacts import get_generated_artifacts
 from .config import _MAKEFILE_MATCH
-from .watcom_util import get_custom_list, get_output_list
+from .watcom_util import get_custom_list, get_output_list, \
+    make_rule_cache_command
 
 # IDEs supported by this generator
 SUPPORTED_IDES = (IDETypes.make,)
@@ -72,6 +80,9 @@ _DEPLOY_PERFORCE = (
     "\tfi"
 )
 
+# Name of the compilation database for clang tooling
+_COMPILE_COMMANDS = "compile_commands.json"
+
 ########################################
 
 
@@ -83,6 +94,11 @@ class BuildMakeFile(BuildObject):
         verbose: Save the verbose flag
     """
 
+    # make runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     def __init__(self, file_name, priority, configuration, verbose=False):
         """
         Class to handle Linux make files
@@ -137,13 +153,15 @@ class BuildMakeFile(BuildObject):
             return result
 
         # Build the requested target configuration
-        cmd = ["make", "-s", "-j", "-f", self.file_name, self.configuration]
+        cmd = ["make", "-s"]
+        cmd.extend(get_job_arguments())
+        cmd.extend(("-f", self.file_name, self.configuration))
         if self.verbose:
             # Have makerez be verbose
             cmd.insert(1, "--debug=v")
             print(" ".join(cmd))
 
-        return self.run_command(cmd, self.verbose)
+        return self.run_command(cmd, self.verbose, get_jobserver())
 
     ########################################
 
@@ -163,6 +181,24 @@ class BuildMakeFile(BuildObject):
 
         return self.build()
 
+    ########################################
+
+    def get_artifacts(self):
+        """
+        Return the files the ``clean`` target deletes.
+
+        Makefiles created by makeprojects are cleaned by deleting the files
+        directly, so make doesn't have to be run. Cleaning a single
+        configuration still runs make.
+
+        Returns:
+            List of pathnames, or None if make has to be run.
+        """
+
+        if self.configuration != "clean":
+            return None
+        return get_generated_artifacts(self.file_name)
+
 ########################################
 
 
@@ -302,17 +338,313 @@ def generate(solution):
     makefile_lines = solution.post_process(makefile_lines)
 
     # Save the file if it changed
-    save_text_file_if_newer(
+    solution.file_batch.save_text_file_if_newer(
         os.path.join(solution.working_directory, solution.makefile_filename),
         makefile_lines,
         bom=False,
-        perforce=solution.perforce,
-        verbose=solution.verbose)
+        perforce=solution.perforce)
+
+    # Save the compilation database for clang tooling
+    save_compile_commands(
+        solution, exporter.get_compile_commands(),
+        ("temp/" + solution.name + "mak",))
     return 0
 
 ########################################
 
 
+def _get_relative_folder(working_directory, folder):
+    """
+    Convert an absolute folder inside the project to a relative one.
+
+    Relative pathnames keep the command lines the same in every checkout, so
+    compiler caches can share their results.
+
+    Args:
+        working_directory: Directory the compiler is invoked from
+        folder: Folder to convert
+    Returns:
+        Relative folder, or folder if it's outside of working_directory.
+    """
+
+    if working_directory and os.path.isabs(folder):
+        try:
+            relative = os.path.relpath(folder, working_directory)
+        except ValueError:
+            # Different drives on Windows
+            return folder
+        if relative != os.pardir and \
+                not relative.startswith(os.pardir + os.sep):
+            return relative
+    return folder
+
+########################################
+
+
+def get_include_folders(configuration_list):
+    """
+    Return the folders to search for headers.
+
+    The folders where source code was found are sorted for consistent
+    diffs, followed by the extra include folders in the order declared.
+    Absolute folders inside the project are made relative.
+
+    Args:
+        configuration_list: List of configurations to scan
+    Returns:
+        Tuple of the source folder list and include folder list.
+    """
+
+    include_folders = []
+    source_folders = []
+    for configuration in configuration_list:
+        for item in configuration.get_unique_chained_list(
+                "_source_include_list"):
+            if item not in source_folders:
+                source_folders.append(item)
+
+        for item in configuration.get_unique_chained_list(
+                "include_folders_list"):
+            item = _get_relative_folder(
+                configuration.working_directory, item)
+            if item not in include_folders:
+                include_folders.append(item)
+    return sorted(source_folders), include_folders
+
+########################################
+
+
+def get_precompiled_header_type(configuration_list, codefiles):
+    """
+    Return the type of source files that use the precompiled header.
+
+    A precompiled header can only be used by files of the language it was
+    compiled with. It's compiled as C++ if there are any C++ files, or as C
+    if there are only C files.
+
+    Args:
+        configuration_list: List of configurations to scan
+        codefiles: List of SourceFile objects of the project
+    Returns:
+        FileTypes.cpp, FileTypes.c or None if there is no precompiled header.
+    """
+
+    for configuration in configuration_list:
+        if configuration.precompiled_header:
+            break
+    else:
+        return None
+
+    file_types = set(item.type for item in codefiles)
+    for item in (FileTypes.cpp, FileTypes.c):
+        if item in file_types:
+            return item
+    return None
+
+########################################
+
+
+def get_c_flags(configuration):
+    """
+    Return the C and C++ compiler flags for a configuration.
+
+    Args:
+        configuration: Configuration to build
+    Returns:
+        List of compiler flags.
+    """
+
+    entries = []
+
+    # Enable debug information
+    if configuration.debug:
+        entries.append("-g")
+
+    # Enable optimization
+    if configuration.optimization:
+        entries.append("-O3")
+    else:
+        entries.append("-Og")
+
+    # Enable relocation for shared libraries
+    if configuration.project_type is ProjectTypes.sharedlibrary:
+        entries.append("-fPIC")
+
+    # Add defines
+    for item in configuration.get_chained_list("define_list"):
+        entries.append("-D" + item)
+    return entries
+
+########################################
+
+
+def get_asm_flags(configuration):
+    """
+    Return the assembler flags for a configuration.
+
+    Args:
+        configuration: Configuration to build
+    Returns:
+        List of assembler flags.
+    """
+
+    entries = []
+
+    # Add defines
+    for item in configuration.get_chained_list("define_list"):
+        if item.find("=") == -1:
+            entries.append("--defsym " + item + "=1")
+        else:
+            entries.append("--defsym " + item)
+    return entries
+
+########################################
+
+
+def get_link_flags(configuration):
+    """
+    Return the linker flags for a configuration.
+
+    Args:
+        configuration: Configuration to build
+    Returns:
+        List of linker flags.
+    """
+
+    entries = []
+
+    # Enable debug information
+    if configuration.debug:
+        entries.append("-g")
+
+    if configuration.project_type is ProjectTypes.sharedlibrary:
+        entries.append("-shared")
+
+    # Add libraries
+
+    if not configuration.project_type.is_library():
+        lib_list = configuration.get_unique_chained_list(
+            "libraries_list")
+
+        for item in lib_list:
+            # Special case, if the lib has the name libfoo.a,
+            # remove the prefix and suffix for the linker
+            if item.startswith("lib") and item.endswith(".a"):
+                item = item[3:-2]
+            entries.append("-l" + item)
+
+        lib_list = configuration.get_unique_chained_list(
+            "library_folders_list")
+        for item in lib_list:
+            entries.append("-L" + convert_to_linux_slashes(item))
+    return entries
+
+########################################
+
+
+def get_compile_command(working_directory, configuration, include_list,
+                        source_file, object_file, precompiled_type=None):
+    """
+    Create a compilation database entry for a source file.
+
+    The arguments match the command used by the generated makefile or
+    ninja file, without the dependency file options.
+
+    Args:
+        working_directory: Directory the compiler is invoked from
+        configuration: Configuration to build
+        include_list: List of folders to search for headers
+        source_file: SourceFile to compile
+        object_file: Pathname of the object file
+        precompiled_type: Type of the files using the precompiled header
+    Returns:
+        dict with the ``directory``, ``arguments``, ``file`` and ``output``
+        of the entry, None if the file isn't C or C++.
+    """
+
+    # pylint: disable=too-many-arguments
+
+    if source_file.type is FileTypes.c:
+        arguments = ["cc", "-c", "-Wall", "-x", "c"]
+    elif source_file.type is FileTypes.cpp:
+        arguments = ["c++", "-c", "-Wall", "-x", "c++"]
+    else:
+        return None
+
+    file_name = convert_to_linux_slashes(source_file.relative_pathname)
+    arguments.extend(["-I" + convert_to_linux_slashes(x)
+                      for x in include_list])
+    arguments.extend(get_c_flags(configuration))
+
+    # The precompiled header is included before the source
+    if source_file.type is precompiled_type and \
+            configuration.precompiled_header:
+        arguments.extend(("-include", convert_to_linux_slashes(
+            configuration.precompiled_header)))
+    arguments.extend((file_name, "-o", object_file))
+    return {
+        "directory": working_directory,
+        "arguments": arguments,
+        "file": file_name,
+        "output": object_file}
+
+########################################
+
+
+def save_compile_commands(solution, entries, temp_folders):
+    """
+    Save a ``compile_commands.json`` file for clang tooling.
+
+    The file is saved in the same folder as the generated project and is
+    only written if the entries changed. The entries of the other projects
+    generated in the folder, such as a ninja file next to a makefile, are
+    kept. The old entries of this project, found by the object files in its
+    temp folders, are replaced, so deleted source files and configurations
+    are removed. The file has absolute pathnames, so it's never added to
+    version control.
+
+    Args:
+        solution: Solution being generated
+        entries: List of dict entries from get_compile_command()
+        temp_folders: Iterable of the start of the names of the temp folders
+            of this project, such as ``temp/hellomak``
+    """
+
+    file_name = os.path.join(solution.working_directory, _COMPILE_COMMANDS)
+    temp_folders = tuple(temp_folders)
+
+    # Merge with the copy waiting to be saved, or the one on disk
+    old_entries = None
+    text_lines = solution.file_batch.pop_pending(file_name)
+    try:
+        if text_lines is not None:
+            old_entries = json.loads("\n".join(text_lines))
+        else:
+            with open(file_name, "r") as fp:
+                old_entries = json.load(fp)
+    except (IOError, OSError, ValueError):
+        pass
+
+    merged = {}
+    if isinstance(old_entries, list):
+        for item in old_entries:
+            if isinstance(item, dict):
+                output = str(item.get("output"))
+                if not output.startswith(temp_folders):
+                    merged[(str(item.get("file")), output)] = item
+    for item in entries:
+        merged[(item["file"], item["output"])] = item
+
+    solution.file_batch.save_text_file_if_newer(
+        file_name,
+        json.dumps([merged[x] for x in sorted(merged)], indent=2,
+                   sort_keys=True, separators=(",", ": ")).splitlines(),
+        bom=False,
+        perforce=False)
+
+########################################
+
+
 class MakeProject(object):
     """
     Root object for a Makefile make file
@@ -326,6 +658,8 @@ class MakeProject(object):
         configuration_names: List of configuration names
         custom_list: List of custom built files
         output_list: List of custom output files
+        rule_cache: True if custom files are built with ``rulecache``
+        precompiled_type: Type of the files using the precompiled header
     """
 
     def __init__(self, solution):
@@ -352,6 +686,9 @@ class MakeProject(object):
                 [FileTypes.h, FileTypes.cpp, FileTypes.c, FileTypes.x86,
                  FileTypes.x64, FileTypes.glsl])
 
+            # Compile unity files instead of the grouped files
+            save_unity_files(solution, project.add_unity_files())
+
             # Keep a copy of the filenames for now
             codefiles = project.codefiles
 
@@ -384,6 +721,16 @@ class MakeProject(object):
         self.custom_list = custom_list
         self.output_list = get_output_list(custom_list)
 
+        # Use the rule cache if any configuration asks for it
+        self.rule_cache = any(
+            x.rule_cache for x in self.configuration_list)
+
+        # Which source files use the precompiled header
+        self.precompiled_type = None
+        if solution.project_list:
+            self.precompiled_type = get_precompiled_header_type(
+                self.configuration_list, solution.project_list[0].codefiles)
+
     ########################################
 
     def write_header(self, line_list):
@@ -834,22 +1181,12 @@ class MakeProject(object):
 
         # Extract the directories from the files
         # Sort them for consistent diffs for source control
-        include_folders = []
-        source_folders = []
-        for configuration in self.configuration_list:
-            for item in configuration.get_unique_chained_list(
-                    "_source_include_list"):
-                if item not in source_folders:
-                    source_folders.append(item)
-
-            for item in configuration.get_unique_chained_list(
-                    "include_folders_list"):
-                if item not in include_folders:
-                    include_folders.append(item)
+        source_folders, include_folders = get_include_folders(
+            self.configuration_list)
 
         if source_folders:
             colon = ":="
-            for item in sorted(source_folders):
+            for item in source_folders:
                 line_list.append(
                     "SOURCE_DIRS " +
                     colon +
@@ -896,26 +1233,7 @@ class MakeProject(object):
 
         for configuration in self.configuration_list:
             entries = ["CFlags" + configuration.make_name + ":="]
-
-            # Enable debug information
-            if configuration.debug:
-                entries.append("-g")
-
-            # Enable optimization
-            if configuration.optimization:
-                entries.append("-O3")
-            else:
-                entries.append("-Og")
-
-            # Enable relocation for shared libraries
-            if configuration.project_type is ProjectTypes.sharedlibrary:
-                entries.append("-fPIC")
-
-            # Add defines
-            define_list = configuration.get_chained_list("define_list")
-            for item in define_list:
-                entries.append("-D" + item)
-
+            entries.extend(get_c_flags(configuration))
             line_list.append(" ".join(entries))
         return 0
 
@@ -941,15 +1259,7 @@ class MakeProject(object):
 
         for configuration in self.configuration_list:
             entries = ["AFlags" + configuration.make_name + ":="]
-
-            # Add defines
-            define_list = configuration.get_chained_list("define_list")
-            for item in define_list:
-                if item.find("=") == -1:
-                    entries.append("--defsym " + item + "=1")
-                else:
-                    entries.append("--defsym " + item)
-
+            entries.extend(get_asm_flags(configuration))
             line_list.append(" ".join(entries))
         return 0
 
@@ -974,32 +1284,7 @@ class MakeProject(object):
 
         for configuration in self.configuration_list:
             entries = ["LFlags" + configuration.make_name + ":="]
-
-            # Enable debug information
-            if configuration.debug:
-                entries.append("-g")
-
-            if configuration.project_type is ProjectTypes.sharedlibrary:
-                entries.append("-shared")
-
-            # Add libraries
-
-            if not configuration.project_type.is_library():
-                lib_list = configuration.get_unique_chained_list(
-                    "libraries_list")
-
-                for item in lib_list:
-                    # Special case, if the lib has the name libfoo.a,
-                    # remove the prefix and suffix for the linker
-                    if item.startswith("lib") and item.endswith(".a"):
-                        item = item[3:-2]
-                    entries.append("-l" + item)
-
-                lib_list = configuration.get_unique_chained_list(
-                    "library_folders_list")
-                for item in lib_list:
-                    entries.append("-L" + convert_to_linux_slashes(item))
-
+            entries.extend(get_link_flags(configuration))
             line_list.append(" ".join(entries))
 
         return 0
@@ -1020,14 +1305,46 @@ class MakeProject(object):
         self._setasmflags(line_list)
         self._setlinkerflags(line_list)
 
+        # Only the files of the same language use the precompiled header
+        c_flags = "$(CFlags$(CONFIG)$(TARGET))"
+        cpp_flags = c_flags
+        if self.precompiled_type is FileTypes.c:
+            c_flags += " $(PCH_FLAGS)"
+        elif self.precompiled_type is FileTypes.cpp:
+            cpp_flags += " $(PCH_FLAGS)"
+
+        # Prefix the compilers with a launcher such as ccache
+        launcher = ""
+        options = ""
+        launcher_list = [
+            x for x in self.configuration_list if x.compiler_launcher]
+        if launcher_list:
+            line_list.extend((
+                "",
+                "#",
+                "# Set the compiler launcher for each of the build types",
+                "#",
+                ""))
+            for configuration in launcher_list:
+                line_list.append(
+                    "Launcher" + configuration.make_name + ":=" +
+                    configuration.compiler_launcher)
+            launcher = "$(Launcher$(CONFIG)$(TARGET)) "
+
+            # Keep the checkout folder out of the debug information so
+            # the cached objects are the same in every checkout
+            options = " -fdebug-prefix-map=$(CURDIR)=."
+
         # Build rules
         line_list.extend((
             "",
             "# Now, set the compiler flags",
             "",
             "C_INCLUDES:=$(addprefix -I,$(INCLUDE_DIRS))",
-            "CL:=$(CC) -c -Wall -x c $(C_INCLUDES)",
-            "CP:=$(CXX) -c -Wall -x c++ $(C_INCLUDES)",
+            "CL:=" + launcher + "$(CC) -c -Wall -x c" + options +
+            " $(C_INCLUDES)",
+            "CP:=" + launcher + "$(CXX) -c -Wall -x c++" + options +
+            " $(C_INCLUDES)",
             "ASM:=$(AS)",
             "LINK:=$(CXX)",
             "",
@@ -1037,13 +1354,13 @@ class MakeProject(object):
             "",
             "define BUILD_C=",
             "@echo $(<F) / $(CONFIG) / $(TARGET); \\",
-            "$(CL) $(CFlags$(CONFIG)$(TARGET)) $< -o $@ "
+            "$(CL) " + c_flags + " $< -o $@ "
             "-MT '$@' -MMD -MF '$*.d'",
             "endef",
             "",
             "define BUILD_CPP=",
             "@echo $(<F) / $(CONFIG) / $(TARGET); \\",
-            "$(CP) $(CFlags$(CONFIG)$(TARGET)) $< -o $@ "
+            "$(CP) " + cpp_flags + " $< -o $@ "
             "-MT '$@' -MMD -MF '$*.d'",
             "endef",
             "",
@@ -1129,6 +1446,62 @@ class MakeProject(object):
 
     ########################################
 
+    def write_precompiled_header(self, line_list):
+        """
+        Output the rule to build the precompiled header.
+
+        The header is compiled into the temp folder and every object file
+        depends on it. gcc and clang use the compiled copy when the path to
+        the header without the .gch extension is included.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        if self.precompiled_type is None:
+            return 0
+
+        line_list.extend((
+            "",
+            "#",
+            "# Precompiled header for each of the build types",
+            "#",
+            ""))
+
+        for configuration in self.configuration_list:
+            if configuration.precompiled_header:
+                line_list.append(
+                    "PCH" + configuration.make_name + ":=" +
+                    convert_to_linux_slashes(
+                        configuration.precompiled_header))
+
+        if self.precompiled_type is FileTypes.c:
+            build = "$(CC) -c -Wall -x c-header"
+        else:
+            build = "$(CXX) -c -Wall -x c++-header"
+
+        line_list.extend((
+            "",
+            "PCH_SOURCE:=$(PCH$(CONFIG)$(TARGET))",
+            "ifneq (,$(PCH_SOURCE))",
+            "PCH:=$(TEMP_DIR)/$(notdir $(PCH_SOURCE)).gch",
+            "PCH_FLAGS:=-include $(basename $(PCH)) -Winvalid-pch",
+            "DEPS+=$(basename $(PCH)).d",
+            "",
+            "$(OBJS): $(PCH)",
+            "",
+            "$(PCH): $(PCH_SOURCE) | $(TEMP_DIR)",
+            "\t@echo $(<F) / $(CONFIG) / $(TARGET); \\",
+            "\t" + build + " $(C_INCLUDES) $(CFlags$(CONFIG)$(TARGET)) "
+            "$< -o $@ -MT '$@' -MMD -MF '$(basename $@).d'",
+            "endif"
+        ))
+        return 0
+
+    ########################################
+
     def write_all_target(self, line_list):
         """
         Output the ``all`` rule
@@ -1261,8 +1634,11 @@ class MakeProject(object):
                 " ".join(entry[2]) + " : " +
                 convert_to_linux_slashes(
                     entry[3].relative_pathname))
+            cmd = entry[0]
+            if self.rule_cache:
+                cmd = make_rule_cache_command(entry)
             line_list.append("\t@echo " + entry[1])
-            line_list.append("\t@" + convert_to_linux_slashes(entry[0]))
+            line_list.append("\t@" + convert_to_linux_slashes(cmd))
 
             for output_test in entry[2]:
                 output_list.remove(output_test)
@@ -1368,6 +1744,44 @@ class MakeProject(object):
 
     ########################################
 
+    def get_compile_commands(self):
+        """
+        Create the compilation database entries.
+
+        There is one entry for every C and C++ file for every configuration,
+        using the same flags as the makefile.
+
+        Returns:
+            List of dict entries for ``compile_commands.json``.
+        """
+
+        source_folders, include_folders = get_include_folders(
+            self.configuration_list)
+        include_list = source_folders + include_folders
+
+        if self.solution.project_list:
+            codefiles = self.solution.project_list[0].codefiles
+        else:
+            codefiles = []
+
+        entries = []
+        for configuration in self.configuration_list:
+            temp_dir = "temp/" + self.solution.name + "mak" + \
+                configuration.platform.get_short_code()[-3:] + \
+                configuration.short_code
+            for item in codefiles:
+                entry = os.path.splitext(os.path.basename(
+                    convert_to_linux_slashes(item.relative_pathname)))[0]
+                entry = get_compile_command(
+                    self.solution.working_directory, configuration,
+                    include_list, item, temp_dir + "/" + entry + ".o",
+                    self.precompiled_type)
+                if entry:
+                    entries.append(entry)
+        return entries
+
+    ########################################
+
     def generate(self, line_list=None):
         """
         Write out the makefile project.
@@ -1401,6 +1815,7 @@ class MakeProject(object):
         self.write_source_dir(line_list)
         self.write_rules(line_list)
         self.write_files(line_list)
+        self.write_precompiled_header(line_list)
         self.write_all_target(line_list)
         self.write_custom_files(line_list)
         self.write_builds(line_list)
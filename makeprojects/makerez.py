@@ -18,7 +18,7 @@ Regex for matching files with *.rezscript
 from __future__ import absolute_import, print_function, unicode_literals
 
 from re import compile as re_compile
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_referenced_files
 
 _REZFILE_MATCH = re_compile('(?is).*\\.rezscript\\Z')
 
@@ -75,6 +75,20 @@ class BuildRezFile(BuildObject):
 
     ########################################
 
+    def get_input_files(self):
+        """
+        Return the files this build reads.
+
+        The script and the files it puts in the resource file.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(self.file_name)
+
+    ########################################
+
     def clean(self):
         """
         Delete temporary files.
@@ -16,8 +16,29 @@ Handler for Ninja projects
 This module contains classes needed to generate
 project files intended for use by ninja
 
-@var makeprojects.codeblocks._NINJAFILE_MATCH
+@var makeprojects.ninja.SUPPORTED_IDES
+List of IDETypes the ninja module supports.
+
+@var makeprojects.ninja._NINJAFILE_MATCH
 Regex for matching files with *.ninja
+
+@var makeprojects.ninja._MAKE_VARIABLE
+Regex for matching make style $(VARIABLE) environment variables
+
+@var makeprojects.ninja._LINK_POOL_DEPTH
+Number of link steps allowed to run at the same time
+
+@var makeprojects.ninja._DEPLOY
+Deploy a file without source control
+
+@var makeprojects.ninja._DEPLOY_PERFORCE
+Using perforce, deploy a file
+
+@var makeprojects.ninja._NINJA_JOBSERVER
+True if ninja supports the job server, None if not checked yet
+
+@var makeprojects.ninja._OBJECT_TYPES
+FileTypes that are compiled into object files
 """
 
 # pylint: disable=consider-using-f-string
@@ -26,12 +47,85 @@ Regex for matching files with *.ninja
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import os
 from re import compile as re_compile
+from burger import encapsulate_path_linux, convert_to_linux_slashes, \
+    run_command
+
+from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes, \
+    get_output_template
+from .build_objects import BuildObject, BuildError, get_job_arguments, \
+    get_jobserver
+from .core import save_unity_files
+from .artifacts import get_generated_artifacts
+from .watcom_util import get_custom_list, get_output_list, \
+    make_rule_cache_command
+from .makefile import get_include_folders, get_c_flags, get_asm_flags, \
+    get_link_flags, get_compile_command, save_compile_commands, \
+    get_precompiled_header_type
 
-from .build_objects import BuildObject, BuildError
+# IDEs supported by this generator
+SUPPORTED_IDES = (IDETypes.ninja,)
+
+# FileTypes that are compiled into object files
+_OBJECT_TYPES = (FileTypes.c, FileTypes.cpp, FileTypes.x86, FileTypes.x64)
 
 _NINJAFILE_MATCH = re_compile('(?is).*\\.ninja\\Z')
 
+# Match $(VARIABLE) so it can be converted to ${VARIABLE} for the shell
+_MAKE_VARIABLE = re_compile("\\$\\((\\w+)\\)")
+
+# Linking is memory and disk bound, so only allow one at a time
+_LINK_POOL_DEPTH = 1
+
+# Deploy a file without source control
+_DEPLOY = " && cp -T $out \"{0}{1}\""
+
+# Using perforce, deploy a file
+_DEPLOY_PERFORCE = (
+    " && if [ -f /bin/wslpath ]; then "
+    "p4.exe edit $$(wslpath -a -w \"{0}{1}\") && "
+    "cp -T $out \"{0}{1}\" && "
+    "p4.exe revert -a $$(wslpath -a -w \"{0}{1}\"); "
+    "else "
+    "p4 edit \"{0}{1}\" && "
+    "cp -T $out \"{0}{1}\" && "
+    "p4 revert -a \"{0}{1}\"; "
+    "fi")
+
+# True if ninja supports the job server, None if not checked yet
+_NINJA_JOBSERVER = None
+
+########################################
+
+
+def has_jobserver():
+    """
+    Test if ``ninja`` can use the GNU make job server.
+
+    Support was added in ``ninja`` 1.13, older versions ignore the job server
+    and need the number of jobs on the command line. The version is only
+    checked once.
+
+    Returns:
+        True if ``ninja`` is 1.13 or later.
+    """
+
+    # pylint: disable=global-statement
+    global _NINJA_JOBSERVER
+
+    if _NINJA_JOBSERVER is None:
+        _NINJA_JOBSERVER = False
+        try:
+            version = run_command(
+                ["ninja", "--version"], quiet=True, capture_stdout=True)[1]
+            version = tuple(
+                int(x) for x in version.strip().split(".")[:2])
+            _NINJA_JOBSERVER = version >= (1, 13)
+        except (ValueError, TypeError, AttributeError):
+            pass
+    return _NINJA_JOBSERVER
+
 
 ########################################
 
@@ -44,6 +138,11 @@ class BuildNinjaFile(BuildObject):
         verbose: Save the verbose flag
     """
 
+    # ninja runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     def __init__(self, file_name, priority, configuration, verbose=False):
         """
         Class to handle Ninja make files
@@ -70,12 +169,19 @@ class BuildNinjaFile(BuildObject):
         """
 
         # Build the requested target configuration
-        cmd = ['ninja', '-f', self.file_name, self.configuration]
+        jobserver = get_jobserver()
+        if jobserver is not None and not has_jobserver():
+            jobserver = None
+        cmd = ['ninja']
+        cmd.extend(get_job_arguments(jobserver is not None))
+        cmd.extend(('-f', self.file_name, self.configuration))
 
         if self.verbose:
             print(' '.join(cmd))
 
-        return self.run_command(cmd, self.verbose)
+        # ninja only opens the job server by name
+        return self.run_command(
+            cmd, self.verbose, jobserver, use_fifo=True)
 
     ########################################
 
@@ -94,6 +200,24 @@ class BuildNinjaFile(BuildObject):
         return BuildError(0, self.file_name,
                           msg="Ninja doesn't support cleaning")
 
+    ########################################
+
+    def get_artifacts(self):
+        """
+        Return the files the build created.
+
+        Ninja files created by makeprojects don't have a ``clean`` target, so
+        they're cleaned by deleting the files directly. A single
+        configuration can't be cleaned.
+
+        Returns:
+            List of pathnames, or None if the files aren't known.
+        """
+
+        if self.configuration != "clean":
+            return None
+        return get_generated_artifacts(self.file_name)
+
 ########################################
 
 
@@ -168,3 +292,847 @@ def create_clean_object(file_name, priority=50,
                 configuration,
                 verbose))
     return results
+
+########################################
+
+
+def test(ide, platform_type):
+    """
+    Filter for supported platforms
+
+    Args:
+        ide: IDETypes
+        platform_type: PlatformTypes
+    Returns:
+        True if supported, False if not
+    """
+
+    # pylint: disable=unused-argument
+
+    return platform_type is PlatformTypes.linux
+
+########################################
+
+
+def generate(solution):
+    """
+    Create a ninja build file.
+    Given a Solution object, generate a .ninja file.
+
+    Args:
+        solution: A Solution object
+    Returns:
+        0 if no error, or an non-zero error code.
+    """
+
+    # Failsafe
+    if solution.ide not in SUPPORTED_IDES:
+        return 10
+
+    # Create the output filename and pass it to the generator
+    # so it can reference itself in build statements
+    solution.ninja_filename = "{}{}{}.ninja".format(
+        solution.name, solution.ide_code, solution.platform_code)
+
+    # Create an instance of the generator
+    exporter = NinjaProject(solution)
+
+    # Output the actual project file
+    ninja_lines = []
+    error = exporter.generate(ninja_lines)
+    if error:
+        return error
+
+    # Handle any post processing
+    ninja_lines = solution.post_process(ninja_lines)
+
+    # Save the file if it changed
+    solution.file_batch.save_text_file_if_newer(
+        os.path.join(solution.working_directory, solution.ninja_filename),
+        ninja_lines,
+        bom=False,
+        perforce=solution.perforce)
+
+    # Save the compilation database for clang tooling
+    save_compile_commands(
+        solution, exporter.get_compile_commands(),
+        set("temp/" + exporter.get_project_name(x) + solution.ide_code
+            for x in exporter.configuration_list))
+    return 0
+
+########################################
+
+
+def escape_path(path_name):
+    """
+    Escape a pathname for a ninja build statement.
+
+    Spaces, colons and dollar signs have special meaning in build statements
+    and are prefixed with a ``$``.
+
+    Args:
+        path_name: Pathname to escape
+    Returns:
+        Pathname suitable for a ninja build statement.
+    """
+
+    return path_name.replace("$", "$$").replace(
+        " ", "$ ").replace(":", "$:")
+
+########################################
+
+
+def escape_value(value):
+    """
+    Escape a string for a ninja variable or command.
+
+    Args:
+        value: String to escape
+    Returns:
+        String with all ``$`` characters doubled.
+    """
+
+    return value.replace("$", "$$")
+
+########################################
+
+
+def escape_command(command):
+    """
+    Escape a shell command for a ninja rule.
+
+    Make style ``$(VARIABLE)`` environment variables are converted to
+    ``${VARIABLE}`` so they are expanded by the shell.
+
+    Args:
+        command: Command line to escape
+    Returns:
+        Command line suitable for a ninja variable.
+    """
+
+    return escape_value(_MAKE_VARIABLE.sub("${\\1}", command))
+
+########################################
+
+
+def get_duplicate_names(codefiles):
+    """
+    Return the object file names used by more than one source file.
+
+    Files such as ``a/util.cpp`` and ``b/util.c`` would both be compiled
+    into ``util.o``.
+
+    Args:
+        codefiles: List of SourceFile objects of the project
+    Returns:
+        Set of file names without the extension.
+    """
+
+    names = set()
+    duplicates = set()
+    for item in codefiles:
+        if item.type in _OBJECT_TYPES:
+            name = os.path.splitext(os.path.basename(
+                convert_to_linux_slashes(item.relative_pathname)))[0]
+            if name in names:
+                duplicates.add(name)
+            names.add(name)
+    return duplicates
+
+########################################
+
+
+class NinjaProject(object):
+    """
+    Root object for a ninja build file
+    Created with the name of the project, the IDE code
+    the platform code (Linux)
+
+    Attributes:
+        solution: Parent solution
+        platforms: List of all platform types
+        configuration_list: List of all configurations
+        configuration_names: List of configuration names
+        custom_list: List of custom built files
+        output_list: List of custom output files
+        rule_cache: True if custom files are built with ``rulecache``
+    """
+
+    def __init__(self, solution):
+        """
+        Initialize the exporter.
+
+        Args:
+            solution: Solution object to build from.
+        """
+
+        self.solution = solution
+        self.platforms = []
+        self.configuration_list = []
+        self.configuration_names = []
+
+        # Init the list of custom rules
+        custom_list = []
+
+        # Process all the projects and configurations
+        for project in solution.project_list:
+
+            # Process the filenames
+            project.get_file_list(
+                [FileTypes.h, FileTypes.cpp, FileTypes.c, FileTypes.x86,
+                 FileTypes.x64, FileTypes.hlsl, FileTypes.glsl])
+
+            # Compile unity files instead of the grouped files
+            save_unity_files(solution, project.add_unity_files())
+
+            # Keep a copy of the filenames for now
+            codefiles = project.codefiles
+
+            # Object files with the same name need their directories
+            project.ninja_duplicates = get_duplicate_names(codefiles)
+
+            # Add to the master list
+            self.configuration_list.extend(project.configuration_list)
+
+            # Create sets of configuration names and projects
+            for configuration in project.configuration_list:
+
+                configuration.ninja_name = \
+                    self.get_project_name(configuration, "") + \
+                    configuration.name + \
+                    configuration.platform.get_short_code()
+
+                # Add only if not already present
+                for item in self.configuration_names:
+                    if configuration.name == item.name:
+                        break
+                else:
+                    self.configuration_names.append(configuration)
+
+                # Add platform if not already found
+                if configuration.platform not in self.platforms:
+                    self.platforms.append(configuration.platform)
+
+                # Get the rule list
+                rule_list = (configuration.custom_rules,
+                             configuration.parent.custom_rules,
+                             configuration.parent.parent.custom_rules)
+                get_custom_list(custom_list, rule_list, codefiles)
+
+        self.custom_list = custom_list
+        self.output_list = get_output_list(custom_list)
+
+        # Use the rule cache if any configuration asks for it
+        self.rule_cache = any(
+            x.rule_cache for x in self.configuration_list)
+
+    ########################################
+
+    def get_project_name(self, configuration, default=None):
+        """
+        Return the name that keeps the projects of a solution apart.
+
+        Rules, targets and files of solutions with several projects start
+        with the project name, solutions with a single project keep the
+        shorter names.
+
+        Args:
+            configuration: Configuration to build
+            default: Name to use for single project solutions, None for
+                the solution name
+        Returns:
+            The project name if there are several projects.
+        """
+
+        if len(self.solution.project_list) > 1:
+            return configuration.parent.name
+        if default is None:
+            return self.solution.name
+        return default
+
+    ########################################
+
+    def get_bin_folder(self, configuration):
+        """
+        Return the base name of the temp folder and binary.
+
+        Args:
+            configuration: Configuration to build
+        Returns:
+            String such as ``projectninlnxdbg``.
+        """
+
+        return self.get_project_name(configuration) + \
+            self.solution.ide_code + \
+            configuration.platform.get_short_code()[-3:] + \
+            configuration.short_code
+
+    ########################################
+
+    def get_object_file(self, configuration, source_file):
+        """
+        Return the pathname of the object file for a source file.
+
+        If another source file of the project has the same name, the
+        directory of the source file is kept, with ``..`` replaced with
+        ``__`` so the object file stays in the temp folder.
+
+        Args:
+            configuration: Configuration to build
+            source_file: SourceFile to compile
+        Returns:
+            Pathname such as ``temp/projectninlnxdbg/file.o``.
+        """
+
+        # Hack off the extension and the directory prefix
+        entry = os.path.splitext(
+            convert_to_linux_slashes(source_file.relative_pathname))[0]
+        name = os.path.basename(entry)
+        if name in configuration.parent.ninja_duplicates:
+            name = "/".join(
+                "__" if item == ".." else item.replace(":", "_")
+                for item in entry.split("/") if item not in ("", "."))
+        return "temp/" + self.get_bin_folder(configuration) + "/" + \
+            name + ".o"
+
+    ########################################
+
+    def get_precompiled_header(self, configuration):
+        """
+        Return the compiled precompiled header for a configuration.
+
+        Args:
+            configuration: Configuration to build
+        Returns:
+            Tuple of the type of the files using it and the pathname such as
+            ``temp/projectninlnxdbg/stdafx.h.gch``, or (None, None).
+        """
+
+        precompiled_type = get_precompiled_header_type(
+            (configuration,), configuration.parent.codefiles)
+        if precompiled_type is None:
+            return None, None
+        return precompiled_type, "temp/" + \
+            self.get_bin_folder(configuration) + "/" + os.path.basename(
+                convert_to_linux_slashes(
+                    configuration.precompiled_header)) + ".gch"
+
+    ########################################
+
+    def get_compile_commands(self):
+        """
+        Create the compilation database entries.
+
+        There is one entry for every C and C++ file for every configuration,
+        using the same flags as the ninja file.
+
+        Returns:
+            List of dict entries for ``compile_commands.json``.
+        """
+
+        source_folders, include_folders = get_include_folders(
+            self.configuration_list)
+        include_list = source_folders + include_folders
+
+        entries = []
+        for configuration in self.configuration_list:
+            precompiled_type = self.get_precompiled_header(configuration)[0]
+            for item in configuration.parent.codefiles:
+                entry = get_compile_command(
+                    self.solution.working_directory, configuration,
+                    include_list, item,
+                    self.get_object_file(configuration, item),
+                    precompiled_type)
+                if entry:
+                    entries.append(entry)
+        return entries
+
+    ########################################
+
+    def write_header(self, line_list):
+        """
+        Write the header for a ninja file
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        line_list.extend((
+            "#",
+            "# Build " + self.solution.name + " with ninja",
+            "# Generated with makeprojects.ninja",
+            "#",
+            "",
+            "# Pools require 1.1 and deps require 1.3",
+            "ninja_required_version = 1.3",
+            "",
+            "#",
+            "# Tools to build with",
+            "#",
+            "",
+            "cc = cc",
+            "cxx = c++",
+            "as = as",
+            "ar = ar",
+            "link = c++",
+            "",
+            "#",
+            "# Limit the number of concurrent link steps",
+            "#",
+            "",
+            "pool link_pool",
+            "  depth = {}".format(_LINK_POOL_DEPTH)))
+        return 0
+
+    ########################################
+
+    def write_source_dir(self, line_list):
+        """
+        Write out the list of directories for the header search
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        # Extract the directories from the files
+        # Sort them for consistent diffs for source control
+        source_folders, include_folders = get_include_folders(
+            self.configuration_list)
+
+        entries = ["includes ="]
+        for item in source_folders:
+            entries.append("-I" + encapsulate_path_linux(item))
+        for item in include_folders:
+            entries.append("-I" + convert_to_linux_slashes(item))
+
+        line_list.extend((
+            "",
+            "#",
+            "# Header includes",
+            "#",
+            "",
+            escape_value(" ".join(entries))))
+        return 0
+
+    ########################################
+
+    def write_flags(self, line_list):
+        """
+        Output the compiler, assembler and linker flags.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        line_list.extend((
+            "",
+            "#",
+            "# Set the flags for each of the build types",
+            "#"))
+
+        for configuration in self.configuration_list:
+
+            # Same flags as the makefile generator
+            name = configuration.ninja_name
+            line_list.extend((
+                "",
+                escape_value(" ".join(
+                    ["cflags_" + name + " ="] + get_c_flags(configuration))),
+                escape_value(" ".join(
+                    ["aflags_" + name + " ="] +
+                    get_asm_flags(configuration))),
+                escape_value(" ".join(
+                    ["lflags_" + name + " ="] +
+                    get_link_flags(configuration)))))
+        return 0
+
+    ########################################
+
+    def _get_deploy_command(self, configuration):
+        """
+        Return the shell commands to deploy a binary.
+
+        Args:
+            configuration: Configuration being linked
+        Returns:
+            String to append to the link command, empty for no deployment.
+        """
+
+        if not configuration.deploy_folder:
+            return ""
+
+        # Convert to proper slashes and make sure there's an
+        # ending slash
+        deploy_folder = convert_to_linux_slashes(
+            configuration.deploy_folder,
+            force_ending_slash=True)
+
+        # Environment variables are expanded by the shell
+        deploy_folder = escape_command(deploy_folder)
+
+        # Executables use the native name
+        if configuration.project_type.is_library():
+            binary_name = get_output_template(
+                configuration.project_type, configuration.platform).format(
+                    self.get_bin_folder(configuration))
+        else:
+            binary_name = self.get_project_name(configuration)
+
+        # Which command to use? Perforce or not?
+        if configuration.get_chained_value("perforce"):
+            deploy_command = _DEPLOY_PERFORCE
+        else:
+            deploy_command = _DEPLOY
+        return deploy_command.format(deploy_folder, binary_name)
+
+    ########################################
+
+    def write_rules(self, line_list):
+        """
+        Output the rules for building object code and binaries
+
+        Each configuration has its own set of rules so the flags are
+        only declared once.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        line_list.extend((
+            "",
+            "#",
+            "# Build rules for each of the build types",
+            "#"))
+
+        for configuration in self.configuration_list:
+            name = configuration.ninja_name
+            description = "$in / {} / {}".format(
+                configuration.name, configuration.platform.get_short_code())
+
+            # Only the files of the same language use the precompiled header
+            c_flags = " $cflags_" + name
+            cpp_flags = c_flags
+            precompiled_type, precompiled_header = \
+                self.get_precompiled_header(configuration)
+            if precompiled_type is not None:
+                pch_flags = " -include " + \
+                    escape_value(precompiled_header[:-4]) + " -Winvalid-pch"
+                if precompiled_type is FileTypes.c:
+                    line_list.extend((
+                        "",
+                        "rule pch_" + name,
+                        "  command = $cc -c -Wall -x c-header $includes" +
+                        c_flags +
+                        " $in -o $out -MT $out -MMD -MF $out.d"))
+                    c_flags += pch_flags
+                else:
+                    line_list.extend((
+                        "",
+                        "rule pch_" + name,
+                        "  command = $cxx -c -Wall -x c++-header $includes" +
+                        cpp_flags +
+                        " $in -o $out -MT $out -MMD -MF $out.d"))
+                    cpp_flags += pch_flags
+                line_list.extend((
+                    "  depfile = $out.d",
+                    "  deps = gcc",
+                    "  description = " + description))
+
+            # Prefix the compilers with a launcher such as ccache
+            launcher = ""
+            options = ""
+            if configuration.compiler_launcher:
+                launcher = escape_command(
+                    configuration.compiler_launcher) + " "
+
+                # Keep the checkout folder out of the debug information so
+                # the cached objects are the same in every checkout
+                options = " -fdebug-prefix-map=$$PWD=."
+
+            line_list.extend((
+                "",
+                "rule cc_" + name,
+                "  command = " + launcher + "$cc -c -Wall -x c" + options +
+                " $includes" + c_flags +
+                " $in -o $out -MT $out -MMD -MF $out.d",
+                "  depfile = $out.d",
+                "  deps = gcc",
+                "  description = " + description,
+                "",
+                "rule cxx_" + name,
+                "  command = " + launcher + "$cxx -c -Wall -x c++" + options +
+                " $includes" + cpp_flags +
+                " $in -o $out -MT $out -MMD -MF $out.d",
+                "  depfile = $out.d",
+                "  deps = gcc",
+                "  description = " + description,
+                "",
+                "rule asmx86_" + name,
+                "  command = $as --defsym __i386__=1 $aflags_" + name +
+                " $in -o $out -MD $out.d",
+                "  depfile = $out.d",
+                "  deps = gcc",
+                "  description = " + description,
+                "",
+                "rule asmx64_" + name,
+                "  command = $as --defsym __amd64__=1 $aflags_" + name +
+                " $in -o $out -MD $out.d",
+                "  depfile = $out.d",
+                "  deps = gcc",
+                "  description = " + description,
+                ""))
+
+            # Invoke the proper linker for a library or exe
+            deploy = self._get_deploy_command(configuration)
+            if configuration.project_type is ProjectTypes.library:
+                line_list.extend((
+                    "rule ar_" + name,
+                    "  command = rm -f $out && $ar -rcs $out $in" + deploy,
+                    "  description = Creating library $out"))
+            else:
+                line_list.extend((
+                    "rule link_" + name,
+                    "  command = $link -o $out $in $lflags_" + name + deploy,
+                    "  description = Performing link $out"))
+            line_list.append("  pool = link_pool")
+
+        # Generic rule for HLSL/GLSL and other custom files
+        if self.custom_list:
+            line_list.extend((
+                "",
+                "rule custom",
+                "  command = $cmd",
+                "  description = $desc"))
+        return 0
+
+    ########################################
+
+    def write_custom_files(self, line_list):
+        """
+        Output the build statements for custom files.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        # Get a list of custom files
+        if not self.custom_list:
+            return 0
+
+        line_list.extend([
+            "",
+            "#",
+            "# Build custom files",
+            "#"
+        ])
+
+        # Output the build statements in the order of the output files
+        output_list = list(self.output_list)
+        while output_list:
+
+            output = output_list[0]
+
+            entry = None
+            for item in self.custom_list:
+                for output_test in item[2]:
+                    if output_test == output:
+                        entry = item
+                        break
+                if entry:
+                    break
+
+            else:
+                output_list.remove(output)
+                continue
+
+            cmd = entry[0]
+            if self.rule_cache:
+                cmd = make_rule_cache_command(entry)
+            line_list.extend((
+                "",
+                "build " + " ".join([escape_path(x) for x in entry[2]]) +
+                ": custom " + escape_path(convert_to_linux_slashes(
+                    entry[3].relative_pathname)),
+                "  cmd = " + escape_command(
+                    convert_to_linux_slashes(cmd)),
+                "  desc = " + escape_value(entry[1])))
+
+            for output_test in entry[2]:
+                output_list.remove(output_test)
+
+        return 0
+
+    ########################################
+
+    def write_builds(self, line_list):
+        """
+        Output the build statements for the object files and binaries.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        # The custom files are built before any binary
+        extra_objs = ""
+        if self.output_list:
+            extra_objs = " | " + " ".join(
+                [escape_path(x) for x in self.output_list])
+
+        for configuration in self.configuration_list:
+            name = configuration.ninja_name
+            bin_folder = self.get_bin_folder(configuration)
+
+            line_list.extend((
+                "",
+                "#",
+                "# Build " + name,
+                "#",
+                ""))
+
+            # Every object file depends on the precompiled header
+            precompiled_type, precompiled_header = \
+                self.get_precompiled_header(configuration)
+            order = ""
+            if precompiled_type is not None:
+                precompiled_header = escape_path(precompiled_header)
+                line_list.append(
+                    "build " + precompiled_header + ": pch_" + name + " " +
+                    escape_path(convert_to_linux_slashes(
+                        configuration.precompiled_header)))
+                order = " | " + precompiled_header
+
+            # Compile all of the source files
+            obj_list = []
+            for item in configuration.parent.codefiles:
+                if item.type is FileTypes.c:
+                    rule = "cc_"
+                elif item.type is FileTypes.cpp:
+                    rule = "cxx_"
+                elif item.type is FileTypes.x86:
+                    rule = "asmx86_"
+                elif item.type is FileTypes.x64:
+                    rule = "asmx64_"
+                else:
+                    continue
+
+                obj_name = escape_path(
+                    self.get_object_file(configuration, item))
+                obj_list.append(obj_name)
+                line_list.append(
+                    "build " + obj_name + ": " + rule + name + " " +
+                    escape_path(convert_to_linux_slashes(
+                        item.relative_pathname)) + order)
+
+            # Create the final binary
+            template = get_output_template(
+                configuration.project_type, configuration.platform)
+            binary_name = "bin/" + template.format(bin_folder)
+
+            if configuration.project_type is ProjectTypes.library:
+                rule = "ar_"
+            else:
+                rule = "link_"
+
+            line_list.extend((
+                "",
+                "build " + escape_path(binary_name) + ": " + rule + name +
+                " " + " ".join(sorted(obj_list)) + extra_objs,
+                "",
+                "build " + name + ": phony " + escape_path(binary_name)))
+        return 0
+
+    ########################################
+
+    def write_phony_targets(self, line_list):
+        """
+        Output the phony targets for configurations and platforms.
+
+        ``all`` builds everything and is the default, each configuration name
+        builds that configuration for all platforms, and each platform short
+        code builds all configurations for that platform.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        line_list.extend((
+            "",
+            "#",
+            "# Configurations",
+            "#",
+            ""))
+
+        for configuration in self.configuration_names:
+            target_list = []
+            for item in self.configuration_list:
+                if item.name == configuration.name:
+                    target_list.append(item.ninja_name)
+            line_list.append(
+                "build " + configuration.name + ": phony " +
+                " ".join(target_list))
+
+        line_list.extend((
+            "",
+            "#",
+            "# Platforms",
+            "#",
+            ""))
+
+        for platform in self.platforms:
+            target_list = []
+            for item in self.configuration_list:
+                if item.platform is platform:
+                    target_list.append(item.ninja_name)
+            line_list.append(
+                "build " + platform.get_short_code() + ": phony " +
+                " ".join(target_list))
+
+        line_list.extend((
+            "",
+            "#",
+            "# Build everything by default",
+            "#",
+            "",
+            "build all: phony " + " ".join(
+                [x.name for x in self.configuration_names]),
+            "",
+            "default all"))
+        return 0
+
+    ########################################
+
+    def generate(self, line_list=None):
+        """
+        Write out the ninja build file.
+
+        Args:
+            line_list: string list to save the text
+        Returns:
+            Zero on no error, non-zero on error.
+        """
+
+        if line_list is None:
+            line_list = []
+
+        self.write_header(line_list)
+        self.write_source_dir(line_list)
+        self.write_flags(line_list)
+        self.write_rules(line_list)
+        self.write_custom_files(line_list)
+        self.write_builds(line_list)
+        self.write_phony_targets(line_list)
+        return 0
@@ -6,7 +6,9 @@ Rebuild a project.
 
 Package that handles the command line program ``rebuildme``.
 
-The command ``rebuildme`` calls ``cleanme`` and then ``buildme`` in that order.
+The command ``rebuildme`` calls ``buildme --clean``, which cleans each
+directory right before it's built, so building starts as soon as the first
+directory is clean.
 
 See Also:
     main, makeprojects.buildme, makeprojects.cleanme
@@ -21,7 +23,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import sys
 import os
 import argparse
-from makeprojects import buildme, cleanme
+from makeprojects import buildme
 from .__init__ import __version__
 from .config import BUILD_RULES_PY
 from .util import do_generate_build_rules
@@ -63,7 +65,7 @@ def main(working_directory=None, args=None):
     # Parse the command line
     parser = argparse.ArgumentParser(
         description='Rebuild project files. Copyright by Rebecca Ann Heineman. '
-        'Invokes cleanme and then buildme.')
+        'Cleans and builds each directory in turn.')
 
     parser.add_argument('--version', action='version',
                         version='%(prog)s ' + __version__)
@@ -81,7 +83,7 @@ def main(working_directory=None, args=None):
         default=BUILD_RULES_PY,
         help='Specify a configuration file.')
 
-    parser.add_argument('-f', dest='fatal', action='store_true',
+    parser.add_argument('-q', '-f', dest='fatal', action='store_true',
                         default=False, help='Quit immediately on any error.')
     parser.add_argument('-d', dest='directories', action='append',
                         metavar='<directory>', default=[],
@@ -97,28 +99,25 @@ def main(working_directory=None, args=None):
     if error is not None:
         return error
 
-    # Generate command lines for the tools
-    cleanargs = []
-    buildargs = []
+    # Generate the command line for buildme, which cleans each directory
+    # and then builds it
+    buildargs = ['--clean']
 
     # Recursive
     if parsed.recursive:
-        cleanargs.append("-r")
         buildargs.append("-r")
 
     # Verbose output
     if parsed.verbose:
-        cleanargs.append("-v")
         buildargs.append("-v")
 
     # Config file
     if parsed.rules_file:
-        cleanargs.extend(['--rules-file', parsed.rules_file])
         buildargs.extend(['--rules-file', parsed.rules_file])
 
-    # Fatal
+    # Fatal, buildme uses -f for file names
     if parsed.fatal:
-        buildargs.append('-f')
+        buildargs.append('-q')
 
     # Doxygen
     if parsed.documentation:
@@ -126,22 +125,16 @@ def main(working_directory=None, args=None):
 
     # Directories to build
     for item in parsed.directories:
-        cleanargs.extend(['-d', item])
         buildargs.extend(['-d', item])
 
     # Excess entries
     for item in project_files:
         buildargs.append(item)
 
-    # Clean and then build, couldn't be simpler!
+    # Clean and build each directory in turn
     if parsed.verbose:
-        print('cleanme ' + ' '.join(cleanargs))
-    error = cleanme.main(working_directory, args=cleanargs)
-    if not error:
-        if parsed.verbose:
-            print('buildme ' + ' '.join(buildargs))
-        error = buildme.main(working_directory, args=buildargs)
-    return error
+        print('buildme ' + ' '.join(buildargs))
+    return buildme.main(working_directory, args=buildargs)
 
 
 # If called as a function and not a class, call my main
@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Cache the output of custom build rules.
+
+Package that handles the command line program ``rulecache``.
+
+Makefiles and Watcom makefiles generated with ``rule_cache`` enabled run the
+HLSL and GLSL tools through ``rulecache``. The outputs are saved in a local
+folder, keyed by the contents of the input files, the command line and the
+tool, so a clean build or another branch with the same shader copies the
+headers from the cache instead of running the tool again.
+
+See Also:
+    main, makeprojects.watcom_util.get_custom_list
+
+@package makeprojects.rule_cache
+
+@var makeprojects.rule_cache._CACHE_FOLDER
+Default folder of the cached outputs
+
+@var makeprojects.rule_cache._TOOL_DIGESTS
+Cache of the digests of the tools used by this process
+"""
+
+# pylint: disable=consider-using-f-string
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+import os
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+try:
+    from shutil import which
+except ImportError:
+    from distutils.spawn import find_executable as which
+
+from .__init__ import __version__
+
+# Default folder of the cached outputs
+_CACHE_FOLDER = "~/.makeprojects_cache"
+
+# Digests of the tools, they don't change while the process runs
+_TOOL_DIGESTS = {}
+
+########################################
+
+
+def get_cache_folder(cache_folder=None):
+    """
+    Return the folder the outputs are cached in.
+
+    Args:
+        cache_folder: Folder to use, None for ``MAKEPROJECTS_CACHE`` or
+            ``~/.makeprojects_cache``
+    Returns:
+        Absolute pathname of the folder.
+    """
+
+    if cache_folder is None:
+        cache_folder = os.environ.get("MAKEPROJECTS_CACHE", _CACHE_FOLDER)
+    return os.path.abspath(os.path.expanduser(cache_folder))
+
+########################################
+
+
+def hash_file(file_name, digest=None):
+    """
+    Add the contents of a file to a hash.
+
+    Args:
+        file_name: Pathname of the file
+        digest: hashlib object, None to create a SHA-256 one
+    Returns:
+        The hashlib object.
+    """
+
+    if digest is None:
+        digest = hashlib.sha256()
+    with open(file_name, "rb") as fp:
+        while True:
+            data = fp.read(65536)
+            if not data:
+                break
+            digest.update(data)
+    return digest
+
+########################################
+
+
+def get_tool_digest(tool):
+    """
+    Return the digest that stands for the version of a tool.
+
+    The executable is hashed, so a new version of the tool doesn't use the
+    outputs of the old one. Tools that can't be found use their name.
+
+    Args:
+        tool: Name or pathname of the tool
+    Returns:
+        Hex string of the SHA-256 hash.
+    """
+
+    result = _TOOL_DIGESTS.get(tool)
+    if result is None:
+        path = which(tool)
+        if path:
+            result = hash_file(path).hexdigest()
+        else:
+            result = hashlib.sha256(tool.encode("utf-8")).hexdigest()
+        _TOOL_DIGESTS[tool] = result
+    return result
+
+########################################
+
+
+def get_cache_key(cmd, inputs):
+    """
+    Return the cache key of a custom build command.
+
+    The key is made from the contents of the input files, every argument of
+    the command line after make expanded it and the version of the tool.
+
+    Args:
+        cmd: List of the command and its arguments
+        inputs: Iterable of pathnames of the input files
+    Returns:
+        Hex string of the SHA-256 hash.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(get_tool_digest(cmd[0]).encode("utf-8"))
+    for item in cmd:
+        digest.update(b"\0" + item.encode("utf-8"))
+    for item in inputs:
+        digest.update(b"\1")
+        hash_file(item, digest)
+    return digest.hexdigest()
+
+########################################
+
+
+def fetch_outputs(entry, outputs):
+    """
+    Copy the cached outputs into place.
+
+    Args:
+        entry: Folder of the cache entry
+        outputs: List of pathnames of the output files
+    Returns:
+        True if the outputs were copied, False if they're not cached.
+    """
+
+    cached = [os.path.join(entry, str(index))
+              for index in range(len(outputs))]
+    for item in cached:
+        if not os.path.isfile(item):
+            return False
+
+    for source, dest in zip(cached, outputs):
+        folder = os.path.dirname(os.path.abspath(dest))
+        if not os.path.isdir(folder):
+            os.makedirs(folder)
+        # Copy the data only, so make sees a new file
+        shutil.copyfile(source, dest)
+    return True
+
+########################################
+
+
+def store_outputs(entry, outputs):
+    """
+    Save the outputs of a command in the cache.
+
+    The files are copied to a temporary folder which is renamed into place,
+    so a build running at the same time never sees half of an entry.
+
+    Args:
+        entry: Folder of the cache entry
+        outputs: List of pathnames of the output files
+    """
+
+    # Commands that don't create all the outputs can't be cached
+    for item in outputs:
+        if not os.path.isfile(item):
+            return
+
+    parent = os.path.dirname(entry)
+    temp_folder = None
+    try:
+        if not os.path.isdir(parent):
+            os.makedirs(parent)
+        temp_folder = tempfile.mkdtemp(dir=parent)
+        for index, item in enumerate(outputs):
+            shutil.copyfile(item, os.path.join(temp_folder, str(index)))
+        os.rename(temp_folder, entry)
+    except (IOError, OSError):
+        # Another build stored it first, or the cache isn't writable
+        if temp_folder is not None:
+            shutil.rmtree(temp_folder, ignore_errors=True)
+
+########################################
+
+
+def run_cached(cmd, inputs, outputs, cache_folder=None, verbose=False):
+    """
+    Run a custom build command, or copy its outputs from the cache.
+
+    Args:
+        cmd: List of the command and its arguments
+        inputs: List of pathnames of the input files
+        outputs: List of pathnames of the output files
+        cache_folder: Folder of the cache, None for get_cache_folder()
+        verbose: True to report cache hits
+    Returns:
+        Exit code of the command, zero if the outputs were cached.
+    """
+
+    key = get_cache_key(cmd, inputs)
+    entry = os.path.join(get_cache_folder(cache_folder), key[:2], key)
+
+    if fetch_outputs(entry, outputs):
+        if verbose:
+            print("Copied {} from the cache".format(" ".join(outputs)))
+        return 0
+
+    # Use the console on Windows, so batch files work
+    error = subprocess.call(cmd, shell=sys.platform.startswith("win"))
+    if not error:
+        store_outputs(entry, outputs)
+    return error
+
+########################################
+
+
+def main(args=None):
+    """
+    Command line shell for ``rulecache``.
+
+    Entry point for the program ``rulecache``, this function
+    will either get the parameters from ``sys.argv`` or the paramater ``args``.
+
+    - ``--version``, show version.
+    - ``-v``, Report outputs copied from the cache.
+    - ``-i``, Input file of the command, can be used more than once.
+    - ``-o``, Output file of the command, can be used more than once.
+    - ``--cache``, Folder of the cache.
+    - The command and its arguments follow ``--``.
+
+    Args:
+        args: Command line to use instead of ``sys.argv``
+    Returns:
+        Exit code of the command, zero if the outputs were cached.
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Run a custom build command, or copy its outputs from "
+        "a local cache. Copyright by Rebecca Ann Heineman.")
+
+    parser.add_argument("--version", action="version",
+                        version="%(prog)s " + __version__)
+    parser.add_argument("-v", "-verbose", dest="verbose", action="store_true",
+                        default=False,
+                        help="Report outputs copied from the cache.")
+    parser.add_argument("-i", dest="inputs", action="append", default=[],
+                        metavar="<file>", help="Input file of the command.")
+    parser.add_argument("-o", dest="outputs", action="append", default=[],
+                        metavar="<file>", help="Output file of the command.")
+    parser.add_argument("--cache", dest="cache_folder", metavar="<folder>",
+                        help="Folder of the cache, the default is "
+                        "$MAKEPROJECTS_CACHE or " + _CACHE_FOLDER)
+    parser.add_argument("cmd", nargs=argparse.REMAINDER,
+                        help="Command to run after --")
+
+    parsed = parser.parse_args(args=args)
+    cmd = parsed.cmd
+    if cmd and cmd[0] == "--":
+        cmd = cmd[1:]
+    if not cmd:
+        parser.error("No command to run")
+    if not parsed.outputs:
+        parser.error("No output files")
+
+    return run_cached(cmd, parsed.inputs, parsed.outputs,
+                      parsed.cache_folder, parsed.verbose)
+
+
+# If called as a function and not a class, call my main
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,7 @@ Regex for matching files with *.slicerscript
 
 from __future__ import absolute_import, print_function, unicode_literals
 from re import compile as re_compile
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_referenced_files
 
 _SLICERFILE_MATCH = re_compile('(?is).*\\.slicerscript\\Z')
 
@@ -74,6 +74,20 @@ class BuildSlicerFile(BuildObject):
 
     ########################################
 
+    def get_input_files(self):
+        """
+        Return the files this build reads.
+
+        The script and the art it refers to.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(self.file_name)
+
+    ########################################
+
     def clean(self):
         """
         Delete temporary files.
@@ -15,6 +15,9 @@ The util module contains subroutines used everywhere.
 
 @var makeprojects._BUILD_RULES_CACHE
 Dict of build rules loaded
+
+@var makeprojects.util._PARALLEL_MINIMUM
+Fewest items before parallel_map() starts a process pool
 """
 
 from __future__ import absolute_import, print_function, unicode_literals
@@ -22,6 +25,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 import os
 import re
 import fnmatch
+import multiprocessing
+import pickle
 from burger import string_to_bool, is_string, import_py_script, norm_paths, \
     convert_to_linux_slashes
 from .config import DEFAULT_BUILD_RULES, _XCODEPROJECT_FILE, save_default
@@ -31,6 +36,9 @@ from .config import DEFAULT_BUILD_RULES, _XCODEPROJECT_FILE, save_default
 # Cache of Build_rules.py python scripts
 _BUILD_RULES_CACHE = {}
 
+# Fewest items before parallel_map() starts a process pool
+_PARALLEL_MINIMUM = 8
+
 ########################################
 
 
@@ -613,3 +621,66 @@ def iterate_configurations(solution):
         # Create sets of configuration names and projects
         for configuration in project.configuration_list:
             yield configuration
+
+########################################
+
+
+def parallel_map(function, item_list, jobs=None, initializer=None,
+                 initargs=()):
+    """
+    Call a function on every item using a process pool.
+
+    The results are returned in the same order as item_list, so the output
+    is identical to a serial run. If there are only a few items, jobs is 1,
+    or the pool can't be used (No multiprocessing support or the data can't
+    be pickled), the items are processed serially in this process. Exceptions
+    raised by the function are passed to the caller.
+
+    The function and initializer must be module level functions so they can
+    be called from a worker process, and initargs must be picklable, since
+    it's sent to every worker if processes are spawned.
+
+    Args:
+        function: Function to call with each item.
+        item_list: Iterable of items to pass to the function.
+        jobs: Number of processes to use, None for the number of CPUs.
+        initializer: Function called once in every worker before any items.
+        initargs: Tuple of arguments for the initializer.
+    Returns:
+        List of the return values of function.
+    """
+
+    # pylint: disable=too-many-arguments
+
+    item_list = list(item_list)
+    if jobs is None:
+        try:
+            jobs = multiprocessing.cpu_count()
+        except NotImplementedError:
+            jobs = 1
+    jobs = min(jobs, len(item_list))
+
+    pool = None
+    if jobs > 1 and len(item_list) >= _PARALLEL_MINIMUM:
+        try:
+            # Make sure the work can be sent to the workers
+            pickle.dumps((function, initializer, initargs, item_list))
+            pool = multiprocessing.Pool(
+                jobs, initializer=initializer, initargs=initargs)
+
+        # Python 3 raises TypeError or AttributeError for some objects
+        except (OSError, ImportError, pickle.PicklingError, TypeError,
+                AttributeError):
+            # Fall back to the serial path below
+            pass
+
+    if pool is not None:
+        try:
+            return pool.map(function, item_list)
+        finally:
+            pool.close()
+            pool.join()
+
+    if initializer is not None:
+        initializer(*initargs)
+    return [function(item) for item in item_list]
@@ -0,0 +1,326 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+# It is released under an MIT Open Source license. Please see LICENSE
+# for license details. Yes, you can use it in a
+# commercial title without paying anything, just give me a credit.
+# Please? It's not like I'm asking you for money!
+
+"""
+Version control support for generated files.
+
+Generators don't write their output directly, they queue the text in a
+FileBatch. When the batch is committed, all the files that changed are
+checked out with a single version control command, written to disk, and then
+all new files are added with a single command.
+
+@package makeprojects.vcs
+
+@var makeprojects.vcs._VCS_BACKEND
+Version control backend used for batched checkouts
+"""
+
+# pylint: disable=consider-using-f-string
+# pylint: disable=useless-object-inheritance
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+import subprocess
+from burger import where_is_p4, compare_file_to_string, \
+    is_write_protected, save_text_file, get_windows_host_type, \
+    convert_to_array
+
+try:
+    from wslwinreg import convert_to_windows_path
+except ImportError:
+    convert_to_windows_path = None
+
+# Version control backend used for batched checkouts
+_VCS_BACKEND = None
+
+########################################
+
+
+class PerforceBackend(object):
+    """
+    Version control backend that invokes the Perforce ``p4`` tool.
+
+    All files are passed to a single invocation of ``p4`` using the ``-x -``
+    option, so the file list is read from stdin and isn't limited by the
+    maximum length of a command line.
+
+    Attributes:
+        executable: Path to the ``p4`` executable, None to search for it.
+    """
+
+    def __init__(self, executable=None):
+        """
+        Initialize the backend.
+
+        Args:
+            executable: Path to ``p4`` or a stand in, None to search for it.
+        """
+
+        self.executable = executable
+
+    ########################################
+
+    def get_executable(self, verbose=False):
+        """
+        Return the path to the version control executable.
+
+        Args:
+            verbose: If True, print warnings
+        Returns:
+            Pathname to the executable or None if not found.
+        """
+
+        if self.executable:
+            return self.executable
+        return where_is_p4(verbose=verbose)
+
+    ########################################
+
+    def command(self, command, files, verbose=False):
+        """
+        Issue a single version control command for a list of files.
+
+        Args:
+            command: Command to issue, such as "edit" or "add".
+            files: Iterable of pathnames to pass to the command.
+            verbose: If True, print the command line
+        Returns:
+            Zero if no error, non-zero on error
+        """
+
+        file_list = [os.path.abspath(item) for item in files]
+        if not file_list:
+            return 0
+
+        perforce_path = self.get_executable(verbose=verbose)
+        if perforce_path is None:
+            return 10
+
+        # If p4.exe is invoked from WSL, use windows pathnames
+        if perforce_path.endswith(".exe") and convert_to_windows_path \
+                and not get_windows_host_type():
+            file_list = [convert_to_windows_path(item) for item in file_list]
+
+        cmd = [perforce_path, "-x", "-", command]
+        if verbose:
+            print("{} ({} files)".format(" ".join(cmd), len(file_list)))
+
+        try:
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE)
+            process.communicate(("\n".join(file_list) + "\n").encode("utf-8"))
+        except OSError as error:
+            print(str(error), file=sys.stderr)
+            return getattr(error, "winerror", error.errno)
+        return process.returncode
+
+    ########################################
+
+    def edit(self, files, verbose=False):
+        """
+        Check out a list of files for editing.
+
+        Args:
+            files: Iterable of pathnames to check out.
+            verbose: If True, print the command line
+        Returns:
+            Zero if no error, non-zero on error
+        """
+
+        return self.command("edit", files, verbose=verbose)
+
+    ########################################
+
+    def add(self, files, verbose=False):
+        """
+        Mark a list of new files for addition.
+
+        Args:
+            files: Iterable of pathnames to add.
+            verbose: If True, print the command line
+        Returns:
+            Zero if no error, non-zero on error
+        """
+
+        return self.command("add", files, verbose=verbose)
+
+########################################
+
+
+def get_vcs_backend():
+    """
+    Return the version control backend for batched checkouts.
+
+    If no backend was set with set_vcs_backend(), a PerforceBackend
+    is created.
+
+    Returns:
+        Version control backend instance.
+    See Also:
+        set_vcs_backend
+    """
+
+    # pylint: disable=global-statement
+    global _VCS_BACKEND
+
+    if _VCS_BACKEND is None:
+        _VCS_BACKEND = PerforceBackend()
+    return _VCS_BACKEND
+
+########################################
+
+
+def set_vcs_backend(backend):
+    """
+    Set the version control backend for batched checkouts.
+
+    The backend needs ``edit(files, verbose)`` and ``add(files, verbose)``
+    methods. Pass None to restore the default PerforceBackend.
+
+    Args:
+        backend: Backend instance or None.
+    See Also:
+        get_vcs_backend
+    """
+
+    # pylint: disable=global-statement
+    global _VCS_BACKEND
+
+    _VCS_BACKEND = backend
+
+########################################
+
+
+class FileBatch(object):
+    """
+    Queue of generated text files to write in a single pass.
+
+    Instead of checking out each file as it's saved, the files are
+    compared against the copy on disk and only the changed ones are queued.
+    commit() checks out all the queued files with one version control
+    command, writes them, and then adds the new files with another command.
+
+    Attributes:
+        verbose: True for verbose output
+        backend: Version control backend, None for get_vcs_backend()
+        pending: List of queued (file_name, text_lines, line_feed, bom,
+            perforce) tuples
+    """
+
+    def __init__(self, verbose=False, backend=None):
+        """
+        Initialize the batch.
+
+        Args:
+            verbose: True for verbose output
+            backend: Version control backend, None for the default
+        """
+
+        self.verbose = verbose
+        self.backend = backend
+        self.pending = []
+
+    ########################################
+
+    def save_text_file_if_newer(self, file_name, text_lines, line_feed=None,
+                                bom=False, perforce=False):
+        """
+        Queue a text file to be saved if it differs from the copy on disk.
+
+        Args:
+            file_name: File to save
+            text_lines: Lines to save, or a single string
+            line_feed: String to use as a line feed
+            bom: If True write the UTF-8 Byte Order Mark
+            perforce: Enable version control checkout or add if True
+        Returns:
+            True if no change was needed, False if the file was queued
+
+        See Also:
+            burger.save_text_file_if_newer
+        """
+
+        # pylint: disable=too-many-arguments
+
+        # A single string is one line, not a list of characters. A copy is
+        # queued, so the caller can reuse its list.
+        text_lines = list(convert_to_array(text_lines))
+        if compare_file_to_string(file_name, text_lines):
+            if self.verbose:
+                print("{} was not changed.".format(file_name))
+            return True
+
+        self.pending.append(
+            (file_name, text_lines, line_feed, bom, perforce))
+        return False
+
+    ########################################
+
+    def pop_pending(self, file_name):
+        """
+        Remove a queued file so it can be replaced.
+
+        Args:
+            file_name: File that was queued
+        Returns:
+            List of the queued lines, or None if the file isn't queued.
+        """
+
+        for index, item in enumerate(self.pending):
+            if item[0] == file_name:
+                del self.pending[index]
+                return item[1]
+        return None
+
+    ########################################
+
+    def commit(self):
+        """
+        Check out, save and add all queued files.
+
+        Returns:
+            Zero if no error, non-zero on error
+        """
+
+        pending = self.pending
+        self.pending = []
+
+        # Determine which files need a checkout and which need an add
+        edit_list = []
+        add_list = []
+        for item in pending:
+            if item[4]:
+                if not os.path.isfile(item[0]):
+                    add_list.append(item[0])
+                elif is_write_protected(item[0]):
+                    edit_list.append(item[0])
+
+        backend = self.backend
+        if backend is None and (edit_list or add_list):
+            backend = get_vcs_backend()
+
+        # One checkout for every file that's going to be replaced
+        error = 0
+        if edit_list:
+            error = backend.edit(edit_list, verbose=self.verbose)
+
+        # Save the files
+        for item in pending:
+            if self.verbose:
+                print("Saving {}.".format(item[0]))
+            save_text_file(item[0], item[1], line_feed=item[2], bom=item[3])
+
+        # One add for every file that's new
+        if add_list:
+            temp = backend.add(add_list, verbose=self.verbose)
+            if not error:
+                error = temp
+        return error
@@ -29,6 +29,12 @@ Tuple of Visual Studio targets that build slowly with msbuild
 
 @var makeprojects.visual_studio._VS_PLATFORM_HACK
 Dict of android targets to remap from nVidia to Microsoft tool chains
+
+@var makeprojects.visual_studio._VS_PROPERTIES
+Dict of Visual Studio 2003-2008 property names to (validator, test, options)
+
+@var makeprojects.visual_studio._WORKER_SOLUTION
+Solution being generated by the project worker processes
 """
 
 # pylint: disable=consider-using-f-string
@@ -40,10 +46,11 @@ from __future__ import absolute_import, print_function, unicode_literals
 import os
 import sys
 import operator
+from functools import partial
 from re import compile as re_compile
-from burger import save_text_file_if_newer, convert_to_windows_slashes, \
+from burger import convert_to_windows_slashes, \
     escape_xml_cdata, escape_xml_attribute, where_is_visual_studio, \
-    load_text_file, string_to_bool, delete_file
+    load_text_file, string_to_bool, delete_file, is_string
 from ide_gen import vs_calcguid
 
 try:
@@ -58,12 +65,14 @@ from .enums import FileTypes, ProjectTypes, IDETypes, PlatformTypes, \
 from .hlsl_support import HLSL_ENUMS, make_hlsl_command
 from .glsl_support import make_glsl_command
 from .masm_support import MASM_ENUMS, make_masm_command
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_referenced_files
 from .visual_studio_utils import get_path_property, \
     convert_file_name_vs2010, add_masm_support, create_deploy_script, \
-    generate_solution_file, wiiu_props
+    generate_solution_file, wiiu_props, escape_xml_tag, get_fragment, \
+    FragmentCache
+from .util import parallel_map
 from .visual_studio_2010 import VS2010vcproj, VS2010vcprojfilter
-from .core import Configuration
+from .core import Configuration, save_unity_files
 
 ########################################
 
@@ -83,6 +92,9 @@ SUPPORTED_IDES = (
 # Match .sln files
 _SLNFILE_MATCH = re_compile("(?is).*\\.sln\\Z")
 
+# Solution being generated by the project worker processes
+_WORKER_SOLUTION = None
+
 # All version years
 _VS_VERSION_YEARS = {
     "2012": 2012,
@@ -255,6 +267,11 @@ class BuildVisualStudioFile(BuildObject):
         vs_version: The required version of Visual Studio
     """
 
+    # msbuild runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     # pylint: disable=too-many-arguments
     def __init__(self, file_name, priority, configuration,
                  verbose=False, vs_version=0):
@@ -395,6 +412,21 @@ class BuildVisualStudioFile(BuildObject):
 
     ########################################
 
+    def get_input_files(self):
+        """
+        Return the files this build reads.
+
+        The solution, the projects it lists and the files they contain.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(
+            self.file_name, follow=(".vcxproj", ".vcproj"))
+
+    ########################################
+
     def clean(self):
         """
         Delete temporary files.
@@ -637,943 +669,1085 @@ def Name(fallback):
 
 ########################################
 
-# Entries usually found in VS2003Configuration
+# Tests for properties only available on some targets
 
 ########################################
 
 
-def OutputDirectory(configuration, fallback=None):
+def _is_vs2003(configuration):
     """
-    Create ``OutputDirectory`` property.
-
-    Directory to store the final exe/lib file output. Will remap to OutDir
-
-    Can be overridden with configuration attribute
-    ``vs_OutputDirectory`` for the C compiler.
+    Test if a configuration is for Visual Studio 2003.
 
     Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
+        configuration: Project configuration to test.
     Returns:
-       validators.VSStringProperty object.
+        True if building for Visual Studio 2003.
     """
 
-    # Convert to string object
-    result = VSStringProperty.vs_validate(
-        "OutputDirectory",
-        configuration,
-        fallback)
-
-    # Post sanity check. Make sure it's terminated with a slash and in Windows
-    # format
-    fallback = result.get_value()
-    if fallback:
-        result.value = convert_to_windows_slashes(
-            fallback,
-            force_ending_slash=True)
-
-    return result
+    return configuration.ide is IDETypes.vs2003
 
 ########################################
 
 
-def IntermediateDirectory(configuration, fallback=None):
+def _is_not_vs2003(configuration):
     """
-    Create ``IntermediateDirectory`` property.
-
-    Directory to store the intermediate outputs such as .obj and .res files
-
-    Can be overridden with configuration attribute
-    ``vs_IntermediateDirectory`` for the C compiler.
+    Test if a configuration is for Visual Studio 2005 or 2008.
 
     Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
+        configuration: Project configuration to test.
     Returns:
-       validators.VSStringProperty object.
+        True if not building for Visual Studio 2003.
     """
 
-    # Convert to string object
-    result = VSStringProperty.vs_validate(
-        "IntermediateDirectory",
-        configuration,
-        fallback)
-
-    # Post sanity check. Make sure it's terminated with a slash and in Windows
-    # format
-    fallback = result.get_value()
-    if fallback:
-        result.value = convert_to_windows_slashes(
-            fallback,
-            force_ending_slash=True)
-
-    return result
+    return configuration.ide is not IDETypes.vs2003
 
 ########################################
 
 
-def ConfigurationType(configuration, fallback=None):
+def _is_vs2008(configuration):
     """
-    Create ``ConfigurationType`` property.
-
-    Type of project generated, dll, static lib, executable.
-
-    No external overrides
+    Test if a configuration is for Visual Studio 2008.
 
     Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
+        configuration: Project configuration to test.
     Returns:
-       validators.VSIntegerProperty object.
+        True if building for Visual Studio 2008.
     """
 
-    # If not overridden, map it out.
-    if fallback is None:
+    return configuration.ide is IDETypes.vs2008
 
-        # The numbers don't map to an enum, since Utility is 10
-        # So manually map to the supported project types
-        project_type = configuration.project_type
-        if project_type is ProjectTypes.library:
-            fallback = 4
-        elif project_type is ProjectTypes.sharedlibrary:
-            fallback = 2
-        else:
-            fallback = 1
+########################################
 
-    # Xbox doesn't support shared libraries, convert to library
-    if fallback == 2 and configuration.platform is PlatformTypes.xbox:
-        fallback = 4
 
-    return VSIntegerProperty("ConfigurationType", fallback)
+def _is_windows(configuration):
+    """
+    Test if a configuration is for a Windows platform.
+
+    Args:
+        configuration: Project configuration to test.
+    Returns:
+        True if building for Windows.
+    """
 
+    return configuration.platform.is_windows()
 
 ########################################
 
-def UseOfMFC(configuration, fallback=None):
-    """
-    Create ``UseOfMFC`` property.
 
-    Enable the use of MFC, static or dynamic library.
+# Table of properties that are a fallback value with an override. The key is
+# the name of the property, which is also the XML attribute and the
+# configuration attribute ``vs_`` + name is the override.
+#
+# Each entry is a tuple with the validator class, a function to test if the
+# property is available for the configuration or None if always available,
+# and the options for the validator. Options are the enumeration table for
+# VSEnumProperty, and a tuple of True if duplicates are removed and the
+# slashes to use for VSStringListProperty.
+_VS_PROPERTIES = {
+    # Entries usually found in VS2003Configuration
 
-    Can be overridden with configuration attribute
-    ``vs_UseOfMFC`` for the C compiler.
+    # Enable the use of MFC, static or dynamic library.
+    "UseOfMFC": (
+        VSEnumProperty, _is_windows,
+        (("Default", "None", "No"),
+         ("Static", "Yes"),
+         ("Dynamic", "DLL"))),
 
-    * "Default" / "None" / "No"
-    * "Static"
-    * "Dynamic" / "DLL"
-    * 0 through 2
+    # Enable the use of Advanced Template Library, static or dynamic.
+    "UseOfATL": (
+        VSEnumProperty, _is_windows,
+        (("Default", "None", "No"),
+         ("Static", "Yes"),
+         ("Dynamic", "DLL"))),
 
-    Note:
-        Only available on Windows platforms
+    # Tells ATL to link to the C runtime libraries statically to minimize
+    # dependencies; requires that ``Use of ATL`` to be set.
+    "ATLMinimizesCRunTimeLibraryUsage": (VSBooleanProperty, _is_windows, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Choose if Unicode or ASCII defaults are used during Windows
+    # compilation.
+    "CharacterSet": (
+        VSEnumProperty, _is_windows,
+        ("Default",
+         "Unicode",
+         ("MultiByte", "ASCII"))),
 
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
+    # List of file extensions to remove on clean.
+    "DeleteExtensionsOnClean": (VSStringListProperty, None, (True, "\\")),
 
-    # Only available on Windows
-    if not configuration.platform.is_windows():
-        return None
+    # List of folders for file references.
+    "ReferencesPath": (VSStringListProperty, _is_vs2003, (True, "\\")),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_UseOfMFC")
-    if value is not None:
-        fallback = value
+    # Entries usually found in VCCLCompilerTool
 
-    return VSEnumProperty(
-        "UseOfMFC",
-        fallback,
-        (("Default", "None", "No"),
-         ("Static", "Yes"),
-         ("Dynamic", "DLL")))
+    # Instructs the project system to generate UNICODE response files
+    # when spawning the librarian. Set this property to True when files
+    # in the project have UNICODE paths.
+    "UseUnicodeResponseFiles": (VSBooleanProperty, _is_not_vs2003, None),
 
-########################################
+    # List of custom compiler options as a single string. The default is
+    # an empty string. Will not generate this attribute if the string is
+    # empty.
+    "AdditionalOptions": (VSStringProperty, None, None),
 
+    # Set the level of code optimization for the C compiler.
+    "Optimization": (
+        VSEnumProperty, None,
+        (("/Od", "-Od", "Disabled"),
+         ("/O1", "-O1", "Minimize Size"),
+         ("/O2", "-O2", "Maximize Speed"),
+         ("/Ox", "-Ox", "Full Optimization", "x"),
+         "Custom")),
 
-def UseOfATL(configuration, fallback=None):
-    """
-    Create ``UseOfATL`` property.
+    # Enables global optimizations incompatible with all ``Runtime
+    # Checks`` options and edit and continue. Also known as
+    # ``WholeProgramOptimizations`` on other versions of Visual Studio.
+    "GlobalOptimizations": (VSBooleanProperty, _is_vs2003, None),
 
-    Enable the use of Advanced Template Library, static or dynamic.
+    # Determine how aggressive to inline code during C compilation.
+    "InlineFunctionExpansion": (
+        VSEnumProperty, None,
+        ("Disable",
+         ("/Ob1", "Only __inline"),
+         ("/Ob2", "Any Suitable"))),
 
-    Can be overridden with configuration attribute
-    ``vs_UseOfATL`` for the C compiler.
+    # Enables intrinsic functions. Using intrinsic functions generates
+    # faster, but possibly larger, code.
+    "EnableIntrinsicFunctions": (VSBooleanProperty, None, None),
 
-    * "Default" / "None" / "No"
-    * "Static"
-    * "Dynamic" / "DLL"
-    * 0 through 2
+    # Enables intrinsic functions. Using intrinsic functions generates
+    # faster, but possibly larger, code.
+    "ImproveFloatingPointConsistency": (VSBooleanProperty, _is_vs2003, None),
 
-    Note:
-        Only available on Windows platforms
+    # Determine if optimizations should focus on saving space vs
+    # unrolling loops.
+    "FavorSizeOrSpeed": (
+        VSEnumProperty, None,
+        ("Neither",
+         ("/Ot", "Favor Fast Code"),
+         ("/Os", "Favor Small Code"))),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Suppress frame pointers.
+    "OmitFramePointers": (VSBooleanProperty, None, None),
 
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
+    # Enables memory space optimization when using fibers and thread
+    # local torage access.
+    "EnableFiberSafeOptimizations": (VSBooleanProperty, None, None),
 
-    # Only available on Windows
-    if not configuration.platform.is_windows():
-        return None
+    # Determine if optimizations should focus on specific Pentium
+    # processors.
+    "OptimizeForProcessor": (
+        VSEnumProperty, _is_vs2003,
+        ("Blended",
+        ("/G5", "Pentium"),
+        ("/G6", "Pentium Pro", "Pentium II", "Pentium III"),
+        ("/G7", "Pentium IV", "Pentium 4"))),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_UseOfATL")
-    if value is not None:
-        fallback = value
+    # Specify whether to optimize code in favor of Windows.EXE execution.
+    "OptimizeForWindowsApplication": (VSBooleanProperty, _is_vs2003, None),
 
-    return VSEnumProperty(
-        "UseOfATL",
-        fallback,
-        (("Default", "None", "No"),
-         ("Static", "Yes"),
-         ("Dynamic", "DLL")))
+    # List of include folders for the C compiler
+    "AdditionalIncludeDirectories": (VSStringListProperty, None, (True, "\\")),
 
-########################################
+    # List of include folders for the # using operation.
+    "AdditionalUsingDirectories": (VSStringListProperty, None, (True, "\\")),
 
+    # List of defines to pass to the C compiler
+    "PreprocessorDefinitions": (VSStringListProperty, None, None),
 
-def ATLMinimizesCRunTimeLibraryUsage(configuration, fallback=None):
-    """
-    Create ``ATLMinimizesCRunTimeLibraryUsage`` property.
+    # Ignore standard include paths.
+    "IgnoreStandardIncludePath": (VSBooleanProperty, None, None),
 
-    Tells ATL to link to the C runtime libraries statically to minimize
-    dependencies; requires that ``Use of ATL`` to be set.
+    # Determine if a preprocessed file is to be generated.
+    "GeneratePreprocessedFile": (
+        VSEnumProperty, None,
+        ("No",
+         ("/P", "With Line Numbers"),
+         ("/EP", "/EP /P", "Without Line Numbers"))),
 
-    Can be overridden with configuration attribute
-    ``vs_ATLMinimizesCRunTimeLibraryUsage`` for the C compiler.
+    # Suppresses comment strip from source code; requires that one of the
+    # ``Preprocessing`` options be set.
+    "KeepComments": (VSBooleanProperty, None, None),
 
-    Note:
-        Not available on Visual Studio 2008 or later and only available on
-        Windows platforms
+    # Enable read-only string pooling for generating smaller compiled
+    # code.
+    "StringPooling": (VSBooleanProperty, None, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Detect changes to C++ class definitions and recompile only affected
+    # source files.
+    "MinimalRebuild": (VSBooleanProperty, None, None),
 
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
+    # Generate runtime code to verify the stack and uninitialized
+    # variables.
+    "BasicRuntimeChecks": (
+        VSEnumProperty, None,
+        ("Default",
+         ("/RTCs", "Stack", "Stack Frames"),
+         ("/RTCu", "Uninitialzed", "Uninitialized Variables"),
+         ("/RTCsu", "/RTC1", "Both"))),
 
-    # Only available on Windows
-    if not configuration.platform.is_windows():
-        return None
+    # Enable checking for conversion to smaller types, incompatible with
+    # any optimization type other than debug.
+    "SmallerTypeCheck": (VSBooleanProperty, None, None),
 
-    # VS2003/2005 only
-    if configuration.ide is IDETypes.vs2008:
-        return None
+    # Set the default structure byte alignment.
+    "StructMemberAlignment": (
+        VSEnumProperty, None,
+        ("Default",
+         ("/Zp1", "1", "1 Byte"),
+         ("/Zp2", "2", "2 Bytes"),
+         ("/Zp4", "4", "4 Bytes"),
+         ("/Zp8", "8", "8 Bytes"),
+         ("/Zp16", "16", "16 Bytes"))),
 
-    return VSBooleanProperty.vs_validate(
-        "ATLMinimizesCRunTimeLibraryUsage",
-        configuration,
-        fallback)
+    # Check for buffer overruns; useful for closing hackable loopholes on
+    # internet servers; ignored for projects using managed extensions.
+    "BufferSecurityCheck": (VSBooleanProperty, None, None),
 
-########################################
+    # Enables function-level linking; required for Edit and Continue to
+    # work.
+    "EnableFunctionLevelLinking": (VSBooleanProperty, None, None),
 
+    # Set the instruction set extensions allowed.
+    "EnableEnhancedInstructionSet": (
+        VSEnumProperty, None,
+        ("Default",
+        ("/arch:SSE", "SSE"),
+        ("/arch:SSE2", "SSE2"))),
 
-def CharacterSet(configuration, fallback=None):
-    """
-    Create ``CharacterSet`` property.
+    # Set the allowable precision for floating point math for speed.
+    "FloatingPointModel": (
+        VSEnumProperty, _is_not_vs2003,
+        (("/fp:precise", "Precise"),
+         ("/fp:strict", "Strict"),
+         ("/fp:fast", "Fast"))),
 
-    Choose if Unicode or ASCII defaults are used during Windows compilation.
+    # Enable floating point exceptions when generating code.
+    "FloatingPointExceptions": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Can be overridden with configuration attribute
-    ``vs_CharacterSet`` for the C compiler.
+    # Supresses or enables language extensions.
+    "DisableLanguageExtensions": (VSBooleanProperty, None, None),
 
-    * "Default"
-    * "Unicode"
-    * "MultiByte" / "ASCII"
-    * 0 through 2
+    # Sets the default char type to unsigned.
+    "DefaultCharIsUnsigned": (VSBooleanProperty, None, None),
 
-    Note:
-        Only available on Windows platforms
+    # Treats wchar_t as a built-in type.
+    "TreatWChar_tAsBuiltInType": (VSBooleanProperty, None, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Forces the compiler to conform to the local scope in a for loop.
+    "ForceConformanceInForLoopScope": (VSBooleanProperty, None, None),
 
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
+    # Adds code for checking C++ object types at run time (runtime type
+    # information)
+    "RuntimeTypeInfo": (VSBooleanProperty, None, None),
 
-    # Only available on Windows
-    if not configuration.platform.is_windows():
-        return None
+    # Enable OpenMP language extensions.
+    "OpenMP": (VSBooleanProperty, _is_not_vs2003, None),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_CharacterSet")
-    if value is not None:
-        fallback = value
+    # Text header file for precompilation
+    "PrecompiledHeaderThrough": (VSStringProperty, None, None),
 
-    return VSEnumProperty(
-        "CharacterSet",
-        fallback,
-        ("Default",
-         "Unicode",
-         ("MultiByte", "ASCII")))
+    # Binary header file for precompilation
+    "PrecompiledHeaderFile": (VSStringProperty, None, None),
 
-########################################
+    # Create listing file with expanded attributes injected into source
+    # file.
+    "ExpandAttributedSource": (VSBooleanProperty, None, None),
 
+    # Set the format of the assembly output
+    "AssemblerOutput": (
+        VSEnumProperty, None,
+        (("No", "No Listing"),
+         ("/FA", "Assembly", "Asm", "Assembly-Only"),
+         ("/FAcs", "Assembly, Machine Code and Source"),
+         ("/FAc", "Assembly With Machine Code"),
+         ("/FAs", "Assembly With Source"))),
 
-def ManagedExtensions(configuration, fallback=None):
-    """
-    Create ``ManagedExtensions`` property.
+    # Output location for .asm file
+    "AssemblerListingLocation": (VSStringProperty, None, None),
 
-    Enable the level of Common Language Runtime support
+    # Output location for .obj file
+    "ObjectFile": (VSStringProperty, None, None),
 
-    Compiler switches /clr, /clr:pure, /clr:safe, /clr:oldSyntax
+    # Output location of shared .pdb file
+    "ProgramDataBaseFileName": (VSStringProperty, None, None),
 
-    Can be overridden with configuration attribute
-    ``vs_ManagedExtensions`` for the C compiler.
+    # Specifies that the compiler should generate XML documentation
+    # comment files.
+    "GenerateXMLDocumentationFiles": (VSBooleanProperty, _is_not_vs2003, None),
 
-    * "No", "Default"
-    * "/clr" / "CLR" / "Yes"
-    * "/clr:pure" / "Pure MISL" / "MISL" / "Pure"
-    * "/clr:safe" / "Safe MISL" / "Safe"
-    * "/clr:oldSyntax" / "Old MISL" / "Old"
-    * 0 through 4
+    # Name of the XML formatted documentation file.
+    "XMLDocumentationFileName": (VSStringProperty, _is_not_vs2003, None),
 
-    Note:
-        A boolean on Visual Studio 2003, an enum on 2005/2008
+    # What browser information to generate?
+    "BrowseInformation": (
+        VSEnumProperty, None,
+        (("None", "No"),
+        ("/FR", "All"),
+        ("/Fr", "No Local Symbols", "No Locals"))),
 
-    Note:
-        Only available on Windows platforms
+    # Name of the browsing file.
+    "BrowseInformationFile": (VSStringProperty, None, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Set the warning level.
+    "WarningLevel": (
+        VSEnumProperty, None,
+        (("/W0", "Off", "No", "None"),
+        ("/W1", "Level 1"),
+        ("/W2", "Level 2"),
+        ("/W3", "Level 3"),
+        ("/W4", "Level 4", "All"))),
 
-    Returns:
-        validators.VSEnumProperty or validators.VSBooleanProperty object.
-    """
+    # Enables the compiler to treat all warnings as errors.
+    "WarnAsError": (VSBooleanProperty, None, None),
 
-    # Only available on Windows
-    if not configuration.platform.is_windows():
-        return None
+    # Suppress the display of the startup banner and information
+    # messages.
+    "SuppressStartupBanner": (VSBooleanProperty, None, None),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_ManagedExtensions")
-    if value is not None:
-        fallback = value
+    # Tells the compiler to check for 64-bit portability issues.
+    "Detect64BitPortabilityProblems": (VSBooleanProperty, None, None),
 
-    # Visual Studio 2003 only has "Yes" or "No"
-    # So, convert the value into a boolean
-    if configuration.ide is IDETypes.vs2003:
+    # Sets the type of debugging information to embed in the obj file.
+    "DebugInformationFormat": (
+        VSEnumProperty, None,
+        (("Off", "No", "None", "Disabled"),
+        ("/C7", "C7 Compatible"),
+        # Hidden in 2005/2008 (maps to C7)
+        ("/Zd", "Line Numbers", "Line Numbers Only"),
+        ("/Zi", "Program Database"),
+        ("/ZI", "Edit and Continue"))),
 
-        if fallback is not None:
-            # Is there a value?
-            # Try the easy way first, is it a number, "Yes", "True"?
-            try:
-                fallback = string_to_bool(fallback)
-
-            # Assume exceptions are requested
-            except ValueError:
-                fallback = True
+    # Sets the type of default calling convention to use. Usually only
+    # meaningful for X86.
+    "CallingConvention": (
+        VSEnumProperty, None,
+        (("/Gd", "__cdecl"),
+        ("/Gr", "__fastcall"),
+        ("/Gz", "__stdcall"))),
 
-        # Enable/Disable Common Language Runtime
-        return VSBooleanProperty(
-            "ManagedExtensions",
-            fallback)
+    # Forces C or C++ compilation. Normally the file extension determines
+    # the choice of compiler.
+    "CompileAs": (
+        VSEnumProperty, None,
+        (("No", "Default"),
+        ("/TC", "C"),
+        ("/TP", "C++", "CPP"))),
 
-    # Visual Studio 2005, 2008 version uses enums
+    # List of warnings to disable during C compilation
+    "DisableSpecificWarnings": (VSStringListProperty, None, None),
 
-    # If a bool, use /clr if True
-    if isinstance(fallback, bool):
-        fallback = "Yes" if fallback else "No"
+    # List of header files to force including before compilation.
+    "ForcedIncludeFiles": (VSStringListProperty, None, None),
 
-    return VSEnumProperty(
-        "ManagedExtensions",
-        fallback,
-        (("No", "Default"),
-        ("/clr", "CLR", "Yes"),
-        ("/clr:pure", "Pure MISL", "MISL", "Pure"),
-        ("/clr:safe", "Safe MISL", "Safe"),
-        ("/clr:oldSyntax", "Old MISL", "Old")))
+    # List of header files to force using before compilation.
+    "ForcedUsingFiles": (VSStringListProperty, None, None),
 
-########################################
+    # Generates a list of include files with compiler output.
+    "ShowIncludes": (VSBooleanProperty, None, None),
 
+    # List of defines to remove from compilation
+    "UndefinePreprocessorDefinitions": (VSStringListProperty, None, None),
 
-def DeleteExtensionsOnClean(configuration, fallback=None):
-    """
-    Create ``DeleteExtensionsOnClean`` property.
+    # Undefine all previously defined preprocessor values.
+    "UndefineAllPreprocessorDefinitions": (VSBooleanProperty, None, None),
 
-    List of file extensions to remove on clean.
+    # Use full paths in diagnostic messages.
+    "UseFullPaths": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Can be overridden with configuration attribute
-    ``vs_DeleteExtensionsOnClean`` for the C compiler.
+    # Do not include default library names in .obj files.
+    "OmitDefaultLibName": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Is error reporting queued or immediate?
+    "ErrorReporting": (
+        VSEnumProperty, _is_not_vs2003,
+        ("Default",
+        ("/errorReport:prompt", "Immediate", "Prompt"),
+        ("/errorReport:queue", "Queue"))),
 
-    Returns:
-       validators.VSStringListProperty object.
-    """
+    # Entries usually found in VCCustomBuildTool
 
-    # Was there an override?
-    value = configuration.get_unique_chained_list(
-        "vs_DeleteExtensionsOnClean")
-    if value:
-        fallback = value
+    # Message to print in the console
+    "Description": (VSStringProperty, None, None),
 
-    return VSStringListProperty(
-        "DeleteExtensionsOnClean",
-        fallback,
-        slashes="\\")
+    # Batch file contents
+    "CommandLine": (VSStringProperty, None, None),
 
-########################################
+    # List of files this custom build command generates
+    "Outputs": (VSStringListProperty, None, None),
 
+    # Entries usually found in VCLinkerTool
 
-def WholeProgramOptimization(configuration, fallback=None):
-    """
-    Create ``WholeProgramOptimization`` property.
+    # Specifies whether to register the primary output of this build to
+    # Windows.
+    "RegisterOutput": (VSBooleanProperty, None, None),
 
-    Enable the type of link time code generation
+    # When Register Output is enabled, Per-user redirection forces
+    # registry writes to HKEY_CLASSES_ROOT to be redirected to
+    # HKEY_CURRENT_USER
+    "PerUserRedirection": (VSBooleanProperty, _is_vs2008, None),
 
-    Can be overridden with configuration attribute
-    ``vs_WholeProgramOptimization`` for the C compiler.
+    # Specifies that the import library generated by this configuration
+    # should not be imported into dependent projects.
+    "IgnoreImportLibrary": (VSBooleanProperty, None, None),
 
-    * "No", "Default"
-    * "Yes", "On"
-    * "Instrument"
-    * "Optimize"
-    * "Update"
-    * 0 through 4
+    # Specifies whether or not library outputs from project dependencies
+    # are automatically linked in.
+    "LinkLibraryDependencies": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Note:
-        A boolean on Visual Studio 2003, an enum on 2005/2008
+    # Specifies whether or not the inputs to the librarian tool are used
+    # rather than the library file itself when linking in library outputs
+    # of project dependencies.
+    "UseLibraryDependencyInputs": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Show progress in linking?
+    "ShowProgress": (
+        VSEnumProperty, None,
+        (("Default", "No", "None"),
+        ("/VERBOSE", "All"),
+        ("/VERBOSE:LIB", "Lib"))),
 
-    Returns:
-        validators.VSEnumProperty or validators.VSBooleanProperty object.
-    """
+    # Name of the output file
+    "OutputFile": (VSStringProperty, None, None),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_WholeProgramOptimization")
-    if value is not None:
-        fallback = value
+    # Version string for linking
+    "Version": (VSStringProperty, None, None),
 
-    # Visual Studio 2003 only has "Yes" or "No"
-    # So, convert the value into a boolean
-    if configuration.ide is IDETypes.vs2003:
+    # Enable incremental linking.
+    "LinkIncremental": (
+        VSEnumProperty, None,
+        ("Default",
+        ("/INCREMENTAL:NO", "No"),
+        ("/INCREMENTAL", "Yes"))),
 
-        if fallback is not None:
-            # Is there a value?
-            # Try the easy way first, is it a number, "Yes", "True"?
-            try:
-                fallback = string_to_bool(fallback)
+    # Specifies if the linker should always generate a manifest file.
+    "GenerateManifest": (VSBooleanProperty, _is_not_vs2003, None),
 
-            # Assume exceptions are requested
-            except ValueError:
-                fallback = True
+    # Name of the manifest file.
+    "ManifestFile": (VSStringProperty, _is_not_vs2003, None),
 
-        # Enable/Disable link time code generation
-        return VSBooleanProperty(
-            "WholeProgramOptimization",
-            fallback)
+    # List of manifests this one is dependent on
+    "AdditionalManifestDependencies": (
+        VSStringListProperty, _is_not_vs2003, None),
 
-    # Visual Studio 2005, 2008 version uses enums
+    # Specifies whether or not User Account Control is enabled.
+    "EnableUAC": (VSBooleanProperty, _is_vs2008, None),
 
-    # If a bool, use LTCG if True
-    if isinstance(fallback, bool):
-        fallback = "Yes" if fallback else "No"
+    # Set the UAC level
+    "UACExecutionLevel": (
+        VSEnumProperty, _is_vs2008,
+        (("asInvoker", "Default"),
+        "highestAvailable",
+        "requireAdministrator")),
 
-    return VSEnumProperty(
-        "WholeProgramOptimization",
-        fallback,
-        (("No", "Default"),
-        ("Yes", "On"),
-         "Instrument",
-        "Optimize",
-        "Update"))
+    # Specifies whether or not to bypass user interface protection levels
+    # for other windows on the desktop. Set this property to ``Yes`` only
+    # for accessability applications.
+    "UACUIAccess": (VSBooleanProperty, _is_vs2008, None),
 
-########################################
+    # Ignore all default libraries during linking.
+    "IgnoreAllDefaultLibraries": (VSBooleanProperty, None, None),
 
+    # List of libraries to ignore
+    "IgnoreDefaultLibraryNames": (VSStringListProperty, None, None),
 
-def ReferencesPath(configuration, fallback=None):
-    """
-    Create ``ReferencesPath`` property.
+    # Name of the module definition file
+    "ModuleDefinitionFile": (VSStringProperty, None, None),
 
-    List of folders for file references.
+    # Add these modules to C# assembly
+    "AddModuleNamesToAssembly": (VSStringListProperty, None, None),
 
-    Can be overridden with configuration attribute
-    ``vs_ReferencesPath`` for the C compiler.
+    # Embed the listed resource files.
+    "EmbedManagedResourceFile": (VSStringListProperty, None, None),
 
-    Note:
-        Only available on Visual Studio 2003
+    # Force these symbols to be public
+    "ForceSymbolReferences": (VSStringListProperty, None, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Only load these DLLs if functions within are called.
+    "DelayLoadDLLs": (VSStringListProperty, None, None),
 
-    Returns:
-       None or validators.VSStringListProperty object.
-    """
+    # Link in these assemblies
+    "AssemblyLinkResource": (VSStringListProperty, _is_not_vs2003, None),
 
-    # Visual Studio 2003 only
-    if configuration.ide is not IDETypes.vs2003:
-        return None
+    # Midl command file to execute.
+    "MidlCommandFile": (VSStringProperty, None, None),
 
-    # Was there an override?
-    value = configuration.get_unique_chained_list(
-        "vs_ReferencesPath")
-    if value:
-        fallback = value
+    # Ignore embedded .idlsym sections of object files.
+    "IgnoreEmbeddedIDL": (VSBooleanProperty, None, None),
 
-    return VSStringListProperty(
-        "ReferencesPath",
-        fallback,
-        slashes="\\")
+    # Filename to contain the merged IDL file
+    "MergedIDLBaseFileName": (VSStringProperty, None, None),
 
-########################################
+    # Name of the type library.
+    "TypeLibraryFile": (VSStringProperty, None, None),
 
-# Entries usually found in VCCLCompilerTool
+    # ID number of the library resource
+    "TypeLibraryResourceID": (VSIntegerProperty, None, None),
 
+    # Enables generation of debug information.
+    "GenerateDebugInformation": (VSBooleanProperty, None, None),
 
-def UseUnicodeResponseFiles(configuration, prefix=None):
-    """
-    Create ``UseUnicodeResponseFiles`` property.
+    # Add debugging information in assembly
+    "AssemblyDebug": (
+        VSEnumProperty, None,
+        (("No", "None"),
+        ("/ASSEMBLYDEBUG", "Runtime Tracking"),
+        ("/ASSEMBLYDEBUG:DISABLE", "No Runtime Tracking"))),
 
-    Instructs the project system to generate UNICODE response files when
-    spawning the librarian.  Set this property to True when files in the project
-    have UNICODE paths.
+    # Name of the program database file
+    "ProgramDatabaseFile": (VSStringProperty, None, None),
 
-    Can be overridden with configuration attributes:
+    # Do not put symbols in the named file
+    "StripPrivateSymbols": (VSStringProperty, None, None),
 
-    * ``vs_UseUnicodeResponseFiles`` for the C compiler.
-    * ``vs_LinkerUseUnicodeResponseFiles`` for the exe/lib linker.
+    # Enables generation of map file during linking.
+    "GenerateMapFile": (VSBooleanProperty, None, None),
 
-    Note:
-        Not available on Visual Studio 2003 and earlier. Overrides do nothing.
+    # Name of the symbol map file
+    "MapFileName": (VSStringProperty, None, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        prefix: Prefix string for override
+    # Includes exported functions in map file information.
+    "MapExports": (VSBooleanProperty, None, None),
 
-    Returns:
-        validators.VSBooleanProperty object.
-    """
+    # Includes source code line number information in map file.
+    "MapLines": (VSBooleanProperty, _is_vs2003, None),
 
-    # Only 2005 / 2008
-    if configuration.ide is IDETypes.vs2003:
-        return None
+    # Amount of heap to reserve
+    "HeapReserveSize": (VSIntegerProperty, None, None),
 
-    return VSBooleanProperty.vs_validate(
-        "UseUnicodeResponseFiles",
-        configuration,
-        prefix=prefix)
+    # Amount of heap to commit
+    "HeapCommitSize": (VSIntegerProperty, None, None),
 
+    # Amount of stack to reserve
+    "StackReserveSize": (VSIntegerProperty, None, None),
 
-########################################
+    # Amount of stack to commit
+    "StackCommitSize": (VSIntegerProperty, None, None),
 
+    # Notifies Windows the application is 32 bit clean.
+    "LargeAddressAware": (
+        VSEnumProperty, None,
+        ("Default",
+         ("/LARGEADDRESSAWARE:NO", "Disable"),
+         ("/LARGEADDRESSAWARE", "Enable"))),
 
-def AdditionalOptions(configuration, fallback=None, prefix=None):
-    """
-    Create ``AdditionalOptions`` property.
+    # Notify Windows that the application is aware of the Terminal
+    # Server.
+    "TerminalServerAware": (
+        VSEnumProperty, None,
+        ("Default",
+         ("/TSAWARE:NO", "Disable"),
+         ("/TSAWARE", "Enable"))),
 
-    List of custom compiler options as a single string. The default is an empty
-    string. Will not generate this attribute if the string is empty.
+    # Run application from the swap location of the CD.
+    "SwapRunFromCD": (VSBooleanProperty, None, None),
 
-    Can be overridden with configuration attributes:
+    # Run application from the swap location of the Net.
+    "SwapRunFromNet": (VSBooleanProperty, None, None),
 
-    * ``vs_AdditionalOptions`` for the C compiler.
-    * ``vs_LinkerAdditionalOptions`` for the exe/lib linker.
+    # Set the flags if this is a device driver.
+    "Driver": (
+        VSEnumProperty, _is_not_vs2003,
+        (("No", "Not Set"),
+        ("/DRIVER:NO", "Driver"),
+        ("/DRIVER:UPONLY", "UPONLY", "Up Only"),
+        ("/DRIVER:WDM", "WDM"))),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-        prefix: Prefix string for override
+    # Remove unreferenced code
+    "OptimizeReferences": (
+        VSEnumProperty, None,
+        ("Default",
+        ("/OPT:NOREF", "Disable"),
+        ("/OPT:REF", "Enable"))),
 
-    Returns:
-       validators.VSStringProperty object.
-    """
+    # Remove redundant COMDAT symbols
+    "EnableCOMDATFolding": (
+        VSEnumProperty, None,
+        ("Default",
+        ("/OPT:NOREF", "Disable"),
+        ("/OPT:REF", "Enable"))),
 
-    return VSStringProperty.vs_validate(
-        "AdditionalOptions",
-        configuration,
-        fallback,
-        prefix=prefix)
+    # Align code on 4K boundaries for Windows 98
+    "OptimizeForWindows98": (
+        VSEnumProperty, None,
+        ("Default",
+        ("/OPT:NOWIN98", "Disable"),
+        ("/OPT:WIN98", "Enable"))),
 
-########################################
+    # Text file with function names to link in order.
+    "FunctionOrder": (VSStringProperty, None, None),
 
+    # Link using link time code generation
+    "LinkTimeCodeGeneration": (
+        VSEnumProperty, _is_not_vs2003,
+        ("Default",
+        ("/ltcg", "Enable"),
+        ("/ltcg:pginstrument", "Instrument"),
+        ("/ltcg:pgoptimize", "Optimize"),
+        ("/ltcg:pgupdate", "Update"))),
 
-def Optimization(configuration, fallback=None):
-    """
-    Create ``Optimization`` property.
+    # Database file for profile based optimizations.
+    "ProfileGuidedDatabase": (VSStringProperty, _is_not_vs2003, None),
 
-    Set the level of code optimization for the C compiler.
+    # Code entry point symbol.
+    "EntryPointSymbol": (VSStringProperty, None, None),
 
-    Compiler switches /Od, /O1, /O2, /Ox
+    # Create DLL with no entry point; incompatible with setting the
+    # ``Entry Point`` option.
+    "ResourceOnlyDLL": (VSBooleanProperty, None, None),
 
-    Can be overridden with configuration attribute
-    ``vs_Optimization`` for the C compiler.
+    # Enables setting the checksum in the header of a .exe.
+    "SetChecksum": (VSBooleanProperty, None, None),
 
-    Acceptable inputs are:
+    # Base address for execution.
+    "BaseAddress": (VSStringProperty, None, None),
 
-    * "/Od" / "-Od" / "Disabled"
-    * "/O1" / "-O1" / "Minimize Size"
-    * "/O2" / "-O2" / "Maximize Speed"
-    * "/Ox" / "-Ox" / "Full Optimization" / "x"
-    * "Custom" (This disables emitting a command switch)
-    * 0 through 4
+    # Enable base address randomization
+    "RandomizedBaseAddress": (
+        VSEnumProperty, _is_vs2008,
+        ("Default",
+         ("/DYNAMICBASE:NO", "Disable"),
+         ("/DYNAMICBASE", "Enable"))),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-    Returns:
-       validators.VSEnumProperty object.
-    """
+    # Enable fixed address code generation
+    "FixedBaseAddress": (
+        VSEnumProperty, None,
+        ("Default",
+         ("/FIXED:NO", "Relocatable"),
+         ("/FIXED", "Fixed"))),
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_Optimization")
-    if value is not None:
-        fallback = value
+    # Enable Data execution protection
+    "DataExecutionPrevention": (
+        VSEnumProperty, _is_vs2008,
+        ("Default",
+         ("/NXCOMPAT:NO", "Disable"),
+         ("/NXCOMPAT", "Enable"))),
 
-    # The settings are the same on 2003, 2005, and 2008
-    return VSEnumProperty(
-        "Optimization",
-        fallback,
-        (("/Od", "-Od", "Disabled"),
-         ("/O1", "-O1", "Minimize Size"),
-         ("/O2", "-O2", "Maximize Speed"),
-         ("/Ox", "-Ox", "Full Optimization", "x"),
-         "Custom"))
+    # Specifies that no assembly will be generated even though common
+    # language runtime information is present in the object files.
+    "TurnOffAssemblyGeneration": (VSBooleanProperty, None, None),
 
-########################################
+    # Specifies allowing explicit unloading of the delayed load DLLs.
+    "SupportUnloadOfDelayLoadedDLL": (VSBooleanProperty, None, None),
 
+    # Name of the import library to generate.
+    "ImportLibrary": (VSStringProperty, None, None),
 
-def GlobalOptimizations(configuration, fallback=None):
-    """
-    Create ``GlobalOptimizations`` property.
+    # Sections to merge on link.
+    "MergeSections": (VSStringProperty, None, None),
 
-    Enables global optimizations incompatible with all ``Runtime Checks``
-    options and edit and continue. Also known as ``WholeProgramOptimizations``
-    on other versions of Visual Studio.
+    # File with key for signing.
+    "KeyFile": (VSStringProperty, _is_not_vs2003, None),
 
-    Compiler switch /Og
+    # Name of the container of the key.
+    "KeyContainer": (VSStringProperty, _is_not_vs2003, None),
 
-    Can be overridden with configuration attribute
-    ``vs_GlobalOptimizations`` for the C compiler.
+    # Indicates whether the output assembly should be delay signed.
+    "DelaySign": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Note:
-        Only available on Visual Studio 2003
+    # Specifies manifest file lookup behavior for side-by-side
+    # assemblies.
+    "AllowIsolation": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # Produce an output file that can be used with the Enterprise
+    # Developer performance profiler.
+    "Profile": (VSBooleanProperty, _is_not_vs2003, None),
 
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
+    # CLR Thread attribute
+    "CLRThreadAttribute": (
+        VSEnumProperty, _is_not_vs2003,
+        ("Default",
+         ("/CLRTHREADATTRIBUTE:MTA", "MTA"),
+         ("/CLRTHREADATTRIBUTE:STA", "STA"))),
 
-    # Only 2003
-    if configuration.ide is not IDETypes.vs2003:
-        return None
+    # CLR data image type
+    "CLRImageType": (
+        VSEnumProperty, _is_not_vs2003,
+        ("Default",
+         ("/CLRIMAGETYPE:IJW", "IJW"),
+         ("/CLRIMAGETYPE:PURE", "RelPureocatable"),
+         ("/CLRIMAGETYPE:SAFE", "Safe"))),
 
-    return VSBooleanProperty.vs_validate(
-        "GlobalOptimizations",
-        configuration,
-        fallback)
+    # Specifies whether the linker will apply
+    # SuppressUnmanagedCodeSecurityAttribute to linker-generated PInvoke
+    # calls.
+    "CLRUnmanagedCodeCheck": (VSBooleanProperty, _is_not_vs2003, None),
 
+    # Export these functions
+    "ExportNamedFunctions": (VSStringListProperty, None, None)
+}
 
 ########################################
 
 
-def InlineFunctionExpansion(configuration, fallback=None):
+def resolve_vs_value(configuration, name, fallback=None, prefix=None):
     """
-    Create ``InlineFunctionExpansion`` property.
-
-    Determine how aggressive to inline code during C compilation.
-
-    Compiler switches /Ob1, /Ob2
-
-    Can be overridden with configuration attribute
-    ``vs_InlineFunctionExpansion`` for the C compiler.
+    Return the override for a property, or the fallback.
 
-    Acceptable inputs are:
-
-    * "Disable"
-    * "/Ob1" / "Only __inline"
-    * "/Ob2" / "Any Suitable"
-    * 0 through 2
+    Check the configuration for the attribute \"vs_\" + prefix + name using
+    the snapshot from Configuration.get_resolved_attributes(), so the lookup
+    is a single dict access instead of a walk up the parent chain.
 
     Args:
         configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+        name: Name of the property
+        fallback: Value to return if there is no override
+        prefix: String to insert after "vs_"
 
     Returns:
-       validators.VSEnumProperty object.
+        Override value or ``fallback``
     """
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_InlineFunctionExpansion")
-    if value is not None:
-        fallback = value
-
-    # The settings are the same on 2003, 2005, and 2008
-    return VSEnumProperty(
-        "InlineFunctionExpansion",
-        fallback,
-        ("Disable",
-         ("/Ob1", "Only __inline"),
-         ("/Ob2", "Any Suitable")))
+    if prefix:
+        name = prefix + name
+    value = configuration.get_resolved_attributes().get("vs_" + name)
+    if value is None:
+        return fallback
+    return value
 
 ########################################
 
 
-def EnableIntrinsicFunctions(configuration, fallback=None):
+def vs_property(name, configuration, fallback=None, prefix=None):
     """
-    Create ``EnableIntrinsicFunctions`` property.
-
-    Enables intrinsic functions. Using intrinsic functions generates faster,
-    but possibly larger, code.
+    Create a property from the property table.
 
-    Compiler switch /Oi
-
-    Can be overridden with configuration attribute
-    ``vs_EnableIntrinsicFunctions`` for the C compiler.
+    Look up the property in _VS_PROPERTIES, and if it's available for the
+    configuration, create the validator with the override or the fallback.
 
     Args:
+        name: Name of the property
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
+        prefix: String to insert after "vs_" for the override
 
     Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "EnableIntrinsicFunctions",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ImproveFloatingPointConsistency(configuration, fallback=None):
+        None or validator object.
     """
-    Create ``ImproveFloatingPointConsistency`` property.
 
-    Enables intrinsic functions. Using intrinsic functions generates faster,
-    but possibly larger, code.
+    validator, test, options = _VS_PROPERTIES[name]
 
-    Compiler switch /Op
+    # Not available on this target?
+    if test is not None and not test(configuration):
+        return None
 
-    Can be overridden with configuration attribute
-    ``vs_ImproveFloatingPointConsistency`` for the C compiler.
+    # Lists are merged with the parent's list instead of replaced
+    if validator is VSStringListProperty:
+        if options:
+            value = configuration.get_unique_chained_list("vs_" + name)
+            if value:
+                fallback = value
+            return VSStringListProperty(name, fallback, slashes=options[1])
 
-    Note:
-        Only available on Visual Studio 2003
+        value = configuration.get_chained_list("vs_" + name)
+        if value:
+            fallback = value
+        return VSStringListProperty(name, fallback)
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    fallback = resolve_vs_value(configuration, name, fallback, prefix)
 
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
+    # Booleans with no value are not created
+    if validator is VSBooleanProperty:
+        if fallback is None:
+            return None
+        return VSBooleanProperty(name, fallback)
 
-    # Only 2003
-    if configuration.ide is not IDETypes.vs2003:
-        return None
+    if validator is VSEnumProperty:
+        return VSEnumProperty(name, fallback, options)
+    return validator(name, fallback)
 
-    return VSBooleanProperty.vs_validate(
-        "ImproveFloatingPointConsistency",
-        configuration,
-        fallback)
+########################################
 
+# Entries usually found in VS2003Configuration
 
 ########################################
 
 
-def FavorSizeOrSpeed(configuration, fallback=None):
+def OutputDirectory(configuration, fallback=None):
     """
-    Create ``FavorSizeOrSpeed`` property.
-
-    Determine if optimizations should focus on saving space vs unrolling loops.
+    Create ``OutputDirectory`` property.
 
-    Compiler switches /Ot, /Os
+    Directory to store the final exe/lib file output. Will remap to OutDir
 
     Can be overridden with configuration attribute
-    ``vs_FavorSizeOrSpeed`` for the C compiler.
-
-    Acceptable inputs are:
-
-    * "Neither"
-    * "/Ot" / "Favor Fast Code"
-    * "/Os" / "Favor Small Code"
-    * 0 through 2
+    ``vs_OutputDirectory`` for the C compiler.
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-       validators.VSEnumProperty object.
+       validators.VSStringProperty object.
     """
 
-    # Was there an override?
-    value = configuration.get_chained_value("vs_FavorSizeOrSpeed")
-    if value is not None:
-        fallback = value
-
-    # The settings are the same on 2003, 2005, and 2008
-    return VSEnumProperty(
-        "FavorSizeOrSpeed",
-        fallback,
-        ("Neither",
-         ("/Ot", "Favor Fast Code"),
-         ("/Os", "Favor Small Code")))
+    # Convert to string object
+    result = VSStringProperty(
+        "OutputDirectory",
+        resolve_vs_value(configuration, "OutputDirectory", fallback))
+
+    # Post sanity check. Make sure it's terminated with a slash and in Windows
+    # format
+    fallback = result.get_value()
+    if fallback:
+        result.value = convert_to_windows_slashes(
+            fallback,
+            force_ending_slash=True)
+
+    return result
 
 ########################################
 
 
-def OmitFramePointers(configuration, fallback=None):
+def IntermediateDirectory(configuration, fallback=None):
     """
-    Create ``OmitFramePointers`` property.
-
-    Suppress frame pointers.
+    Create ``IntermediateDirectory`` property.
 
-    Compiler switch /Oy
+    Directory to store the intermediate outputs such as .obj and .res files
 
     Can be overridden with configuration attribute
-    ``vs_OmitFramePointers`` for the C compiler.
+    ``vs_IntermediateDirectory`` for the C compiler.
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        validators.VSBooleanProperty object.
+       validators.VSStringProperty object.
     """
 
-    return VSBooleanProperty.vs_validate(
-        "OmitFramePointers",
-        configuration,
-        fallback)
+    # Convert to string object
+    result = VSStringProperty(
+        "IntermediateDirectory",
+        resolve_vs_value(configuration, "IntermediateDirectory", fallback))
+
+    # Post sanity check. Make sure it's terminated with a slash and in Windows
+    # format
+    fallback = result.get_value()
+    if fallback:
+        result.value = convert_to_windows_slashes(
+            fallback,
+            force_ending_slash=True)
+
+    return result
 
 ########################################
 
 
-def EnableFiberSafeOptimizations(configuration, fallback=None):
+def ConfigurationType(configuration, fallback=None):
+    """
+    Create ``ConfigurationType`` property.
+
+    Type of project generated, dll, static lib, executable.
+
+    No external overrides
+
+    Args:
+        configuration: Project configuration to scan for overrides.
+        fallback: Default value to use
+
+    Returns:
+       validators.VSIntegerProperty object.
     """
-    Create ``EnableFiberSafeOptimizations`` property.
 
-    Enables memory space optimization when using fibers and thread local
-    torage access.
+    # If not overridden, map it out.
+    if fallback is None:
+
+        # The numbers don't map to an enum, since Utility is 10
+        # So manually map to the supported project types
+        project_type = configuration.project_type
+        if project_type is ProjectTypes.library:
+            fallback = 4
+        elif project_type is ProjectTypes.sharedlibrary:
+            fallback = 2
+        else:
+            fallback = 1
+
+    # Xbox doesn't support shared libraries, convert to library
+    if fallback == 2 and configuration.platform is PlatformTypes.xbox:
+        fallback = 4
+
+    return VSIntegerProperty("ConfigurationType", fallback)
+
+########################################
+
+
+def ATLMinimizesCRunTimeLibraryUsage(configuration, fallback=None):
+    """
+    Create ``ATLMinimizesCRunTimeLibraryUsage`` property.
 
-    Compiler switch /GT
+    Tells ATL to link to the C runtime libraries statically to minimize
+    dependencies; requires that ``Use of ATL`` to be set.
 
     Can be overridden with configuration attribute
-    ``vs_EnableFiberSafeOptimizations`` for the C compiler.
+    ``vs_ATLMinimizesCRunTimeLibraryUsage`` for the C compiler.
+
+    Note:
+        Not available on Visual Studio 2008 or later and only available on
+        Windows platforms
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        validators.VSBooleanProperty object.
+        None or validators.VSBooleanProperty object.
     """
 
-    return VSBooleanProperty.vs_validate(
-        "EnableFiberSafeOptimizations",
-        configuration,
-        fallback)
+    # VS2003/2005 only
+    if configuration.ide is IDETypes.vs2008:
+        return None
+
+    # Only available on Windows
+    return vs_property(
+        "ATLMinimizesCRunTimeLibraryUsage", configuration, fallback)
 
 ########################################
 
 
-def OptimizeForProcessor(configuration, fallback=None):
+def ManagedExtensions(configuration, fallback=None):
     """
-    Create ``OptimizeForProcessor`` property.
+    Create ``ManagedExtensions`` property.
 
-    Determine if optimizations should focus on specific Pentium processors.
+    Enable the level of Common Language Runtime support
 
-    Compiler switches /G5, /G6, /G7
+    Compiler switches /clr, /clr:pure, /clr:safe, /clr:oldSyntax
 
     Can be overridden with configuration attribute
-    ``vs_OptimizeForProcessor`` for the C compiler.
+    ``vs_ManagedExtensions`` for the C compiler.
 
-    Acceptable inputs are:
+    * "No", "Default"
+    * "/clr" / "CLR" / "Yes"
+    * "/clr:pure" / "Pure MISL" / "MISL" / "Pure"
+    * "/clr:safe" / "Safe MISL" / "Safe"
+    * "/clr:oldSyntax" / "Old MISL" / "Old"
+    * 0 through 4
 
-    * "Blended"
-    * "/G5" / "Pentium"
-    * "/G6" / "Pentium Pro" / "Pentium II" / "Pentium III"
-    * "/G7" / "Pentium IV" / "Pentium 4"
-    * 0 through 3
+    Note:
+        A boolean on Visual Studio 2003, an enum on 2005/2008
 
     Note:
-        Only available on Visual Studio 2003
+        Only available on Windows platforms
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSEnumProperty object.
+        validators.VSEnumProperty or validators.VSBooleanProperty object.
     """
 
-    # Only 2003
-    if configuration.ide is not IDETypes.vs2003:
+    # Only available on Windows
+    if not configuration.platform.is_windows():
         return None
 
     # Was there an override?
-    value = configuration.get_chained_value("vs_OptimizeForProcessor")
-    if value is not None:
-        fallback = value
+    fallback = resolve_vs_value(configuration, "ManagedExtensions", fallback)
+
+    # Visual Studio 2003 only has "Yes" or "No"
+    # So, convert the value into a boolean
+    if configuration.ide is IDETypes.vs2003:
+
+        if fallback is not None:
+            # Is there a value?
+            # Try the easy way first, is it a number, "Yes", "True"?
+            try:
+                fallback = string_to_bool(fallback)
+
+            # Assume exceptions are requested
+            except ValueError:
+                fallback = True
+
+        # Enable/Disable Common Language Runtime
+        return VSBooleanProperty(
+            "ManagedExtensions",
+            fallback)
+
+    # Visual Studio 2005, 2008 version uses enums
+
+    # If a bool, use /clr if True
+    if isinstance(fallback, bool):
+        fallback = "Yes" if fallback else "No"
 
     return VSEnumProperty(
-        "OptimizeForProcessor",
+        "ManagedExtensions",
         fallback,
-        ("Blended",
-        ("/G5", "Pentium"),
-        ("/G6", "Pentium Pro", "Pentium II", "Pentium III"),
-        ("/G7", "Pentium IV", "Pentium 4")))
-
+        (("No", "Default"),
+        ("/clr", "CLR", "Yes"),
+        ("/clr:pure", "Pure MISL", "MISL", "Pure"),
+        ("/clr:safe", "Safe MISL", "Safe"),
+        ("/clr:oldSyntax", "Old MISL", "Old")))
 
 ########################################
 
 
-def OptimizeForWindowsApplication(configuration, fallback=None):
+def WholeProgramOptimization(configuration, fallback=None):
     """
-    Create ``OptimizeForWindowsApplication`` property.
-
-    Specify whether to optimize code in favor of Windows.EXE execution.
+    Create ``WholeProgramOptimization`` property.
 
-    Compiler switch /GA
+    Enable the type of link time code generation
 
     Can be overridden with configuration attribute
-    ``vs_OptimizeForWindowsApplication`` for the C compiler.
+    ``vs_WholeProgramOptimization`` for the C compiler.
+
+    * "No", "Default"
+    * "Yes", "On"
+    * "Instrument"
+    * "Optimize"
+    * "Update"
+    * 0 through 4
 
     Note:
-        Only available on Visual Studio 2003
+        A boolean on Visual Studio 2003, an enum on 2005/2008
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSBooleanProperty object.
+        validators.VSEnumProperty or validators.VSBooleanProperty object.
     """
 
-    # Only 2003
-    if configuration.ide is not IDETypes.vs2003:
-        return None
+    # Was there an override?
+    fallback = resolve_vs_value(
+        configuration, "WholeProgramOptimization", fallback)
 
-    return VSBooleanProperty.vs_validate(
-        "OptimizeForWindowsApplication",
-        configuration,
-        fallback)
+    # Visual Studio 2003 only has "Yes" or "No"
+    # So, convert the value into a boolean
+    if configuration.ide is IDETypes.vs2003:
+
+        if fallback is not None:
+            # Is there a value?
+            # Try the easy way first, is it a number, "Yes", "True"?
+            try:
+                fallback = string_to_bool(fallback)
+
+            # Assume exceptions are requested
+            except ValueError:
+                fallback = True
+
+        # Enable/Disable link time code generation
+        return VSBooleanProperty(
+            "WholeProgramOptimization",
+            fallback)
+
+    # Visual Studio 2005, 2008 version uses enums
+
+    # If a bool, use LTCG if True
+    if isinstance(fallback, bool):
+        fallback = "Yes" if fallback else "No"
+
+    return VSEnumProperty(
+        "WholeProgramOptimization",
+        fallback,
+        (("No", "Default"),
+        ("Yes", "On"),
+         "Instrument",
+        "Optimize",
+        "Update"))
+
+########################################
 
+# Entries usually found in VCCLCompilerTool
 
 ########################################
 
@@ -1607,4148 +1781,424 @@ def WholeProgramOptimization2003(configuration, fallback=None):
 ########################################
 
 
-def AdditionalIncludeDirectories(configuration, fallback=None):
+def ExceptionHandling(configuration, fallback=None):
     """
-    Create ``AdditionalIncludeDirectories`` property.
+    Create ``ExceptionHandling`` property.
+
+    Calls destructors for automatic objects during a strack unwind caused
+    by an exceptions being thrown.
 
-    List of include folders for the C compiler
+    Compiler switches /EHsc, /EHa
 
     Can be overridden with configuration attribute
-    ``vs_AdditionalIncludeDirectories`` for the C compiler.
+    ``vs_ExceptionHandling`` for the C compiler.
+
+    * "No"
+    * "/EHsc" / "Yes"
+    * "/EHa" / "Yes with SEH" / "Yes with SEH Exceptions" / "SEH"
+    * 0 through 2
+
+    Note:
+        A boolean on Visual Studio 2003, an enum on 2005/2008
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-       validators.VSStringListProperty object.
+        validators.VSEnumProperty or validators.VSBooleanProperty object.
     """
 
     # Was there an override?
-    value = configuration.get_unique_chained_list(
-        "vs_AdditionalIncludeDirectories")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AdditionalIncludeDirectories",
-        fallback,
-        slashes="\\")
+    fallback = resolve_vs_value(configuration, "ExceptionHandling", fallback)
 
-########################################
+    # Visual Studio 2003 only has "Yes" or "No"
+    # So, convert the value into a boolean
+    if configuration.ide is IDETypes.vs2003:
 
+        # Is there a value?
+        # Try the easy way first, is it a number, "Yes", "True"?
+        try:
+            fallback = string_to_bool(fallback)
 
-def AdditionalUsingDirectories(configuration, fallback=None):
-    """
-    Create ``AdditionalUsingDirectories`` property.
+        # Assume exceptions are requested
+        except ValueError:
+            fallback = True
 
-    List of include folders for the # using operation.
+        # Enable/Disable exceptions
+        return VSBooleanProperty(
+            "ExceptionHandling",
+            fallback)
 
-    Can be overridden with configuration attribute
-    ``vs_AdditionalUsingDirectories`` for the C compiler.
+    # Visual Studio 2005, 2008 version uses enums
 
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+    # If a bool, use /EHsc if True
+    if isinstance(fallback, bool):
+        fallback = "Yes" if fallback else "No"
 
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_unique_chained_list(
-        "vs_AdditionalUsingDirectories")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AdditionalUsingDirectories",
-        fallback,
-        slashes="\\")
-
-########################################
-
-
-def PreprocessorDefinitions(configuration, fallback=None):
-    """
-    Create ``PreprocessorDefinitions`` property.
-
-    List of defines to pass to the C compiler
-
-    Can be overridden with configuration attribute
-    ``vs_PreprocessorDefinitions`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_PreprocessorDefinitions")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "PreprocessorDefinitions",
-        fallback)
-
-########################################
-
-
-def IgnoreStandardIncludePath(configuration, fallback=None):
-    """
-    Create ``IgnoreStandardIncludePath`` property.
-
-    Ignore standard include paths.
-
-    Compiler switch /X
-
-    Can be overridden with configuration attribute
-    ``vs_IgnoreStandardIncludePath`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "IgnoreStandardIncludePath",
-        configuration,
-        fallback)
-
-########################################
-
-
-def GeneratePreprocessedFile(configuration, fallback=None):
-    """
-    Create ``GeneratePreprocessedFile`` property.
-
-    Determine if a preprocessed file is to be generated.
-
-    Compiler switches /P, /EP
-
-    Can be overridden with configuration attribute
-    ``vs_GeneratePreprocessedFile`` for the C compiler.
-
-    Acceptable inputs are:
-
-    * "No"
-    * "/P" / "With Line Numbers"
-    * "/EP" / "Without Line Numbers"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_GeneratePreprocessedFile")
-    if value is not None:
-        fallback = value
-
-    # The settings are the same on 2003, 2005, and 2008
-    return VSEnumProperty(
-        "GeneratePreprocessedFile",
-        fallback,
-        ("No",
-         ("/P", "With Line Numbers"),
-         ("/EP", "/EP /P", "Without Line Numbers")))
-
-########################################
-
-
-def KeepComments(configuration, fallback=None):
-    """
-    Create ``KeepComments`` property.
-
-    Suppresses comment strip from source code; requires that one of the
-    ``Preprocessing`` options be set.
-
-    Compiler switch /C
-
-    Can be overridden with configuration attribute
-    ``vs_KeepComments`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "KeepComments",
-        configuration,
-        fallback)
-
-########################################
-
-
-def StringPooling(configuration, fallback=None):
-    """
-    Create ``StringPooling`` property.
-
-    Enable read-only string pooling for generating smaller compiled code.
-
-    Compiler switch /GF
-
-    Can be overridden with configuration attribute
-    ``vs_StringPooling`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "StringPooling",
-        configuration,
-        fallback)
-
-########################################
-
-
-def MinimalRebuild(configuration, fallback=None):
-    """
-    Create ``MinimalRebuild`` property.
-
-    Detect changes to C++ class definitions and recompile only affected
-    source files.
-
-    Compiler switch /Gm
-
-    Can be overridden with configuration attribute
-    ``vs_MinimalRebuild`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "MinimalRebuild",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ExceptionHandling(configuration, fallback=None):
-    """
-    Create ``ExceptionHandling`` property.
-
-    Calls destructors for automatic objects during a strack unwind caused
-    by an exceptions being thrown.
-
-    Compiler switches /EHsc, /EHa
-
-    Can be overridden with configuration attribute
-    ``vs_ExceptionHandling`` for the C compiler.
-
-    * "No"
-    * "/EHsc" / "Yes"
-    * "/EHa" / "Yes with SEH" / "Yes with SEH Exceptions" / "SEH"
-    * 0 through 2
-
-    Note:
-        A boolean on Visual Studio 2003, an enum on 2005/2008
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty or validators.VSBooleanProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_ExceptionHandling")
-    if value is not None:
-        fallback = value
-
-    # Visual Studio 2003 only has "Yes" or "No"
-    # So, convert the value into a boolean
-    if configuration.ide is IDETypes.vs2003:
-
-        # Is there a value?
-        # Try the easy way first, is it a number, "Yes", "True"?
-        try:
-            fallback = string_to_bool(fallback)
-
-        # Assume exceptions are requested
-        except ValueError:
-            fallback = True
-
-        # Enable/Disable exceptions
-        return VSBooleanProperty(
-            "ExceptionHandling",
-            fallback)
-
-    # Visual Studio 2005, 2008 version uses enums
-
-    # If a bool, use /EHsc if True
-    if isinstance(fallback, bool):
-        fallback = "Yes" if fallback else "No"
-
-    # If none, turn off Exceptions
-    if fallback is None:
-        fallback = "No"
+    # If none, turn off Exceptions
+    if fallback is None:
+        fallback = "No"
 
     return VSEnumProperty(
         "ExceptionHandling",
-        fallback,
-        ("No",
-        ("/EHsc", "Yes"),
-        ("/EHa", "Yes with SEH", "Yes with SEH Exceptions", "SEH")))
-
-########################################
-
-
-def BasicRuntimeChecks(configuration, fallback=None):
-    """
-    Create ``BasicRuntimeChecks`` property.
-
-    Generate runtime code to verify the stack and uninitialized variables.
-
-    Compiler switches /RTCs, /RTCu, /RTC1
-
-    Can be overridden with configuration attribute
-    ``vs_BasicRuntimeChecks`` for the C compiler.
-
-    * "Default"
-    * "/RTCs" / "Stack" / "Stack Frames"
-    * "/RTCu" / "Uninitialzed" / "Uninitialized Variables"
-    * "/RTCsu" / "/RTC1" / "Both"
-    * 0 through 3
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_BasicRuntimeChecks")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "BasicRuntimeChecks",
-        fallback,
-        ("Default",
-         ("/RTCs", "Stack", "Stack Frames"),
-         ("/RTCu", "Uninitialzed", "Uninitialized Variables"),
-         ("/RTCsu", "/RTC1", "Both")))
-
-########################################
-
-
-def SmallerTypeCheck(configuration, fallback=None):
-    """
-    Create ``SmallerTypeCheck`` property.
-
-    Enable checking for conversion to smaller types, incompatible with
-    any optimization type other than debug.
-
-    Compiler switch /RTCc
-
-    Can be overridden with configuration attribute
-    ``vs_SmallerTypeCheck`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SmallerTypeCheck",
-        configuration,
-        fallback)
-
-########################################
-
-
-def RuntimeLibrary(configuration, fallback=None):
-    """
-    Create ``RuntimeLibrary`` property.
-
-    Select runtime standard library to link with this code module.
-
-    Compiler switches /MT, /MTd, /MD, /MDd, /ML, /MLd
-
-    Can be overridden with configuration attribute
-    ``vs_RuntimeLibrary`` for the C compiler.
-
-    * "/MT" / "Multi-Threaded"
-    * "/MTd" / "Multi-Threaded Debug"
-    * "/MD" / "Multi-Threaded DLL"
-    * "/MDd" / "Multi-Threaded DLL Debug"
-    * "/ML" / "Single-Threaded"
-    * "/MLd" / "Single-Threaded Debug"
-    * 0 through 5
-
-    Note: The Single Threaded libraries are only available on Visual
-        Studio 2003. If 2005 or 2008 is generated, the Multi-Threaded
-        version is substituted.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_RuntimeLibrary")
-    if value is not None:
-        fallback = value
-
-    enum_list = [
-        ("/MT", "Multi-Threaded"),
-        ("/MTd", "Multi-Threaded Debug"),
-        ("/MD", "Multi-Threaded DLL"),
-        ("/MDd", "Multi-Threaded DLL Debug")]
-
-    # Visual Studio 2003 support single threaded libraries
-    if configuration.ide is IDETypes.vs2003:
-        enum_list.extend([
-            ("/ML", "Single-Threaded"),
-            ("/MLd", "Single-Threaded Debug")])
-    else:
-        # Perform substitution from single threaded
-        # to multi-threaded
-        sub_dict = {
-            "/ML": "/MT",
-            "Single-Threaded": "/MT",
-            4: 2,
-            "/MLd": "/MTd",
-            "Single-Threaded Debug": "/MTd",
-            5: 3
-        }
-        fallback = sub_dict.get(fallback, fallback)
-
-    return VSEnumProperty(
-        "RuntimeLibrary",
-        fallback,
-        enum_list)
-
-########################################
-
-
-def StructMemberAlignment(configuration, fallback=None):
-    """
-    Create ``StructMemberAlignment`` property.
-
-    Set the default structure byte alignment.
-
-    Compiler switches /Zp1, /Zp2, /Zp4, /Zp8, /Zp16
-
-    Can be overridden with configuration attribute
-    ``vs_StructMemberAlignment`` for the C compiler.
-
-    * "Default"
-    * "/Zp1" / "1" / "1 Byte"
-    * "/Zp2" / "2" / "2 Bytes"
-    * "/Zp4" / "4" / "4 Bytes"
-    * "/Zp8" / "8" / "8 Bytes"
-    * "/Zp16" / "16" / "16 Bytes"
-    * 0 through 5
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_StructMemberAlignment")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "StructMemberAlignment",
-        fallback,
-        ("Default",
-         ("/Zp1", "1", "1 Byte"),
-         ("/Zp2", "2", "2 Bytes"),
-         ("/Zp4", "4", "4 Bytes"),
-         ("/Zp8", "8", "8 Bytes"),
-         ("/Zp16", "16", "16 Bytes")))
-
-########################################
-
-
-def BufferSecurityCheck(configuration, fallback=None):
-    """
-    Create ``BufferSecurityCheck`` property.
-
-    Check for buffer overruns; useful for closing hackable loopholes
-    on internet servers; ignored for projects using managed extensions.
-
-    Compiler switch /GS
-
-    Can be overridden with configuration attribute
-    ``vs_BufferSecurityCheck`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "BufferSecurityCheck",
-        configuration,
-        fallback)
-
-########################################
-
-
-def EnableFunctionLevelLinking(configuration, fallback=None):
-    """
-    Create ``EnableFunctionLevelLinking`` property.
-
-    Enables function-level linking; required for Edit and Continue to work.
-
-    Compiler switch /Gy
-
-    Can be overridden with configuration attribute
-    ``vs_EnableFunctionLevelLinking`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "EnableFunctionLevelLinking",
-        configuration,
-        fallback)
-
-########################################
-
-
-def EnableEnhancedInstructionSet(configuration, fallback=None):
-    """
-    Create ``EnableEnhancedInstructionSet`` property.
-
-    Set the instruction set extensions allowed.
-
-    Compiler switches /arch:SSE, /arch:SSE2
-
-    Can be overridden with configuration attribute
-    ``vs_EnableEnhancedInstructionSet`` for the C compiler.
-
-    * "Default"
-    * "/arch:SSE" / "SSE"
-    * "/arch:SSE2" / "SSE2"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_EnableEnhancedInstructionSet")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "EnableEnhancedInstructionSet",
-        fallback,
-        ("Default",
-        ("/arch:SSE", "SSE"),
-        ("/arch:SSE2", "SSE2")))
-
-########################################
-
-
-def FloatingPointModel(configuration, fallback=None):
-    """
-    Create ``FloatingPointModel`` property.
-
-    Set the allowable precision for floating point math for speed.
-
-    Compiler switches /fp:precise, /fp:strict, /fp:fast
-
-    Can be overridden with configuration attribute
-    ``vs_FloatingPointModel`` for the C compiler.
-
-    * "/fp:precise" / "Precise"
-    * "/fp:strict" / "Strict"
-    * "/fp:fast" / "Fast"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    # Only 2003
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_FloatingPointModel")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "FloatingPointModel",
-        fallback,
-        (("/fp:precise", "Precise"),
-         ("/fp:strict", "Strict"),
-         ("/fp:fast", "Fast")))
-
-########################################
-
-
-def FloatingPointExceptions(configuration, fallback=None):
-    """
-    Create ``FloatingPointExceptions`` property.
-
-    Enable floating point exceptions when generating code.
-
-    Compiler switch /fp:except
-
-    Can be overridden with configuration attribute
-    ``vs_FloatingPointExceptions`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # Only 2005/2008
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "FloatingPointExceptions",
-        configuration,
-        fallback)
-
-########################################
-
-
-def DisableLanguageExtensions(configuration, fallback=None):
-    """
-    Create ``DisableLanguageExtensions`` property.
-
-    Supresses or enables language extensions.
-
-    Compiler switch /Za
-
-    Can be overridden with configuration attribute
-    ``vs_DisableLanguageExtensions`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "DisableLanguageExtensions",
-        configuration,
-        fallback)
-
-########################################
-
-
-def DefaultCharIsUnsigned(configuration, fallback=None):
-    """
-    Create ``DefaultCharIsUnsigned`` property.
-
-    Sets the default char type to unsigned.
-
-    Compiler switch /J
-
-    Can be overridden with configuration attribute
-    ``vs_DefaultCharIsUnsigned`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "DefaultCharIsUnsigned",
-        configuration,
-        fallback)
-
-########################################
-
-
-def TreatWChar_tAsBuiltInType(configuration, fallback=None):
-    """
-    Create ``TreatWChar_tAsBuiltInType`` property.
-
-    Treats wchar_t as a built-in type.
-
-    Compiler switch /Zc:wchar_t
-
-    Can be overridden with configuration attribute
-    ``vs_TreatWChar_tAsBuiltInType`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "TreatWChar_tAsBuiltInType",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ForceConformanceInForLoopScope(configuration, fallback=None):
-    """
-    Create ``ForceConformanceInForLoopScope`` property.
-
-    Forces the compiler to conform to the local scope in a for loop.
-
-    Compiler switch /Zc:forScope
-
-    Can be overridden with configuration attribute
-    ``vs_ForceConformanceInForLoopScope`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "ForceConformanceInForLoopScope",
-        configuration,
-        fallback)
-
-########################################
-
-
-def RuntimeTypeInfo(configuration, fallback=None):
-    """
-    Create ``RuntimeTypeInfo`` property.
-
-    Adds code for checking C++ object types at run time (runtime type
-    information)
-
-    Compiler switches /GR and /GR-
-
-    Can be overridden with configuration attribute
-    ``vs_RuntimeTypeInfo`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "RuntimeTypeInfo",
-        configuration,
-        fallback)
-
-########################################
-
-
-def OpenMP(configuration, fallback=None):
-    """
-    Create ``OpenMP`` property.
-
-    Enable OpenMP language extensions.
-
-    Compiler switch /openmp
-
-    Can be overridden with configuration attribute
-    ``vs_OpenMP`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # Only 2005/2008
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "OpenMP",
-        configuration,
-        fallback)
-
-########################################
-
-
-def UsePrecompiledHeader(configuration, fallback=None):
-    """
-    Create ``UsePrecompiledHeader`` property.
-
-    Enable use of a precompiled header.
-
-    Compiler switches /Yc, /Yu, /YX
-
-    Can be overridden with configuration attribute
-    ``vs_UsePrecompiledHeader`` for the C compiler.
-
-    * "No" / "Not using"
-    * "/Yc" / "Create"
-    * "/YX" / "Automatic" (Only 2003)
-    * "/Yu" / "Use" (2 on 2005/2008, 3 on 2003)
-    * 0 through 3
-
-    Note:
-        /YX is only available on Visual Studio 2003, on 2005/2008
-        it is swapped with /Yu / "Use"
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_UsePrecompiledHeader")
-    if value is not None:
-        fallback = value
-
-    # Create the list for 2005/2008
-    enum_list = [
-        ("No", "Not using"),
-        ("/Yc", "Create"),
-        ("/Yu", "Use")]
-
-    # Visual Studio 2003 supports automatic generation
-    if configuration.ide is IDETypes.vs2003:
-        # Insert before "/Yu"
-        enum_list.insert(-1, ("/YX", "Automatic"))
-    else:
-        # Remap /YX to /Yu
-        if fallback in ("/YX", "Automatic", 3):
-            fallback = 2
-
-    return VSEnumProperty(
-        "UsePrecompiledHeader",
-        fallback,
-        enum_list)
-
-########################################
-
-
-def PrecompiledHeaderThrough(configuration, fallback=None):
-    """
-    Create ``AdditionalOptions`` property.
-
-    Text header file for precompilation
-
-    Can be overridden with configuration attribute
-    ``vs_PrecompiledHeaderThrough`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "PrecompiledHeaderThrough",
-        configuration,
-        fallback)
-
-########################################
-
-
-def PrecompiledHeaderFile(configuration, fallback=None):
-    """
-    Create ``AdditionalOptions`` property.
-
-    Binary header file for precompilation
-
-    Can be overridden with configuration attribute
-    ``vs_PrecompiledHeaderFile`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "PrecompiledHeaderFile",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ExpandAttributedSource(configuration, fallback=None):
-    """
-    Create ``ExpandAttributedSource`` property.
-
-    Create listing file with expanded attributes injected into source file.
-
-    Compiler switch /Fx
-
-    Can be overridden with configuration attribute
-    ``vs_ExpandAttributedSource`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "ExpandAttributedSource",
-        configuration,
-        fallback)
-
-########################################
-
-
-def AssemblerOutput(configuration, fallback=None):
-    """
-    Create ``AssemblerOutput`` property.
-
-    Set the format of the assembly output
-
-    Compiler switches /FA, /FAcs, /FAc, /FAs
-
-    Can be overridden with configuration attribute
-    ``vs_AssemblerOutput`` for the C compiler.
-
-    * "No" / "No Listing"
-    * "/FA" / "Assembly" / "Asm" / "Assembly-Only"
-    * "/FAcs" / "Assembly, Machine Code and Source"
-    * "/FAc" / "Assembly With Machine Code"
-    * "/FAs" / "Assembly With Source"
-    * 0 through 4
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_AssemblerOutput")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "AssemblerOutput",
-        fallback,
-        (("No", "No Listing"),
-         ("/FA", "Assembly", "Asm", "Assembly-Only"),
-         ("/FAcs", "Assembly, Machine Code and Source"),
-         ("/FAc", "Assembly With Machine Code"),
-         ("/FAs", "Assembly With Source")))
-
-########################################
-
-
-def AssemblerListingLocation(configuration, fallback=None):
-    """
-    Create ``AssemblerListingLocation`` property.
-
-    Output location for .asm file
-
-    Can be overridden with configuration attribute
-    ``vs_AssemblerListingLocation`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "AssemblerListingLocation",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ObjectFile(configuration, fallback=None):
-    """
-    Create ``ObjectFile`` property.
-
-    Output location for .obj file
-
-    Can be overridden with configuration attribute
-    ``vs_ObjectFile`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "ObjectFile",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ProgramDataBaseFileName(configuration, fallback=None):
-    """
-    Create ``ProgramDataBaseFileName`` property.
-
-    Output location of shared .pdb file
-
-    Can be overridden with configuration attribute
-    ``vs_ProgramDataBaseFileName`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "ProgramDataBaseFileName",
-        configuration,
-        fallback)
-
-########################################
-
-
-def GenerateXMLDocumentationFiles(configuration, fallback=None):
-    """
-    Create ``GenerateXMLDocumentationFiles`` property.
-
-    Specifies that the compiler should generate XML documentation comment
-    files.
-
-    Compiler switch /doc
-
-    Can be overridden with configuration attribute
-    ``vs_GenerateXMLDocumentationFiles`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "GenerateXMLDocumentationFiles",
-        configuration,
-        fallback)
-
-########################################
-
-
-def XMLDocumentationFileName(configuration, fallback=None):
-    """
-    Create ``XMLDocumentationFileName`` property.
-
-    Name of the XML formatted documentation file.
-
-    Can be overridden with configuration attribute
-    ``vs_XMLDocumentationFileName`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringProperty object.
-    """
-
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSStringProperty.vs_validate(
-        "XMLDocumentationFileName",
-        configuration,
-        fallback)
-
-########################################
-
-
-def BrowseInformation(configuration, fallback=None):
-    """
-    Create ``BrowseInformation`` property.
-
-    What browser information to generate?
-
-    Compiler switches /FR, /Fr
-
-    Can be overridden with configuration attribute
-    ``vs_BrowseInformation`` for the C compiler.
-
-    * "None" / "No"
-    * "/FR" / "All"
-    * "/Fr" / "No Local Symbols" / "No Locals"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_BrowseInformation")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "BrowseInformation",
-        fallback,
-        (("None", "No"),
-        ("/FR", "All"),
-        ("/Fr", "No Local Symbols", "No Locals")))
-
-########################################
-
-
-def BrowseInformationFile(configuration, fallback=None):
-    """
-    Create ``BrowseInformationFile`` property.
-
-    Name of the browsing file.
-
-    Can be overridden with configuration attribute
-    ``vs_BrowseInformationFile`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "BrowseInformationFile",
-        configuration,
-        fallback)
-
-########################################
-
-
-def WarningLevel(configuration, fallback=None):
-    """
-    Create ``WarningLevel`` property.
-
-    Set the warning level.
-
-    Compiler switches /W0, /W1, /W2, /W3, /W4
-
-    Can be overridden with configuration attribute
-    ``vs_WarningLevel`` for the C compiler.
-
-    * "/W0" / "Off" / "No" / "None"
-    * "/W1" / "Level 1"
-    * "/W2" / "Level 2"
-    * "/W3" / "Level 3"
-    * "/W4" / "Level 4"
-    * 0 through 4
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_WarningLevel")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "WarningLevel",
-        fallback,
-        (("/W0", "Off", "No", "None"),
-        ("/W1", "Level 1"),
-        ("/W2", "Level 2"),
-        ("/W3", "Level 3"),
-        ("/W4", "Level 4", "All")))
-
-########################################
-
-
-def WarnAsError(configuration, fallback=None):
-    """
-    Create ``WarnAsError`` property.
-
-    Enables the compiler to treat all warnings as errors.
-
-    Compiler switch /WX
-
-    Can be overridden with configuration attribute
-    ``vs_WarnAsError`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "WarnAsError",
-        configuration,
-        fallback)
-
-########################################
-
-
-def SuppressStartupBanner(configuration, fallback=None, prefix=None):
-    """
-    Create ``SuppressStartupBanner`` property.
-
-    Suppress the display of the startup banner and information messages.
-
-    Compiler switch /nologo
-
-    Can be overridden with configuration attributes:
-
-    * ``vs_SuppressStartupBanner`` for the C compiler.
-    * ``vs_LinkerSuppressStartupBanner`` for the exe/lib linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-        prefix: Prefix string for override
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SuppressStartupBanner",
-        configuration,
-        fallback,
-        prefix=prefix)
-
-########################################
-
-
-def Detect64BitPortabilityProblems(configuration, fallback=None):
-    """
-    Create ``Detect64BitPortabilityProblems`` property.
-
-    Tells the compiler to check for 64-bit portability issues.
-
-    Compiler switch /Wp64
-
-    Can be overridden with configuration attribute
-    ``vs_Detect64BitPortabilityProblems`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "Detect64BitPortabilityProblems",
-        configuration,
-        fallback)
-
-########################################
-
-
-def DebugInformationFormat(configuration, fallback=None):
-    """
-    Create ``DebugInformationFormat`` property.
-
-    Sets the type of debugging information to embed in the obj file.
-
-    Compiler switches /C7, /Zd, /Zi, /ZI
-
-    Can be overridden with configuration attribute
-    ``vs_DebugInformationFormat`` for the C compiler.
-
-    * "Off" / "No" / "None" / "Disabled"
-    * "/C7" / "C7 Compatible"
-    * "/Zd" / "Line Numbers" / "Line Numbers Only"
-    * "/Zi" / "Program Database"
-    * "/ZI" / "Edit and Continue"
-    * 0 through 4
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_DebugInformationFormat")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "DebugInformationFormat",
-        fallback,
-        (("Off", "No", "None", "Disabled"),
-        ("/C7", "C7 Compatible"),
-        # Hidden in 2005/2008 (maps to C7)
-        ("/Zd", "Line Numbers", "Line Numbers Only"),
-        ("/Zi", "Program Database"),
-        ("/ZI", "Edit and Continue")))
-
-
-########################################
-
-
-def CallingConvention(configuration, fallback=None):
-    """
-    Create ``CallingConvention`` property.
-
-    Sets the type of default calling convention to use. Usually only
-    meaningful for X86.
-
-    Compiler switches /Gd, /Gr, /Gz
-
-    Can be overridden with configuration attribute
-    ``vs_CallingConvention`` for the C compiler.
-
-    * "/Gd" / "__cdecl"
-    * "/Gr" / "__fastcall"
-    * "/Gz" / "__stdcall"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_CallingConvention")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "CallingConvention",
-        fallback,
-        (("/Gd", "__cdecl"),
-        ("/Gr", "__fastcall"),
-        ("/Gz", "__stdcall")))
-
-########################################
-
-
-def CompileAs(configuration, fallback=None):
-    """
-    Create ``CompileAs`` property.
-
-    Forces C or C++ compilation. Normally the file extension determines the
-    choice of compiler.
-
-    Compiler switches /TC, /TP
-
-    Can be overridden with configuration attribute
-    ``vs_CompileAs`` for the C compiler.
-
-    * "No" / "Default"
-    * "/TC" / "C"
-    * "/TP" / "C++" / "CPP"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_CompileAs")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "CompileAs",
-        fallback,
-        (("No", "Default"),
-        ("/TC", "C"),
-        ("/TP", "C++", "CPP")))
-
-########################################
-
-
-def DisableSpecificWarnings(configuration, fallback=None):
-    """
-    Create ``DisableSpecificWarnings`` property.
-
-    List of warnings to disable during C compilation
-
-    Can be overridden with configuration attribute
-    ``vs_DisableSpecificWarnings`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_DisableSpecificWarnings")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "DisableSpecificWarnings",
-        fallback)
-
-########################################
-
-
-def ForcedIncludeFiles(configuration, fallback=None):
-    """
-    Create ``ForcedIncludeFiles`` property.
-
-    List of header files to force including before compilation.
-
-    Can be overridden with configuration attribute
-    ``vs_ForcedIncludeFiles`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_ForcedIncludeFiles")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "ForcedIncludeFiles",
-        fallback)
-
-########################################
-
-
-def ForcedUsingFiles(configuration, fallback=None):
-    """
-    Create ``ForcedUsingFiles`` property.
-
-    List of header files to force using before compilation.
-
-    Can be overridden with configuration attribute
-    ``vs_ForcedUsingFiles`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_ForcedUsingFiles")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "ForcedUsingFiles",
-        fallback)
-
-
-########################################
-
-def ShowIncludes(configuration, fallback=None):
-    """
-    Create ``ShowIncludes`` property.
-
-    Generates a list of include files with compiler output.
-
-    Compiler switch /showIncludes
-
-    Can be overridden with configuration attribute
-    ``vs_ShowIncludes`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "ShowIncludes",
-        configuration,
-        fallback)
-
-########################################
-
-
-def UndefinePreprocessorDefinitions(configuration, fallback=None):
-    """
-    Create ``UndefinePreprocessorDefinitions`` property.
-
-    List of defines to remove from compilation
-
-    Can be overridden with configuration attribute
-    ``vs_UndefinePreprocessorDefinitions`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_UndefinePreprocessorDefinitions")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "UndefinePreprocessorDefinitions",
-        fallback)
-
-########################################
-
-
-def UndefineAllPreprocessorDefinitions(configuration, fallback=None):
-    """
-    Create ``UndefineAllPreprocessorDefinitions`` property.
-
-    Undefine all previously defined preprocessor values.
-
-    Compiler switch /u
-
-    Can be overridden with configuration attribute
-    ``vs_UndefineAllPreprocessorDefinitions`` for the C compiler.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "UndefineAllPreprocessorDefinitions",
-        configuration,
-        fallback)
-
-########################################
-
-
-def UseFullPaths(configuration, fallback=None):
-    """
-    Create ``UseFullPaths`` property.
-
-    Use full paths in diagnostic messages.
-
-    Compiler switch /FC
-
-    Can be overridden with configuration attribute
-    ``vs_UseFullPaths`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "UseFullPaths",
-        configuration,
-        fallback)
-
-########################################
-
-
-def OmitDefaultLibName(configuration, fallback=None):
-    """
-    Create ``OmitDefaultLibName`` property.
-
-    Do not include default library names in .obj files.
-
-    Compiler switch /Zl
-
-    Can be overridden with configuration attribute
-    ``vs_OmitDefaultLibName`` for the C compiler.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "OmitDefaultLibName",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ErrorReporting(configuration, fallback=None):
-    """
-    Create ``ErrorReporting`` property.
-
-    Is error reporting queued or immediate?
-
-    Compiler switches /errorReport:prompt, /errorReport:queue
-
-    Can be overridden with configuration attribute
-    ``vs_ErrorReporting`` for the C compiler.
-
-    * "Default"
-    * "/errorReport:prompt" / "Immediate"
-    * "/errorReport:queue" / "Queue"
-    * 0 through 2
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_ErrorReporting")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "ErrorReporting",
-        fallback,
-        ("Default",
-        ("/errorReport:prompt", "Immediate", "Prompt"),
-        ("/errorReport:queue", "Queue")))
-
-########################################
-
-# Entries usually found in VCCustomBuildTool
-
-########################################
-
-
-def Description(configuration, fallback=None, prefix=None):
-    """
-    Create ``Description`` property.
-
-    Message to print in the console
-
-    Can be overridden with configuration attributes:
-
-    * ``vs_Description`` for CustomBuild
-    * ``vs_PreBuildDescription`` for PreBuild
-    * ``vs_PostBuildDescription`` for PostBuild
-    * ``vs_PreLinkDescription`` for PreLink
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-        prefix: Prefix string for override
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "Description",
-        configuration,
-        fallback,
-        prefix=prefix)
-
-########################################
-
-
-def CommandLine(configuration, fallback=None, prefix=None):
-    """
-    Create ``CommandLine`` property.
-
-    Batch file contents
-
-    Can be overridden with configuration attributes:
-
-    * ``vs_CommandLine`` for CustomBuild
-    * ``vs_PreBuildCommandLine`` for PreBuild
-    * ``vs_PostBuildCommandLine`` for PostBuild
-    * ``vs_PreLinkCommandLine`` for PreLink
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-        prefix: Prefix string for override
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "CommandLine",
-        configuration,
-        fallback,
-        prefix=prefix)
-
-########################################
-
-
-def AdditionalDependencies(configuration, fallback=None, prefix=None):
-    """
-    Create ``AdditionalDependencies`` property.
-
-    List of files this build object depends on. If custom build, it's a list
-    of input files for the build script. If it's a linker, it's a list of
-    library files to link into the final output.
-
-    Can be overridden with configuration attributes:
-
-    * ``vs_AdditionalDependencies`` for Linkers
-    * ``vs_CustomAdditionalDependencies`` for CustomBuild
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-        prefix: Prefix string for override
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Insert the optional prefix
-    new_key = "vs_"
-
-    # Assume space for libraries
-    separator = " "
-    if prefix:
-        new_key = new_key + prefix
-        # Custom build separates with ';'
-        separator = ";"
-    new_key = new_key + "AdditionalDependencies"
-
-    # Was there an override?
-    value = configuration.get_chained_list(new_key)
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AdditionalDependencies",
-        fallback,
-        separator=separator)
-
-########################################
-
-
-def Outputs(configuration, fallback=None):
-    """
-    Create ``Outputs`` property.
-
-    List of files this custom build command generates
-
-    Can be overridden with configuration attribute
-    ``vs_Outputs`` for the custom builder.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_Outputs")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "Outputs",
-        fallback)
-
-########################################
-
-# Entries usually found in VCLinkerTool
-
-########################################
-
-
-def RegisterOutput(configuration, fallback=None):
-    """
-    Create ``RegisterOutput`` property.
-
-    Specifies whether to register the primary output of this build to Windows.
-
-    Can be overridden with configuration attribute
-    ``vs_RegisterOutput`` for the Linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "RegisterOutput",
-        configuration, fallback)
-
-########################################
-
-
-def PerUserRedirection(configuration, fallback=None):
-    """
-    Create ``PerUserRedirection`` property.
-
-    When Register Output is enabled, Per-user redirection forces registry
-    writes to HKEY_CLASSES_ROOT to be redirected to HKEY_CURRENT_USER
-
-    Can be overridden with configuration attribute
-    ``vs_PerUserRedirection`` for the Linker.
-
-    Note:
-        Not available on Visual Studio 2005 and earlier
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    # VS2008 only
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "PerUserRedirection",
-        configuration,
-        fallback)
-
-########################################
-
-
-def IgnoreImportLibrary(configuration, fallback=None):
-    """
-    Create ``IgnoreImportLibrary`` property.
-
-    Specifies that the import library generated by this configuration should not
-    be imported into dependent projects.
-
-    Can be overridden with configuration attribute
-    ``vs_IgnoreImportLibrary`` for the Linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "IgnoreImportLibrary",
-        configuration,
-        fallback)
-
-########################################
-
-
-def LinkLibraryDependencies(configuration, fallback=None):
-    """
-    Create ``LinkLibraryDependencies`` property.
-
-    Specifies whether or not library outputs from project dependencies are
-    automatically linked in.
-
-    Can be overridden with configuration attribute
-    ``vs_LinkLibraryDependencies`` for the Linker.
-
-    Note:
-        Not available on Visual Studio 2003 and earlier
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "LinkLibraryDependencies",
-        configuration,
-        fallback)
-
-########################################
-
-
-def UseLibraryDependencyInputs(configuration, fallback=None):
-    """
-    Create ``UseLibraryDependencyInputs`` property.
-
-    Specifies whether or not the inputs to the librarian tool are used rather
-    than the library file itself when linking in library outputs of project
-    dependencies.
-
-    Can be overridden with configuration attribute
-    ``vs_UseLibraryDependencyInputs`` for the Linker.
-
-    Note:
-        Not available on Visual Studio 2003 and earlier
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "UseLibraryDependencyInputs",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ShowProgress(configuration, fallback=None):
-    """
-    Create ``ShowProgress`` property.
-
-    Show progress in linking?
-
-    Compiler switches /VERBOSE, /VERBOSE:LIB
-
-    Can be overridden with configuration attribute
-    ``vs_ShowProgress`` for the linker.
-
-    * "Default" / "No" / "None"
-    * "/VERBOSE" / "All"
-    * "/VERBOSE:LIB" / "Lib"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_ShowProgress")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "ShowProgress",
-        fallback,
-        (("Default", "No", "None"),
-        ("/VERBOSE", "All"),
-        ("/VERBOSE:LIB", "Lib")))
-
-########################################
-
-
-def OutputFile(configuration, fallback=None):
-    """
-    Create ``OutputFile`` property.
-
-    Name of the output file
-
-    Can be overridden with configuration attribute
-    ``vs_OutputFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "OutputFile",
-        configuration,
-        fallback)
-
-########################################
-
-
-def Version(configuration, fallback=None):
-    """
-    Create ``Version`` property.
-
-    Version string for linking
-
-    Can be overridden with configuration attribute
-    ``vs_Version`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "Version",
-        configuration,
-        fallback)
-
-########################################
-
-
-def LinkIncremental(configuration, fallback=None):
-    """
-    Create ``LinkIncremental`` property.
-
-    Enable incremental linking.
-
-    Compiler switches /INCREMENTAL:NO, /INCREMENTAL
-
-    Can be overridden with configuration attribute
-    ``vs_LinkIncremental`` for the linker.
-
-    * "Default" / "No" / "None"
-    * "/INCREMENTAL:NO" / "No"
-    * "/INCREMENTAL" / "Yes"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_LinkIncremental")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "LinkIncremental",
-        fallback,
-        ("Default",
-        ("/INCREMENTAL:NO", "No"),
-        ("/INCREMENTAL", "Yes")))
-
-########################################
-
-
-def GenerateManifest(configuration, fallback=None):
-    """
-    Create ``GenerateManifest`` property.
-
-    Specifies if the linker should always generate a manifest file.
-
-    Can be overridden with configuration attribute
-    ``vs_GenerateManifest`` for the Linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "GenerateManifest",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ManifestFile(configuration, fallback=None):
-    """
-    Create ``ManifestFile`` property.
-
-    Name of the manifest file.
-
-    Can be overridden with configuration attribute
-    ``vs_ManifestFile`` for the linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSStringProperty.vs_validate(
-        "ManifestFile",
-        configuration,
-        fallback)
-
-########################################
-
-
-def AdditionalManifestDependencies(configuration, fallback=None):
-    """
-    Create ``AdditionalManifestDependencies`` property.
-
-    List of manifests this one is dependent on
-
-    Can be overridden with configuration attribute
-    ``vs_AdditionalManifestDependencies`` for the custom builder.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringListProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_AdditionalManifestDependencies")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AdditionalManifestDependencies",
-        fallback)
-
-########################################
-
-
-def EnableUAC(configuration, fallback=None):
-    """
-    Create ``EnableUAC`` property.
-
-    Specifies whether or not User Account Control is enabled.
-
-    Note:
-        Not available on Visual Studio 2003 or 2005
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-            Returns:
-        None or VSBooleanProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "EnableUAC", configuration, fallback)
-
-########################################
-
-
-def UACExecutionLevel(configuration, fallback=None):
-    """
-    Create ``UACExecutionLevel`` property.
-
-    Set the UAC level
-
-    Compiler switches /MANIFESTUAC:level=asInvoker
-
-    Can be overridden with configuration attribute
-    ``vs_UACExecutionLevel`` for the linker.
-
-    * "Default" / "asInvoker"
-    * "highestAvailable"
-    * "requireAdministrator"
-    * 0 through 2
-
-    Note:
-        Not available on Visual Studio 2003 or 2005
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_UACExecutionLevel")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "UACExecutionLevel",
-        fallback,
-        (("asInvoker", "Default"),
-        "highestAvailable",
-        "requireAdministrator"))
-
-########################################
-
-
-def UACUIAccess(configuration, fallback=None):
-    """
-    Create ``UACUIAccess`` property.
-
-    Specifies whether or not to bypass user interface protection levels for
-    other windows on the desktop. Set this property to ``Yes`` only for
-    accessability applications.
-
-    Compiler switches /MANIFESTUAC:uiAccess=``true`` or
-    /MANIFESTUAC:uiAccess=``false``
-
-    Note:
-        Not available on Visual Studio 2003 or 2005
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "UACUIAccess", configuration, fallback)
-
-########################################
-
-
-def IgnoreAllDefaultLibraries(configuration, fallback=None):
-    """
-    Create ``IgnoreAllDefaultLibraries`` property.
-
-    Ignore all default libraries during linking.
-
-    Compiler switch /NODEFAULTLIB
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "IgnoreAllDefaultLibraries", configuration, fallback)
-
-########################################
-
-
-def IgnoreDefaultLibraryNames(configuration, fallback=None):
-    """
-    Create ``IgnoreDefaultLibraryNames`` property.
-
-    List of libraries to ignore
-
-    Can be overridden with configuration attribute
-    ``vs_IgnoreDefaultLibraryNames`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_IgnoreDefaultLibraryNames")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "IgnoreDefaultLibraryNames",
-        fallback)
-
-########################################
-
-
-def ModuleDefinitionFile(configuration, fallback=None):
-    """
-    Create ``ModuleDefinitionFile`` property.
-
-    Name of the module definition file
-
-    Can be overridden with configuration attribute
-    ``vs_ModuleDefinitionFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "ModuleDefinitionFile", configuration, fallback)
-
-########################################
-
-
-def AddModuleNamesToAssembly(configuration, fallback=None):
-    """
-    Create ``AddModuleNamesToAssembly`` property.
-
-    Add these modules to C# assembly
-
-    Can be overridden with configuration attribute
-    ``vs_AddModuleNamesToAssembly`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_AddModuleNamesToAssembly")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AddModuleNamesToAssembly",
-        fallback)
-
-########################################
-
-
-def EmbedManagedResourceFile(configuration, fallback=None):
-    """
-    Create ``EmbedManagedResourceFile`` property.
-
-    Embed the listed resource files.
-
-    Can be overridden with configuration attribute
-    ``vs_EmbedManagedResourceFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_EmbedManagedResourceFile")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "EmbedManagedResourceFile",
-        fallback)
-
-########################################
-
-
-def ForceSymbolReferences(configuration, fallback=None):
-    """
-    Create ``ForceSymbolReferences`` property.
-
-    Force these symbols to be public
-
-    Can be overridden with configuration attribute
-    ``vs_ForceSymbolReferences`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_ForceSymbolReferences")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "ForceSymbolReferences",
-        fallback)
-
-########################################
-
-
-def DelayLoadDLLs(configuration, fallback=None):
-    """
-    Create ``DelayLoadDLLs`` property.
-
-    Only load these DLLs if functions within are called.
-
-    Can be overridden with configuration attribute
-    ``vs_DelayLoadDLLs`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringListProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_DelayLoadDLLs")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "DelayLoadDLLs",
-        fallback)
-
-########################################
-
-
-def AssemblyLinkResource(configuration, fallback=None):
-    """
-    Create ``AssemblyLinkResource`` property.
-
-    Link in these assemblies
-
-    Can be overridden with configuration attribute
-    ``vs_AssemblyLinkResource`` for the linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringListProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_list("vs_AssemblyLinkResource")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "AssemblyLinkResource",
-        fallback)
-
-########################################
-
-
-def MidlCommandFile(configuration, fallback=None):
-    """
-    Create ``MidlCommandFile`` property.
-
-    Midl command file to execute.
-
-    Can be overridden with configuration attribute
-    ``vs_MidlCommandFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "MidlCommandFile", configuration, fallback)
-
-########################################
-
-
-def IgnoreEmbeddedIDL(configuration, fallback=None):
-    """
-    Create ``IgnoreEmbeddedIDL`` property.
-
-    Ignore embedded .idlsym sections of object files.
-
-    Compiler switch /IGNOREIDL
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-    return VSBooleanProperty.vs_validate(
-        "IgnoreEmbeddedIDL", configuration, fallback)
-
-########################################
-
-
-def MergedIDLBaseFileName(configuration, fallback=None):
-    """
-    Create ``MergedIDLBaseFileName`` property.
-
-    Filename to contain the merged IDL file
-
-    Can be overridden with configuration attribute
-    ``vs_MergedIDLBaseFileName`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "MergedIDLBaseFileName", configuration, fallback)
-
-########################################
-
-
-def TypeLibraryFile(configuration, fallback=None):
-    """
-    Create ``TypeLibraryFile`` property.
-
-    Name of the type library.
-
-    Can be overridden with configuration attribute
-    ``vs_TypeLibraryFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "TypeLibraryFile", configuration, fallback)
-
-########################################
-
-
-def TypeLibraryResourceID(configuration, fallback=None):
-    """
-    Create ``TypeLibraryResourceID`` property.
-
-    ID number of the library resource
-
-    Can be overridden with configuration attribute
-    ``vs_TypeLibraryResourceID`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSIntegerProperty object.
-    """
-
-    return VSIntegerProperty.vs_validate(
-        "TypeLibraryResourceID", configuration, fallback)
-
-########################################
-
-
-def GenerateDebugInformation(configuration, fallback=None):
-    """
-    Create ``GenerateDebugInformation`` property.
-
-    Enables generation of debug information.
-
-    Compiler switch /DEBUG
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "GenerateDebugInformation", configuration, fallback)
-
-########################################
-
-
-def AssemblyDebug(configuration, fallback=None):
-    """
-    Create ``AssemblyDebug`` property.
-
-    Add debugging information in assembly
-
-    Compiler switches /ASSEMBLYDEBUG, /ASSEMBLYDEBUG:DISABLE
-
-    Can be overridden with configuration attribute
-    ``vs_AssemblyDebug`` for the linker.
-
-    * "No" / "None"
-    * "/ASSEMBLYDEBUG" / "Runtime Tracking"
-    * "/ASSEMBLYDEBUG:DISABLE" / "No Runtime Tracking"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_AssemblyDebug")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "AssemblyDebug",
-        fallback,
-        (("No", "None"),
-        ("/ASSEMBLYDEBUG", "Runtime Tracking"),
-        ("/ASSEMBLYDEBUG:DISABLE", "No Runtime Tracking")))
-
-########################################
-
-
-def ProgramDatabaseFile(configuration, fallback=None):
-    """
-    Create ``ProgramDatabaseFile`` property.
-
-    Name of the program database file
-
-    Can be overridden with configuration attribute
-    ``vs_ProgramDatabaseFile`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "ProgramDatabaseFile", configuration, fallback)
-
-########################################
-
-
-def StripPrivateSymbols(configuration, fallback=None):
-    """
-    Create ``StripPrivateSymbols`` property.
-
-    Do not put symbols in the named file
-
-    Can be overridden with configuration attribute
-    ``vs_StripPrivateSymbols`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "StripPrivateSymbols", configuration, fallback)
-
-########################################
-
-
-def GenerateMapFile(configuration, fallback=None):
-    """
-    Create ``GenerateMapFile`` property.
-
-    Enables generation of map file during linking.
-
-    Compiler switch /MAP
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "GenerateMapFile", configuration, fallback)
-
-########################################
-
-
-def MapFileName(configuration, fallback=None):
-    """
-    Create ``MapFileName`` property.
-
-    Name of the symbol map file
-
-    Can be overridden with configuration attribute
-    ``vs_MapFileName`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "MapFileName", configuration, fallback)
-
-########################################
-
-
-def MapExports(configuration, fallback=None):
-    """
-    Create ``MapExports`` property.
-
-    Includes exported functions in map file information.
-
-    Compiler switch /MAPINFO:EXPORTS
-
-    Can be overridden with configuration attribute
-    ``vs_MapExports`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "MapExports", configuration, fallback)
-
-########################################
-
-
-def MapLines(configuration, fallback=None):
-    """
-    Create ``MapLines`` property.
-
-    Includes source code line number information in map file.
-
-    Compiler switch /MAPINFO:LINES
-
-    Can be overridden with configuration attribute
-    ``vs_MapLines`` for the linker.
-
-    Note:
-        Only available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSBooleanProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2003:
-        return None
-
-    return VSBooleanProperty.vs_validate(
-        "MapLines", configuration, fallback)
-
-########################################
-
-
-def SubSystem(configuration, fallback=None):
-    """
-    Create ``SubSystem`` property.
-
-    Subsystem to link to.
-
-    Compiler switches /SUBSYSTEM:CONSOLE, /SUBSYSTEM:WINDOWS
-
-    Can be overridden with configuration attribute
-    ``vs_AssemblyDebug`` for the linker.
-
-    * "No" / "None"
-    * "/SUBSYSTEM:CONSOLE" / "Console"
-    * "/SUBSYSTEM:WINDOWS" / "Windows"
-    * "/SUBSYSTEM:NATIVE" / "Native" 2005-2008
-    * "/SUBSYSTEM:EFI_APPLICATION" / "EFI Application" 2005-2008
-    * "/SUBSYSTEM:EFI_BOOT_SERVICE_DRIVER" / "EFI Boot Service Driver" 2005-2008
-    * "/SUBSYSTEM:EFI_ROM" / "EFI ROM" 2005-2008
-    * "/SUBSYSTEM:EFI_RUNTIME_DRIVER" / "EFI Runtime" 2005-2008
-    * "/SUBSYSTEM:POSIX" / "Posix" 2005
-    * "/SUBSYSTEM:WINDOWSCE" / "WindowsCE" 2005-2008
-    * 0 through 2 2003, 10 - 2005, 9 - 2008
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_SubSystem")
-    if value is not None:
-        fallback = value
-
-    enum_list = [
-        ("No", "None"),
-        ("/SUBSYSTEM:CONSOLE", "Console"),
-        ("/SUBSYSTEM:WINDOWS", "Windows")
-    ]
-
-    if configuration.ide is not IDETypes.vs2003:
-        enum_list.extend([
-            ("/SUBSYSTEM:NATIVE", "Native"),
-            ("/SUBSYSTEM:EFI_APPLICATION", "EFI Application"),
-            ("/SUBSYSTEM:EFI_BOOT_SERVICE_DRIVER",
-                "EFI Boot Service Driver"),
-            ("/SUBSYSTEM:EFI_ROM", "EFI ROM"),
-            ("/SUBSYSTEM:EFI_RUNTIME_DRIVER", "EFI Runtime"),
-            ("/SUBSYSTEM:WINDOWSCE", "WindowsCE")
-        ])
-
-        # Only Visual Studio 2005 supported Posix
-        if configuration.ide is IDETypes.vs2005:
-            enum_list.insert(-1, ("/SUBSYSTEM:POSIX", "Posix"))
-
-    return VSEnumProperty("SubSystem", fallback, enum_list)
-
-########################################
-
-
-def HeapReserveSize(configuration, fallback=None):
-    """
-    Create ``SubSystem`` property.
-
-    Amount of heap to reserve
-
-    Can be overridden with configuration attribute
-    ``vs_HeapReserveSize`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSIntegerProperty object.
-    """
-
-    return VSIntegerProperty.vs_validate(
-        "HeapReserveSize", configuration, fallback)
-
-########################################
-
-
-def HeapCommitSize(configuration, fallback=None):
-    """
-    Create ``SubSystem`` property.
-
-    Amount of heap to commit
-
-    Can be overridden with configuration attribute
-    ``vs_HeapCommitSize`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSIntegerProperty object.
-    """
-
-    return VSIntegerProperty.vs_validate(
-        "HeapCommitSize", configuration, fallback)
-
-########################################
-
-
-def StackReserveSize(configuration, fallback=None):
-    """
-    Create ``SubSystem`` property.
-
-    Amount of stack to reserve
-
-    Can be overridden with configuration attribute
-    ``vs_StackReserveSize`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSIntegerProperty object.
-    """
-
-    return VSIntegerProperty.vs_validate(
-        "StackReserveSize", configuration, fallback)
-
-########################################
-
-
-def StackCommitSize(configuration, fallback=None):
-    """
-    Create ``SubSystem`` property.
-
-    Amount of stack to commit
-
-    Can be overridden with configuration attribute
-    ``vs_StackCommitSize`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSIntegerProperty object.
-    """
-
-    return VSIntegerProperty.vs_validate(
-        "StackCommitSize", configuration, fallback)
-
-########################################
-
-
-def LargeAddressAware(configuration, fallback=None):
-    """
-    Create ``LargeAddressAware`` property.
-
-    Notifies Windows the application is 32 bit clean.
-
-    Compiler switches /LARGEADDRESSAWARE:NO, /LARGEADDRESSAWARE
-
-    Can be overridden with configuration attribute
-    ``vs_LargeAddressAware`` for the linker.
-
-    * "Default"
-    * "/LARGEADDRESSAWARE:NO" / "Disable"
-    * "/LARGEADDRESSAWARE" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_LargeAddressAware")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "LargeAddressAware",
-        fallback,
-        ("Default",
-         ("/LARGEADDRESSAWARE:NO", "Disable"),
-         ("/LARGEADDRESSAWARE", "Enable")))
-
-########################################
-
-
-def TerminalServerAware(configuration, fallback=None):
-    """
-    Create ``TerminalServerAware`` property.
-
-    Notify Windows that the application is aware of the Terminal Server.
-
-    Compiler switches /TSAWARE:NO, /TSAWARE
-
-    Can be overridden with configuration attribute
-    ``vs_TerminalServerAware`` for the linker.
-
-    * "Default"
-    * "/TSAWARE:NO" / "Disable"
-    * "/TSAWARE" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_TerminalServerAware")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "TerminalServerAware",
-        fallback,
-        ("Default",
-         ("/TSAWARE:NO", "Disable"),
-         ("/TSAWARE", "Enable")))
-
-
-########################################
-
-def SwapRunFromCD(configuration, fallback=None):
-    """
-    Create ``SwapRunFromCD`` property.
-
-    Run application from the swap location of the CD.
-
-    Compiler switch /SWAPRUN:CD
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SwapRunFromCD", configuration, fallback)
-
-########################################
-
-
-def SwapRunFromNet(configuration, fallback=None):
-    """
-    Create ``SwapRunFromNet`` property.
-
-    Run application from the swap location of the Net.
-
-    Compiler switch /SWAPRUN:NET
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SwapRunFromNet", configuration, fallback)
-
-########################################
-
-
-def Driver(configuration, fallback=None):
-    """
-    Create ``Driver`` property.
-
-    Set the flags if this is a device driver.
-
-    Compiler switches /DRIVER:NO, /DRIVER:UPONLY, /DRIVER:WDM
-
-    Can be overridden with configuration attribute
-    ``vs_Driver`` for the linker.
-
-    * "No" / "Not Set"
-    * "/DRIVER:NO" / "Driver"
-    * "/DRIVER:UPONLY" / "UPONLY" / "Up Only"
-    * "/DRIVER:WDM" / "WDM"
-    * 0 through 3
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_Driver")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "Driver",
-        fallback,
-        (("No", "Not Set"),
-        ("/DRIVER:NO", "Driver"),
-        ("/DRIVER:UPONLY", "UPONLY", "Up Only"),
-        ("/DRIVER:WDM", "WDM")))
-
-########################################
-
-
-def OptimizeReferences(configuration, fallback=None):
-    """
-    Create ``OptimizeReferences`` property.
-
-    Remove unreferenced code
-
-    Compiler switches /OPT:NOREF, /OPT:REF
-
-    Can be overridden with configuration attribute
-    ``vs_OptimizeReferences`` for the linker.
-
-    * "Default"
-    * "/OPT:NOREF" / "Disable"
-    * "/OPT:REF" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_OptimizeReferences")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "OptimizeReferences",
-        fallback,
-        ("Default",
-        ("/OPT:NOREF", "Disable"),
-        ("/OPT:REF", "Enable")))
-
-########################################
-
-
-def EnableCOMDATFolding(configuration, fallback=None):
-    """
-    Create ``EnableCOMDATFolding`` property.
-
-    Remove redundant COMDAT symbols
-
-    Compiler switches /OPT:NOICF, /OPT:ICF
-
-    Can be overridden with configuration attribute
-    ``vs_EnableCOMDATFolding`` for the linker.
-
-    * "Default"
-    * "/OPT:NOICF" / "Disable"
-    * "/OPT:ICF" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_EnableCOMDATFolding")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "EnableCOMDATFolding",
-        fallback,
-        ("Default",
-        ("/OPT:NOREF", "Disable"),
-        ("/OPT:REF", "Enable")))
-
-########################################
-
-
-def OptimizeForWindows98(configuration, fallback=None):
-    """
-    Create ``OptimizeForWindows98`` property.
-
-    Align code on 4K boundaries for Windows 98
-
-    Compiler switches /OPT:NOWIN98, /OPT:WIN98
-
-    Can be overridden with configuration attribute
-    ``vs_OptimizeForWindows98`` for the linker.
-
-    * "Default"
-    * "/OPT:NOWIN98" / "Disable"
-    * "/OPT:WIN98" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_OptimizeForWindows98")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "OptimizeForWindows98",
-        fallback,
-        ("Default",
-        ("/OPT:NOWIN98", "Disable"),
-        ("/OPT:WIN98", "Enable")))
-
-########################################
-
-
-def FunctionOrder(configuration, fallback=None):
-    """
-    Create ``FunctionOrder`` property.
-
-    Text file with function names to link in order.
-
-    Can be overridden with configuration attribute
-    ``vs_FunctionOrder`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "FunctionOrder",
-        configuration,
-        fallback)
-
-########################################
-
-
-def LinkTimeCodeGeneration(configuration, fallback=None):
-    """
-    Create ``LinkTimeCodeGeneration`` property.
-
-    Link using link time code generation
-
-    Compiler switches /ltcg, /ltcg:pginstrument
-
-    Can be overridden with configuration attribute
-    ``vs_LinkTimeCodeGeneration`` for the linker.
-
-    * "Default"
-    * "/ltcg" / "Enable"
-    * "/ltcg:pginstrument" / "Instrument"
-    * "/ltcg:pgoptimize" / "Optimize"
-    * "/ltcg:pgupdate" / "Update"
-    * 0 through 4
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_LinkTimeCodeGeneration")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "LinkTimeCodeGeneration",
-        fallback,
-        ("Default",
-        ("/ltcg", "Enable"),
-        ("/ltcg:pginstrument", "Instrument"),
-        ("/ltcg:pgoptimize", "Optimize"),
-        ("/ltcg:pgupdate", "Update")))
-
-########################################
-
-
-def ProfileGuidedDatabase(configuration, fallback=None):
-    """
-    Create ``ProfileGuidedDatabase`` property.
-
-    Database file for profile based optimizations.
-
-    Can be overridden with configuration attribute
-    ``vs_ProfileGuidedDatabase`` for the linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSStringProperty.vs_validate(
-        "ProfileGuidedDatabase",
-        configuration,
-        fallback)
-
-########################################
-
-
-def EntryPointSymbol(configuration, fallback=None):
-    """
-    Create ``EntryPointSymbol`` property.
-
-    Code entry point symbol.
-
-    Can be overridden with configuration attribute
-    ``vs_EntryPointSymbol`` for tshe linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "EntryPointSymbol",
-        configuration,
-        fallback)
-
-########################################
-
-
-def ResourceOnlyDLL(configuration, fallback=None):
-    """
-    Create ``ResourceOnlyDLL`` property.
-
-    Create DLL with no entry point; incompatible with setting the
-    ``Entry Point`` option.
-
-    Compiler switch /NOENTRY
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "ResourceOnlyDLL", configuration, fallback)
-
-########################################
-
-
-def SetChecksum(configuration, fallback=None):
-    """
-    Create ``SetChecksum`` property.
-
-    Enables setting the checksum in the header of a .exe.
-
-    Compiler switch /RELEASE
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SetChecksum", configuration, fallback)
-
-########################################
-
-
-def BaseAddress(configuration, fallback=None):
-    """
-    Create ``BaseAddress`` property.
-
-    Base address for execution.
-
-    Can be overridden with configuration attribute
-    ``vs_BaseAddress`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "BaseAddress", configuration, fallback)
-
-########################################
-
-
-def RandomizedBaseAddress(configuration, fallback=None):
-    """
-    Create ``RandomizedBaseAddress`` property.
-
-    Enable base address randomization
-
-    Compiler switches /DYNAMICBASE:NO, /DYNAMICBASE
-
-    Can be overridden with configuration attribute
-    ``vs_RandomizedBaseAddress`` for the linker.
-
-    * "Default"
-    * "/DYNAMICBASE:NO" / "Disable"
-    * "/DYNAMICBASE" / "Enable"
-    * 0 through 2
-
-    Note:
-        Not available on Visual Studio 2003 or 2005
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_RandomizedBaseAddress")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "RandomizedBaseAddress",
-        fallback,
-        ("Default",
-         ("/DYNAMICBASE:NO", "Disable"),
-         ("/DYNAMICBASE", "Enable")))
-
-########################################
-
-
-def FixedBaseAddress(configuration, fallback=None):
-    """
-    Create ``FixedBaseAddress`` property.
-
-    Enable fixed address code generation
-
-    Compiler switches /FIXED:NO, /FIXED
-
-    Can be overridden with configuration attribute
-    ``vs_FixedBaseAddress`` for the linker.
-
-    * "Default"
-    * "/FIXED:NO" / "Relocatable"
-    * "/FIXED" / "Fixed"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_FixedBaseAddress")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "FixedBaseAddress",
-        fallback,
-        ("Default",
-         ("/FIXED:NO", "Relocatable"),
-         ("/FIXED", "Fixed")))
-
-########################################
-
-
-def DataExecutionPrevention(configuration, fallback=None):
-    """
-    Create ``DataExecutionPrevention`` property.
-
-    Enable Data execution protection
-
-    Compiler switches /NXCOMPAT:NO, /NXCOMPAT
-
-    Can be overridden with configuration attribute
-    ``vs_DataExecutionPrevention`` for the linker.
-
-    * "Default"
-    * "/NXCOMPAT:NO" / "Disable"
-    * "/NXCOMPAT" / "Enable"
-    * 0 through 2
-
-    Note:
-        Not available on Visual Studio 2003 or 2005
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        None or validators.VSEnumProperty object.
-    """
-
-    if configuration.ide is not IDETypes.vs2008:
-        return None
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_DataExecutionPrevention")
-    if value is not None:
-        fallback = value
-
-    return VSEnumProperty(
-        "DataExecutionPrevention",
-        fallback,
-        ("Default",
-         ("/NXCOMPAT:NO", "Disable"),
-         ("/NXCOMPAT", "Enable")))
-
-
-########################################
-
-def TurnOffAssemblyGeneration(configuration, fallback=None):
-    """
-    Create ``TurnOffAssemblyGeneration`` property.
-
-    Specifies that no assembly will be generated even though common language
-    runtime information is present in the object files.
-
-    Compiler switch /NOASSEMBLY
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "TurnOffAssemblyGeneration", configuration, fallback)
-
-########################################
-
-
-def SupportUnloadOfDelayLoadedDLL(configuration, fallback=None):
-    """
-    Create ``SupportUnloadOfDelayLoadedDLL`` property.
-
-    Specifies allowing explicit unloading of the delayed load DLLs.
-
-    Compiler switch /DELAY:UNLOAD
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSBooleanProperty object.
-    """
-
-    return VSBooleanProperty.vs_validate(
-        "SupportUnloadOfDelayLoadedDLL", configuration, fallback)
-
-########################################
-
-
-def ImportLibrary(configuration, fallback=None):
-    """
-    Create ``ImportLibrary`` property.
-
-    Name of the import library to generate.
-
-    Can be overridden with configuration attribute
-    ``vs_ImportLibrary`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "ImportLibrary", configuration, fallback)
-
-########################################
-
-
-def MergeSections(configuration, fallback=None):
-    """
-    Create ``MergeSections`` property.
-
-    Sections to merge on link.
-
-    Can be overridden with configuration attribute
-    ``vs_MergeSections`` for the linker.
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       validators.VSStringProperty object.
-    """
-
-    return VSStringProperty.vs_validate(
-        "MergeSections", configuration, fallback)
-
-########################################
-
-
-def TargetMachine(configuration, fallback=None):
-    """
-    Create ``TargetMachine`` property.
-
-    Target machine to build data for
-
-    Compiler switches /MACHINE:X86, /MACHINE:X64
-
-    Can be overridden with configuration attribute
-    ``vs_TargetMachine`` for the linker.
-
-    * "Default"
-    * "/MACHINE:X86" / "Disable"
-    * "/NXCOMPAT" / "Enable"
-    * 0 through 2
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-        validators.VSEnumProperty object.
-    """
-
-    # Was there an override?
-    value = configuration.get_chained_value("vs_TargetMachine")
-    if value is not None:
-        fallback = value
-
-    enum_list = [
-        ("Default", "Not Set"),
-        ("/MACHINE:X86", "X86")
-    ]
-
-    # Visual Studio 2005 and 2008 support other CPUs
-    if configuration.ide is not IDETypes.vs2003:
-        enum_list.extend([
-            ("/MACHINE:AM33", "AM33"),
-            ("/MACHINE:ARM", "ARM"),
-            ("/MACHINE:EBC", "EBC"),
-            ("/MACHINE:IA64", "IA64"),
-            ("/MACHINE:M32R", "M32R"),
-            ("/MACHINE:MIPS", "MIPS"),
-            ("/MACHINE:MIPS16", "MIPS16"),
-            ("/MACHINE:MIPSFPU", "MIPSFPU"),
-            ("/MACHINE:MIPSFPU16", "MIPSFPU16"),
-            ("/MACHINE:MIPSR41XX", "MIPSR41XX"),
-            ("/MACHINE:SH3", "SH3"),
-            ("/MACHINE:SH3DSP", "SH3DSP"),
-            ("/MACHINE:SH4", "SH4"),
-            ("/MACHINE:SH5", "SH5"),
-            ("/MACHINE:THUMB", "THUMB"),
-            ("/MACHINE:X64", "X64")
-        ])
-
-    return VSEnumProperty(
-        "TargetMachine",
-        fallback,
-        enum_list)
-
-########################################
-
-
-def KeyFile(configuration, fallback=None):
-    """
-    Create ``KeyFile`` property.
-
-    File with key for signing.
-
-    Can be overridden with configuration attribute
-    ``vs_KeyFile`` for the linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSStringProperty.vs_validate(
-        "KeyFile", configuration, fallback)
-
-########################################
-
-
-def KeyContainer(configuration, fallback=None):
-    """
-    Create ``KeyContainer`` property.
-
-    Name of the container of the key.
-
-    Can be overridden with configuration attribute
-    ``vs_KeyContainer`` for the linker.
-
-    Note:
-        Not available on Visual Studio 2003
-
-    Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
-
-    Returns:
-       None or validators.VSStringProperty object.
-    """
-
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
-    return VSStringProperty.vs_validate(
-        "KeyContainer", configuration, fallback)
+        fallback,
+        ("No",
+        ("/EHsc", "Yes"),
+        ("/EHa", "Yes with SEH", "Yes with SEH Exceptions", "SEH")))
 
 ########################################
 
 
-def DelaySign(configuration, fallback=None):
+def RuntimeLibrary(configuration, fallback=None):
     """
-    Create ``DelaySign`` property.
+    Create ``RuntimeLibrary`` property.
+
+    Select runtime standard library to link with this code module.
 
-    Indicates whether the output assembly should be delay signed.
+    Compiler switches /MT, /MTd, /MD, /MDd, /ML, /MLd
 
-    Compiler switch /DELAYSIGN
+    Can be overridden with configuration attribute
+    ``vs_RuntimeLibrary`` for the C compiler.
 
-    Note:
-        Only available on Visual Studio 2005 or higher
+    * "/MT" / "Multi-Threaded"
+    * "/MTd" / "Multi-Threaded Debug"
+    * "/MD" / "Multi-Threaded DLL"
+    * "/MDd" / "Multi-Threaded DLL Debug"
+    * "/ML" / "Single-Threaded"
+    * "/MLd" / "Single-Threaded Debug"
+    * 0 through 5
+
+    Note: The Single Threaded libraries are only available on Visual
+        Studio 2003. If 2005 or 2008 is generated, the Multi-Threaded
+        version is substituted.
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSBooleanProperty object.
+        validators.VSEnumProperty object.
     """
 
-    if configuration.ide is IDETypes.vs2003:
-        return None
+    # Was there an override?
+    fallback = resolve_vs_value(configuration, "RuntimeLibrary", fallback)
+
+    enum_list = [
+        ("/MT", "Multi-Threaded"),
+        ("/MTd", "Multi-Threaded Debug"),
+        ("/MD", "Multi-Threaded DLL"),
+        ("/MDd", "Multi-Threaded DLL Debug")]
 
-    return VSBooleanProperty.vs_validate(
-        "DelaySign", configuration, fallback)
+    # Visual Studio 2003 support single threaded libraries
+    if configuration.ide is IDETypes.vs2003:
+        enum_list.extend([
+            ("/ML", "Single-Threaded"),
+            ("/MLd", "Single-Threaded Debug")])
+    else:
+        # Perform substitution from single threaded
+        # to multi-threaded
+        sub_dict = {
+            "/ML": "/MT",
+            "Single-Threaded": "/MT",
+            4: 2,
+            "/MLd": "/MTd",
+            "Single-Threaded Debug": "/MTd",
+            5: 3
+        }
+        fallback = sub_dict.get(fallback, fallback)
 
+    return VSEnumProperty(
+        "RuntimeLibrary",
+        fallback,
+        enum_list)
 
 ########################################
 
 
-def AllowIsolation(configuration, fallback=None):
+def UsePrecompiledHeader(configuration, fallback=None):
     """
-    Create ``AllowIsolation`` property.
+    Create ``UsePrecompiledHeader`` property.
+
+    Enable use of a precompiled header.
+
+    Compiler switches /Yc, /Yu, /YX
 
-    Specifies manifest file lookup behavior for side-by-side assemblies.
+    Can be overridden with configuration attribute
+    ``vs_UsePrecompiledHeader`` for the C compiler.
 
-    Compiler switch /ALLOWISOLATION:NO
+    * "No" / "Not using"
+    * "/Yc" / "Create"
+    * "/YX" / "Automatic" (Only 2003)
+    * "/Yu" / "Use" (2 on 2005/2008, 3 on 2003)
+    * 0 through 3
 
     Note:
-        Only available on Visual Studio 2005 or higher
+        /YX is only available on Visual Studio 2003, on 2005/2008
+        it is swapped with /Yu / "Use"
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSBooleanProperty object.
+        validators.VSEnumProperty object.
     """
 
+    # Was there an override?
+    fallback = resolve_vs_value(
+        configuration, "UsePrecompiledHeader", fallback)
+
+    # Create the list for 2005/2008
+    enum_list = [
+        ("No", "Not using"),
+        ("/Yc", "Create"),
+        ("/Yu", "Use")]
+
+    # Visual Studio 2003 supports automatic generation
     if configuration.ide is IDETypes.vs2003:
-        return None
+        # Insert before "/Yu"
+        enum_list.insert(-1, ("/YX", "Automatic"))
+    else:
+        # Remap /YX to /Yu
+        if fallback in ("/YX", "Automatic", 3):
+            fallback = 2
 
-    return VSBooleanProperty.vs_validate(
-        "AllowIsolation", configuration, fallback)
+    return VSEnumProperty(
+        "UsePrecompiledHeader",
+        fallback,
+        enum_list)
 
+########################################
+
+# Entries usually found in VCCustomBuildTool
 
 ########################################
 
 
-def Profile(configuration, fallback=None):
+def AdditionalDependencies(configuration, fallback=None, prefix=None):
     """
-    Create ``Profile`` property.
+    Create ``AdditionalDependencies`` property.
 
-    Produce an output file that can be used with the Enterprise Developer
-    performance profiler.
+    List of files this build object depends on. If custom build, it's a list
+    of input files for the build script. If it's a linker, it's a list of
+    library files to link into the final output.
 
-    Compiler switch /PROFILE
+    Can be overridden with configuration attributes:
 
-    Note:
-        Only available on Visual Studio 2005 or higher
+    * ``vs_AdditionalDependencies`` for Linkers
+    * ``vs_CustomAdditionalDependencies`` for CustomBuild
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
+        prefix: Prefix string for override
 
     Returns:
-        None or validators.VSBooleanProperty object.
+       validators.VSStringListProperty object.
     """
 
-    if configuration.ide is IDETypes.vs2003:
-        return None
+    # Insert the optional prefix
+    new_key = "vs_"
+
+    # Assume space for libraries
+    separator = " "
+    if prefix:
+        new_key = new_key + prefix
+        # Custom build separates with ';'
+        separator = ";"
+    new_key = new_key + "AdditionalDependencies"
+
+    # Was there an override?
+    value = configuration.get_chained_list(new_key)
+    if value:
+        fallback = value
+
+    return VSStringListProperty(
+        "AdditionalDependencies",
+        fallback,
+        separator=separator)
+
+########################################
 
-    return VSBooleanProperty.vs_validate(
-        "Profile", configuration, fallback)
+# Entries usually found in VCLinkerTool
 
 ########################################
 
 
-def CLRThreadAttribute(configuration, fallback=None):
+def SubSystem(configuration, fallback=None):
     """
-    Create ``CLRThreadAttribute`` property.
+    Create ``SubSystem`` property.
 
-    CLR Thread attribute
+    Subsystem to link to.
 
-    Compiler switches /CLRTHREADATTRIBUTE:MTA, /CLRTHREADATTRIBUTE:STA
+    Compiler switches /SUBSYSTEM:CONSOLE, /SUBSYSTEM:WINDOWS
 
     Can be overridden with configuration attribute
-    ``vs_CLRThreadAttribute`` for the linker.
-
-    * "Default"
-    * "/CLRTHREADATTRIBUTE:MTA" / "MTA"
-    * "/CLRTHREADATTRIBUTE:STA" / "STA"
-    * 0 through 2
+    ``vs_AssemblyDebug`` for the linker.
 
-    Note:
-        Not available on Visual Studio 2003
+    * "No" / "None"
+    * "/SUBSYSTEM:CONSOLE" / "Console"
+    * "/SUBSYSTEM:WINDOWS" / "Windows"
+    * "/SUBSYSTEM:NATIVE" / "Native" 2005-2008
+    * "/SUBSYSTEM:EFI_APPLICATION" / "EFI Application" 2005-2008
+    * "/SUBSYSTEM:EFI_BOOT_SERVICE_DRIVER" / "EFI Boot Service Driver" 2005-2008
+    * "/SUBSYSTEM:EFI_ROM" / "EFI ROM" 2005-2008
+    * "/SUBSYSTEM:EFI_RUNTIME_DRIVER" / "EFI Runtime" 2005-2008
+    * "/SUBSYSTEM:POSIX" / "Posix" 2005
+    * "/SUBSYSTEM:WINDOWSCE" / "WindowsCE" 2005-2008
+    * 0 through 2 2003, 10 - 2005, 9 - 2008
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSEnumProperty object.
+        validators.VSEnumProperty object.
     """
 
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
     # Was there an override?
-    value = configuration.get_chained_value("vs_CLRThreadAttribute")
-    if value is not None:
-        fallback = value
+    fallback = resolve_vs_value(configuration, "SubSystem", fallback)
 
-    return VSEnumProperty(
-        "CLRThreadAttribute",
-        fallback,
-        ("Default",
-         ("/CLRTHREADATTRIBUTE:MTA", "MTA"),
-         ("/CLRTHREADATTRIBUTE:STA", "STA")))
+    enum_list = [
+        ("No", "None"),
+        ("/SUBSYSTEM:CONSOLE", "Console"),
+        ("/SUBSYSTEM:WINDOWS", "Windows")
+    ]
+
+    if configuration.ide is not IDETypes.vs2003:
+        enum_list.extend([
+            ("/SUBSYSTEM:NATIVE", "Native"),
+            ("/SUBSYSTEM:EFI_APPLICATION", "EFI Application"),
+            ("/SUBSYSTEM:EFI_BOOT_SERVICE_DRIVER",
+                "EFI Boot Service Driver"),
+            ("/SUBSYSTEM:EFI_ROM", "EFI ROM"),
+            ("/SUBSYSTEM:EFI_RUNTIME_DRIVER", "EFI Runtime"),
+            ("/SUBSYSTEM:WINDOWSCE", "WindowsCE")
+        ])
+
+        # Only Visual Studio 2005 supported Posix
+        if configuration.ide is IDETypes.vs2005:
+            enum_list.insert(-1, ("/SUBSYSTEM:POSIX", "Posix"))
+
+    return VSEnumProperty("SubSystem", fallback, enum_list)
 
 ########################################
 
 
-def CLRImageType(configuration, fallback=None):
+def TargetMachine(configuration, fallback=None):
     """
-    Create ``CLRImageType`` property.
+    Create ``TargetMachine`` property.
 
-    CLR data image type
+    Target machine to build data for
 
-    Compiler switches /CLRIMAGETYPE:IJW, /CLRIMAGETYPE:PURE
+    Compiler switches /MACHINE:X86, /MACHINE:X64
 
     Can be overridden with configuration attribute
-    ``vs_CLRImageType`` for the linker.
+    ``vs_TargetMachine`` for the linker.
 
     * "Default"
-    * "/CLRIMAGETYPE:IJW" / "IJW"
-    * "/CLRIMAGETYPE:PURE" / "RelPureocatable"
-    * "/CLRIMAGETYPE:SAFE" / "Safe"
-    * 0 through 3
-
-    Note:
-        Not available on Visual Studio 2003
+    * "/MACHINE:X86" / "Disable"
+    * "/NXCOMPAT" / "Enable"
+    * 0 through 2
 
     Args:
         configuration: Project configuration to scan for overrides.
         fallback: Default value to use
 
     Returns:
-        None or validators.VSEnumProperty object.
+        validators.VSEnumProperty object.
     """
 
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
-
     # Was there an override?
-    value = configuration.get_chained_value("vs_CLRImageType")
-    if value is not None:
-        fallback = value
+    fallback = resolve_vs_value(configuration, "TargetMachine", fallback)
+
+    enum_list = [
+        ("Default", "Not Set"),
+        ("/MACHINE:X86", "X86")
+    ]
+
+    # Visual Studio 2005 and 2008 support other CPUs
+    if configuration.ide is not IDETypes.vs2003:
+        enum_list.extend([
+            ("/MACHINE:AM33", "AM33"),
+            ("/MACHINE:ARM", "ARM"),
+            ("/MACHINE:EBC", "EBC"),
+            ("/MACHINE:IA64", "IA64"),
+            ("/MACHINE:M32R", "M32R"),
+            ("/MACHINE:MIPS", "MIPS"),
+            ("/MACHINE:MIPS16", "MIPS16"),
+            ("/MACHINE:MIPSFPU", "MIPSFPU"),
+            ("/MACHINE:MIPSFPU16", "MIPSFPU16"),
+            ("/MACHINE:MIPSR41XX", "MIPSR41XX"),
+            ("/MACHINE:SH3", "SH3"),
+            ("/MACHINE:SH3DSP", "SH3DSP"),
+            ("/MACHINE:SH4", "SH4"),
+            ("/MACHINE:SH5", "SH5"),
+            ("/MACHINE:THUMB", "THUMB"),
+            ("/MACHINE:X64", "X64")
+        ])
 
     return VSEnumProperty(
-        "CLRImageType",
+        "TargetMachine",
         fallback,
-        ("Default",
-         ("/CLRIMAGETYPE:IJW", "IJW"),
-         ("/CLRIMAGETYPE:PURE", "RelPureocatable"),
-         ("/CLRIMAGETYPE:SAFE", "Safe")))
-
+        enum_list)
 
-def CLRUnmanagedCodeCheck(configuration, fallback=None):
-    """
-    Create ``CLRUnmanagedCodeCheck`` property.
+########################################
 
-    Specifies whether the linker will apply
-    SuppressUnmanagedCodeSecurityAttribute to linker-generated PInvoke calls.
 
-    Compiler switch /CLRUNMANAGEDCODECHECK
+def AdditionalLibraryDirectories(configuration, fallback=None):
+    """
+    Create ``AdditionalLibraryDirectories`` property.
 
-    Note:
-        Only available on Visual Studio 2005 or higher
+    Folders to search for libraries to link with.
 
     Args:
         configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+        fallback: Default value to use, None for ``library_folders_list``
 
     Returns:
-        None or validators.VSBooleanProperty object.
+       validators.VSStringListProperty object.
     """
 
-    # 2005/2008 only
-    if configuration.ide is IDETypes.vs2003:
-        return None
+    if fallback is None:
+        fallback = configuration.get_unique_chained_list(
+            "library_folders_list")
 
-    return VSBooleanProperty.vs_validate(
-        "CLRUnmanagedCodeCheck", configuration, fallback)
+    return VSStringListProperty(
+        "AdditionalLibraryDirectories",
+        fallback,
+        slashes="\\")
 
 
 ########################################
 
 
-def ExportNamedFunctions(configuration, fallback=None):
+def _linker_libraries(configuration):
     """
-    Create ``ExportNamedFunctions`` property.
+    Return the list of libraries for the linker.
 
-    Export these functions
-
-    Can be overridden with configuration attribute
-    ``vs_ExportNamedFunctions`` for the linker.
+    Check if the MFC library is already present. This is a hack since if this
+    library is not first, it will cause link errors.
 
     Args:
-        configuration: Project configuration to scan for overrides.
-        fallback: Default value to use
+        configuration: Project configuration to scan for libraries.
 
     Returns:
-       validators.VSStringListProperty object.
+        List of library names.
     """
 
-    # Was there an override?
-    value = configuration.get_chained_list(
-        "vs_ExportNamedFunctions")
-    if value:
-        fallback = value
-
-    return VSStringListProperty(
-        "ExportNamedFunctions",
-        fallback)
+    default = configuration.get_unique_chained_list("libraries_list")
+    if configuration.use_mfc:
+        for item in default:
+            temp = item.lower()
+            if temp in ("nafxcw.lib", "nafxcwd.lib"):
+                break
+        else:
+            # Insert the library first
+            item = "nafxcwd.lib" if configuration.debug else "nafxcw.lib"
+            default.insert(0, item)
+    return default
 
 
 ########################################
@@ -5979,8 +2429,6 @@ class VS2003XML():
             line_list with all lines appended to it.
         """
 
-        # pylint: disable=too-many-branches
-
         # Create the default
         if line_list is None:
             line_list = []
@@ -5988,82 +2436,104 @@ class VS2003XML():
         if ide is None:
             ide = IDETypes.vs2008
 
-        # Determine the indentation
-        # VS2003 uses tabs
-        tabs = "\t" * indent
-
-        # Special case, if no attributes, don't allow <foo/> XML
-        # This is to duplicate the output of Visual Studio 2005-2008
-        line_list.append("{0}<{1}".format(tabs, escape_xml_cdata(self.name)))
-
-        attributes = []
-        for item in self.attributes:
-            value = item.get_value()
-            if value is not None:
-                attributes.append((item.name, value))
+        self._generate(line_list.append, indent, ide is IDETypes.vs2003)
+        return line_list
 
-        elements = self.elements
-        if attributes:
+    ########################################
 
-            # Output tag with attributes and support "/>" closing
-            for attribute in attributes:
-                value = attribute[1]
+    def _generate(self, append, indent, is_vs2003):
+        """
+        Stream the text lines for this XML element.
+        @details
+        Every line is passed to ``append`` once it's complete, lines already
+        output are never modified, so the element tree is serialized in a
+        single pass.
 
-                # VS2003 has upper case booleans
-                if ide is IDETypes.vs2003:
-                    if value in ("true", "false"):
-                        value = value.upper()
+        Args:
+            append: Callable that receives each text line
+            indent: number of tabs to insert (For recursion)
+            is_vs2003: True if using the Visual Studio 2003 format
+        """
 
-                # If the string has CR, VS2003 doesn't xml encode it,
-                # so it's in the string literally
-                # VS2005 and VS2008 use &#x0D;&#x0A;
+        # pylint: disable=too-many-branches
 
-                # Encode special characters
-                value = escape_xml_attribute(value)
+        # Determine the indentation
+        # VS2003 uses tabs
+        tabs = "\t" * indent
+        name = escape_xml_tag(self.name)
+        elements = self.elements
 
-                # If there's a CR, it's &#10;, so convert it
-                cr_fixup = "\n" if ide is IDETypes.vs2003 else "&#x0D;&#x0A;"
-                value = value.replace("&#10;", cr_fixup)
+        # Create the lines for the attributes, the last line is held back
+        # since VS2003 closes the tag on the same line
+        last_line = "<".join((tabs, name))
+        has_attributes = False
+        for item in self.attributes:
+            value = item.get_value()
+            if value is None:
+                continue
 
-                # Create the line (Might have line feeds)
-                item = "{0}\t{1}=\"{2}\"".format(
-                    tabs,
-                    escape_xml_cdata(attribute[0]),
-                    value)
+            # VS2003 has upper case booleans
+            if is_vs2003:
+                if value in ("true", "false"):
+                    value = value.upper()
+
+            # Encode special characters
+            value = escape_xml_attribute(value)
+
+            # If the string has CR, VS2003 doesn't xml encode it,
+            # so it's in the string literally
+            # VS2005 and VS2008 use &#x0D;&#x0A;
+            if "&#10;" in value:
+                value = value.replace(
+                    "&#10;", "\n" if is_vs2003 else "&#x0D;&#x0A;")
+
+            append(last_line)
+            has_attributes = True
+            last_line = "".join(
+                (tabs, "\t", escape_xml_tag(item.name), "=\"", value, "\""))
+
+            # Convert to line(s)
+            # This only happens on VS2003, the others always have one line
+            if is_vs2003 and "\n" in last_line:
+                lines = last_line.split("\n")
+                last_line = lines.pop()
+                for line in lines:
+                    append(line)
 
-                # Convert to line(s) and append
-                # This only happens on VS2003, the others always have one line
-                line_list.extend(item.split("\n"))
+        # Special case, if no attributes, don't allow <foo/> XML
+        # This is to duplicate the output of Visual Studio 2005-2008
+        if has_attributes:
 
             # Check if /> closing is disabled
-            force_pair = self.force_pair
-            if not elements and not force_pair:
+            if not elements and not self.force_pair:
                 # 2003 closes on the current line, which makes the xml
                 # compact, where 2005 and 2008 are on the next line
-                if ide is IDETypes.vs2003:
-                    line_list[-1] = line_list[-1] + "/>"
+                if is_vs2003:
+                    append(last_line + "/>")
                 else:
-                    line_list.append(tabs + "/>")
-                return line_list
+                    append(last_line)
+                    append(tabs + "/>")
+                return
 
             # Close the open tag on the same line with 2003,
             # next line on 2005/2008
-            if ide is IDETypes.vs2003:
-                line_list[-1] = line_list[-1] + ">"
+            if is_vs2003:
+                append(last_line + ">")
             else:
-                line_list.append(tabs + "\t>")
+                append(last_line)
+                append(tabs + "\t>")
         else:
 
-            # No elements? Close on the same line
-            line_list[-1] = line_list[-1] + ">"
+            # No attributes? Close on the same line
+            append(last_line + ">")
 
         # Output the embedded elements
+        indent += 1
         for element in elements:
-            element.generate(line_list, indent=indent + 1, ide=ide)
+            element._generate(append, indent, is_vs2003)
 
         # Close the current element
-        line_list.append(tabs + "</" + escape_xml_cdata(self.name) + ">")
-        return line_list
+        append("".join((tabs, "</", name, ">")))
 
     def __repr__(self):
         """
@@ -6095,15 +2565,26 @@ class VS2003Tool(VS2003XML):
 
     In Visual Studio project files from version 2003 to 2008, Tool
     XML records were used for settings for each and every compiler tool
+
+    The settings of a tool are declared in the class variable
+    ``attribute_table``, which is a tuple of (factory, fallback) rows in the
+    order Visual Studio writes them. The factory is either the name of an
+    entry in ``_VS_PROPERTIES`` or a callable. It's called with the
+    configuration, and the fallback if it's not None. If the fallback is
+    callable, it's called with the configuration to create the value.
     """
 
-    def __init__(self, name, force_pair=False):
+    # Rows of (factory, fallback) for the attributes of this tool
+    attribute_table = ()
+
+    def __init__(self, name, force_pair=False, configuration=None):
         """
         Init a tool record with the tool name.
 
         Args:
             name: Name of the tool.
             force_pair: If True, disable the use of /> XML suffix usage.
+            configuration: Configuration for the ``attribute_table``.
         """
 
         VS2003XML.__init__(
@@ -6111,6 +2592,33 @@ class VS2003Tool(VS2003XML):
 
         self.add_attribute(Name(name))
 
+        if configuration is not None:
+            self.add_attribute_table(configuration, self.attribute_table)
+
+    ########################################
+
+    def add_attribute_table(self, configuration, table):
+        """
+        Add the attributes from a table of (factory, fallback) rows.
+
+        Args:
+            configuration: Configuration record to extract defaults.
+            table: Iterable of (factory, fallback) tuples.
+        """
+
+        for factory, fallback in table:
+            if callable(fallback):
+                fallback = fallback(configuration)
+
+            # Strings are names of entries in _VS_PROPERTIES
+            if is_string(factory):
+                self.add_attribute(
+                    vs_property(factory, configuration, fallback))
+            elif fallback is None:
+                self.add_attribute(factory(configuration))
+            else:
+                self.add_attribute(factory(configuration, fallback))
+
 ########################################
 
 
@@ -6218,251 +2726,235 @@ class VCCLCompilerTool(VS2003Tool):
         configuration: Parent configuration
     """
 
-    def __init__(self, configuration):
-        """
-        Init defaults
-
-        Args:
-            configuration: Configuration record to extract defaults.
-        """
-
-        # pylint: disable=too-many-statements
-
-        self.configuration = configuration
-
-        # Set the tag
-        VS2003Tool.__init__(self, name="VCCLCompilerTool")
-
-        # Values needed for defaults
-        optimization = configuration.optimization
-        debug = configuration.debug
-        project_type = configuration.project_type
-
-        # Attributes are added in the same order they are written
-        # in Visual Studio
-
+    # Attributes are in the same order they are written in Visual Studio
+    attribute_table = (
         # Unicode response files (Only on 2005/2008)
-        self.add_attribute(UseUnicodeResponseFiles(configuration))
+        ("UseUnicodeResponseFiles", None),
 
         # List of custom compiler options as a single string
-        self.add_attribute(AdditionalOptions(configuration))
+        ("AdditionalOptions", None),
 
         # Optimizations
-        item = "Full Optimization" if optimization else "Disabled"
-        self.add_attribute(Optimization(configuration, item))
+        ("Optimization", lambda configuration: "Full Optimization"
+         if configuration.optimization else "Disabled"),
 
         # Global optimizations (2003 only)
-        self.add_attribute(
-            GlobalOptimizations(configuration, optimization))
+        ("GlobalOptimizations",
+         lambda configuration: configuration.optimization),
 
         # Inline functions
-        item = "Any Suitable" if optimization else None
-        self.add_attribute(InlineFunctionExpansion(configuration, item))
+        ("InlineFunctionExpansion", lambda configuration: "Any Suitable"
+         if configuration.optimization else None),
 
         # Enable intrinsics
-        self.add_attribute(
-            EnableIntrinsicFunctions(configuration, optimization))
+        ("EnableIntrinsicFunctions",
+         lambda configuration: configuration.optimization),
 
         # True if floating point consistency is important (2003 only)
-        self.add_attribute(ImproveFloatingPointConsistency(configuration))
+        ("ImproveFloatingPointConsistency", None),
 
         # Size or speed?
-        self.add_attribute(FavorSizeOrSpeed(configuration, "Favor Fast Code"))
+        ("FavorSizeOrSpeed", "Favor Fast Code"),
 
         # Get rid of stack frame pointers for speed
-        self.add_attribute(
-            OmitFramePointers(configuration, optimization))
+        ("OmitFramePointers",
+         lambda configuration: configuration.optimization),
 
         # Enable memory optimizations for fibers
-        self.add_attribute(
-            EnableFiberSafeOptimizations(configuration, optimization))
+        ("EnableFiberSafeOptimizations",
+         lambda configuration: configuration.optimization),
 
         # Build for Pentium, Pro, P4
-        self.add_attribute(
-            OptimizeForProcessor(configuration, "Pentium 4"))
+        ("OptimizeForProcessor", "Pentium 4"),
 
         # Optimize for Windows Applications
         # Default to True because it's the 21st century.
-        self.add_attribute(
-            OptimizeForWindowsApplication(configuration, True))
+        ("OptimizeForWindowsApplication", True),
 
         # Enable cross function optimizations
-        self.add_attribute(
-            WholeProgramOptimization2003(
-                configuration,
-                configuration.link_time_code_generation))
+        (WholeProgramOptimization2003,
+         lambda configuration: configuration.link_time_code_generation),
 
         # Get the header includes
-        item = configuration.get_unique_chained_list(
-            "_source_include_list")
-        item.extend(configuration.get_unique_chained_list(
-            "include_folders_list"))
-        self.add_attribute(
-            AdditionalIncludeDirectories(configuration, item))
+        ("AdditionalIncludeDirectories",
+         lambda configuration: configuration.get_unique_chained_list(
+             "_source_include_list") + configuration.get_unique_chained_list(
+             "include_folders_list")),
 
         # Directory for #using includes
-        self.add_attribute(
-            AdditionalUsingDirectories(configuration))
+        ("AdditionalUsingDirectories", None),
 
         # Get the defines
-        item = configuration.get_chained_list("define_list")
-        self.add_attribute(
-            PreprocessorDefinitions(configuration, item))
+        ("PreprocessorDefinitions",
+         lambda configuration: configuration.get_chained_list("define_list")),
 
         # Ignore standard include path if true
-        self.add_attribute(IgnoreStandardIncludePath(configuration))
+        ("IgnoreStandardIncludePath", None),
 
         # Create a preprocessed file
-        self.add_attribute(GeneratePreprocessedFile(configuration))
+        ("GeneratePreprocessedFile", None),
 
         # Keep comments in a preprocessed file
-        self.add_attribute(KeepComments(configuration))
+        ("KeepComments", None),
 
         # Pool all constant strings
-        self.add_attribute(StringPooling(configuration, True))
+        ("StringPooling", True),
 
         # Enable code analysis for minimal rebuild
-        self.add_attribute(MinimalRebuild(configuration))
+        ("MinimalRebuild", None),
 
         # Set up exceptions
-        self.add_attribute(
-            ExceptionHandling(
-                configuration,
-                configuration.exceptions))
+        (ExceptionHandling, lambda configuration: configuration.exceptions),
 
         # Runtime checks (Only valid if no optimizations)
-        item = None if optimization else "Both"
-        self.add_attribute(BasicRuntimeChecks(configuration, item))
+        ("BasicRuntimeChecks", lambda configuration: None
+         if configuration.optimization else "Both"),
 
         # Test for data size shrinkage (Only valid if no optimizations)
-        self.add_attribute(SmallerTypeCheck(configuration))
+        ("SmallerTypeCheck", None),
 
         # Which run time library to use?
-        item = "Multi-Threaded Debug" if debug else "Multi-Threaded"
-        self.add_attribute(RuntimeLibrary(configuration, item))
+        (RuntimeLibrary, lambda configuration: "Multi-Threaded Debug"
+         if configuration.debug else "Multi-Threaded"),
 
         # Structure alignment
-        self.add_attribute(StructMemberAlignment(configuration, "8 Bytes"))
+        ("StructMemberAlignment", "8 Bytes"),
 
         # Check for buffer overrun
-        self.add_attribute(BufferSecurityCheck(configuration, bool(debug)))
+        ("BufferSecurityCheck",
+         lambda configuration: bool(configuration.debug)),
 
         # Function level linking
-        self.add_attribute(EnableFunctionLevelLinking(configuration, True))
+        ("EnableFunctionLevelLinking", True),
 
         # Enhanced instruction set
-        self.add_attribute(EnableEnhancedInstructionSet(configuration))
+        ("EnableEnhancedInstructionSet", None),
 
         # Floating point precision (2005/2008 only)
-        self.add_attribute(FloatingPointModel(configuration, "Fast"))
+        ("FloatingPointModel", "Fast"),
 
         # Floating point exception support (2005/2008 only)
-        self.add_attribute(FloatingPointExceptions(configuration))
+        ("FloatingPointExceptions", None),
 
         # Enable Microsoft specific extensions
-        self.add_attribute(DisableLanguageExtensions(configuration))
+        ("DisableLanguageExtensions", None),
 
         # "char" is unsigned
-        self.add_attribute(DefaultCharIsUnsigned(configuration))
+        ("DefaultCharIsUnsigned", None),
 
         # Enable wchar_t
-        self.add_attribute(TreatWChar_tAsBuiltInType(configuration, True))
+        ("TreatWChar_tAsBuiltInType", True),
 
         # for (int i) "i" stays in the loop
-        self.add_attribute(ForceConformanceInForLoopScope(configuration))
+        ("ForceConformanceInForLoopScope", None),
 
         # Enable run time type info
-        self.add_attribute(RuntimeTypeInfo(configuration, False))
+        ("RuntimeTypeInfo", False),
 
         # OpenMP support (2005/2008 only)
-        self.add_attribute(OpenMP(configuration))
+        ("OpenMP", None),
 
         # Enable precompiled headers
-        self.add_attribute(UsePrecompiledHeader(configuration))
+        (UsePrecompiledHeader, None),
 
         # Text header file for precompilation
-        self.add_attribute(PrecompiledHeaderThrough(configuration))
+        ("PrecompiledHeaderThrough", None),
 
         # Binary header file for precompilation
-        self.add_attribute(PrecompiledHeaderFile(configuration))
+        ("PrecompiledHeaderFile", None),
 
         # Add extended attributes to .asm output
-        self.add_attribute(ExpandAttributedSource(configuration))
+        ("ExpandAttributedSource", None),
 
         # Format of the assembly output
-        self.add_attribute(AssemblerOutput(configuration))
+        ("AssemblerOutput", None),
 
         # Output location for .asm file
-        self.add_attribute(AssemblerListingLocation(configuration))
+        ("AssemblerListingLocation", None),
 
         # Output location for .obj file
-        self.add_attribute(ObjectFile(configuration))
+        ("ObjectFile", None),
 
         # Output location of shared .pdb file
-        self.add_attribute(ProgramDataBaseFileName(configuration,
-            "\"$(OutDir)$(TargetName).pdb\""))
+        ("ProgramDataBaseFileName", "\"$(OutDir)$(TargetName).pdb\""),
 
         # Generate XML formatted documentation (2005/2008 only)
-        self.add_attribute(GenerateXMLDocumentationFiles(configuration))
+        ("GenerateXMLDocumentationFiles", None),
 
         # Name of the XML formatted documentation file (2005/2008 only)
-        self.add_attribute(XMLDocumentationFileName(configuration))
+        ("XMLDocumentationFileName", None),
 
         # Type of source browsing information
-        self.add_attribute(BrowseInformation(configuration))
+        ("BrowseInformation", None),
 
         # Name of the browsing file
-        self.add_attribute(BrowseInformationFile(configuration))
+        ("BrowseInformationFile", None),
 
         # Warning level
-        self.add_attribute(WarningLevel(configuration, "All"))
+        ("WarningLevel", "All"),
 
         # Warnings are errors
-        self.add_attribute(WarnAsError(configuration))
+        ("WarnAsError", None),
 
         # Don't show startup banner
-        self.add_attribute(SuppressStartupBanner(configuration))
+        ("SuppressStartupBanner", None),
 
         # Warnings for 64 bit code issues
-        self.add_attribute(Detect64BitPortabilityProblems(configuration))
+        ("Detect64BitPortabilityProblems", None),
 
         # Debug information type
-        item = "/C7" if debug or project_type.is_library() else None
-        self.add_attribute(DebugInformationFormat(configuration, item))
+        ("DebugInformationFormat", lambda configuration: "/C7"
+         if configuration.debug or configuration.project_type.is_library()
+         else None),
 
         # Code calling convention
-        item = "__fastcall" if configuration.fastcall else None
-        self.add_attribute(CallingConvention(configuration, item))
+        ("CallingConvention", lambda configuration: "__fastcall"
+         if configuration.fastcall else None),
 
         # C or C++
-        self.add_attribute(CompileAs(configuration))
+        ("CompileAs", None),
 
         # Disable these warnings
-        self.add_attribute(DisableSpecificWarnings(configuration, ["4201"]))
+        ("DisableSpecificWarnings", lambda configuration: ["4201"]),
 
         # List of include files to force inclusion
-        self.add_attribute(ForcedIncludeFiles(configuration))
+        ("ForcedIncludeFiles", None),
 
         # List of using files to force inclusion
-        self.add_attribute(ForcedUsingFiles(configuration))
+        ("ForcedUsingFiles", None),
 
         # Show include file list
-        self.add_attribute(ShowIncludes(configuration))
+        ("ShowIncludes", None),
 
         # List of defines to remove
-        self.add_attribute(UndefinePreprocessorDefinitions(configuration))
+        ("UndefinePreprocessorDefinitions", None),
 
         # Remove all compiler definitions
-        self.add_attribute(UndefineAllPreprocessorDefinitions(configuration))
+        ("UndefineAllPreprocessorDefinitions", None),
 
         # Use full pathnames in error messages (2005/2008 only)
-        self.add_attribute(UseFullPaths(configuration))
+        ("UseFullPaths", None),
 
         # Remove default library names (2005/2008 only)
-        self.add_attribute(OmitDefaultLibName(configuration))
+        ("OmitDefaultLibName", None),
 
         # Error reporting style (2005/2008 only)
-        self.add_attribute(ErrorReporting(configuration))
+        ("ErrorReporting", None)
+    )
+
+    def __init__(self, configuration):
+        """
+        Init defaults
+
+        Args:
+            configuration: Configuration record to extract defaults.
+        """
+
+        self.configuration = configuration
+
+        # Set the tag and the attributes
+        VS2003Tool.__init__(
+            self, name="VCCLCompilerTool", configuration=configuration)
 
 ########################################
 
@@ -6499,6 +2991,20 @@ class VCCustomBuildTool(VS2003Tool):
         configuration: Parent configuration
     """
 
+    attribute_table = (
+        # Describe the build step
+        ("Description", None),
+
+        # Command line to perform the build
+        ("CommandLine", None),
+
+        # List of files this step depends on
+        (partial(AdditionalDependencies, prefix="Custom"), None),
+
+        # List of files created by this build step
+        ("Outputs", None)
+    )
+
     def __init__(self, configuration):
         """
         Init defaults.
@@ -6509,20 +3015,8 @@ class VCCustomBuildTool(VS2003Tool):
 
         self.configuration = configuration
 
-        VS2003Tool.__init__(self, name="VCCustomBuildTool")
-
-        # Describe the build step
-        self.add_attribute(Description(configuration))
-
-        # Command line to perform the build
-        self.add_attribute(CommandLine(configuration))
-
-        # List of files this step depends on
-        self.add_attribute(
-            AdditionalDependencies(configuration, prefix="Custom"))
-
-        # List of files created by this build step
-        self.add_attribute(Outputs(configuration))
+        VS2003Tool.__init__(
+            self, name="VCCustomBuildTool", configuration=configuration)
 
 
 ########################################
@@ -6535,299 +3029,269 @@ class VCLinkerTool(VS2003Tool):
         configuration: Parent configuration
     """
 
-    def __init__(self, configuration):
-        """
-        Init defaults.
-
-        Args:
-            configuration: Configuration record to extract defaults.
-        """
-
-        # Too many branches
-        # Too many statements
-        # pylint: disable=R0912,R0915
-
-        self.configuration = configuration
-
-        VS2003Tool.__init__(self, "VCLinkerTool")
-
-        # Values needed for defaults
-        ide = configuration.ide
-        optimization = configuration.optimization
-        project_type = configuration.project_type
-        link_time_code_generation = configuration.link_time_code_generation
+    # The output file name uses the project name
+    fragment_inputs = ("name",)
 
+    attribute_table = (
         # Register the output on completion
-        self.add_attribute(RegisterOutput(configuration))
+        ("RegisterOutput", None),
 
         # Register per user instead of for everyone
-        self.add_attribute(PerUserRedirection(configuration))
+        ("PerUserRedirection", None),
 
         # Don't allow this library generated be imported by dependent projects
-        self.add_attribute(IgnoreImportLibrary(configuration))
+        ("IgnoreImportLibrary", None),
 
         # Link in libraries from dependent projects
-        self.add_attribute(LinkLibraryDependencies(configuration))
+        ("LinkLibraryDependencies", None),
 
         # Use the librarian for input
-        self.add_attribute(UseLibraryDependencyInputs(configuration))
+        ("UseLibraryDependencyInputs", None),
 
         # Unicode response files (Only on 2005/2008)
-        self.add_attribute(UseUnicodeResponseFiles(configuration, "Linker"))
+        (partial(vs_property, "UseUnicodeResponseFiles",
+                 prefix="Linker"), None),
 
         # Additional commands
-        self.add_attribute(AdditionalOptions(configuration, prefix="Linker"))
+        (partial(vs_property, "AdditionalOptions", prefix="Linker"), None),
 
         # Additional libraries
-        default = configuration.get_unique_chained_list(
-            "libraries_list")
-
-        # Check if the MFC library is already present
-        # This is a hack since if this library is not first, it will cause
-        # link errors
-        if configuration.use_mfc:
-            for item in default:
-                temp = item.lower()
-                if temp in ("nafxcw.lib", "nafxcwd.lib"):
-                    break
-            else:
-                # Insert the library first
-                item = "nafxcwd.lib" if configuration.debug else "nafxcw.lib"
-                default.insert(0, item)
-
-        self.add_attribute(AdditionalDependencies(configuration, default))
+        (AdditionalDependencies, _linker_libraries),
 
         # Show progress in linking
-        self.add_attribute(ShowProgress(configuration))
+        ("ShowProgress", None),
 
         # Output file name
         # Don't use $(TargetExt)
-        item = "\"$(OutDir){}{}.exe\"".format(
-            configuration.project.name,
-            configuration.get_suffix())
-        self.add_attribute(OutputFile(configuration, item))
+        ("OutputFile", lambda configuration: "\"$(OutDir){}{}.exe\"".format(
+            configuration.project.name, configuration.get_suffix())),
 
         # Version number
-        self.add_attribute(Version(configuration))
+        ("Version", None),
 
         # Enable incremental linking
-        self.add_attribute(LinkIncremental(configuration))
+        ("LinkIncremental", None),
 
         # Turn off startup banner
-        self.add_attribute(
-            SuppressStartupBanner(configuration, prefix="Linker"))
+        (partial(vs_property, "SuppressStartupBanner", prefix="Linker"), None),
 
         # Library folders
-        item = configuration.get_unique_chained_list("library_folders_list")
-        self.add_attribute(
-            VSStringListProperty(
-                "AdditionalLibraryDirectories",
-                item,
-                slashes="\\"))
+        (AdditionalLibraryDirectories, None),
 
         # Generate a manifest file (2005/2008 only)
-        self.add_attribute(GenerateManifest(configuration))
+        ("GenerateManifest", None),
 
         # Name of the manifest file (2005/2008 only)
-        self.add_attribute(ManifestFile(configuration))
+        ("ManifestFile", None),
 
         # Manifests this one is dependent on (2005/2008 only)
-        self.add_attribute(
-            AdditionalManifestDependencies(configuration))
+        ("AdditionalManifestDependencies", None),
 
         # Enable User Access Control
-        self.add_attribute(EnableUAC(configuration))
+        ("EnableUAC", None),
 
         # Set the UAC Execution level
-        self.add_attribute(UACExecutionLevel(configuration))
+        ("UACExecutionLevel", None),
 
         # Enable UI bypass for User Access Control
-        self.add_attribute(UACUIAccess(configuration))
+        ("UACUIAccess", None),
 
         # Ignore default libraries
-        self.add_attribute(IgnoreAllDefaultLibraries(configuration))
+        ("IgnoreAllDefaultLibraries", None),
 
         # Ignore these libraries
-        self.add_attribute(IgnoreDefaultLibraryNames(configuration))
+        ("IgnoreDefaultLibraryNames", None),
 
         # Module definition file, if one exists
-        self.add_attribute(ModuleDefinitionFile(configuration))
+        ("ModuleDefinitionFile", None),
 
         # Add these modules to the C# assembly
-        self.add_attribute(AddModuleNamesToAssembly(configuration))
+        ("AddModuleNamesToAssembly", None),
 
         # Embed these resource fildes
-        self.add_attribute(EmbedManagedResourceFile(configuration))
+        ("EmbedManagedResourceFile", None),
 
         # Force these symbols
-        self.add_attribute(ForceSymbolReferences(configuration))
+        ("ForceSymbolReferences", None),
 
         # Load these DLLs only when called.
-        self.add_attribute(DelayLoadDLLs(configuration))
+        ("DelayLoadDLLs", None),
 
         # Link in these assemblies (2005/2008 only)
-        self.add_attribute(AssemblyLinkResource(configuration))
+        ("AssemblyLinkResource", None),
 
         # Contents of a Midl comment file (Actual commands)
-        self.add_attribute(MidlCommandFile(configuration))
+        ("MidlCommandFile", None),
 
         # Ignore embedded .idlsym sections
-        self.add_attribute(IgnoreEmbeddedIDL(configuration))
+        ("IgnoreEmbeddedIDL", None),
 
         # Filename the contains the contents of the merged idl
-        self.add_attribute(MergedIDLBaseFileName(configuration))
+        ("MergedIDLBaseFileName", None),
 
         # Name of the type library
-        self.add_attribute(TypeLibraryFile(configuration))
+        ("TypeLibraryFile", None),
 
         # ID number of the library resource
-        self.add_attribute(TypeLibraryResourceID(configuration))
+        ("TypeLibraryResourceID", None),
 
         # Generate debugging information
-        self.add_attribute(
-            GenerateDebugInformation(configuration, bool(configuration.debug)))
+        ("GenerateDebugInformation",
+         lambda configuration: bool(configuration.debug)),
 
         # Add debugging information in assembly
-        self.add_attribute(AssemblyDebug(configuration))
+        ("AssemblyDebug", None),
 
         # Name of the program database file
-        self.add_attribute(
-            ProgramDatabaseFile(
-                configuration, "\"$(OutDir)$(TargetName).pdb\""))
+        ("ProgramDatabaseFile", "\"$(OutDir)$(TargetName).pdb\""),
 
         # Do not put private symboles in this program database file
-        self.add_attribute(StripPrivateSymbols(configuration))
+        ("StripPrivateSymbols", None),
 
         # Generate the map file
-        self.add_attribute(GenerateMapFile(configuration))
+        ("GenerateMapFile", None),
 
         # Name of the map file
-        self.add_attribute(MapFileName(configuration))
+        ("MapFileName", None),
 
         # Include exported symbols in the map file
-        self.add_attribute(MapExports(configuration))
+        ("MapExports", None),
 
         # Include source code line numbers in the map file
-        self.add_attribute(MapLines(configuration))
+        ("MapLines", None),
 
         # Subsystem to link to
-        item = "Console" if project_type is ProjectTypes.tool else "Windows"
-        self.add_attribute(SubSystem(configuration, item))
+        (SubSystem, lambda configuration: "Console"
+         if configuration.project_type is ProjectTypes.tool else "Windows"),
 
         # Amount of heap to reserve
-        self.add_attribute(HeapReserveSize(configuration))
+        ("HeapReserveSize", None),
 
         # Amount of heap to commit
-        self.add_attribute(HeapCommitSize(configuration))
+        ("HeapCommitSize", None),
 
         # Amount of stack to reserve
-        self.add_attribute(StackReserveSize(configuration))
+        ("StackReserveSize", None),
 
         # Amount of stack to commit
-        self.add_attribute(StackCommitSize(configuration))
+        ("StackCommitSize", None),
 
         # Large address space aware?
-        self.add_attribute(LargeAddressAware(configuration))
+        ("LargeAddressAware", None),
 
         # Terminal server aware?
-        self.add_attribute(TerminalServerAware(configuration))
+        ("TerminalServerAware", None),
 
         # Run the file from swap location on CD
-        self.add_attribute(SwapRunFromCD(configuration))
+        ("SwapRunFromCD", None),
 
         # Run the file from swap location for network
-        self.add_attribute(SwapRunFromNet(configuration))
+        ("SwapRunFromNet", None),
 
         # Device driver?
-        self.add_attribute(Driver(configuration))
+        ("Driver", None),
 
         # Remove unreferenced code
-        self.add_attribute(OptimizeReferences(configuration, "Enable"))
+        ("OptimizeReferences", "Enable"),
 
         # Remove redundant COMDAT symbols
-        item = "Enable" if optimization else None
-        self.add_attribute(EnableCOMDATFolding(configuration, item))
+        ("EnableCOMDATFolding", lambda configuration: "Enable"
+         if configuration.optimization else None),
 
         # Align code on 4K boundaries for Windows 98
-        self.add_attribute(OptimizeForWindows98(configuration))
+        ("OptimizeForWindows98", None),
 
         # Name of file containing the function link order
-        self.add_attribute(FunctionOrder(configuration))
+        ("FunctionOrder", None),
 
         # Link using link time code generation
-        item = "Enable" if link_time_code_generation else None
-        self.add_attribute(LinkTimeCodeGeneration(configuration, item))
+        ("LinkTimeCodeGeneration", lambda configuration: "Enable"
+         if configuration.link_time_code_generation else None),
 
         # Database file for profile based optimizations
-        self.add_attribute(ProfileGuidedDatabase(configuration))
+        ("ProfileGuidedDatabase", None),
 
         # Code entry point symbol
-        self.add_attribute(EntryPointSymbol(configuration))
+        ("EntryPointSymbol", None),
 
         # No entry point (Resource only DLL)
-        self.add_attribute(ResourceOnlyDLL(configuration))
+        ("ResourceOnlyDLL", None),
 
         # Create a checksum in the header of the exe file
-        self.add_attribute(SetChecksum(configuration))
+        ("SetChecksum", None),
 
         # Base address for execution
-        self.add_attribute(BaseAddress(configuration))
+        ("BaseAddress", None),
 
         # Enable base address randomization
-        self.add_attribute(RandomizedBaseAddress(configuration))
+        ("RandomizedBaseAddress", None),
 
         # Enable fixed address code generation
-        if ide is IDETypes.vs2008:
-            self.add_attribute(FixedBaseAddress(configuration))
+        (lambda configuration: vs_property("FixedBaseAddress", configuration)
+         if configuration.ide is IDETypes.vs2008 else None, None),
 
         # Enable Data execution protection
-        self.add_attribute(DataExecutionPrevention(configuration))
+        ("DataExecutionPrevention", None),
 
         # Don't output assembly for C#
-        self.add_attribute(TurnOffAssemblyGeneration(configuration))
+        ("TurnOffAssemblyGeneration", None),
 
         # Disable unloading of delayed load DLLs
-        self.add_attribute(SupportUnloadOfDelayLoadedDLL(configuration))
+        ("SupportUnloadOfDelayLoadedDLL", None),
 
         # Name of the import library to generate
-        self.add_attribute(ImportLibrary(configuration))
+        ("ImportLibrary", None),
 
         # Sections to merge on link
-        self.add_attribute(MergeSections(configuration))
+        ("MergeSections", None),
 
         # Target machine to build data for.
-        self.add_attribute(TargetMachine(configuration))
+        (TargetMachine, None),
 
         # This is a duplication of what is in 2008 for sorting
-        if ide is not IDETypes.vs2008:
-            self.add_attribute(FixedBaseAddress(configuration))
+        (lambda configuration: vs_property("FixedBaseAddress", configuration)
+         if configuration.ide is not IDETypes.vs2008 else None, None),
 
         # File with key for signing
-        self.add_attribute(KeyFile(configuration))
+        ("KeyFile", None),
 
         # Name of the container of the key
-        self.add_attribute(KeyContainer(configuration))
+        ("KeyContainer", None),
 
         # Output should be delay signed
-        self.add_attribute(DelaySign(configuration))
+        ("DelaySign", None),
 
         # Allow assemblies to be isolated in the manifest
-        self.add_attribute(AllowIsolation(configuration))
+        ("AllowIsolation", None),
 
         # Enable profiling
-        self.add_attribute(Profile(configuration))
+        ("Profile", None),
 
         # CLR Thread attribute
-        self.add_attribute(CLRThreadAttribute(configuration))
+        ("CLRThreadAttribute", None),
 
         # CLR data image type
-        self.add_attribute(CLRImageType(configuration))
+        ("CLRImageType", None),
 
         # Error reporting
-        self.add_attribute(ErrorReporting(configuration))
+        ("ErrorReporting", None),
 
         # Check for unmanaged code
-        self.add_attribute(CLRUnmanagedCodeCheck(configuration))
+        ("CLRUnmanagedCodeCheck", None)
+    )
+
+    def __init__(self, configuration):
+        """
+        Init defaults.
+
+        Args:
+            configuration: Configuration record to extract defaults.
+        """
+
+        self.configuration = configuration
+
+        VS2003Tool.__init__(
+            self, "VCLinkerTool", configuration=configuration)
 
 ########################################
 
@@ -6840,64 +3304,62 @@ class VCLibrarianTool(VS2003Tool):
         configuration: Parent configuration
     """
 
-    def __init__(self, configuration):
-        """
-        Init defaults.
-
-        Args:
-            configuration: Configuration record to extract defaults.
-        """
-
-        self.configuration = configuration
-
-        VS2003Tool.__init__(self, "VCLibrarianTool")
+    # The output file name uses the project name
+    fragment_inputs = ("name",)
 
+    attribute_table = (
         # Unicode response files (Only on 2005/2008)
-        self.add_attribute(UseUnicodeResponseFiles(configuration, "Linker"))
+        (partial(vs_property, "UseUnicodeResponseFiles",
+                 prefix="Linker"), None),
 
         # Link in library dependencies
-        self.add_attribute(LinkLibraryDependencies(configuration))
+        ("LinkLibraryDependencies", None),
 
         # Additional command lines
-        self.add_attribute(AdditionalOptions(configuration, prefix="Linker"))
+        (partial(vs_property, "AdditionalOptions", prefix="Linker"), None),
 
         # Libaries to link in
-        self.add_attribute(AdditionalDependencies(configuration))
+        (AdditionalDependencies, None),
 
         # Name of the output file
         # Don't use $(TargetExt)
-        default = "\"$(OutDir){}{}.lib\"".format(
-            configuration.project.name,
-            configuration.get_suffix())
-        self.add_attribute(OutputFile(configuration, default))
+        ("OutputFile", lambda configuration: "\"$(OutDir){}{}.lib\"".format(
+            configuration.project.name, configuration.get_suffix())),
 
         # Library folders
-        default = configuration.get_unique_chained_list("library_folders_list")
-        self.add_attribute(
-            VSStringListProperty(
-                "AdditionalLibraryDirectories",
-                default,
-                slashes="\\"))
+        (AdditionalLibraryDirectories, None),
 
         # Suppress the startup banner
-        self.add_attribute(
-            SuppressStartupBanner(configuration, prefix="Linker"))
+        (partial(vs_property, "SuppressStartupBanner", prefix="Linker"), None),
 
         # Name of the module file name
-        self.add_attribute(ModuleDefinitionFile(configuration))
+        ("ModuleDefinitionFile", None),
 
         # Ignore the default libraries
-        self.add_attribute(IgnoreAllDefaultLibraries(configuration))
+        ("IgnoreAllDefaultLibraries", None),
 
         # Ignore these libraries
-        self.add_attribute(IgnoreDefaultLibraryNames(configuration))
+        ("IgnoreDefaultLibraryNames", None),
 
         # Export these functions
-        self.add_attribute(ExportNamedFunctions(configuration))
+        ("ExportNamedFunctions", None),
 
         # Force linking to these symbols
-        self.add_attribute(ForceSymbolReferences(configuration))
+        ("ForceSymbolReferences", None)
+    )
+
+    def __init__(self, configuration):
+        """
+        Init defaults.
+
+        Args:
+            configuration: Configuration record to extract defaults.
+        """
 
+        self.configuration = configuration
+
+        VS2003Tool.__init__(
+            self, "VCLibrarianTool", configuration=configuration)
 
 ########################################
 
@@ -7104,14 +3566,16 @@ class VCPostBuildEventTool(VS2003Tool):
 
         # Message to print in the console
         self.add_attribute(
-            Description(
+            vs_property(
+                "Description",
                 configuration,
                 vs_description,
                 prefix="PostBuild"))
 
         # Batch file contents
         self.add_attribute(
-            CommandLine(
+            vs_property(
+                "CommandLine",
                 configuration,
                 vs_cmd,
                 prefix="PostBuild"))
@@ -7131,6 +3595,17 @@ class VCPreBuildEventTool(VS2003Tool):
         configuration: Parent configuration
     """
 
+    attribute_table = (
+        # Message to print in the console
+        (partial(vs_property, "Description", prefix="PreBuild"), None),
+
+        # Batch file contents
+        (partial(vs_property, "CommandLine", prefix="PreBuild"), None),
+
+        # Ignore from build
+        (lambda configuration: ExcludedFromBuild(), None)
+    )
+
     def __init__(self, configuration):
         """
         Init defaults.
@@ -7140,16 +3615,9 @@ class VCPreBuildEventTool(VS2003Tool):
         """
 
         self.configuration = configuration
-        VS2003Tool.__init__(self, "VCPreBuildEventTool")
 
-        # Message to print in the console
-        self.add_attribute(Description(configuration, prefix="PreBuild"))
-
-        # Batch file contents
-        self.add_attribute(CommandLine(configuration, prefix="PreBuild"))
-
-        # Ignore from build
-        self.add_attribute(ExcludedFromBuild())
+        VS2003Tool.__init__(
+            self, "VCPreBuildEventTool", configuration=configuration)
 
 
 ########################################
@@ -7163,6 +3631,17 @@ class VCPreLinkEventTool(VS2003Tool):
         configuration: Parent configuration
     """
 
+    attribute_table = (
+        # Message to print in the console
+        (partial(vs_property, "Description", prefix="PreLink"), None),
+
+        # Batch file contents
+        (partial(vs_property, "CommandLine", prefix="PreLink"), None),
+
+        # Ignore from build
+        (lambda configuration: ExcludedFromBuild(), None)
+    )
+
     def __init__(self, configuration):
         """
         Init defaults.
@@ -7173,16 +3652,8 @@ class VCPreLinkEventTool(VS2003Tool):
 
         self.configuration = configuration
 
-        VS2003Tool.__init__(self, "VCPreLinkEventTool")
-
-        # Message to print in the console
-        self.add_attribute(Description(configuration, prefix="PreLink"))
-
-        # Batch file contents
-        self.add_attribute(CommandLine(configuration, prefix="PreLink"))
-
-        # Ignore from build
-        self.add_attribute(ExcludedFromBuild())
+        VS2003Tool.__init__(
+            self, "VCPreLinkEventTool", configuration=configuration)
 
 ########################################
 
@@ -7524,23 +3995,26 @@ class VS2003Configuration(VS2003XML):
         self.add_attribute(ConfigurationType(configuration))
 
         # Enable/disable MFC
-        self.add_attribute(UseOfMFC(configuration, configuration.use_mfc))
+        self.add_attribute(
+            vs_property("UseOfMFC", configuration, configuration.use_mfc))
 
         # Enable/disable ATL
-        self.add_attribute(UseOfATL(configuration, configuration.use_atl))
+        self.add_attribute(
+            vs_property("UseOfATL", configuration, configuration.use_atl))
 
         # Enable/disable ATL linkage at runtime (2003/2005 only)
         self.add_attribute(ATLMinimizesCRunTimeLibraryUsage(configuration))
 
         # Set whether it's ASCII or Unicode compilation
-        self.add_attribute(CharacterSet(configuration))
+        self.add_attribute(vs_property("CharacterSet", configuration))
 
         # Is CLR support enabled?
         self.add_attribute(
             ManagedExtensions(configuration, configuration.clr_support))
 
         # List of file extensions to delete on clean
-        self.add_attribute(DeleteExtensionsOnClean(configuration))
+        self.add_attribute(
+            vs_property("DeleteExtensionsOnClean", configuration))
 
         # Enable link time code generation
         self.add_attribute(
@@ -7549,23 +4023,23 @@ class VS2003Configuration(VS2003XML):
                 configuration.link_time_code_generation))
 
         # Paths for file references (2003 only)
-        self.add_attribute(ReferencesPath(configuration))
+        self.add_attribute(vs_property("ReferencesPath", configuration))
 
         # The data chunks are in different orders on 2003 vs
         # 2005/2008, so break it into two paths
         if ide is IDETypes.vs2003:
-            self.add_element(VCCLCompilerTool(configuration))
+            self.add_element(get_fragment(VCCLCompilerTool, configuration))
             self.add_element(VCCustomBuildTool(configuration))
 
             if project_type.is_library():
-                self.add_element(VCLibrarianTool(configuration))
+                self.add_element(get_fragment(VCLibrarianTool, configuration))
             else:
-                self.add_element(VCLinkerTool(configuration))
+                self.add_element(get_fragment(VCLinkerTool, configuration))
 
             if platform.is_windows():
                 self.add_element(VCMIDLTool(configuration))
 
-            self.add_element(VCPostBuildEventTool(configuration))
+            self.add_element(get_fragment(VCPostBuildEventTool, configuration))
             self.add_element(VCPreBuildEventTool(configuration))
             self.add_element(VCPreLinkEventTool(configuration))
 
@@ -7616,7 +4090,7 @@ class VS2003Configuration(VS2003XML):
                     configuration))
                 self.add_element(VCMIDLTool(configuration))
 
-            self.add_element(VCCLCompilerTool(configuration))
+            self.add_element(get_fragment(VCCLCompilerTool, configuration))
 
             if platform.is_windows():
                 self.add_element(VCManagedResourceCompilerTool(
@@ -7626,9 +4100,9 @@ class VS2003Configuration(VS2003XML):
             self.add_element(VCPreLinkEventTool(configuration))
 
             if project_type.is_library():
-                self.add_element(VCLibrarianTool(configuration))
+                self.add_element(get_fragment(VCLibrarianTool, configuration))
             else:
-                self.add_element(VCLinkerTool(configuration))
+                self.add_element(get_fragment(VCLinkerTool, configuration))
 
             self.add_element(VCALinkTool(configuration))
             self.add_element(VCManifestTool(configuration))
@@ -7641,7 +4115,7 @@ class VS2003Configuration(VS2003XML):
             if ide is IDETypes.vs2005:
                 self.add_element(VCWebDeploymentTool(configuration))
 
-            self.add_element(VCPostBuildEventTool(configuration))
+            self.add_element(get_fragment(VCPostBuildEventTool, configuration))
 
 ########################################
 
@@ -7757,6 +4231,47 @@ class VS2003FileConfiguration(VS2003XML):
 
     ########################################
 
+    @staticmethod
+    def is_needed(configuration, base_name, source_file):
+        """
+        Quick test if a file could have settings for a configuration.
+
+        Most files have no per configuration settings, so this is tested
+        before creating a VS2003FileConfiguration. If False, the record
+        would be empty and is not written.
+
+        Args:
+            configuration: Configuration record to test.
+            base_name: Base filename
+            source_file: SourceFile reference
+        Returns:
+            False if there are no settings, True if there may be.
+        """
+
+        # Shaders and assembly always need their tool records
+        file_type = source_file.type
+        if file_type in (FileTypes.hlsl, FileTypes.glsl,
+                         FileTypes.x86, FileTypes.x64):
+            return True
+
+        # Excluded from the build?
+        for exclude_regex in configuration.exclude_list_regex:
+            if exclude_regex(base_name):
+                return True
+
+        # Only C/C++ files use the rules
+        if file_type in (FileTypes.cpp, FileTypes.c):
+            for rule in (
+                    configuration.custom_rules,
+                    configuration.parent.custom_rules,
+                    configuration.parent.parent.custom_rules):
+                for key in rule:
+                    if key(base_name):
+                        return True
+        return False
+
+    ########################################
+
     def check_for_exclusion(self, base_name):
         """
         Given a filename, check if it's excluded from the build
@@ -7966,6 +4481,10 @@ class VS2003File(VS2003XML):
         # Perform all of the customizations
         # Most cases, there are none
         for configuration in project.configuration_list:
+            if not VS2003FileConfiguration.is_needed(
+                    configuration, base_name, source_file):
+                continue
+
             item = VS2003FileConfiguration(
                 configuration, base_name, source_file)
 
@@ -8201,6 +4720,83 @@ class VS2003vcproj(VS2003XML):
 ########################################
 
 
+def _init_worker(solution):
+    """
+    Set the solution used by _generate_project().
+
+    Args:
+        solution: Solution being generated
+    """
+
+    # pylint: disable=global-statement
+    global _WORKER_SOLUTION
+
+    _WORKER_SOLUTION = solution
+
+########################################
+
+
+def _generate_project(index):
+    """
+    Create the text for a single Visual Studio project.
+
+    This is called from a worker process, so only the text is returned,
+    saving the files is done by generate().
+
+    Args:
+        index: Index into the solution's project_list
+    Returns:
+        Tuple of project lines, filter lines or None for no filter file,
+        and the unity files to save.
+    """
+
+    solution = _WORKER_SOLUTION
+    project = solution.project_list[index]
+
+    project.get_file_list(
+        [FileTypes.h, FileTypes.cpp, FileTypes.c, FileTypes.rc,
+         FileTypes.x86, FileTypes.x64, FileTypes.ppc, FileTypes.arm,
+         FileTypes.arm64, FileTypes.s,
+         FileTypes.hlsl, FileTypes.glsl, FileTypes.x360sl, FileTypes.vitacg,
+         FileTypes.ico, FileTypes.appxmanifest, FileTypes.image])
+
+    # Visual Studio 2010 and higher can compile unity files, the grouped
+    # files are shown but excluded from the build
+    unity_files = []
+    if solution.ide >= IDETypes.vs2010:
+        unity_files = project.add_unity_files(keep_members=True)
+
+    # Handle WiiU extensions based on found files
+    wiiu_props(project)
+
+    # Check if masm.rules needs to be added
+    add_masm_support(project)
+
+    # Create the project file template
+    if solution.ide >= IDETypes.vs2010:
+        exporter = VS2010vcproj(project)
+    else:
+        exporter = VS2003vcproj(project)
+
+    # Convert to a text file
+    project_lines = []
+    exporter.generate(project_lines, ide=solution.ide)
+
+    # Visual Studio 2010 and higher has a 3rd file, filters
+    filter_lines = None
+    if solution.ide >= IDETypes.vs2010:
+
+        # Generate the filter
+        exporter = VS2010vcprojfilter(project)
+
+        # Create the file
+        filter_lines = []
+        exporter.generate(filter_lines)
+    return project_lines, filter_lines, unity_files
+
+########################################
+
+
 def generate(solution):
     """
     Create a solution and project(s) file for Visual Studio.
@@ -8266,73 +4862,55 @@ def generate(solution):
 
     # Get the output flags
     perforce = solution.perforce
-    verbose = solution.verbose
 
     # Create the final filename for the Visual Studio Solution file
-    item = getattr(solution, "vs_output_filename", None)
-    if not item:
-        item = solution.name + solution.ide_code + \
+    solution_item = getattr(solution, "vs_output_filename", None)
+    if not solution_item:
+        solution_item = solution.name + solution.ide_code + \
             solution.platform_code + ".sln"
 
-    # Save out the solution file
-    save_text_file_if_newer(
-        os.path.join(solution.working_directory, item),
-        solution_lines,
-        bom=solution.ide != IDETypes.vs2003,
-        perforce=perforce,
-        verbose=verbose)
-
     # Now that the solution file was generated, create the individual project
     # files using the format appropriate for the selected IDE
 
-    for project in solution.project_list:
-        project.get_file_list(
-            [FileTypes.h, FileTypes.cpp, FileTypes.c, FileTypes.rc,
-             FileTypes.x86, FileTypes.x64, FileTypes.ppc, FileTypes.arm,
-             FileTypes.arm64, FileTypes.s,
-             FileTypes.hlsl, FileTypes.glsl, FileTypes.x360sl, FileTypes.vitacg,
-             FileTypes.ico, FileTypes.appxmanifest, FileTypes.image])
-
-        # Handle WiiU extensions based on found files
-        wiiu_props(project)
-
-        # Check if masm.rules needs to be added
-        add_masm_support(project)
-
-        # Create the project file template
-        if solution.ide >= IDETypes.vs2010:
-            exporter = VS2010vcproj(project)
-        else:
-            exporter = VS2003vcproj(project)
-
-        # Convert to a text file
-        project_lines = []
-
-        # Convert to a text file
-        exporter.generate(project_lines, ide=solution.ide)
+    # Projects with identical configurations share XML fragments
+    solution.vs_fragment_cache = FragmentCache()
+
+    # The projects are independent, so generate them in parallel. The post
+    # processor and the file batch stay in this process.
+    post_process = solution.post_process
+    file_batch = solution.file_batch
+    del solution.post_process
+    del solution.file_batch
+    try:
+        results = parallel_map(
+            _generate_project, range(len(solution.project_list)),
+            initializer=_init_worker, initargs=(solution,))
+    finally:
+        solution.post_process = post_process
+        solution.file_batch = file_batch
+        _init_worker(None)
+
+    # Save the files in project order
+    for project, (project_lines, filter_lines, unity_files) in zip(
+            solution.project_list, results):
+
+        # The files the project compiles come first
+        save_unity_files(solution, unity_files)
 
         # Handle any post processing
         project_lines = solution.post_process(project_lines)
 
         # Save the text
-        save_text_file_if_newer(
+        solution.file_batch.save_text_file_if_newer(
             os.path.join(
                 solution.working_directory,
                 project.vs_output_filename),
             project_lines,
             bom=True,
-            perforce=perforce,
-            verbose=verbose)
+            perforce=perforce)
 
         # Visual Studio 2010 and higher has a 3rd file, filters
-        if solution.ide >= IDETypes.vs2010:
-
-            # Generate the filter
-            exporter = VS2010vcprojfilter(project)
-
-            # Create the file
-            filter_lines = []
-            exporter.generate(filter_lines)
+        if filter_lines is not None:
 
             # Save it out
             item = os.path.join(
@@ -8343,14 +4921,20 @@ def generate(solution):
             if len(filter_lines) >= 4:
 
                 # Save it
-                save_text_file_if_newer(
+                solution.file_batch.save_text_file_if_newer(
                     item,
                     filter_lines,
                     bom=True,
-                    perforce=perforce,
-                    verbose=verbose)
+                    perforce=perforce)
             else:
 
                 # File is not needed, remove it.
                 delete_file(item)
+
+    # Save out the solution file last, after all of its projects
+    solution.file_batch.save_text_file_if_newer(
+        os.path.join(solution.working_directory, solution_item),
+        solution_lines,
+        bom=solution.ide != IDETypes.vs2003,
+        perforce=perforce)
     return 0
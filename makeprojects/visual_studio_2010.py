@@ -10,6 +10,8 @@ Microsoft's Visual Studio IDE
 
 @package makeprojects.visual_studio_2010
 
+@var makeprojects.visual_studio_2010._INDENTS
+Indentation strings for the XML serializer
 """
 
 # pylint: disable=consider-using-f-string
@@ -18,6 +20,7 @@ Microsoft's Visual Studio IDE
 from __future__ import absolute_import, print_function, unicode_literals
 
 import os
+from collections import OrderedDict
 from burger import convert_to_windows_slashes, escape_xml_cdata, \
     escape_xml_attribute, packed_paths, truefalse
 from ide_gen import vs_calcguid
@@ -25,7 +28,10 @@ from ide_gen import vs_calcguid
 from .enums import FileTypes, ProjectTypes, IDETypes, PlatformTypes, \
     source_file_filter
 from .visual_studio_utils import get_toolset_version, \
-    create_deploy_script
+    create_deploy_script, escape_xml_tag, get_fragment
+
+# Indentation strings for the XML serializer
+_INDENTS = tuple("  " * _i for _i in range(16))
 
 ########################################
 
@@ -49,8 +55,8 @@ class VS2010XML():
         ## Name of this XML chunk.
         self.name = name
 
-        ## List of name/data attributes
-        self.attributes = []
+        ## Ordered dict of name/data attributes
+        self.attributes = OrderedDict()
 
         ## List of elements in this element.
         self.elements = []
@@ -81,9 +87,10 @@ class VS2010XML():
 
             # Update the list of valid attributes to include
             # non None entries
+            attributes = self.attributes
             for item in attribute_defaults.items():
                 if item[1] is not None:
-                    self.set_attribute(item[0], item[1])
+                    attributes[item[0]] = item[1]
 
     ########################################
 
@@ -95,7 +102,7 @@ class VS2010XML():
             name: Name of the attribute
             value: Attribute data
         """
-        self.attributes.append([name, value])
+        self.attributes[name] = value
 
     ########################################
 
@@ -120,7 +127,7 @@ class VS2010XML():
         """
 
         if tag_value is not None:
-            self.add_element(VS2010XML(tag_name, contents=tag_value))
+            self.elements.append(VS2010XML(tag_name, contents=tag_value))
 
     ########################################
 
@@ -147,13 +154,9 @@ class VS2010XML():
             name: String of the entry to match
             value: Value to substitute
         """
-        for attribute in self.attributes:
-            if attribute[0] == name:
-                attribute[1] = value
-                break
-        else:
-            # Not found? Add the entry and then exit
-            self.attributes.append([name, value])
+
+        # Existing entries keep their position in the ordered dict
+        self.attributes[name] = value
 
     ########################################
 
@@ -167,11 +170,7 @@ class VS2010XML():
             name: String of the entry to remove
         """
 
-        for item in self.attributes:
-            # Match? Kill it.
-            if item[0] == name:
-                self.attributes.remove(item)
-                break
+        self.attributes.pop(name, None)
 
     ########################################
 
@@ -204,47 +203,69 @@ class VS2010XML():
 
         if line_list is None:
             line_list = []
+        self._generate(line_list.append, indent)
+        return line_list
+
+    ########################################
+
+    def _generate(self, append, indent):
+        """
+        Append the text lines for this XML element.
+
+        Internal serializer that builds each line with a single join
+        and passes it to ``append``.
+
+        Args:
+            append: Function to call with each generated line
+            indent: number of tabs to insert (For recursion)
+        """
 
         # Determine the indentation
-        tabs = "  " * indent
+        tabs = _INDENTS[indent] if indent < len(_INDENTS) else "  " * indent
 
-        # Output the tag
-        line = "{0}<{1}".format(tabs, escape_xml_cdata(self.name))
+        # Output the tag, with attributes
+        name = escape_xml_tag(self.name)
+        parts = [tabs, "<", name]
+        for key, value in self.attributes.items():
+            parts.extend((" ", escape_xml_tag(key), "=\"",
+                          escape_xml_attribute(value), "\""))
 
-        # Output tag with attributes and support "/>" closing
-        for attribute in self.attributes:
-            line = "{0} {1}=\"{2}\"".format(line,
-                                          escape_xml_cdata(attribute[0]),
-                                          escape_xml_attribute(attribute[1]))
+        elements = self.elements
+        contents = self.contents
 
-        if not self.elements and not self.contents:
-            line_list.append(line + " />")
-            return line_list
+        # Support "/>" closing
+        if not elements and not contents:
+            parts.append(" />")
+            append("".join(parts))
+            return
 
         # Close the open tag
-        line = line + ">"
-        if self.contents:
+        parts.append(">")
+        if contents:
 
             # contents could be multi-line, deal with it.
-            lines = escape_xml_cdata(self.contents).split("\n")
-            line = line + lines.pop(0)
-            if lines:
-                line_list.append(line)
-                line = lines.pop()
-                line_list.extend(lines)
-
-        if not self.elements:
-            line_list.append(
-                "{0}</{1}>".format(line, escape_xml_cdata(self.name)))
-            return line_list
-
-        line_list.append(line)
+            lines = escape_xml_cdata(contents).split("\n")
+            parts.append(lines[0])
+            if len(lines) > 1:
+                append("".join(parts))
+                for item in lines[1:-1]:
+                    append(item)
+                parts = [lines[-1]]
+
+        if not elements:
+            parts.extend(("</", name, ">"))
+            append("".join(parts))
+            return
+
+        append("".join(parts))
+
         # Output the embedded elements
-        for element in self.elements:
-            element.generate(line_list, indent=indent + 1)
+        indent += 1
+        for element in elements:
+            element._generate(append, indent)
+
         # Close the current element
-        line_list.append("{0}</{1}>".format(tabs, escape_xml_cdata(self.name)))
-        return line_list
+        append("".join((tabs, "</", name, ">")))
 
     ########################################
 
@@ -1568,6 +1589,11 @@ class VS2010Files(VS2010XML):
             # Add it to the chain
             self.add_element(new_xml)
 
+            # Files grouped into a unity file are only shown
+            if item.relative_pathname in self.project.unity_members:
+                new_xml.add_element(
+                    VS2010XML("ExcludedFromBuild", contents="true"))
+
             # Check if needs to be marked as "Not part of build"
             if xml_name in ("MASM", "MARMASM"):
 
@@ -1688,10 +1714,12 @@ class VS2010vcproj(VS2010XML):
         self.add_element(self.usermacros)
 
         for configuration in project.configuration_list:
-            self.add_element(VS2010PropertyGroup(configuration))
+            self.add_element(
+                get_fragment(VS2010PropertyGroup, configuration))
 
         for configuration in project.configuration_list:
-            self.add_element(VS2010ItemDefinitionGroup(configuration))
+            self.add_element(
+                get_fragment(VS2010ItemDefinitionGroup, configuration))
 
         ## VS2010Files
         self.files = VS2010Files(project)
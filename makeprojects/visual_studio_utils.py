@@ -19,13 +19,19 @@ Internal list of Visual Studio headers for SLN files.
 
 @var makeprojects.visual_studio_utils._SLN_POSTSOLUTION
 UUIDs for postSolution SLN records
+
+@var makeprojects.visual_studio_utils._ESCAPED_TAGS
+Cache of escaped tag and attribute names
+
+@var makeprojects.visual_studio_utils._FRAGMENT_SKIP
+Project attributes that don't affect shared XML fragments
 """
 
 from __future__ import absolute_import, print_function, unicode_literals
 
 from uuid import NAMESPACE_DNS, UUID
 from hashlib import md5
-from burger import is_string, convert_to_windows_slashes
+from burger import is_string, convert_to_windows_slashes, escape_xml_cdata
 
 from .validators import VSStringProperty
 from .enums import IDETypes, FileTypes, PlatformTypes, ProjectTypes, \
@@ -33,6 +39,7 @@ from .enums import IDETypes, FileTypes, PlatformTypes, ProjectTypes, \
 from .util import iterate_configurations
 
 # pylint: disable=consider-using-f-string
+# pylint: disable=useless-object-inheritance
 
 # Map platform CPUs to folder names
 _PLATFORM_CPUS = {
@@ -103,6 +110,170 @@ _SLN_POSTSOLUTION = {
     IDETypes.vs2022: "B6FA54F0-2622-4700-BD43-73EB0EBEFE41"
 }
 
+# Cache of escaped tag and attribute names
+_ESCAPED_TAGS = {}
+
+# Project attributes that don't affect shared XML fragments
+_FRAGMENT_SKIP = (
+    "_name", "_working_directory", "_source_files_list",
+    "_source_folders_list", "codefiles", "file_list", "include_list",
+    "platform_code", "unity_members", "vs_output_filename", "vs_uuid")
+
+########################################
+
+
+def escape_xml_tag(name):
+    """
+    Return an escaped XML tag or attribute name.
+
+    Tag names are a small set of constants, so the escaped version is
+    cached to avoid scanning the same strings for every element.
+
+    Args:
+        name: Tag or attribute name
+    Returns:
+        Name processed by escape_xml_cdata()
+    """
+
+    result = _ESCAPED_TAGS.get(name)
+    if result is None:
+        result = escape_xml_cdata(name)
+        _ESCAPED_TAGS[name] = result
+    return result
+
+########################################
+
+
+class CachedFragment(object):
+    """
+    XML element that's shared by several projects.
+
+    The text is created by the element on first use and the same lines are
+    output from then on.
+
+    Attributes:
+        element: VS2003XML or VS2010XML element
+        elements: Elements of ``element``
+        lines: dict of serializer arguments to generated lines
+    """
+
+    def __init__(self, element):
+        """
+        Wrap an element.
+
+        Args:
+            element: VS2003XML or VS2010XML element
+        """
+
+        self.element = element
+        self.elements = element.elements
+        self.lines = {}
+
+    ########################################
+
+    def _generate(self, append, *args):
+        """
+        Output the cached text lines of the element.
+
+        Args:
+            append: Callable that receives each text line
+            args: Indentation and other arguments of the element serializer
+        """
+
+        # pylint: disable=protected-access
+
+        lines = self.lines.get(args)
+        if lines is None:
+            lines = []
+            self.element._generate(lines.append, *args)
+            self.lines[args] = lines
+        for line in lines:
+            append(line)
+
+########################################
+
+
+class FragmentCache(object):
+    """
+    Cache of XML fragments shared between projects.
+
+    Projects in a solution usually have the same settings for their
+    configurations, so elements like the compiler settings are identical.
+    Elements are looked up by the element class and the fingerprint of the
+    configuration, which doesn't include the attributes that are specific
+    to a project, such as its name.
+
+    If an element class uses attributes of the project that are not part of
+    the fingerprint, they are listed in the class variable
+    ``fragment_inputs`` and added to the key.
+
+    Attributes:
+        fragments: dict of keys to CachedFragment objects
+    """
+
+    def __init__(self):
+        """
+        Create an empty cache.
+        """
+
+        self.fragments = {}
+
+    ########################################
+
+    def get_fragment(self, factory, configuration):
+        """
+        Return a shared element for a configuration.
+
+        If the configuration has attributes that can't be fingerprinted, such
+        as objects set by ``build_rules.py``, the element isn't shared.
+
+        Args:
+            factory: Element class that takes a configuration.
+            configuration: Configuration to generate the element for.
+        Returns:
+            CachedFragment instance, or the element if it can't be cached.
+        """
+
+        try:
+            fingerprint = configuration.fingerprint(_FRAGMENT_SKIP)
+        except TypeError:
+            return factory(configuration)
+
+        project = configuration.project
+        key = (factory, fingerprint) + tuple(
+            getattr(project, name) for name in
+            getattr(factory, "fragment_inputs", ()))
+
+        fragment = self.fragments.get(key)
+        if fragment is None:
+            fragment = CachedFragment(factory(configuration))
+            self.fragments[key] = fragment
+        return fragment
+
+########################################
+
+
+def get_fragment(factory, configuration):
+    """
+    Create an element, sharing it with other projects if possible.
+
+    If the solution has a FragmentCache in ``vs_fragment_cache``, the element
+    is obtained from it, otherwise a new element is created.
+
+    Args:
+        factory: Element class that takes a configuration.
+        configuration: Configuration to generate the element for.
+    Returns:
+        Element or CachedFragment instance.
+    See Also:
+        FragmentCache
+    """
+
+    cache = configuration.get_chained_value("vs_fragment_cache")
+    if cache is None:
+        return factory(configuration)
+    return cache.get_fragment(factory, configuration)
+
 ########################################
 
 
@@ -482,25 +653,59 @@ def create_copy_file_script(source_file, dest_file, perforce):
         List of command strings for Windows Command shell.
 
     See Also:
-        create_deploy_script
+        create_deploy_script, create_copy_files_script
+    """
+
+    return create_copy_files_script(((source_file, dest_file),), perforce)
+
+########################################
+
+
+def create_copy_files_script(file_list, perforce):
+    """
+    Create a batch file to copy a list of files.
+
+    Create a list of command lines to copy files with perforce support. All
+    of the destination files are checked out with a single ``p4 edit`` and
+    reverted with a single ``p4 revert -a`` so only two instances of ``p4``
+    are launched no matter how many files are deployed.
+
+    ```bash
+    p4 edit dest_file1 dest_file2
+    copy /Y source_file1 dest_file1
+    copy /Y source_file2 dest_file2
+    p4 revert -a dest_file1 dest_file2
+    ```
+
+    Args:
+        file_list: Iterable of (source_file, dest_file) pairs
+        perforce: True if perforce commands should be generated.
+
+    Returns:
+        List of command strings for Windows Command shell.
+
+    See Also:
+        create_copy_file_script
     """
 
     command_list = []
+    dest_files = " ".join(["\"{}\"".format(item[1]) for item in file_list])
 
-    # Check out the file
-    if perforce:
+    # Check out the files
+    if perforce and dest_files:
         # Note, use ``cmd /c``` so if the call fails, the batch file will
         # continue
-        command_list.append("cmd /c p4 edit \"{}\"".format(dest_file))
+        command_list.append("cmd /c p4 edit {}".format(dest_files))
 
-    # Perform the copy
-    command_list.append(
-        "copy /Y \"{}\" \"{}\"".format(source_file, dest_file))
+    # Perform the copies
+    for source_file, dest_file in file_list:
+        command_list.append(
+            "copy /Y \"{}\" \"{}\"".format(source_file, dest_file))
 
-    # Revert the file if it hasn't changed
-    if perforce:
+    # Revert the files if they haven't changed
+    if perforce and dest_files:
         command_list.append(
-            "cmd /c p4 revert -a \"{}\"".format(dest_file))
+            "cmd /c p4 revert -a {}".format(dest_files))
 
     return command_list
 
@@ -537,7 +742,7 @@ def create_deploy_script(configuration):
         None, None or description and batch file string.
 
     See Also:
-        create_copy_file_script
+        create_copy_files_script
     """
 
     # Is there an override?
@@ -579,20 +784,19 @@ def create_deploy_script(configuration):
     command_list = ["mkdir \"{}\" 2>nul".format(deploy_folder)]
 
     # Copy the executable
-    command_list.extend(
-        create_copy_file_script(
-            "$(TargetPath)",
-            "{}{}$(TargetExt)".format(deploy_folder, deploy_name),
-            perforce))
+    copy_list = [
+        ("$(TargetPath)",
+         "{}{}$(TargetExt)".format(deploy_folder, deploy_name))]
 
     # Copy the symbols on Microsoft platforms
     # if platform.is_windows() or platform.is_xbox():
     #    if project_type.is_library() or configuration.debug:
-    #       command_list.extend(
-    #           create_copy_file_script(
-    #              "$(TargetDir)$(TargetName).pdb",
-    #               "{}{}.pdb".format(deploy_folder, deploy_name),
-    #               perforce))
+    #       copy_list.append(
+    #           ("$(TargetDir)$(TargetName).pdb",
+    #            "{}{}.pdb".format(deploy_folder, deploy_name)))
+
+    # Check out and copy all the files with a single p4 invocation
+    command_list.extend(create_copy_files_script(copy_list, perforce))
 
     return "Copying $(TargetFileName) to {}".format(
         deploy_folder), "\n".join(command_list) + "\n"
@@ -34,9 +34,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import os
 from re import compile as re_compile
-from burger import save_text_file_if_newer, encapsulate_path_linux, \
-    convert_to_linux_slashes, convert_to_windows_slashes, where_is_watcom, \
-    get_windows_host_type
+from burger import encapsulate_path_linux, convert_to_linux_slashes, \
+    convert_to_windows_slashes, where_is_watcom, get_windows_host_type
 
 try:
     from wslwinreg import convert_to_windows_path
@@ -45,10 +44,13 @@ except ImportError:
 
 from .enums import FileTypes, ProjectTypes, PlatformTypes, IDETypes, \
     get_output_template
-from .build_objects import BuildObject, BuildError
+from .build_objects import BuildObject, BuildError, get_referenced_files
+from .core import save_unity_files
+from .artifacts import get_generated_artifacts
+from .makefile import get_precompiled_header_type
 from .watcom_util import fixup_env, get_custom_list, get_output_list, \
     add_post_build, watcom_linker_system, get_obj_list, add_obj_list, \
-    warn_if_invalid
+    warn_if_invalid, make_rule_cache_command
 
 # IDEs supported by this generator
 SUPPORTED_IDES = (IDETypes.watcom,)
@@ -70,6 +72,11 @@ class BuildWatcomFile(BuildObject):
         verbose: Save the verbose flag
     """
 
+    # wmake runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     def __init__(self, file_name, priority, configuration, verbose=False):
         r"""
         Class to handle watcom make files
@@ -96,7 +103,7 @@ class BuildWatcomFile(BuildObject):
         On Linux and Windows hosts, this function will invoke the ``wmake``
         tool to build the watcom make file.
 
-        The PATH will be temporarily adjusted to include the watcom tools so
+        The PATH given to wmake is adjusted to include the watcom tools so
         wmake can find its shared libraries.
 
         The default target built is ``all``.
@@ -116,7 +123,6 @@ class BuildWatcomFile(BuildObject):
         # Watcom requires the path set up so it can access link files
         exe_name = where_is_watcom("wmake", verbose=self.verbose)
 
-        saved_path = os.environ["PATH"]
         if get_windows_host_type() or exe_name.endswith(".exe"):
 
             # Building for DOS/Windows needs the binnt and binw folders
@@ -132,8 +138,8 @@ class BuildWatcomFile(BuildObject):
             new_path = os.path.join(watcom_path, "binl")
             file_name = self.file_name
 
-        # Make sure they are in the path
-        os.environ["PATH"] = new_path + os.pathsep + saved_path
+        # Make sure they are in the path, only for wmake
+        env = {"PATH": new_path + os.pathsep + os.environ.get("PATH", "")}
 
         # Set the configuration target
         cmd = [exe_name, "-e", "-h", "-f", file_name, self.configuration]
@@ -142,13 +148,22 @@ class BuildWatcomFile(BuildObject):
         if self.verbose:
             print(" ".join(cmd))
 
-        result = self.run_command(cmd, self.verbose)
+        return self.run_command(cmd, self.verbose, env=env)
+
+    ########################################
 
-        # Restore the path variable
-        os.environ["PATH"] = saved_path
+    def get_input_files(self):
+        """
+        Return the files this build reads.
 
-        # Return the error code
-        return result
+        The makefile, the files it names and the files in its
+        ``SOURCE_DIRS``.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(self.file_name, folders=True)
 
     ########################################
 
@@ -167,6 +182,24 @@ class BuildWatcomFile(BuildObject):
 
         return self.build()
 
+    ########################################
+
+    def get_artifacts(self):
+        """
+        Return the files the ``clean`` target deletes.
+
+        Watcom makefiles created by makeprojects are cleaned by deleting the
+        files directly, so wmake doesn't have to be run. Cleaning a single
+        configuration still runs wmake.
+
+        Returns:
+            List of pathnames, or None if wmake has to be run.
+        """
+
+        if self.configuration != "clean":
+            return None
+        return get_generated_artifacts(self.file_name)
+
 ########################################
 
 
@@ -313,12 +346,11 @@ def generate(solution):
     watcom_lines = solution.post_process(watcom_lines)
 
     # Save the file if it changed
-    save_text_file_if_newer(
+    solution.file_batch.save_text_file_if_newer(
         os.path.join(solution.working_directory, solution.watcom_filename),
         watcom_lines,
         bom=False,
-        perforce=solution.perforce,
-        verbose=solution.verbose)
+        perforce=solution.perforce)
     return 0
 
 
@@ -339,6 +371,9 @@ class WatcomProject(object):
         configuration_names: List of configuration names
         custom_list: List of custom built files
         output_list: List of custom output files
+        rule_cache: True if custom files are built with ``rulecache``
+        precompiled_types: Set of the types of files using the precompiled
+            headers
     """
 
     def __init__(self, solution):
@@ -359,6 +394,7 @@ class WatcomProject(object):
         self.platforms = platforms
         self.configuration_list = []
         self.configuration_names = []
+        self.precompiled_types = set()
 
         # Process all the projects and configurations
         for project in solution.project_list:
@@ -368,6 +404,9 @@ class WatcomProject(object):
                 [FileTypes.h, FileTypes.cpp, FileTypes.c, FileTypes.x86,
                  FileTypes.hlsl, FileTypes.glsl, FileTypes.rc])
 
+            # Compile unity files instead of the grouped files
+            save_unity_files(solution, project.add_unity_files())
+
             # Keep a copy of the filenames for now
             codefiles = project.codefiles
 
@@ -380,6 +419,12 @@ class WatcomProject(object):
                 configuration.watcommake_name = configuration.name + \
                     configuration.platform.get_short_code()
 
+                # Which source files use the precompiled header
+                configuration.watcom_pch_type = get_precompiled_header_type(
+                    (configuration,), codefiles)
+                if configuration.watcom_pch_type is not None:
+                    self.precompiled_types.add(configuration.watcom_pch_type)
+
                 # Add only if not already present
                 for item in self.configuration_names:
                     if configuration.name == item.name:
@@ -400,6 +445,10 @@ class WatcomProject(object):
         self.custom_list = custom_list
         self.output_list = get_output_list(custom_list)
 
+        # Use the rule cache if any configuration asks for it
+        self.rule_cache = any(
+            x.rule_cache for x in self.configuration_list)
+
     ########################################
 
     def write_header(self, line_list):
@@ -1192,6 +1241,64 @@ class WatcomProject(object):
 
     ########################################
 
+    def _setpchflags(self, line_list):
+        """
+        Output the precompiled header flags
+
+        Open Watcom creates the precompiled header when the first file is
+        compiled and rebuilds it when any of the headers change. The header
+        is forced to be the first include so every file uses it.
+
+        If some projects compile the header as C and others as C++, the
+        flags are also set for each language, so only the files of the
+        language the header was compiled with use it.
+
+        Args:
+            line_list: List of lines of text generated.
+        Returns:
+            Zero
+        """
+
+        if not self.precompiled_types:
+            return 0
+
+        line_list.extend((
+            "",
+            "#",
+            "# Set the precompiled header flags for each of the build types",
+            "#",
+            ""))
+
+        configuration_list = self.configuration_list
+        for configuration in configuration_list:
+            entries = ["PCHFlags" + configuration.watcommake_name + "="]
+
+            precompiled_header = configuration.precompiled_header
+            if precompiled_header and configuration.watcom_pch_type:
+                precompiled_header = convert_to_linux_slashes(
+                    precompiled_header)
+                entries.append("-fi=" + precompiled_header)
+                entries.append(
+                    "-fhq=$(TEMP_DIR)\\" +
+                    os.path.splitext(os.path.basename(
+                        precompiled_header))[0] + ".pch")
+
+            line_list.append(" ".join(entries))
+
+            # Split the flags by language if they're mixed
+            if len(self.precompiled_types) > 1:
+                for file_type, prefix in (
+                        (FileTypes.c, "PCHCFlags"),
+                        (FileTypes.cpp, "PCHCPPFlags")):
+                    entry = prefix + configuration.watcommake_name + "="
+                    if configuration.watcom_pch_type is file_type:
+                        entry += "$(PCHFlags" + \
+                            configuration.watcommake_name + ")"
+                    line_list.append(entry)
+        return 0
+
+    ########################################
+
     def write_rules(self, line_list):
         """
         Output the default rules for building object code
@@ -1207,6 +1314,18 @@ class WatcomProject(object):
         self._setasmflags(line_list)
         self._setlinkerflags(line_list)
         self._setresourceflags(line_list)
+        self._setpchflags(line_list)
+
+        # Only the files of the same language use the precompiled header
+        c_flags = "$(CFlags$(%CONFIG)$(%TARGET))"
+        cpp_flags = c_flags
+        if len(self.precompiled_types) > 1:
+            c_flags += " $(PCHCFlags$(%CONFIG)$(%TARGET))"
+            cpp_flags += " $(PCHCPPFlags$(%CONFIG)$(%TARGET))"
+        elif FileTypes.c in self.precompiled_types:
+            c_flags += " $(PCHFlags$(%CONFIG)$(%TARGET))"
+        elif FileTypes.cpp in self.precompiled_types:
+            cpp_flags += " $(PCHFlags$(%CONFIG)$(%TARGET))"
 
         # Global compiler flags
         line_list.extend([
@@ -1247,12 +1366,12 @@ class WatcomProject(object):
             "",
             ".c.obj : .AUTODEPEND",
             "\t@echo $[&.c / $(%CONFIG) / $(%TARGET)",
-            "\t@$(CL) $(CFlags$(%CONFIG)$(%TARGET)) $[*.c "
+            "\t@$(CL) " + c_flags + " $[*.c "
             "-fo=$^@ -fr=$^*.err",
             "",
             ".cpp.obj : .AUTODEPEND",
             "\t@echo $[&.cpp / $(%CONFIG) / $(%TARGET)",
-            "\t@$(CP) $(CFlags$(%CONFIG)$(%TARGET)) $[*.cpp "
+            "\t@$(CP) " + cpp_flags + " $[*.cpp "
             "-fo=$^@ -fr=$^*.err"
         ])
         return 0
@@ -1378,8 +1497,11 @@ class WatcomProject(object):
                 " ".join(entry[2]) + " : " +
                 convert_to_linux_slashes(
                     entry[3].relative_pathname))
+            cmd = entry[0]
+            if self.rule_cache:
+                cmd = make_rule_cache_command(entry)
             line_list.append("\t@echo " + entry[1])
-            line_list.append("\t@cmd /c & " + fixup_env(entry[0]))
+            line_list.append("\t@cmd /c & " + fixup_env(cmd))
 
             for output_test in entry[2]:
                 output_list.remove(output_test)
@@ -1418,6 +1540,12 @@ class WatcomProject(object):
                 configuration.platform.get_short_code()[-3:] +
                 configuration.short_code)
 
+            # Every object file depends on the precompiled header
+            if configuration.watcom_pch_type is not None:
+                line_list.append(
+                    "$+$(OBJS)$- : " + convert_to_linux_slashes(
+                        configuration.precompiled_header))
+
             if has_rez and configuration.platform.is_windows():
                 rc_objs = "$+$(RC_OBJS)$- "
             else:
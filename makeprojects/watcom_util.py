@@ -218,6 +218,34 @@ def get_custom_list(custom_list, rule_list, codefiles):
 ########################################
 
 
+def make_rule_cache_command(entry):
+    """
+    Create a command line that runs a custom build through ``rulecache``.
+
+    ``rulecache`` copies the output files from its cache if the input file,
+    the command line and the tool are the same as a previous build, and
+    runs the command otherwise.
+
+    Args:
+        entry: Tuple of command, description, outputs and input file
+
+    Returns:
+        Command line string
+
+    See Also:
+        get_custom_list, makeprojects.rule_cache.main
+    """
+
+    cmd = ["rulecache", "-i", convert_to_linux_slashes(
+        entry[3].relative_pathname)]
+    for output in entry[2]:
+        cmd.extend(("-o", output))
+    cmd.extend(("--", entry[0]))
+    return " ".join(cmd)
+
+########################################
+
+
 def get_output_list(custom_list):
     """
     Scan the custom_list and return the output files
@@ -51,17 +51,17 @@ import sys
 from re import compile as re_compile
 from operator import attrgetter, itemgetter
 
-from burger import create_folder_if_needed, save_text_file_if_newer, \
-    convert_to_linux_slashes, PY2, \
-    get_mac_host_type, where_is_xcode, run_command
+from burger import create_folder_if_needed, convert_to_linux_slashes, PY2, \
+    get_mac_host_type, where_is_xcode
 from ide_gen import xcode_calcuuid, JSONEntry, JSONArray, JSONDict, \
     XCProject, PBXFileReference, PBXBuildFile, PBXGroup, PBXBuildRule, \
     PBXFrameworksBuildPhase
 
 from .enums import ProjectTypes, PlatformTypes, IDETypes, FileTypes
-from .core import SourceFile, Configuration, Project
+from .core import SourceFile, Configuration, Project, get_file_lists, \
+    save_unity_files
 from .config import _XCODEPROJECT_FILE
-from .build_objects import BuildError, BuildObject
+from .build_objects import BuildError, BuildObject, get_referenced_files
 from .xcode_utils import get_sdk_root, PBXShellScriptBuildPhase, \
     PERFORCE_PATH, TEMP_EXE_NAME, copy_tool_to_bin
 
@@ -188,6 +188,11 @@ class BuildXCodeFile(BuildObject):
         verbose: The verbose flag
     """
 
+    # xcodebuild runs several jobs at once and takes a while
+    weight = 4
+    resource_class = "heavy"
+    estimate = 60.0
+
     def __init__(self, file_name, priority, configuration,
                  verbose=False):
         """
@@ -205,6 +210,39 @@ class BuildXCodeFile(BuildObject):
 
     ########################################
 
+    def get_job_name(self):
+        """
+        Return the name of this build for output and log files.
+
+        The file is inside the .xcodeproj folder, so use the folder's name.
+
+        Returns:
+            String in the form of ``name.xcodeproj|configuration``.
+        """
+
+        name = os.path.basename(os.path.dirname(self.file_name))
+        if self.configuration:
+            name += "|" + self.configuration
+        return name
+
+    ########################################
+
+    def get_log_file_name(self):
+        """
+        Return the pathname of the log file used with stream_output.
+
+        Logs are saved in the ``temp`` folder next to the .xcodeproj folder.
+
+        Returns:
+            Pathname of the log file.
+        """
+
+        return os.path.join(
+            os.path.dirname(os.path.dirname(self.file_name)), "temp",
+            os.path.basename(super().get_log_file_name()))
+
+    ########################################
+
     def build_clean(self, build=True):
         """
         Build a macOS XCode file.
@@ -259,20 +297,10 @@ class BuildXCodeFile(BuildObject):
         if self.verbose:
             print(" ".join(cmd))
 
-        try:
-            error_code = run_command(
-                cmd, working_dir=os.path.dirname(file_dir_name),
-                quiet=not self.verbose)[0]
-            msg = None
-        except OSError as error:
-            error_code = getattr(error, "winerror", error.errno)
-            msg = str(error)
-            print(msg, file=sys.stderr)
-
-        return BuildError(
-            error_code,
-            file_dir_name,
-            configuration=self.configuration)
+        result = self.run_command(
+            cmd, self.verbose, working_dir=os.path.dirname(file_dir_name))
+        result.filename = file_dir_name
+        return result
 
     ########################################
 
@@ -292,6 +320,24 @@ class BuildXCodeFile(BuildObject):
 
     ########################################
 
+    def get_input_files(self):
+        """
+        Return the files this build reads.
+
+        The project.pbxproj file, the files it names and the files in its
+        groups. Names are relative to the folder of the .xcodeproj.
+
+        Returns:
+            List of pathnames.
+        """
+
+        return get_referenced_files(
+            self.file_name,
+            base_dir=os.path.dirname(os.path.dirname(self.file_name)),
+            folders=True)
+
+    ########################################
+
     def clean(self):
         """
         Delete temporary files.
@@ -1778,11 +1824,15 @@ class MakeXCProject(XCProject):
         rootproject = PBXProject(self.uuid, solution)
         objects.add_item(rootproject)
 
+        # Find all the input files, the projects are scanned in parallel
+        get_file_lists(solution.project_list, SUPPORTED_FILES)
+
         # Process all the projects and configurations
         for project in solution.project_list:
 
-            # Find all the input files
-            project.get_file_list(SUPPORTED_FILES)
+            # Compile unity files, the grouped files are only shown
+            save_unity_files(
+                solution, project.add_unity_files(keep_members=True))
 
             # Determine if there are frameworks, if so, add them to
             # the input file list
@@ -1809,10 +1859,13 @@ class MakeXCProject(XCProject):
 
             # Create all the file references
             file_references = []
+            unity_references = []
             for item in project.codefiles:
                 file_reference = PBXFileReference(item.relative_pathname)
                 objects.add_item(file_reference)
                 file_references.append(file_reference)
+                if item.relative_pathname in project.unity_members:
+                    unity_references.append(file_reference)
 
             # What's the final output file?
             if project.project_type is ProjectTypes.library:
@@ -1871,6 +1924,8 @@ class MakeXCProject(XCProject):
                 # Add source files to compile for the ARM and the Intel libs
 
                 for item in file_references:
+                    if item in unity_references:
+                        continue
                     if item.file_type in ("sourcecode.cpp.cpp",
                                           "sourcecode.c.c",
                                           "sourcecode.c.objc",
@@ -1906,6 +1961,8 @@ class MakeXCProject(XCProject):
                     objects.add_item(framephase1)
 
                     for item in file_references:
+                        if item in unity_references:
+                            continue
                         if item.file_type in ("sourcecode.cpp.cpp",
                                               "sourcecode.c.c",
                                               "sourcecode.c.objc",
@@ -2391,8 +2448,8 @@ def generate(solution):
                                   solution.xcode_folder_name,
                                   _XCODEPROJECT_FILE)
 
-    save_text_file_if_newer(
+    solution.file_batch.save_text_file_if_newer(
         xcode_filename, xcode_lines, bom=False,
-        perforce=solution.perforce, verbose=solution.verbose)
+        perforce=solution.perforce)
 
     return 0
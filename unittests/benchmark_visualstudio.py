@@ -0,0 +1,181 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Benchmark for the Visual Studio 2003-2008 project generator
+
+Creates a synthetic project with thousands of source files, custom rules and
+per configuration exclusions, and times how long it takes to generate the
+.vcproj files. Not run by pytest, invoke it directly.
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import sys
+import os
+import argparse
+import tempfile
+import shutil
+import timeit
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+# pylint: disable=consider-using-f-string
+# pylint: disable=cell-var-from-loop
+import makeprojects
+from makeprojects.enums import IDETypes
+from makeprojects.validators import VSStringProperty, VSBooleanProperty
+from makeprojects.visual_studio import VS2003XML
+
+########################################
+
+
+def create_source_files(working_directory, count):
+    """
+    Create a folder of empty source files.
+
+    Args:
+        working_directory: Directory to create the "source" folder in
+        count: Number of .cpp/.h pairs to create
+    """
+
+    source_folder = os.path.join(working_directory, "source")
+    os.makedirs(source_folder)
+    names = ["shader{}.hlsl".format(index) for index in range(count // 100)]
+    for index in range(count):
+        names.append("file{}.cpp".format(index))
+        names.append("file{}.h".format(index))
+    for name in names:
+        with open(os.path.join(source_folder, name), "w") as fp:
+            fp.write("// {}\n".format(name))
+
+
+########################################
+
+
+def create_solution(working_directory):
+    """
+    Create a library solution for the synthetic project.
+
+    Args:
+        working_directory: Directory with the "source" folder
+    Returns:
+        Solution instance.
+    """
+
+    solution = makeprojects.Solution(name="bench", project_type="library")
+    solution.perforce = False
+    solution.working_directory = working_directory
+
+    project = makeprojects.Project(name="bench")
+    project.working_directory = working_directory
+    project.source_folders_list = ["source/*.*"]
+    project.define_list = ["BENCHMARK=1"]
+    project.custom_rules = {
+        "file2*.cpp": {"ObjectFile": "$(IntDir)file2.obj"},
+        "*.hlsl": {"VariableName": "g_%(FileName)"}
+    }
+    solution.add_project(project)
+
+    for name in ("Debug", "Internal", "Release"):
+        configuration = makeprojects.Configuration(name, platform="windows")
+        if name == "Release":
+            configuration.exclude_list = ["file1*.cpp"]
+        project.add_configuration(configuration)
+    return solution
+
+
+########################################
+
+
+def create_file_tree(count):
+    """
+    Create a Files element as the generator would for a large project.
+
+    Args:
+        count: Number of File elements to create
+    Returns:
+        VS2003XML instance.
+    """
+
+    files = VS2003XML("Files")
+    for index in range(count):
+        item = VS2003XML("File", force_pair=True)
+        item.add_attribute(VSStringProperty(
+            "RelativePath", ".\\source\\file{}.cpp".format(index)))
+        for name in ("Debug", "Internal", "Release"):
+            configuration = VS2003XML("FileConfiguration")
+            configuration.add_attribute(
+                VSStringProperty("Name", name + "|Win32"))
+            configuration.add_attribute(
+                VSBooleanProperty("ExcludedFromBuild", True))
+            tool = VS2003XML("Tool")
+            tool.add_attribute(VSStringProperty("Name", "VCCLCompilerTool"))
+            tool.add_attribute(VSStringProperty(
+                "CommandLine", "echo \"file{}\"\necho done".format(index)))
+            configuration.add_element(tool)
+            item.add_element(configuration)
+        files.add_element(item)
+    return files
+
+
+########################################
+
+
+def main(argv=None):
+    """
+    Time the generation of the synthetic project.
+
+    Args:
+        argv: Command line arguments, None for sys.argv
+    Returns:
+        Zero
+    """
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark Visual Studio 2003-2008 project generation")
+    parser.add_argument("-n", dest="count", type=int, default=2000,
+                        help="Number of source files to create")
+    parser.add_argument("-r", dest="repeat", type=int, default=3,
+                        help="Number of times to repeat each test")
+    args = parser.parse_args(argv)
+
+    working_directory = os.path.realpath(tempfile.mkdtemp())
+    try:
+        create_source_files(working_directory, args.count)
+
+        for ide in (IDETypes.vs2003, IDETypes.vs2005, IDETypes.vs2008):
+
+            # Time the entire generation, including the file scan
+            elapsed = min(timeit.repeat(
+                lambda: create_solution(working_directory).generate(ide=ide),
+                number=1, repeat=args.repeat))
+
+            print("{}: {} files, generate {:.3f}s".format(
+                ide, args.count * 2 + args.count // 100, elapsed))
+
+        # Time the serializer alone on an equivalent element tree
+        files = create_file_tree(args.count)
+        for ide in (IDETypes.vs2003, IDETypes.vs2008):
+            elapsed = min(timeit.repeat(
+                lambda: files.generate(ide=ide),
+                number=1, repeat=args.repeat))
+            print("{}: serialize {:.3f}s".format(ide, elapsed))
+    finally:
+        shutil.rmtree(working_directory)
+    return 0
+
+
+# If called as a function and not a class, call my main
+if __name__ == "__main__":
+    sys.exit(main())
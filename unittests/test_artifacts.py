@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for the makeprojects artifact deletion
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+from burger import save_text_file, Interceptstdout
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.enums import IDETypes
+from makeprojects.config import BUILD_RULES_PY
+from makeprojects.artifacts import get_generated_artifacts, find_artifacts, \
+    delete_artifacts
+import makeprojects
+
+########################################
+
+
+class TestArtifacts(unittest.TestCase):
+    """
+    Test deleting build output without the build tools
+    """
+
+########################################
+
+    def setUp(self):
+        """
+        Handle temporary directory
+        """
+
+        self.tmpdir = os.path.realpath(tempfile.mkdtemp())
+        # Make sure anything left behind is removed
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+########################################
+
+    def save_files(self, *names):
+        """
+        Create files with a single line of text and their folders.
+        """
+
+        for name in names:
+            file_name = os.path.join(self.tmpdir, name)
+            if not os.path.isdir(os.path.dirname(file_name)):
+                os.makedirs(os.path.dirname(file_name))
+            save_text_file(file_name, ("abc",))
+
+########################################
+
+    def test_delete_artifacts(self):
+        """
+        Test makeprojects.artifacts.delete_artifacts
+        """
+
+        self.save_files(
+            "temp/foodbg/a.o", "temp/foodbg/a.d", "temp/foodbg/sub/b.o",
+            "bin/foo", "source/a.cpp")
+        paths = find_artifacts(
+            self.tmpdir, ("temp/foo*", "temp/foodbg/sub", "bin/*", ".", ".."))
+        self.assertEqual(paths, [
+            os.path.join(self.tmpdir, "bin", "foo"),
+            os.path.join(self.tmpdir, "temp", "foodbg"),
+            os.path.join(self.tmpdir, "temp", "foodbg", "sub")])
+
+        # Nothing outside of the folder is found
+        self.assertEqual(find_artifacts(
+            os.path.join(self.tmpdir, "source"),
+            ("../*", "../bin", os.path.join(self.tmpdir, "bin", "*"))), [])
+
+        # Nothing is deleted in a dry run
+        files, size, errors = delete_artifacts(paths, dry_run=True, jobs=4)
+        self.assertEqual((files, errors), (4, []))
+        self.assertEqual(size, 4 * os.path.getsize(
+            os.path.join(self.tmpdir, "bin", "foo")))
+        self.assertTrue(os.path.isfile(
+            os.path.join(self.tmpdir, "temp", "foodbg", "sub", "b.o")))
+
+        # The empty output folders go away too
+        self.assertEqual(delete_artifacts(paths, jobs=4)[0], 4)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["source"])
+
+########################################
+
+    def test_generated(self):
+        """
+        Test cleaning a generated makefile
+        """
+
+        self.save_files("source/helloworld.cpp", "source/shader.glsl")
+
+        solution = makeprojects.Solution(name="hello", project_type="Tool")
+        solution.perforce = False
+        solution.working_directory = self.tmpdir
+
+        project = makeprojects.Project(name="helloworld")
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ["source"]
+        solution.add_project(project)
+        for item in ("Debug", "Release"):
+            project.add_configuration(
+                makeprojects.Configuration(item, platform="linux"))
+
+        self.assertEqual(solution.generate(ide=IDETypes.make), 0)
+        makefile = os.path.join(self.tmpdir, "hellomaklnx.mak")
+
+        # Only the files of this makefile are found
+        self.save_files(
+            "temp/hellomaklnxdbg/helloworld.o", "temp/hellomaklnxrel/a.o",
+            "temp/helloninlnxdbg/helloworld.o", "bin/hellomaklnxrel",
+            "source/shader.h", "temp/hellomaklnx.mak_Debug.log",
+            "temp/hellomaklnx.mak.log", "temp/helloninlnx.ninja_Debug.log")
+        self.assertEqual(get_generated_artifacts(makefile), [
+            os.path.join(self.tmpdir, "bin", "hellomaklnxrel"),
+            os.path.join(self.tmpdir, "source", "shader.h"),
+            os.path.join(self.tmpdir, "temp", "hellomaklnx.mak.log"),
+            os.path.join(self.tmpdir, "temp", "hellomaklnx.mak_Debug.log"),
+            os.path.join(self.tmpdir, "temp", "hellomaklnxdbg"),
+            os.path.join(self.tmpdir, "temp", "hellomaklnxrel")])
+
+        # Hand written makefiles run make
+        hand_written = os.path.join(self.tmpdir, "makefile")
+        save_text_file(hand_written, ("clean:", "\trm -rf temp/foo"))
+        self.assertIsNone(get_generated_artifacts(hand_written))
+
+        # cleanme uses the makefile and CLEAN_PATTERNS without running make
+        save_text_file(
+            os.path.join(self.tmpdir, BUILD_RULES_PY),
+            ("CLEAN_PATTERNS = \"source/*.h\"",))
+        os.remove(hand_written)
+        self.save_files("source/other.h")
+        with Interceptstdout():
+            self.assertEqual(makeprojects.clean(self.tmpdir), 0)
+        self.assertEqual(
+            sorted(os.listdir(self.tmpdir)),
+            ["build_rules.py", "compile_commands.json", "hellomaklnx.mak",
+             "source", "temp"])
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.tmpdir, "temp"))),
+            ["helloninlnx.ninja_Debug.log", "helloninlnxdbg"])
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(self.tmpdir, "source"))),
+            ["helloworld.cpp", "shader.glsl"])
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,532 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for makeprojects build objects
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+import sys
+import time
+import threading
+import unittest
+import tempfile
+import shutil
+from io import StringIO
+from burger import load_text_file, save_text_file
+import multiprocessing
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.build_objects import set_job_limit, get_job_limit, \
+    get_job_arguments, start_jobserver, stop_jobserver, get_jobserver, \
+    BuildObject, BuildError, BuildScheduler, BuildHistory, BuildStamps, \
+    create_environment, cancel_commands, get_referenced_files
+
+########################################
+
+
+class SleepObject(BuildObject):
+    """
+    Build object that sleeps and records what else was running.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, name, priority, log, weight=1,
+                 resource_class="light", error=0):
+        super(SleepObject, self).__init__(name, priority)
+        self.name = name
+        self.log = log
+        self.weight = weight
+        self.resource_class = resource_class
+        self.error = error
+
+    def build(self):
+        with self.log["lock"]:
+            self.log["running"].add(self.name)
+            self.log["order"].append(self.name)
+            self.log["peak"][self.name] = set(self.log["running"])
+        time.sleep(0.05)
+        with self.log["lock"]:
+            self.log["running"].discard(self.name)
+        return BuildError(self.error, self.file_name)
+
+########################################
+
+
+class CommandObject(BuildObject):
+    """
+    Build object that runs a command.
+    """
+
+    def __init__(self, file_name, priority, cmd):
+        super(CommandObject, self).__init__(file_name, priority)
+        self.cmd = cmd
+
+    def build(self):
+        return self.run_command(self.cmd, False)
+
+########################################
+
+
+class StampObject(BuildObject):
+    """
+    Build object that reads a makefile and records that it was built.
+    """
+
+    def __init__(self, file_name, priority, log):
+        super(StampObject, self).__init__(file_name, priority)
+        self.log = log
+
+    def get_input_files(self):
+        return get_referenced_files(self.file_name, folders=True)
+
+    def build(self):
+        self.log.append(os.path.basename(self.file_name))
+        output = os.path.join(os.path.dirname(self.file_name), "bin")
+        if not os.path.isdir(output):
+            os.mkdir(output)
+        return BuildError(0, self.file_name)
+
+########################################
+
+
+class TestBuildObjects(unittest.TestCase):
+    """
+    Test build objects
+    """
+
+########################################
+
+    def tearDown(self):
+        """
+        Restore the default job limit
+        """
+
+        stop_jobserver()
+        set_job_limit()
+
+########################################
+
+    def test_job_limit(self):
+        """
+        Test makeprojects.build_objects.set_job_limit
+        """
+
+        # Default is one job per CPU and no load limit
+        set_job_limit()
+        self.assertEqual(
+            get_job_limit(), (multiprocessing.cpu_count(), None))
+
+        set_job_limit(4, 6)
+        self.assertEqual(get_job_limit(), (4, 6.0))
+        self.assertEqual(get_job_arguments(), ["-j", "4", "-l", "6.0"])
+
+        # Values from build_rules.py may be strings
+        set_job_limit("2")
+        self.assertEqual(get_job_arguments(), ["-j", "2"])
+
+        with self.assertRaises(ValueError):
+            set_job_limit(0)
+        with self.assertRaises(ValueError):
+            set_job_limit(1, -1.0)
+
+########################################
+
+    @unittest.skipUnless(hasattr(os, "mkfifo"), "Requires named pipes")
+    def test_jobserver(self):
+        """
+        Test makeprojects.build_objects.start_jobserver
+        """
+
+        set_job_limit(3, 5)
+        jobserver = start_jobserver()
+        self.assertIs(get_jobserver(), jobserver)
+        path = jobserver.path
+
+        # make and ninja get the jobs from the job server
+        self.assertEqual(get_job_arguments(), ["-l", "5.0"])
+        self.assertEqual(
+            jobserver.get_makeflags(),
+            "-j3 --jobserver-auth={},{}".format(
+                jobserver.read_fd, jobserver.write_fd))
+        self.assertEqual(
+            jobserver.get_environment(True)["MAKEFLAGS"],
+            "-j3 --jobserver-auth=fifo:" + path)
+
+        # One job is implicit, so only two tokens are in the pipe
+        tokens = [jobserver.acquire(), jobserver.acquire()]
+        self.assertEqual(tokens, [b"+", b"+"])
+        for token in tokens:
+            jobserver.release(token)
+        self.assertEqual(
+            [jobserver.acquire(), jobserver.acquire()], [b"+", b"+"])
+
+        # Waiting on an empty pipe stops when cancelled
+        calls = []
+        self.assertIsNone(
+            jobserver.acquire(lambda: calls.append(0) or len(calls) > 2))
+        self.assertEqual(len(calls), 3)
+
+        # Lost tokens are replaced, without adding extra tokens
+        jobserver.reset()
+        jobserver.release(jobserver.acquire())
+        jobserver.reset()
+        self.assertEqual(
+            [jobserver.acquire(), jobserver.acquire()], [b"+", b"+"])
+        self.assertIsNone(jobserver.acquire(lambda: True))
+
+        stop_jobserver()
+        self.assertIsNone(get_jobserver())
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(get_job_arguments(), ["-j", "3", "-l", "5.0"])
+
+########################################
+
+    def test_environment(self):
+        """
+        Test makeprojects.build_objects.BuildObject.run_command environment
+        """
+
+        self.assertIsNone(create_environment())
+        env = create_environment({"BUILDME_TEST": "1", "PATH": None})
+        self.assertEqual(env["BUILDME_TEST"], "1")
+        self.assertNotIn("PATH", env)
+        self.assertIn("PATH", os.environ)
+
+        # Only the child process sees the change
+        build_object = BuildObject(os.path.abspath(__file__))
+        cmd = [sys.executable, "-c",
+               "import os, sys; "
+               "sys.exit(os.environ.get('BUILDME_TEST') != 'yes')"]
+        self.assertEqual(build_object.run_command(
+            cmd, False, env={"BUILDME_TEST": "yes"}).error, 0)
+        self.assertNotIn("BUILDME_TEST", os.environ)
+        self.assertEqual(build_object.run_command(cmd, False).error, 1)
+
+########################################
+
+    def test_stream_output(self):
+        """
+        Test makeprojects.build_objects.BuildObject.run_command streaming
+        """
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.addCleanup(cancel_commands, False)
+
+        build_object = BuildObject(
+            os.path.join(tmpdir, "hello.mak"), configuration="Debug")
+        build_object.stream_output = True
+        cmd = [sys.executable, "-c",
+               "import sys; print('hello'); sys.stderr.write('oops\\n')"]
+
+        saved = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = StringIO(), StringIO()
+        try:
+            result = build_object.run_command(cmd, False)
+            stdout, stderr = sys.stdout.getvalue(), sys.stderr.getvalue()
+        finally:
+            sys.stdout, sys.stderr = saved
+
+        # Each line says which build it came from, the log has everything
+        self.assertEqual(result.error, 0)
+        self.assertEqual(stdout, "[hello.mak|Debug] hello\n")
+        self.assertEqual(stderr, "[hello.mak|Debug] oops\n")
+        self.assertEqual(
+            sorted(load_text_file(
+                os.path.join(tmpdir, "temp", "hello.mak_Debug.log"))),
+            ["hello", "oops"])
+
+        # Long commands are stopped
+        build_object.stream_output = False
+        build_object.timeout = 0.2
+        cmd = [sys.executable, "-c", "import time; time.sleep(30)"]
+        start = time.time()
+        result = build_object.run_command(cmd, False)
+        self.assertTrue(time.time() - start < 10)
+        self.assertNotEqual(result.error, 0)
+        self.assertEqual(result.msg, "Timed out after 0.2 seconds")
+
+        # Cancelled commands don't start
+        cancel_commands()
+        result = build_object.run_command(cmd, False)
+        self.assertEqual((result.error, result.msg), (10, "Cancelled"))
+
+########################################
+
+    def test_scheduler(self):
+        """
+        Test makeprojects.build_objects.BuildScheduler
+        """
+
+        log = {"lock": threading.Lock(), "running": set(), "order": [],
+               "peak": {}}
+        projects = [
+            SleepObject("post", 90, log),
+            SleepObject("heavy1", 50, log, 4, "heavy"),
+            SleepObject("heavy2", 50, log, 4, "heavy"),
+            SleepObject("light1", 50, log),
+            SleepObject("light2", 50, log),
+            SleepObject("pre", 10, log)]
+
+        results = []
+        self.assertFalse(
+            BuildScheduler(6, 4096).run(projects, results))
+        self.assertEqual(len(results), 6)
+
+        # Priorities are built in order
+        self.assertEqual(log["order"][0], "pre")
+        self.assertEqual(log["order"][-1], "post")
+
+        # Only one heavy build fits, the light ones run next to it
+        self.assertEqual(log["order"][4], "heavy2")
+        self.assertNotIn("heavy1", log["peak"]["heavy2"])
+
+        # The memory budget limits the heavy builds too
+        log["order"] = []
+        projects = [
+            SleepObject("heavy1", 50, log, 1, "heavy"),
+            SleepObject("heavy2", 50, log, 1, "heavy"),
+            SleepObject("light1", 50, log)]
+        BuildScheduler(8, 2500).run(projects, [])
+        self.assertNotIn("heavy1", log["peak"]["heavy2"])
+
+        # Stop after an error
+        log["order"] = []
+        projects = [
+            SleepObject("bad", 10, log, error=10),
+            SleepObject("never", 20, log)]
+        results = []
+        self.assertTrue(
+            BuildScheduler(2, None).run(projects, results, fatal=True))
+        self.assertEqual(log["order"], ["bad"])
+        self.assertEqual(results[0].error, 10)
+
+########################################
+
+    def test_history(self):
+        """
+        Test makeprojects.build_objects.BuildHistory
+        """
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        file_name = os.path.join(tmpdir, "history.json")
+
+        log = {"lock": threading.Lock(), "running": set(), "order": [],
+               "peak": {}}
+        short = SleepObject("short", 50, log)
+        long_build = SleepObject("long", 50, log)
+        heavy = SleepObject("heavy", 50, log)
+        heavy.estimate = 60.0
+
+        # Unknown builds use the class estimate
+        history = BuildHistory(file_name)
+        self.assertEqual(history.get_estimate(short), 5.0)
+        history.record(long_build, 100.0)
+        history.record(long_build, 200.0)
+        history.save()
+
+        history = BuildHistory(file_name)
+        self.assertEqual(history.get_estimate(long_build), 150.0)
+
+        # Longest first, one at a time
+        BuildScheduler(1, None, history).run(
+            [short, heavy, long_build], [])
+        self.assertEqual(log["order"], ["long", "heavy", "short"])
+        self.assertTrue(history.get_estimate(short) < 1.0)
+
+########################################
+
+    def test_referenced_files(self):
+        """
+        Test makeprojects.build_objects.get_referenced_files
+        """
+
+        tmpdir = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmpdir)
+        for item in ("source", "bin"):
+            os.mkdir(os.path.join(tmpdir, item))
+        for item in ("source/a.cpp", "source/a.h", "bin/a.exe", "b.cpp",
+                     "unused.cpp"):
+            save_text_file(os.path.join(tmpdir, item), ("//",))
+
+        project = os.path.join(tmpdir, "project.vcxproj")
+        save_text_file(project, (
+            "<ClCompile Include=\"source\\a.cpp\" />",
+            "<OutDir>bin\\a.exe</OutDir>",
+            "<ClCompile Include=\"$(IntDir)b.cpp\" />"))
+        solution = os.path.join(tmpdir, "project.sln")
+        save_text_file(solution, (
+            "Project(\"{8BC9}\") = \"project\", \"project.vcxproj\"",
+            "SOURCE_DIRS = ..;b.cpp;source"))
+
+        # Macros and output folders are skipped
+        self.assertEqual(
+            get_referenced_files(project),
+            [project, os.path.join(tmpdir, "source", "a.cpp")])
+
+        # Folders in the project's tree and the files in referenced projects
+        self.assertEqual(
+            get_referenced_files(
+                solution, folders=True, follow=(".vcxproj",)),
+            [os.path.join(tmpdir, x) for x in (
+                "b.cpp", "project.sln", "project.vcxproj",
+                os.path.join("source", "a.cpp"),
+                os.path.join("source", "a.h"))])
+
+########################################
+
+    def test_stamps(self):
+        """
+        Test makeprojects.build_objects.BuildStamps
+        """
+
+        tmpdir = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmpdir)
+        file_name = os.path.join(tmpdir, "stamps.json")
+        source = os.path.join(tmpdir, "source")
+        os.mkdir(source)
+        save_text_file(os.path.join(source, "a.cpp"), ("//",))
+        for item in ("one", "two"):
+            save_text_file(
+                os.path.join(tmpdir, item + ".wmk"), ("SOURCE_DIRS=source",))
+
+        log = []
+        one = StampObject(os.path.join(tmpdir, "one.wmk"), 50, log)
+        two = StampObject(os.path.join(tmpdir, "two.wmk"), 60, log)
+
+        # Nothing is skipped the first time
+        stamps = BuildStamps(file_name)
+        BuildScheduler(2, None, stamps=stamps).run([one, two], [])
+        self.assertEqual(log, ["one.wmk", "two.wmk"])
+        stamps.save()
+
+        # Nothing changed
+        del log[:]
+        stamps = BuildStamps(file_name)
+        BuildScheduler(2, None, stamps=stamps).run([one, two], [])
+        self.assertEqual(log, [])
+        self.assertTrue(stamps.is_current(one))
+
+        # A source file changed
+        save_text_file(os.path.join(source, "a.cpp"), ("// Changed",))
+        self.assertFalse(stamps.is_current(two))
+        stamps.record(two)
+        self.assertTrue(stamps.is_current(two))
+
+        # The output folder was deleted
+        shutil.rmtree(os.path.join(tmpdir, "bin"))
+        self.assertFalse(stamps.is_current(one))
+        one.build()
+        stamps.record(one)
+        self.assertTrue(stamps.is_current(one))
+
+        # Build objects without input files are always built
+        self.assertFalse(stamps.is_current(SleepObject("x", 50, {})))
+
+        # Force builds everything
+        stamps.force = True
+        self.assertFalse(stamps.is_current(two))
+        stamps.record(two)
+
+        # Cleaning the folder removes the stamps
+        stamps.force = False
+        stamps.forget(tmpdir)
+        self.assertFalse(stamps.is_current(two))
+
+########################################
+
+    def test_fatal(self):
+        """
+        Test makeprojects.build_objects.BuildScheduler stopping on errors
+        """
+
+        if os.name == "nt":
+            self.skipTest("Requires a POSIX shell")
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        log = {"lock": threading.Lock(), "running": set(), "order": [],
+               "peak": {}}
+
+        # The child of the shell is stopped too, or this would take a minute
+        slow = CommandObject(
+            os.path.join(tmpdir, "slow.mak"), 50,
+            ["sh", "-c", "sleep 60 & sleep 60; wait"])
+        slow.estimate = 100.0
+        never = SleepObject("never", 50, log)
+        projects = [slow, SleepObject("bad", 50, log, error=10), never]
+
+        results = []
+        start = time.time()
+        saved = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = StringIO(), StringIO()
+        try:
+            self.assertTrue(BuildScheduler(2, None).run(
+                projects, results, fatal=True))
+        finally:
+            sys.stdout, sys.stderr = saved
+        self.assertTrue(time.time() - start < 30)
+        self.assertEqual(log["order"], ["bad"])
+        self.assertEqual(
+            sorted(str(x.msg) for x in results), ["Cancelled", "None"])
+        self.assertTrue(all(x.error for x in results))
+
+        # Commands are allowed after the scheduler is done
+        self.assertEqual(CommandObject(
+            os.path.join(tmpdir, "ok.mak"), 50,
+            [sys.executable, "-c", "pass"]).build().error, 0)
+
+########################################
+
+    def test_buffer_output(self):
+        """
+        Test makeprojects.build_objects.BuildObject.buffer_output
+        """
+
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+
+        projects = []
+        for name, code in (("good", 0), ("bad", 1)):
+            build_object = CommandObject(
+                os.path.join(tmpdir, name + ".mak"), 50,
+                [sys.executable, "-c",
+                 "import sys; print('{}'); sys.exit({})".format(name, code)])
+            build_object.buffer_output = True
+            projects.append(build_object)
+
+        saved = sys.stdout, sys.stderr
+        sys.stdout, sys.stderr = StringIO(), StringIO()
+        try:
+            # Nothing is printed until the build is done
+            self.assertEqual(projects[0].build().error, 0)
+            self.assertEqual(sys.stdout.getvalue(), "")
+            projects[0].replay_output()
+            self.assertEqual(sys.stdout.getvalue(), "good\n")
+
+            # Only the failed build is shown
+            sys.stdout = StringIO()
+            BuildScheduler(2, None).run(projects, [])
+            stdout = sys.stdout.getvalue()
+        finally:
+            sys.stdout, sys.stderr = saved
+        self.assertEqual(stdout, "[bad.mak] bad\n")
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
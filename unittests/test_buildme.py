@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for the buildme command
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+import json
+from burger import save_text_file, Interceptstdout
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.config import BUILD_RULES_PY
+from makeprojects.build_objects import set_job_limit, get_job_limit
+import makeprojects
+
+########################################
+
+
+class TestBuildme(unittest.TestCase):
+    """
+    Test the buildme command
+    """
+
+########################################
+
+    def setUp(self):
+        """
+        Handle temporary directory
+        """
+
+        self.tmpdir = os.path.realpath(tempfile.mkdtemp())
+        # Make sure anything left behind is removed
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.addCleanup(set_job_limit)
+
+########################################
+
+    def test_bad_jobs(self):
+        """
+        Test reporting a bad BUILDME_JOBS in build_rules.py
+        """
+
+        rules_file = os.path.join(self.tmpdir, BUILD_RULES_PY)
+        set_job_limit()
+        default = get_job_limit()
+        for value in ("0", "\"abc\""):
+            save_text_file(rules_file, ("BUILDME_JOBS = " + value,))
+            with Interceptstdout() as output:
+                self.assertEqual(makeprojects.build(self.tmpdir), 10)
+            self.assertIn(rules_file, "\n".join(output))
+            self.assertIn("BUILDME_JOBS", "\n".join(output))
+
+            # The default job limit is used
+            self.assertEqual(get_job_limit(), default)
+
+########################################
+
+    def test_clean_stamps(self):
+        """
+        Test that cleaning only removes existing stamps
+        """
+
+        stamps_file = os.path.join(self.tmpdir, "stamps.json")
+        old_stamps = os.environ.get("BUILDME_STAMPS")
+        os.environ["BUILDME_STAMPS"] = stamps_file
+        if old_stamps is None:
+            self.addCleanup(os.environ.pop, "BUILDME_STAMPS")
+        else:
+            self.addCleanup(
+                os.environ.__setitem__, "BUILDME_STAMPS", old_stamps)
+
+        project_dir = os.path.join(self.tmpdir, "project")
+        os.mkdir(project_dir)
+        save_text_file(os.path.join(project_dir, BUILD_RULES_PY), (
+            "def clean(working_directory):",
+            "    return None",
+            "def build(working_directory, configuration):",
+            "    return None"))
+
+        # Without stamps, nothing is created
+        makeprojects.build(project_dir, ["--clean"])
+        makeprojects.clean(project_dir)
+        self.assertFalse(os.path.exists(stamps_file))
+
+        # Only the stamps of the cleaned folder are removed
+        inside = "BuildObject|{}|".format(
+            os.path.join(project_dir, "x.mak"))
+        outside = "BuildObject|{}|".format(
+            os.path.join(self.tmpdir, "other", "x.mak"))
+        for args in (["--clean"], None):
+            save_text_file(stamps_file, (json.dumps(
+                {inside: "1", outside: "2"}),))
+            if args is None:
+                makeprojects.clean(project_dir)
+            else:
+                makeprojects.build(project_dir, args)
+            with open(stamps_file, "r") as fp:
+                self.assertEqual(json.load(fp), {outside: "2"})
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
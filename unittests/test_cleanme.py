@@ -336,6 +336,26 @@ class TestCleanme(unittest.TestCase):
         )
         makeprojects.clean(a_dir)
 
+        # CLEAN_PATTERNS of the generic rules are stopped too, but not the
+        # ones next to the clean() function that returned
+        save_text_file(build_rules, [
+            _CLEANME_PROCESS_PROJECT_FILES,
+            "CLEANME_GENERIC = True",
+            "CLEAN_PATTERNS = \"*.txt\""]
+        )
+        save_text_file(a_build_rules, [
+            _CLEANME_PROCESS_PROJECT_FILES,
+            "CONTINUE = True",
+            "CLEAN_PATTERNS = \"*.cpp\"",
+            _DEF_CLEAN,
+            _RETURN_ZERO]
+        )
+        a_foo_cpp = self.save_text_file(a_dir, "foo.cpp")
+        with Interceptstdout():
+            makeprojects.clean(a_dir)
+        self.assertTrue(os.path.isfile(a_foo_txt))
+        self.assertFalse(os.path.isfile(a_foo_cpp))
+
         # Test for returning an error code
         save_text_file(build_rules, [
             _CLEANME_PROCESS_PROJECT_FILES,
@@ -557,6 +577,47 @@ class TestCleanme(unittest.TestCase):
         self.assertEqual(result, 1)
         self.assertFalse(os.path.isfile(a_foo_cpp))
 
+########################################
+
+    def test_rebuildme(self):
+        """
+        Test that rebuildme builds each folder right after cleaning it.
+        """
+
+        log_file = os.path.join(self.tmpdir, "log.txt")
+        for item in ("a", "b"):
+            folder = self.mkdir(self.tmpdir, item)
+            self.save_text_file(folder, "foo.o")
+            save_text_file(os.path.join(folder, BUILD_RULES_PY), [
+                _IMPORT_BURGER,
+                "import os",
+                "def log(line):",
+                "\twith open({!r}, \"a\") as fp:".format(log_file),
+                "\t\tfp.write(line + \"\\n\")",
+                _DEF_CLEAN,
+                "\tburger.clean_files(working_directory, \"*.o\")",
+                "\tlog(\"clean {}\")".format(item),
+                _RETURN_ZERO,
+                "def build(working_directory, configuration):",
+                ("\tlog(\"build {} \" + str(os.path.isfile("
+                 "os.path.join(working_directory, \"foo.o\"))))").format(
+                     item),
+                _RETURN_ZERO]
+            )
+
+        with Interceptstdout():
+            result = makeprojects.rebuild(self.tmpdir, ["-r"])
+        self.assertEqual(result, 0)
+
+        # The build of a folder follows its clean, before the next folder
+        with open(log_file) as fp:
+            lines = fp.read().splitlines()
+        self.assertEqual(len(lines), 4)
+        for index in (0, 2):
+            item = lines[index].split()[1]
+            self.assertEqual(lines[index], "clean " + item)
+            self.assertEqual(lines[index + 1], "build " + item + " False")
+
 ########################################
 
 
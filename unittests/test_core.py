@@ -19,13 +19,21 @@ Please? It's not like I'm asking you for money!
 import sys
 import unittest
 import os
+import tempfile
+import shutil
+from burger import save_text_file
 
 # Insert the location of makeprojects at the begining so it's the first
 # to be processed
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from makeprojects.enums import PlatformTypes, ProjectTypes, IDETypes
-from makeprojects.core import Attributes, Configuration, Project, Solution
+from makeprojects.enums import PlatformTypes, ProjectTypes, IDETypes, \
+    FileTypes
+from makeprojects.core import Attributes, Configuration, Project, Solution, \
+    SourceFile, save_unity_files
+from makeprojects.util import regex_dict
+from makeprojects.vcs import FileBatch
+import makeprojects.ninja
 
 ########################################
 
@@ -303,6 +311,198 @@ class TestCore(unittest.TestCase):
         c.short_code = None
         self.assertEqual(c.short_code, "Release")
 
+########################################
+
+    def test_resolved_attributes(self):
+        """
+        Test Configuration.get_resolved_attributes.
+        """
+
+        s = Solution(name="solution")
+        p = Project(name="project")
+        s.add_project(p)
+        c = Configuration("Release", "win32")
+        p.add_configuration(c)
+
+        s.vs_Solution = "solution"
+        s.vs_Override = "solution"
+        p.vs_Override = "project"
+        p.vs_Project = "project"
+        c.vs_Project = None
+
+        resolved = c.get_resolved_attributes()
+
+        # Child values override the parent, None doesn't hide the parent
+        self.assertEqual(resolved["vs_Solution"], "solution")
+        self.assertEqual(resolved["vs_Override"], "project")
+        self.assertEqual(resolved["vs_Project"], "project")
+        self.assertEqual(resolved["_name"], "Release")
+        self.assertEqual(
+            resolved["vs_Project"], c.get_chained_value("vs_Project"))
+
+        # Cached until an attribute is assigned
+        self.assertIs(c.get_resolved_attributes(), resolved)
+        c.vs_Override = "configuration"
+        self.assertEqual(
+            c.get_resolved_attributes()["vs_Override"], "configuration")
+        self.assertNotIn("_chained_cache", c.get_resolved_attributes())
+
+########################################
+
+    def test_chained_cache(self):
+        """
+        Test the chained lookup cache of Attributes.
+        """
+
+        s = Solution(name="solution")
+        p = Project(name="project")
+        s.add_project(p)
+        c = Configuration("Release", "win32")
+        p.add_configuration(c)
+
+        # Assigning to the parent invalidates the child
+        s.vs_Value = "solution"
+        self.assertEqual(c.get_chained_value("vs_Value"), "solution")
+        p.vs_Value = "project"
+        self.assertEqual(c.get_chained_value("vs_Value"), "project")
+
+        # Lists modified in place are found if not frozen
+        p.define_list = ["A", "B"]
+        c.define_list = ["B"]
+        self.assertEqual(c.get_unique_chained_list("define_list"), ["B", "A"])
+        p.define_list.append("C")
+        self.assertEqual(
+            c.get_chained_list("define_list"), ["B", "A", "B", "C"])
+
+        s.freeze()
+
+        # Frozen lists are cached, but a copy is returned
+        value = c.get_unique_chained_list("define_list")
+        self.assertEqual(value, ["B", "A", "C"])
+        value.append("D")
+        self.assertEqual(
+            c.get_unique_chained_list("define_list"), ["B", "A", "C"])
+
+        # Assigning to a frozen parent still invalidates the child
+        self.assertEqual(c.get_chained_value("vs_Value"), "project")
+        s.vs_Value = "frozen"
+        p.vs_Value = None
+        self.assertEqual(c.get_chained_value("vs_Value"), "frozen")
+        p.define_list = ["E"]
+        self.assertEqual(
+            c.get_unique_chained_list("define_list"), ["B", "E"])
+
+        # Once thawed, lists modified in place are found again
+        s.thaw()
+        p.define_list.append("F")
+        self.assertEqual(
+            c.get_unique_chained_list("define_list"), ["B", "E", "F"])
+
+########################################
+
+    def test_generate_thaw(self):
+        """
+        Test that Solution.generate() thaws its copy of the solution.
+        """
+
+        tmpdir = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, tmpdir)
+
+        s = Solution(name="solution", working_directory=tmpdir)
+        s.perforce = False
+        p = Project(name="project", working_directory=tmpdir)
+        s.add_project(p)
+        p.add_configuration(Configuration("Debug", "linux"))
+
+        # The generator sees a frozen copy
+        copies = []
+
+        def generate(solution):
+            # pylint: disable=protected-access
+            copies.append((solution, solution._frozen))
+            raise ValueError("generate")
+
+        saved = makeprojects.ninja.generate
+        makeprojects.ninja.generate = generate
+        try:
+            with self.assertRaises(ValueError):
+                s.generate(IDETypes.ninja)
+        finally:
+            makeprojects.ninja.generate = saved
+
+        # pylint: disable=protected-access
+        self.assertIsNot(copies[0][0], s)
+        self.assertTrue(copies[0][1])
+        self.assertFalse(copies[0][0]._frozen)
+        self.assertFalse(s._frozen)
+
+########################################
+
+    def test_fingerprint(self):
+        """
+        Test Configuration.fingerprint and Project.fingerprint.
+        """
+
+        def create():
+            s = Solution(name="solution")
+            p = Project(name="project")
+            s.add_project(p)
+            c = Configuration("Release", "win32")
+            p.add_configuration(c)
+            p.custom_rules = {"*.cpp": {"a": "b"}, "*.h": {"c": "d"}}
+            return s, p, c
+
+        s, p, c = create()
+        s2, p2, c2 = create()
+
+        # Identical setups have the same fingerprint
+        self.assertEqual(c.fingerprint(), c2.fingerprint())
+        self.assertEqual(p.fingerprint(), p2.fingerprint())
+        self.assertEqual(len(c.fingerprint()), 40)
+
+        # Changes anywhere in the chain change the fingerprint
+        value = c.fingerprint()
+        project_value = p.fingerprint()
+        s.define_list.append("SOLUTION")
+        self.assertNotEqual(c.fingerprint(), value)
+        self.assertNotEqual(p.fingerprint(), project_value)
+
+        # Changing the configuration changes the project too
+        project_value = p.fingerprint()
+        c.debug = not c.debug
+        self.assertNotEqual(p.fingerprint(), project_value)
+        c.debug = not c.debug
+        self.assertEqual(p.fingerprint(), project_value)
+
+        # Cached while frozen, and updated on assignment
+        s.freeze()
+        value = c.fingerprint()
+        self.assertEqual(c.fingerprint(), value)
+        p.optimization = not p.optimization
+        self.assertNotEqual(c.fingerprint(), value)
+
+        # Regexes created by Solution.generate() are stable
+        s2.custom_rules = regex_dict({"*.cpp": {"a": "b"}})
+        value = c2.fingerprint()
+        s2.custom_rules = regex_dict({"*.cpp": {"a": "b"}})
+        self.assertEqual(c2.fingerprint(), value)
+        s2.custom_rules = regex_dict({"*.c": {"a": "b"}})
+        self.assertNotEqual(c2.fingerprint(), value)
+
+        # Source files are compared by name and type
+        value = c2.fingerprint()
+        p2.codefiles = [SourceFile("a.cpp", os.getcwd(), FileTypes.cpp)]
+        self.assertNotEqual(c2.fingerprint(), value)
+        value = c2.fingerprint()
+        project_value = p2.fingerprint()
+        p2.codefiles = [SourceFile("zzz.cpp", os.getcwd(), FileTypes.cpp)]
+        self.assertNotEqual(c2.fingerprint(), value)
+        self.assertNotEqual(p2.fingerprint(), project_value)
+
+        # Unknown types can't be fingerprinted
+        p2.vs_Unknown = object()
+        self.assertRaises(TypeError, p2.fingerprint)
+
 ########################################
 
     def test_project(self):
@@ -324,6 +524,113 @@ class TestCore(unittest.TestCase):
         with self.assertRaises(AttributeError):
             p.ide = None
 
+########################################
+
+    def test_unity_files(self):
+        """
+        Test Project.add_unity_files.
+        """
+
+        working_directory = os.path.join(os.sep, "work")
+        p = Project(name="game", working_directory=working_directory)
+        p.codefiles = [
+            SourceFile(name, working_directory, file_type)
+            for name, file_type in (
+                ("source/a.cpp", FileTypes.cpp),
+                ("source/b.cpp", FileTypes.cpp),
+                ("source/c.cpp", FileTypes.cpp),
+                ("source/main.cpp", FileTypes.cpp),
+                ("source/d.c", FileTypes.c),
+                ("source/a.h", FileTypes.h),
+                ("tools/e.cpp", FileTypes.cpp))]
+
+        # Nothing happens unless requested
+        self.assertEqual(p.add_unity_files(), [])
+        self.assertEqual(len(p.codefiles), 7)
+
+        with self.assertRaises(ValueError):
+            p.unity_batch_size = 0
+        p.unity_build = True
+        p.unity_batch_size = 2
+        p.unity_exclude_list = ["main.cpp"]
+        unity_files = p.add_unity_files()
+
+        # Single files aren't grouped
+        self.assertEqual(
+            [os.path.basename(x[0]) for x in unity_files],
+            ["game_source_0.cpp"])
+        self.assertEqual(
+            unity_files[0][0],
+            os.path.join(working_directory, "unity", "game_source_0.cpp"))
+        self.assertEqual(
+            unity_files[0][1][-2:],
+            ["#include \"../source/a.cpp\"",
+             "#include \"../source/b.cpp\""])
+        self.assertEqual(
+            p.unity_members, {"source\\a.cpp", "source\\b.cpp"})
+        self.assertEqual(
+            [x.relative_pathname for x in p.codefiles],
+            ["source\\a.h", "source\\c.cpp", "source\\d.c",
+             "source\\main.cpp", "tools\\e.cpp",
+             "unity\\game_source_0.cpp"])
+        self.assertIn("unity", p._source_include_list)
+
+        # Settings in a configuration apply to the project, and folders with
+        # the same name after the special characters are replaced are kept
+        # apart
+        p = Project(name="game", working_directory=working_directory)
+        p.codefiles = [
+            SourceFile(name, working_directory, FileTypes.cpp)
+            for name in ("a/b/c.cpp", "a/b/d.cpp", "a_b/e.cpp", "a_b/f.cpp")]
+        p.add_configuration(Configuration("Debug", platform="linux"))
+        self.assertEqual(p.add_unity_files(), [])
+        p.configuration_list[0].unity_build = True
+        unity_files = [os.path.basename(x[0]) for x in p.add_unity_files()]
+        self.assertEqual(len(unity_files), 2)
+        self.assertEqual(unity_files[1], "game_a_b_0.cpp")
+        self.assertNotEqual(unity_files[0], unity_files[1])
+        self.assertEqual(len(p.unity_members), 4)
+
+########################################
+
+    def test_unity_files_stale(self):
+        """
+        Test deleting unity files that are no longer created.
+        """
+
+        working_directory = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, working_directory)
+        unity_directory = os.path.join(working_directory, "unity")
+
+        def generate(names, unity_build=True):
+            s = Solution(name="solution")
+            s.file_batch = FileBatch()
+            p = Project(name="game", working_directory=working_directory)
+            s.add_project(p)
+            p.codefiles = [SourceFile(x, working_directory, FileTypes.cpp)
+                           for x in names]
+            p.unity_build = unity_build
+            save_unity_files(s, p.add_unity_files())
+            self.assertEqual(s.file_batch.commit(), 0)
+            return sorted(os.listdir(unity_directory))
+
+        self.assertEqual(
+            generate(("a/b.cpp", "a/c.cpp", "d/e.cpp", "d/f.cpp")),
+            ["game_a_0.cpp", "game_d_0.cpp"])
+
+        # Files of other projects and hand written files are kept
+        save_text_file(
+            os.path.join(unity_directory, "game_x.cpp"), ("// game_x",))
+        save_text_file(os.path.join(unity_directory, "game_tool_0.cpp"), (
+            "//", "// Unity build file for game_tool"))
+
+        self.assertEqual(
+            generate(("a/b.cpp", "a/c.cpp", "d/e.cpp")),
+            ["game_a_0.cpp", "game_tool_0.cpp", "game_x.cpp"])
+        self.assertEqual(
+            generate(("a/b.cpp", "a/c.cpp"), unity_build=False),
+            ["game_tool_0.cpp", "game_x.cpp"])
+
 ########################################
 
     def test_solution(self):
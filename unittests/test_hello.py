@@ -17,6 +17,7 @@ import sys
 import unittest
 import tempfile
 import shutil
+from burger import save_text_file, load_text_file
 # from burger import compare_files
 
 # Insert the location of makeprojects at the begining so it's the first
@@ -117,6 +118,127 @@ class TestHello(unittest.TestCase):
             #    'assets', 'hello', item[1])
             # assert compare_files(empty_file, str(tmpdir.join(item[1])))
 
+########################################
+
+    def test_precompiled_header(self):
+        """
+        Test to see if makefiles build the precompiled header first.
+        """
+
+        source_dir = os.path.join(self.tmpdir, 'source')
+        os.mkdir(source_dir)
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                'assets', 'hello', 'source', 'helloworld.cpp'),
+            os.path.join(source_dir, 'helloworld.cpp'))
+        save_text_file(os.path.join(source_dir, 'hello.h'), ('#define A',))
+
+        solution = makeprojects.Solution(name='hello', project_type='Tool')
+        solution.perforce = False
+        solution.working_directory = self.tmpdir
+
+        project = makeprojects.Project(name='helloworld')
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ['source']
+        project.precompiled_header = 'source/hello.h'
+        solution.add_project(project)
+
+        for item in ('Debug', 'Release'):
+            project.add_configuration(
+                makeprojects.Configuration(item, platform='linux'))
+
+        self.assertEqual(solution.generate(ide=IDETypes.make), 0)
+        lines = load_text_file(os.path.join(self.tmpdir, 'hellomaklnx.mak'))
+
+        # The header is compiled for each configuration
+        self.assertIn('PCHDebuglnx:=source/hello.h', lines)
+        self.assertIn('$(OBJS): $(PCH)', lines)
+        self.assertIn('$(PCH): $(PCH_SOURCE) | $(TEMP_DIR)', lines)
+
+        # Only C++ files use it
+        self.assertIn(
+            '$(CP) $(CFlags$(CONFIG)$(TARGET)) $(PCH_FLAGS) $< -o $@ '
+            '-MT \'$@\' -MMD -MF \'$*.d\'', lines)
+        self.assertIn(
+            '$(CL) $(CFlags$(CONFIG)$(TARGET)) $< -o $@ '
+            '-MT \'$@\' -MMD -MF \'$*.d\'', lines)
+
+########################################
+
+    def test_watcom_precompiled_header(self):
+        """
+        Test to see if Watcom makefiles use the precompiled header.
+        """
+
+        source_dir = os.path.join(self.tmpdir, 'source')
+        os.mkdir(source_dir)
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                'assets', 'hello', 'source', 'helloworld.cpp'),
+            os.path.join(source_dir, 'helloworld.cpp'))
+        save_text_file(os.path.join(source_dir, 'hello.h'), ('#define A',))
+        c_dir = os.path.join(self.tmpdir, 'csource')
+        os.mkdir(c_dir)
+        save_text_file(os.path.join(c_dir, 'helloc.c'), ('int a;',))
+        save_text_file(os.path.join(c_dir, 'helloc.h'), ('#define B',))
+
+        solution = makeprojects.Solution(name='hello', project_type='Tool')
+        solution.perforce = False
+        solution.working_directory = self.tmpdir
+
+        project = makeprojects.Project(name='helloworld')
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ['source']
+        project.precompiled_header = 'source/hello.h'
+        solution.add_project(project)
+        project.add_configuration(
+            makeprojects.Configuration('Debug', platform='msdos4gw'))
+
+        self.assertEqual(solution.generate(ide=IDETypes.watcom), 0)
+        lines = load_text_file(
+            os.path.join(self.tmpdir, 'hellowatdos4gw.wmk'))
+
+        # The header is compiled for each configuration
+        self.assertIn(
+            'PCHFlagsDebugdos4gw= -fi=source/hello.h '
+            '-fhq=$(TEMP_DIR)\\hello.pch', lines)
+        self.assertIn('$+$(OBJS)$- : source/hello.h', lines)
+
+        # Only C++ files use it
+        self.assertIn(
+            '\t@$(CP) $(CFlags$(%CONFIG)$(%TARGET)) '
+            '$(PCHFlags$(%CONFIG)$(%TARGET)) $[*.cpp -fo=$^@ -fr=$^*.err',
+            lines)
+        self.assertIn(
+            '\t@$(CL) $(CFlags$(%CONFIG)$(%TARGET)) $[*.c -fo=$^@ '
+            '-fr=$^*.err', lines)
+
+        # The second project compiles its header as C
+        project = makeprojects.Project(name='helloc')
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ['csource']
+        project.precompiled_header = 'csource/helloc.h'
+        solution.add_project(project)
+        project.add_configuration(
+            makeprojects.Configuration('Release', platform='msdos4gw'))
+
+        self.assertEqual(solution.generate(ide=IDETypes.watcom), 0)
+        lines = load_text_file(
+            os.path.join(self.tmpdir, 'hellowatdos4gw.wmk'))
+        self.assertIn('PCHCFlagsDebugdos4gw=', lines)
+        self.assertIn(
+            'PCHCPPFlagsDebugdos4gw=$(PCHFlagsDebugdos4gw)', lines)
+        self.assertIn(
+            'PCHCFlagsReleasedos4gw=$(PCHFlagsReleasedos4gw)', lines)
+        self.assertIn('PCHCPPFlagsReleasedos4gw=', lines)
+        self.assertIn('$+$(OBJS)$- : csource/helloc.h', lines)
+        self.assertIn(
+            '\t@$(CL) $(CFlags$(%CONFIG)$(%TARGET)) '
+            '$(PCHCFlags$(%CONFIG)$(%TARGET)) $[*.c -fo=$^@ -fr=$^*.err',
+            lines)
+
 ########################################
 
 
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for the makeprojects ninja generator
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+import sys
+import json
+import unittest
+import tempfile
+import shutil
+from burger import load_text_file, save_text_file
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.enums import IDETypes
+from makeprojects.ninja import escape_path, escape_value, escape_command
+import makeprojects
+
+########################################
+
+
+class TestNinja(unittest.TestCase):
+    """
+    Test ninja build file generation
+    """
+
+########################################
+
+    def setUp(self):
+        """
+        Handle temporary directory
+        """
+
+        self.tmpdir = os.path.realpath(tempfile.mkdtemp())
+        # Make sure anything left behind is removed
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+        # Every test builds hello world
+        source_dir = os.path.join(self.tmpdir, "source")
+        os.mkdir(source_dir)
+        shutil.copyfile(
+            os.path.join(
+                os.path.dirname(os.path.abspath(__file__)),
+                "assets", "hello", "source", "helloworld.cpp"),
+            os.path.join(source_dir, "helloworld.cpp"))
+
+########################################
+
+    def create_solution(self):
+        """
+        Create a solution in the temporary directory.
+
+        Returns:
+            Solution with no projects.
+        """
+
+        solution = makeprojects.Solution(name="hello", project_type="Tool")
+        solution.perforce = False
+        solution.working_directory = self.tmpdir
+        return solution
+
+########################################
+
+    def add_project(self, solution, name, configurations=("Debug",)):
+        """
+        Add a project that builds the source folder.
+
+        Args:
+            solution: Solution to add the project to
+            name: Name of the project
+            configurations: Names of the Linux configurations to build
+        Returns:
+            The new Project.
+        """
+
+        project = makeprojects.Project(name=name)
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ["source"]
+        solution.add_project(project)
+        for item in configurations:
+            project.add_configuration(
+                makeprojects.Configuration(item, platform="linux"))
+        return project
+
+########################################
+
+    def test_escape(self):
+        """
+        Test makeprojects.ninja escape functions
+        """
+
+        self.assertEqual(escape_path("a b/c:d$e"), "a$ b/c$:d$$e")
+        self.assertEqual(escape_value("-DA=$B c"), "-DA=$$B c")
+        self.assertEqual(
+            escape_command("cp \"$(SDKS)/a\" $(B)"),
+            "cp \"$${SDKS}/a\" $${B}")
+
+########################################
+
+    def test_generate(self):
+        """
+        Test makeprojects.ninja.generate
+        """
+
+        solution = self.create_solution()
+        self.add_project(solution, "helloworld", ("Debug", "Release"))
+
+        self.assertEqual(solution.generate(ide=IDETypes.ninja), 0)
+
+        lines = load_text_file(os.path.join(self.tmpdir, "helloninlnx.ninja"))
+
+        # One set of rules per configuration, with gcc style depfiles
+        self.assertIn("rule cxx_Debuglnx", lines)
+        self.assertIn("rule link_Releaselnx", lines)
+        self.assertIn("  deps = gcc", lines)
+
+        # Links are limited by a pool
+        self.assertIn("pool link_pool", lines)
+        self.assertIn("  pool = link_pool", lines)
+
+        # Targets used by buildme
+        self.assertIn(
+            "build temp/helloninlnxdbg/helloworld.o: cxx_Debuglnx "
+            "source/helloworld.cpp", lines)
+        self.assertIn("build Debug: phony Debuglnx", lines)
+        self.assertIn("build all: phony Debug Release", lines)
+        self.assertIn("default all", lines)
+
+        # The compilation database has the same flags
+        with open(os.path.join(self.tmpdir, "compile_commands.json")) as fp:
+            entries = json.load(fp)
+        self.assertEqual(
+            [x["output"] for x in entries],
+            ["temp/helloninlnxdbg/helloworld.o",
+             "temp/helloninlnxrel/helloworld.o"])
+        self.assertEqual(entries[0]["directory"], self.tmpdir)
+        self.assertEqual(entries[0]["file"], "source/helloworld.cpp")
+        self.assertEqual(
+            entries[0]["arguments"],
+            ["c++", "-c", "-Wall", "-x", "c++", "-Isource", "-g", "-Og",
+             "source/helloworld.cpp", "-o",
+             "temp/helloninlnxdbg/helloworld.o"])
+
+        # A makefile in the same folder adds its entries
+        self.assertEqual(solution.generate(ide=IDETypes.make), 0)
+        with open(os.path.join(self.tmpdir, "compile_commands.json")) as fp:
+            entries = json.load(fp)
+        self.assertEqual(
+            [x["output"] for x in entries],
+            ["temp/hellomaklnxdbg/helloworld.o",
+             "temp/hellomaklnxrel/helloworld.o",
+             "temp/helloninlnxdbg/helloworld.o",
+             "temp/helloninlnxrel/helloworld.o"])
+
+        # Old entries of the ninja file are removed, others are kept
+        entries.append({"file": "source/gone.cpp",
+                        "output": "temp/helloninlnxint/gone.o"})
+        entries.append({"file": "source/other.cpp",
+                        "output": "temp/otherninlnxdbg/other.o"})
+        with open(os.path.join(
+                self.tmpdir, "compile_commands.json"), "w") as fp:
+            json.dump(entries, fp)
+        self.assertEqual(solution.generate(ide=IDETypes.ninja), 0)
+        with open(os.path.join(self.tmpdir, "compile_commands.json")) as fp:
+            entries = json.load(fp)
+        self.assertEqual(
+            [x["output"] for x in entries],
+            ["temp/hellomaklnxdbg/helloworld.o",
+             "temp/hellomaklnxrel/helloworld.o",
+             "temp/helloninlnxdbg/helloworld.o",
+             "temp/helloninlnxrel/helloworld.o",
+             "temp/otherninlnxdbg/other.o"])
+
+########################################
+
+    def test_compiler_launcher(self):
+        """
+        Test makeprojects.ninja with a compiler cache
+        """
+
+        solution = self.create_solution()
+        solution.compiler_launcher = "ccache"
+        project = self.add_project(solution, "helloworld")
+        project.include_folders_list = [
+            os.path.join(self.tmpdir, "include"), "/usr/local/include"]
+
+        self.assertEqual(solution.generate(ide=IDETypes.ninja), 0)
+        lines = load_text_file(os.path.join(self.tmpdir, "helloninlnx.ninja"))
+
+        # The launcher prefixes the compiler, and the checkout folder
+        # isn't part of the command line
+        self.assertIn(
+            "  command = ccache $cxx -c -Wall -x c++ "
+            "-fdebug-prefix-map=$$PWD=. $includes $cflags_Debuglnx "
+            "$in -o $out -MT $out -MMD -MF $out.d", lines)
+        self.assertIn(
+            "includes = -Isource -Iinclude -I/usr/local/include", lines)
+
+########################################
+
+    def test_multiple_projects(self):
+        """
+        Test makeprojects.ninja with several projects in a solution
+        """
+
+        solution = self.create_solution()
+
+        for name in ("alpha", "beta"):
+            self.add_project(solution, name)
+
+        self.assertEqual(solution.generate(ide=IDETypes.ninja), 0)
+        lines = load_text_file(os.path.join(self.tmpdir, "helloninlnx.ninja"))
+
+        # Each project has its own rules and outputs
+        rules = [x for x in lines if x.startswith("rule ")]
+        self.assertEqual(len(rules), len(set(rules)))
+        builds = [x.split(":")[0] for x in lines if x.startswith("build ")]
+        self.assertEqual(len(builds), len(set(builds)))
+        self.assertIn("rule cxx_alphaDebuglnx", lines)
+        self.assertIn("build bin/betaninlnxdbg: link_betaDebuglnx "
+                      "temp/betaninlnxdbg/helloworld.o", lines)
+        self.assertIn("build Debug: phony alphaDebuglnx betaDebuglnx", lines)
+
+########################################
+
+    def test_duplicate_names(self):
+        """
+        Test makeprojects.ninja with source files that have the same name
+        """
+
+        other_dir = os.path.join(self.tmpdir, "other")
+        os.mkdir(other_dir)
+        save_text_file(
+            os.path.join(other_dir, "helloworld.c"), ("int a;",))
+        save_text_file(os.path.join(other_dir, "util.cpp"), ("int b;",))
+
+        solution = self.create_solution()
+        project = self.add_project(solution, "helloworld")
+        project.source_folders_list = ["source", "other"]
+
+        self.assertEqual(solution.generate(ide=IDETypes.ninja), 0)
+        lines = load_text_file(os.path.join(self.tmpdir, "helloninlnx.ninja"))
+
+        # Only the files with the same name keep their directories
+        self.assertIn(
+            "build temp/helloninlnxdbg/source/helloworld.o: cxx_Debuglnx "
+            "source/helloworld.cpp", lines)
+        self.assertIn(
+            "build temp/helloninlnxdbg/other/helloworld.o: cc_Debuglnx "
+            "other/helloworld.c", lines)
+        self.assertIn(
+            "build temp/helloninlnxdbg/util.o: cxx_Debuglnx "
+            "other/util.cpp", lines)
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for the makeprojects custom rule cache
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import os
+import sys
+import unittest
+import tempfile
+import shutil
+from burger import save_text_file, load_text_file
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.enums import IDETypes
+from makeprojects.rule_cache import run_cached
+import makeprojects
+
+# Stand in for a shader compiler that logs every time it's run
+_FAKE_TOOL = (
+    "import sys",
+    "with open(sys.argv[1] + '.log', 'a') as fp:",
+    "    fp.write('run\\n')",
+    "with open(sys.argv[1]) as fp:",
+    "    data = fp.read()",
+    "with open(sys.argv[2], 'w') as fp:",
+    "    fp.write(sys.argv[3] + data)"
+)
+
+########################################
+
+
+class TestRuleCache(unittest.TestCase):
+    """
+    Test the custom rule cache
+    """
+
+########################################
+
+    def setUp(self):
+        """
+        Handle temporary directory
+        """
+
+        self.tmpdir = os.path.realpath(tempfile.mkdtemp())
+        # Make sure anything left behind is removed
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+########################################
+
+    def test_run_cached(self):
+        """
+        Test makeprojects.rule_cache.run_cached
+        """
+
+        tool = os.path.join(self.tmpdir, "tool.py")
+        save_text_file(tool, _FAKE_TOOL)
+        cache = os.path.join(self.tmpdir, "cache")
+        source = os.path.join(self.tmpdir, "shader.glsl")
+        output = os.path.join(self.tmpdir, "temp", "shader.h")
+        log = source + ".log"
+        save_text_file(source, ("void main();",))
+        os.mkdir(os.path.dirname(output))
+
+        def build(prefix):
+            return run_cached(
+                [sys.executable, tool, source, output, prefix],
+                [source], [output], cache)
+
+        # The first build runs the tool
+        self.assertEqual(build("// "), 0)
+        self.assertEqual(load_text_file(log), ["run"])
+
+        # A clean build copies the output from the cache
+        shutil.rmtree(os.path.dirname(output))
+        self.assertEqual(build("// "), 0)
+        self.assertEqual(load_text_file(log), ["run"])
+        self.assertEqual(load_text_file(output), ["// void main();"])
+
+        # A different command line or input runs the tool
+        self.assertEqual(build("/* */ "), 0)
+        save_text_file(source, ("void main2();",))
+        self.assertEqual(build("// "), 0)
+        self.assertEqual(load_text_file(log), ["run", "run", "run"])
+        self.assertEqual(load_text_file(output), ["// void main2();"])
+
+        # Failed commands aren't cached
+        self.assertNotEqual(run_cached(
+            [sys.executable, "-c", "import sys; sys.exit(3)"],
+            [source], [output], cache), 0)
+
+########################################
+
+    def test_makefile(self):
+        """
+        Test makefiles with rule_cache
+        """
+
+        source_dir = os.path.join(self.tmpdir, "source")
+        os.mkdir(source_dir)
+        save_text_file(
+            os.path.join(source_dir, "helloworld.cpp"), ("int main();",))
+        save_text_file(
+            os.path.join(source_dir, "shader.glsl"), ("void main();",))
+
+        solution = makeprojects.Solution(name="hello", project_type="Tool")
+        solution.perforce = False
+        solution.working_directory = self.tmpdir
+        solution.rule_cache = True
+
+        project = makeprojects.Project(name="helloworld")
+        project.working_directory = self.tmpdir
+        project.source_folders_list = ["source"]
+        solution.add_project(project)
+        project.add_configuration(
+            makeprojects.Configuration("Debug", platform="linux"))
+
+        self.assertEqual(solution.generate(ide=IDETypes.make), 0)
+        lines = load_text_file(os.path.join(self.tmpdir, "hellomaklnx.mak"))
+
+        self.assertIn(
+            "\t@rulecache -i source/shader.glsl -o source/shader.h -- "
+            "stripcomments \"source/shader.glsl\" -c "
+            "\"source/shader.h\" -l g_shader", lines)
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,7 +22,8 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # pylint: disable=wrong-import-position
 from makeprojects.enums import PlatformTypes, IDETypes, ProjectTypes
 from makeprojects.util import validate_enum_type, regex_dict, \
-    validate_boolean, validate_string, remove_ending_os_sep, was_processed
+    validate_boolean, validate_string, remove_ending_os_sep, was_processed, \
+    parallel_map
 
 ########################################
 
@@ -184,6 +185,44 @@ class TestUtil(unittest.TestCase):
         self.assertTrue(was_processed(processed, "a", False))
         self.assertTrue(was_processed(processed, "b", False))
 
+########################################
+
+    def test_parallel_map(self):
+        """
+        Test makeprojects.util.parallel_map
+        """
+
+        items = list(range(-20, 0))
+        expected = list(range(20, 0, -1))
+
+        # Results are in item order, serial or parallel
+        self.assertEqual(parallel_map(abs, items, jobs=1), expected)
+        self.assertEqual(parallel_map(abs, items, jobs=4), expected)
+        self.assertEqual(parallel_map(abs, [], jobs=4), [])
+
+        # Functions that can't be pickled are run serially
+        self.assertEqual(
+            parallel_map(lambda x: -x, items, jobs=4), expected)
+
+        # Errors in the workers are passed to the caller
+        with self.assertRaises(ValueError):
+            parallel_map(int, ["bad"] * 20, jobs=4)
+
+        # The initializer is called before the items are processed
+        called = []
+        self.assertEqual(
+            parallel_map(abs, items[:2], jobs=4, initializer=called.append,
+                         initargs=("init",)), [20, 19])
+        self.assertEqual(called, ["init"])
+
+        # Initializer arguments that can't be pickled are run serially
+        del called[:]
+        unpicklable = lambda: None
+        self.assertEqual(
+            parallel_map(abs, items, jobs=4, initializer=called.append,
+                         initargs=(unpicklable,)), expected)
+        self.assertEqual(called, [unpicklable])
+
 
 ########################################
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+""" Unit tests for makeprojects version control batching
+
+Copyright 2025 by Rebecca Ann Heineman becky@burgerbecky.com
+
+It is released under an MIT Open Source license. Please see LICENSE
+for license details. Yes, you can use it in a
+commercial title without paying anything, just give me a credit.
+Please? It's not like I'm asking you for money!
+
+"""
+
+import sys
+import unittest
+import os
+import stat
+import tempfile
+import shutil
+from burger import save_text_file, load_text_file
+
+# Insert the location of makeprojects at the begining so it's the first
+# to be processed
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# pylint: disable=wrong-import-position
+from makeprojects.vcs import PerforceBackend, FileBatch
+
+# Stand in for p4 that logs the command and the file list from stdin
+# and makes edited files writable
+_FAKE_P4 = (
+    "import os, sys, stat",
+    "with open(sys.argv[0] + '.log', 'a') as fp:",
+    "    fp.write(' '.join(sys.argv[1:]) + '\\n')",
+    "    for line in sys.stdin:",
+    "        fp.write(line)",
+    "        if sys.argv[-1] == 'edit':",
+    "            os.chmod(line.strip(), stat.S_IREAD | stat.S_IWRITE)"
+)
+
+########################################
+
+
+class TestVCS(unittest.TestCase):
+    """
+    Test version control batching
+    """
+
+########################################
+
+    def setUp(self):
+        """
+        Handle temporary directory
+        """
+
+        self.tmpdir = os.path.realpath(tempfile.mkdtemp())
+        # Make sure anything left behind is removed
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+        # Create the stand in p4 tool
+        script = os.path.join(self.tmpdir, "fake_p4.py")
+        save_text_file(script, _FAKE_P4)
+        if sys.platform.startswith("win"):
+            self.executable = os.path.join(self.tmpdir, "fake_p4.bat")
+            save_text_file(
+                self.executable, ("@\"{}\" \"{}\" %*".format(
+                    sys.executable, script),))
+        else:
+            self.executable = os.path.join(self.tmpdir, "fake_p4")
+            save_text_file(
+                self.executable, ("#!/bin/sh",
+                "exec \"{}\" \"{}\" \"$@\"".format(sys.executable, script)))
+            os.chmod(self.executable, stat.S_IRWXU)
+        self.log = script + ".log"
+
+########################################
+
+    def test_filebatch(self):
+        """
+        Test makeprojects.vcs.FileBatch
+        """
+
+        unchanged = os.path.join(self.tmpdir, "unchanged.txt")
+        locked = os.path.join(self.tmpdir, "locked.txt")
+        locked2 = os.path.join(self.tmpdir, "locked2.txt")
+        new_file = os.path.join(self.tmpdir, "new.txt")
+
+        save_text_file(unchanged, ("same",))
+        for item in (locked, locked2):
+            save_text_file(item, ("old",))
+            os.chmod(item, stat.S_IREAD)
+
+        batch = FileBatch(backend=PerforceBackend(self.executable))
+        self.assertTrue(batch.save_text_file_if_newer(
+            unchanged, ("same",), perforce=True))
+        self.assertFalse(batch.save_text_file_if_newer(
+            locked, ("new",), perforce=True))
+        self.assertFalse(batch.save_text_file_if_newer(
+            locked2, ("new",), perforce=True))
+        self.assertFalse(batch.save_text_file_if_newer(
+            new_file, ("new",), perforce=True))
+
+        # Nothing is written until the commit
+        self.assertFalse(os.path.isfile(new_file))
+
+        self.assertEqual(batch.commit(), 0)
+
+        # One edit for both locked files, one add for the new file
+        self.assertEqual(
+            load_text_file(self.log),
+            ["-x - edit", locked, locked2, "-x - add", new_file])
+        for item in (locked, locked2, new_file):
+            self.assertEqual(load_text_file(item), ["new"])
+
+########################################
+
+    def test_filebatch_no_perforce(self):
+        """
+        Test makeprojects.vcs.FileBatch without version control
+        """
+
+        new_file = os.path.join(self.tmpdir, "new.txt")
+        batch = FileBatch(backend=PerforceBackend(self.executable))
+        self.assertFalse(batch.save_text_file_if_newer(new_file, ("new",)))
+
+        # Queued files can be replaced before the commit
+        self.assertEqual(batch.pop_pending(new_file), ["new"])
+        self.assertIsNone(batch.pop_pending(new_file))
+        self.assertFalse(batch.save_text_file_if_newer(new_file, ("new",)))
+
+        self.assertEqual(batch.commit(), 0)
+        self.assertFalse(os.path.isfile(self.log))
+        self.assertEqual(load_text_file(new_file), ["new"])
+
+        # A single string is saved as one line
+        batch = FileBatch()
+        self.assertFalse(batch.save_text_file_if_newer(new_file, "string"))
+        self.assertEqual(batch.pop_pending(new_file), ["string"])
+        self.assertFalse(batch.save_text_file_if_newer(new_file, "string"))
+        self.assertEqual(batch.commit(), 0)
+        self.assertEqual(load_text_file(new_file), ["string"])
+        self.assertTrue(batch.save_text_file_if_newer(new_file, "string"))
+
+
+########################################
+
+
+if __name__ == "__main__":
+    unittest.main()
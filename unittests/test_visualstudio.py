@@ -21,8 +21,13 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # pylint: disable=wrong-import-position
-from makeprojects.validators import VSStringProperty
-from makeprojects.visual_studio import VS2003XML
+from makeprojects.enums import IDETypes
+from makeprojects.validators import VSStringProperty, VSBooleanProperty
+from makeprojects.core import Configuration, Project, Solution
+from makeprojects.visual_studio import VS2003XML, VS2003Tool, vs_property, \
+    VCCLCompilerTool, VCLinkerTool
+from makeprojects.visual_studio_utils import FragmentCache
+from makeprojects.visual_studio_2010 import VS2010XML
 
 ########################################
 
@@ -119,6 +124,218 @@ class TestVisualStudio(unittest.TestCase):
             '\t\tName="Win32"\n\t/>\n'
             '</VisualStudioProject>'))
 
+########################################
+
+    def test_vs2003xml_vs2003(self):
+        """
+        Test makeprojects.visual_studio.VS2003XML in the 2003 format
+        """
+
+        # 2003 closes tags on the same line and has upper case booleans
+        platform = VS2003XML("Platform")
+        platform.add_attribute(VSStringProperty("Name", "Win32"))
+        platform.add_attribute(VSBooleanProperty("Enabled", True))
+        self.assertEqual(
+            platform.generate(ide=IDETypes.vs2003),
+            ["<Platform", "\tName=\"Win32\"", "\tEnabled=\"TRUE\"/>"])
+
+        # Line feeds are in the attribute literally
+        tool = VS2003XML("Tool", force_pair=True)
+        tool.add_attribute(VSStringProperty("CommandLine", "a\nb & c"))
+        self.assertEqual(
+            tool.generate(ide=IDETypes.vs2003),
+            ["<Tool", "\tCommandLine=\"a", "b &amp; c\">", "</Tool>"])
+        self.assertEqual(
+            tool.generate(ide=IDETypes.vs2008),
+            ["<Tool", "\tCommandLine=\"a&#x0D;&#x0A;b &amp; c\"",
+             "\t>", "</Tool>"])
+
+        # Nested elements
+        vs_project = VS2003XML("VisualStudioProject")
+        vs_project.add_attribute(VSStringProperty("ProjectType", "Visual C++"))
+        vs_project.add_element(platform)
+        self.assertEqual(
+            vs_project.generate(ide=IDETypes.vs2003), [
+                "<VisualStudioProject",
+                "\tProjectType=\"Visual C++\">",
+                "\t<Platform",
+                "\t\tName=\"Win32\"",
+                "\t\tEnabled=\"TRUE\"/>",
+                "</VisualStudioProject>"])
+
+########################################
+
+    def test_vs2003tool(self):
+        """
+        Test makeprojects.visual_studio.VS2003Tool.add_attribute_table
+        """
+
+        tool = VS2003Tool("VCTest")
+        tool.add_attribute_table("Debug", (
+            (lambda configuration, fallback=None: None, None),
+            (lambda configuration, fallback="Constant": VSStringProperty(
+                "Fixed", fallback), None),
+            (lambda configuration, fallback: VSStringProperty(
+                "Value", fallback), "Fallback"),
+            (lambda configuration, fallback: VSStringProperty(
+                "Config", fallback), lambda configuration: configuration)))
+        self.assertEqual(
+            tool.generate(), [
+                "<Tool",
+                "\tName=\"VCTest\"",
+                "\tFixed=\"Constant\"",
+                "\tValue=\"Fallback\"",
+                "\tConfig=\"Debug\"",
+                "/>"])
+
+########################################
+
+    def test_vs_property(self):
+        """
+        Test makeprojects.visual_studio.vs_property
+        """
+
+        s = Solution(name="solution", ide="vs2008")
+        p = Project(name="project")
+        s.add_project(p)
+        c = Configuration("Release", "win32")
+        p.add_configuration(c)
+
+        # Fallback is used if there is no override
+        self.assertEqual(
+            vs_property("CharacterSet", c, "Unicode").get_value(), "1")
+
+        # The override in the parent replaces the fallback
+        p.vs_CharacterSet = "MultiByte"
+        self.assertEqual(
+            vs_property("CharacterSet", c, "Unicode").get_value(), "2")
+
+        # Overrides with a prefix
+        p.vs_LinkerAdditionalOptions = "/VERBOSE"
+        self.assertIsNone(
+            vs_property("AdditionalOptions", c).get_value())
+        self.assertEqual(
+            vs_property(
+                "AdditionalOptions", c, prefix="Linker").get_value(),
+            "/VERBOSE")
+
+        # Booleans without a value are not created
+        self.assertIsNone(vs_property("SuppressStartupBanner", c))
+
+        # ReferencesPath is only available on Visual Studio 2003
+        self.assertIsNone(vs_property("ReferencesPath", c, ["."]))
+
+########################################
+
+    def test_fragment_cache(self):
+        """
+        Test makeprojects.visual_studio_utils.FragmentCache
+        """
+
+        s = Solution(name="solution", ide="vs2008")
+        configurations = []
+        for name in ("alpha", "beta", "gamma"):
+            p = Project(name=name)
+            p.working_directory = name
+            s.add_project(p)
+            c = Configuration("Release", "win32")
+            p.add_configuration(c)
+            c.vs_configuration_name = "Release|Win32"
+            configurations.append(c)
+        configurations[2].define_list = ["GAMMA"]
+
+        cache = FragmentCache()
+        alpha = cache.get_fragment(VCCLCompilerTool, configurations[0])
+        beta = cache.get_fragment(VCCLCompilerTool, configurations[1])
+        gamma = cache.get_fragment(VCCLCompilerTool, configurations[2])
+
+        # Project names are not part of the key, but defines are
+        self.assertIs(alpha, beta)
+        self.assertIsNot(alpha, gamma)
+
+        # The linker uses the project name, so it's not shared
+        self.assertIsNot(
+            cache.get_fragment(VCLinkerTool, configurations[0]),
+            cache.get_fragment(VCLinkerTool, configurations[1]))
+
+        # The cached text matches the element
+        lines = []
+        alpha._generate(lines.append, 2, False)
+        self.assertEqual(lines, VCCLCompilerTool(configurations[1]).generate(
+            indent=2, ide=IDETypes.vs2008))
+
+        # Second pass is output from the cache
+        lines = []
+        alpha._generate(lines.append, 2, False)
+        self.assertEqual(lines, VCCLCompilerTool(configurations[1]).generate(
+            indent=2, ide=IDETypes.vs2008))
+
+        # Objects that can't be fingerprinted aren't shared
+        configurations[0].vs_Custom = object()
+        configurations[1].vs_Custom = object()
+        self.assertIsNot(
+            cache.get_fragment(VCCLCompilerTool, configurations[0]),
+            cache.get_fragment(VCCLCompilerTool, configurations[1]))
+
+########################################
+
+    def test_vs2010xml(self):
+        """
+        Test makeprojects.visual_studio_2010.VS2010XML
+        """
+
+        # Empty entry
+        vs_project = VS2010XML('Project', {'DefaultTargets': 'Build'})
+        self.assertEqual(
+            str(vs_project), '<Project DefaultTargets="Build" />')
+
+        # Attributes keep their order when changed
+        vs_project.add_attribute('ToolsVersion', '4.0')
+        vs_project.set_attribute('DefaultTargets', 'Clean')
+        self.assertEqual(
+            str(vs_project),
+            '<Project DefaultTargets="Clean" ToolsVersion="4.0" />')
+
+        # Reset to the default
+        vs_project.reset_attribute('DefaultTargets')
+        self.assertEqual(
+            str(vs_project),
+            '<Project DefaultTargets="Build" ToolsVersion="4.0" />')
+
+        # Attributes without a default are removed
+        vs_project.reset_attribute('ToolsVersion')
+        vs_project.remove_attribute('foofar')
+        self.assertEqual(
+            str(vs_project), '<Project DefaultTargets="Build" />')
+
+        # Escaping of attributes and contents
+        vs_project.add_tag('Command', 'a < b & "c"')
+        vs_project.add_element(
+            VS2010XML('Item', {'Include': 'a"b<c>'}))
+        self.assertEqual(str(vs_project), (
+            '<Project DefaultTargets="Build">\n'
+            '  <Command>a &lt; b &amp; "c"</Command>\n'
+            '  <Item Include="a&quot;b&lt;c&gt;" />\n'
+            '</Project>'))
+
+        # Multi-line contents
+        command = VS2010XML('Command', contents='one\ntwo\nthree')
+        self.assertEqual(
+            str(command), '<Command>one\ntwo\nthree</Command>')
+        vs_project = VS2010XML('PostBuildEvent')
+        vs_project.add_element(command)
+        self.assertEqual(str(vs_project), (
+            '<PostBuildEvent>\n'
+            '  <Command>one\ntwo\nthree</Command>\n'
+            '</PostBuildEvent>'))
+
+        # Contents and elements
+        command.add_element(VS2010XML('Message', contents='hi'))
+        self.assertEqual(str(command), (
+            '<Command>one\ntwo\nthree\n'
+            '  <Message>hi</Message>\n'
+            '</Command>'))
+
 ########################################
 
 